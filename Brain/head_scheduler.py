@@ -0,0 +1,226 @@
+"""
+ORGAN: HEAD SCHEDULER v1.0
+PURPOSE: Concurrent, deadline-driven execution of Hydra heads
+INTEGRATION: Brain Layer (used by HydraEngine.hunt)
+
+Each head has its own interval and jitter. Deadlines are anchored to the
+schedule (not to when the previous run finished), the scheduler waits on an
+Event until the earliest deadline instead of fixed sleeps, and independent
+heads run side by side on a small thread pool. A head that is still running
+when its next deadline arrives is skipped for that slot rather than stacked.
+
+Also provides AuditorQueue: asynchronous Auditor sign-off so revenue capture
+never blocks a head.
+"""
+
+import time
+import heapq
+import random
+import threading
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any
+
+
+@dataclass
+class HeadSpec:
+    """One independent head of the Hydra"""
+    name: str
+    fn: Callable[[], Any]
+    interval: float          # seconds between deadlines
+    jitter: float = 0.0      # +/- seconds added to each deadline
+    runs: int = 0
+    busy_s: float = 0.0
+    errors: int = 0
+    running: bool = field(default=False, repr=False)
+
+
+class HeadScheduler:
+    def __init__(self, heads: List[HeadSpec], max_workers: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.heads = {h.name: h for h in heads}
+        self.clock = clock
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or len(heads),
+                                       thread_name_prefix="hydra-head")
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._active = 0
+        self._idle_since: Optional[float] = None
+        self.idle_s = 0.0
+        self.started_at: Optional[float] = None
+
+    # --- Deadlines ---
+    def _next_deadline(self, head: HeadSpec, previous: float) -> float:
+        jitter = random.uniform(-head.jitter, head.jitter) if head.jitter else 0.0
+        deadline = previous + head.interval + jitter
+        now = self.clock()
+        if deadline < now:
+            # Fell behind (long run or suspend): skip missed slots instead of bursting
+            missed = int((now - deadline) // head.interval) + 1
+            deadline += missed * head.interval
+        return deadline
+
+    # --- Execution ---
+    def _run_head(self, head: HeadSpec):
+        start = self.clock()
+        try:
+            head.fn()
+        except Exception as e:
+            head.errors += 1
+            logging.error(f"HEAD {head.name} FAILED: {e}")
+        finally:
+            with self._lock:
+                head.busy_s += self.clock() - start
+                head.runs += 1
+                head.running = False
+                self._active -= 1
+                if self._active == 0:
+                    self._idle_since = self.clock()
+            self._wake.set()
+
+    def _dispatch(self, head: HeadSpec) -> bool:
+        with self._lock:
+            if head.running:
+                return False
+            head.running = True
+            if self._active == 0 and self._idle_since is not None:
+                self.idle_s += self.clock() - self._idle_since
+                self._idle_since = None
+            self._active += 1
+        self.pool.submit(self._run_head, head)
+        return True
+
+    @property
+    def cycles(self) -> int:
+        """Completed cycles = rounds in which every head has run at least once"""
+        return min(h.runs for h in self.heads.values()) if self.heads else 0
+
+    def run(self, cycles: Optional[int] = None, duration: Optional[float] = None,
+            on_cycle: Optional[Callable[[int], None]] = None):
+        """
+        Runs until `cycles` full rounds, `duration` seconds, or stop().
+        All heads are due immediately on start.
+        """
+        self.started_at = self.clock()
+        self._idle_since = self.started_at
+        queue = [(self.started_at, name) for name in self.heads]
+        heapq.heapify(queue)
+        reported = 0
+
+        while not self._stop.is_set():
+            if cycles is not None and self.cycles >= cycles:
+                break
+            if duration is not None and self.clock() - self.started_at >= duration:
+                break
+
+            if self.cycles > reported:
+                reported = self.cycles
+                if on_cycle:
+                    on_cycle(reported)
+
+            deadline, name = queue[0]
+            wait = deadline - self.clock()
+            if duration is not None:
+                wait = min(wait, self.started_at + duration - self.clock())
+            if wait > 0:
+                # Woken early by head completion so cycle/stop checks stay responsive
+                self._wake.wait(wait)
+                self._wake.clear()
+                continue
+
+            heapq.heappop(queue)
+            head = self.heads[name]
+            if cycles is None or head.runs < cycles:
+                self._dispatch(head)
+            heapq.heappush(queue, (self._next_deadline(head, deadline), name))
+
+        self.pool.shutdown(wait=True)
+        if self._idle_since is not None:
+            self.idle_s += self.clock() - self._idle_since
+            self._idle_since = None
+        return self.report()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = max(self.clock() - (self.started_at or self.clock()), 1e-9)
+        cycles = self.cycles
+        return {
+            "elapsed_s": elapsed,
+            "cycles": cycles,
+            "cycles_per_hour": cycles / elapsed * 3600,
+            "idle_s": self.idle_s,
+            "idle_per_cycle_s": self.idle_s / cycles if cycles else self.idle_s,
+            "heads": {
+                h.name: {"runs": h.runs, "busy_s": round(h.busy_s, 4), "errors": h.errors}
+                for h in self.heads.values()
+            },
+        }
+
+
+class AuditorQueue:
+    """
+    Asynchronous Auditor sign-off.
+    submit() returns immediately; the acknowledgement callback fires from the
+    auditor thread once verification completes.
+    """
+    def __init__(self, verify: Callable[[Dict], bool], review_time: float = 0.0):
+        self.verify = verify
+        self.review_time = review_time
+        self._queue: List = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self.pending = 0
+        self.acknowledged = 0
+        self.rejected = 0
+        self._thread = threading.Thread(target=self._worker, name="hydra-auditor", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, entry: Dict, on_ack: Callable[[Dict], None]):
+        with self._cond:
+            if self._closed:
+                # Nothing would ever sign it off, and drain() would wait forever
+                raise RuntimeError("AuditorQueue is closed")
+            self._queue.append((entry, on_ack))
+            self.pending += 1
+            self._cond.notify()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                entry, on_ack = self._queue.pop(0)
+            if self.review_time:
+                time.sleep(self.review_time)
+            approved = self.verify(entry)
+            with self._cond:
+                self.pending -= 1
+                if approved:
+                    self.acknowledged += 1
+                else:
+                    self.rejected += 1
+                self._cond.notify_all()
+            if approved:
+                on_ack(entry)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every submitted entry has been signed off"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.pending == 0, timeout)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
@@ -14,11 +14,15 @@ import time
 import random
 import json
 import logging
+import threading
 from datetime import datetime
 
 # Add parent to path to find config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
+from Brain.head_scheduler import HeadScheduler, HeadSpec, AuditorQueue
+from Brain.revenue_ledger import RevenueLedger
+from System.Intelligence.feed_engine import FeedEngine, FeedSource
 
 try:
     import feedparser
@@ -28,7 +32,18 @@ except ImportError:
 
 # --- CONFIGURATION ---
 LOG_FILE = os.path.join(config.BASE_DIR, "Logs", "monolith.log")
-REVENUE_LOG = os.path.join(config.BASE_DIR, "Logs", "revenue.json")
+REVENUE_LOG = os.path.join(config.BASE_DIR, "Logs", "revenue.json")  # Legacy; migrated on startup
+REVENUE_DIR = os.path.join(config.BASE_DIR, "Logs", "Revenue")
+
+# Per-head schedule: (interval seconds, jitter seconds)
+HEAD_SCHEDULE = {
+    "FREELANCE_ARBITRAGE": (10, 2),
+    "CONTENT_FACTORY": (10, 2),
+    "CRYPTO_TREASURY": (5, 1),
+    "IP_ARBITRAGE": (10, 3),
+}
+AUDITOR_THRESHOLD = 50.00   # Revenue above this needs Auditor sign-off
+AUDITOR_REVIEW_TIME = 1.0   # Simulated review latency (seconds)
 
 # Ensure logs dir exists
 os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
@@ -46,10 +61,17 @@ class HydraEngine:
     Four heads that hunt independently.
     """
     
-    def __init__(self):
+    def __init__(self, time_scale=1.0):
         self.vectors = ["FREELANCE_ARBITRAGE", "CONTENT_FACTORY", "CRYPTO_TREASURY", "IP_ARBITRAGE"]
         self.daily_revenue = 0.00
         self.session_start = datetime.now()
+        self.time_scale = time_scale  # <1.0 compresses every wait (benchmarks)
+        self.idle_s = 0.0
+        self._revenue_lock = threading.Lock()
+        self.async_audit = True
+        self.feeds = FeedEngine()
+        self.ledger = RevenueLedger(root=REVENUE_DIR, legacy_file=REVENUE_LOG)
+        self.auditor = self._new_auditor()
         
         print("🐙 HYDRA ENGINE: INITIALIZING...")
         print(f"   Active Vectors: {len(self.vectors)}")
@@ -58,27 +80,50 @@ class HydraEngine:
         
         logging.info("HYDRA ENGINE: ONLINE")
 
+    def _new_auditor(self):
+        return AuditorQueue(self._auditor_verify, review_time=AUDITOR_REVIEW_TIME * self.time_scale)
+
+    def _open_auditor(self):
+        """shutdown() closes the Auditor; the next hunt or capture gets a fresh one"""
+        if self.auditor.closed:
+            self.auditor = self._new_auditor()
+        return self.auditor
+
+    def _sleep(self, seconds):
+        """Instrumented sleep for the sequential loop (counts as idle time)"""
+        scaled = seconds * self.time_scale
+        self.idle_s += scaled
+        time.sleep(scaled)
+
+    def _auditor_verify(self, entry):
+        print(f"⚖️ AUDITOR: Logic confirmed. Sign-off complete (${entry['amount']:.2f} via {entry['source']}).")
+        return entry["amount"] > 0
+
     def log_revenue(self, source, amount):
         """Record revenue capture with Auditor sign-off (Immortal v4.1)"""
-        if amount > 50:
+        entry = {"source": source, "amount": amount}
+        if amount > AUDITOR_THRESHOLD:
             print(f"⚖️ AUDITOR: Verifying transaction of ${amount:.2f}...")
-            time.sleep(1) # Simulation
-            print(f"⚖️ AUDITOR: Logic confirmed. Sign-off complete.")
-            
-        self.daily_revenue += amount
+            if self.async_audit:
+                # Head keeps hunting; revenue is committed when the Auditor acknowledges
+                self._open_auditor().submit(entry, self._commit_revenue)
+                return
+            self._sleep(AUDITOR_REVIEW_TIME)
+            if not self._auditor_verify(entry):
+                return
+        self._commit_revenue(entry)
+
+    def _commit_revenue(self, entry):
+        source, amount = entry["source"], entry["amount"]
+        with self._revenue_lock:
+            self.daily_revenue += amount
+            total = self.daily_revenue
         msg = f"💰 REVENUE CAPTURED: ${amount:.2f} via {source}"
         print(msg)
         logging.info(msg)
         
         try:
-            with open(REVENUE_LOG, "a") as f:
-                json.dump({
-                    "timestamp": datetime.now().isoformat(),
-                    "source": source,
-                    "amount": amount,
-                    "total_session": self.daily_revenue
-                }, f)
-                f.write("\n")
+            self.ledger.append(source, amount, total_session=total)
         except Exception as e:
             logging.error(f"Failed to write revenue log: {e}")
 
@@ -92,11 +137,19 @@ class HydraEngine:
             try:
                 # Upwork RSS Feed for Python Jobs
                 url = "https://www.upwork.com/ab/feed/jobs/rss?q=python&sort=recency"
-                feed = feedparser.parse(url)
+                result = self.feeds.fetch_all([FeedSource(
+                    name="upwork.python",
+                    url=url,
+                    parse=lambda body: feedparser.parse(body).entries,
+                    key=lambda entry: entry.get("id") or entry.get("link", "")
+                )])["upwork.python"]
+                if result.error:
+                    raise RuntimeError(result.error)
+                entries = result.items
                 
-                if feed.entries:
-                    print(f"   📡 LIVE FEED: Found {len(feed.entries)} new listings.")
-                    for entry in feed.entries[:3]:
+                if entries:
+                    print(f"   📡 LIVE FEED: Found {len(entries)} new listings.")
+                    for entry in entries[:3]:
                         title = entry.title
                         link = entry.link
                         # Simple keyword arbitrage logic
@@ -193,59 +246,117 @@ class HydraEngine:
             print("   ⏸️ No assets found.")
 
     # --- THE HUNT LOOP ---
-    def hunt(self, cycles=None):
+    def build_scheduler(self):
+        heads = {
+            "FREELANCE_ARBITRAGE": self.scan_freelance_gaps,
+            "CONTENT_FACTORY": self.generate_asset,
+            "CRYPTO_TREASURY": self.check_yields,
+            "IP_ARBITRAGE": self.scan_ip_assets,
+        }
+        return HeadScheduler([
+            HeadSpec(name, fn, HEAD_SCHEDULE[name][0] * self.time_scale, HEAD_SCHEDULE[name][1] * self.time_scale)
+            for name, fn in heads.items()
+        ])
+
+    def _print_summary(self, cycle_count):
+        runtime = (datetime.now() - self.session_start).total_seconds()
+        print(f"\n{'='*60}")
+        print(f"HUNT CYCLE #{cycle_count} COMPLETE")
+        print(f"💵 SESSION REVENUE: ${self.daily_revenue:.2f}")
+        print(f"⏱️ RUNTIME: {runtime:.0f}s ({runtime/60:.1f}m)")
+        print(f"{'='*60}\n")
+
+    def hunt(self, cycles=None, duration=None):
         """
-        Main hunting loop.
+        Main hunting loop. Heads run concurrently on their own deadlines.
         Args:
-            cycles: Number of hunt cycles (None = infinite)
+            cycles: Number of hunt cycles, i.e. rounds where every head ran (None = infinite)
+            duration: Optional wall-clock limit in seconds
         """
         print("\n⚔️ HYDRA: STARTING HUNT CYCLE")
         print(f"   Mode: {'Infinite' if cycles is None else f'{cycles} cycles'}")
         print("")
         
-        cycle_count = 0
-        
+        self._open_auditor()
+        self.scheduler = self.build_scheduler()
+        report = None
         try:
-            while True:
-                cycle_count += 1
-                print(f"\n{'='*60}")
-                print(f"HUNT CYCLE #{cycle_count}")
-                print(f"{'='*60}\n")
-                
-                # 1. Scan for Work
-                self.scan_freelance_gaps()
-                time.sleep(2)
-                
-                # 2. Create Value
-                self.generate_asset()
-                time.sleep(2)
-                
-                # 3. Check Money
-                self.check_yields()
-                time.sleep(2)
-                
-                # 4. IP Scan
-                self.scan_ip_assets()
-                
-                # Session summary
-                runtime = (datetime.now() - self.session_start).total_seconds()
-                print(f"\n💵 SESSION REVENUE: ${self.daily_revenue:.2f}")
-                print(f"⏱️ RUNTIME: {runtime:.0f}s ({runtime/60:.1f}m)")
-                
-                # Check if we hit cycle limit
-                if cycles and cycle_count >= cycles:
-                    print(f"\n✅ COMPLETED {cycles} HUNT CYCLES")
-                    break
-                
-                # Sleep before next cycle
-                sleep_duration = 10
-                print(f"💤 Sleeping for {sleep_duration}s...")
-                time.sleep(sleep_duration)
-                
+            report = self.scheduler.run(cycles=cycles, duration=duration, on_cycle=self._print_summary)
+            self.auditor.drain()
+            self.ledger.flush()
+            if cycles:
+                print(f"\n✅ COMPLETED {report['cycles']} HUNT CYCLES")
         except KeyboardInterrupt:
+            self.shutdown()
+            report = self.scheduler.report()
             print("\n🛑 HYDRA: HUNTING PAUSED BY COMMANDER")
             print(f"   Total Revenue: ${self.daily_revenue:.2f}")
-            print(f"   Cycles Completed: {cycle_count}")
+            print(f"   Cycles Completed: {report['cycles']}")
+        return report
+
+    def shutdown(self):
+        """Lets running heads finish, then commits every entry still awaiting Auditor sign-off"""
+        scheduler = getattr(self, "scheduler", None)
+        if scheduler:
+            scheduler.stop()
+            scheduler.pool.shutdown(wait=True)
+        pending = self.auditor.pending
+        if pending:
+            print(f"   ⚖️ AUDITOR: Signing off {pending} pending entries before exit...")
+        self.auditor.drain()
+        self.auditor.close()
+        self.ledger.flush()
+
+    def hunt_sequential(self, cycles):
+        """Original one-head-at-a-time loop with fixed sleeps (kept for benchmarking)"""
+        self.async_audit = False
+        self.idle_s = 0.0
+        start = time.monotonic()
+        for cycle_count in range(1, cycles + 1):
+            self.scan_freelance_gaps()
+            self._sleep(2)
+            self.generate_asset()
+            self._sleep(2)
+            self.check_yields()
+            self._sleep(2)
+            self.scan_ip_assets()
+            if cycle_count < cycles:
+                self._sleep(10)
+        elapsed = time.monotonic() - start
+        self.async_audit = True
+        return {
+            "elapsed_s": elapsed,
+            "cycles": cycles,
+            "cycles_per_hour": cycles / elapsed * 3600,
+            "idle_s": self.idle_s,
+            "idle_per_cycle_s": self.idle_s / cycles,
+        }
+
+def benchmark(cycles=20, time_scale=0.01):
+    """Cycles/hour and idle time per cycle: sequential loop vs head scheduler"""
+    import io
+    import contextlib
+
+    results = {}
+    for label in ("sequential", "scheduler"):
+        engine = HydraEngine(time_scale=time_scale)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if label == "sequential":
+                report = engine.hunt_sequential(cycles)
+            else:
+                report = engine.hunt(cycles=cycles)
+        engine.shutdown()
+        engine.ledger.close()
+        # Undo the time compression so numbers read as real seconds
+        results[label] = {
+            "cycles_per_hour": report["cycles_per_hour"] * time_scale,
+            "idle_per_cycle_s": report["idle_per_cycle_s"] / time_scale,
+        }
+
+    print(f"\n{'Loop':<12} {'Cycles/hour':>12} {'Idle/cycle (s)':>16}")
+    for label, r in results.items():
+        print(f"{label:<12} {r['cycles_per_hour']:>12.0f} {r['idle_per_cycle_s']:>16.2f}")
+    return results
 
 if __name__ == "__main__":
     print("""
@@ -255,6 +366,10 @@ if __name__ == "__main__":
     ╚══════════════════════════════════════════════════════════╝
     """)
     
+    if "--benchmark" in sys.argv:
+        benchmark()
+        sys.exit(0)
+
     engine = HydraEngine()
     
     # Start hunting
@@ -0,0 +1,330 @@
+"""
+ORGAN: REVENUE LEDGER v1.0
+PURPOSE: Append-only revenue event store for the Hydra
+INTEGRATION: Brain Layer (replaces Logs/revenue.json)
+
+Layout (Logs/Revenue/):
+    events/YYYY-MM-DD.jsonl   one JSON record per line, append-only
+    rollups/YYYY-MM-DD.json   per-day totals by head and source
+    index.json                compact index: head/source -> days, total, count
+
+Appending an entry writes and flushes one line to the open day file (fsync
+optional), so a recorded event survives a crash. Rollups and the index are
+updated in memory and saved every `flush_every` entries, on day change and on
+close. Write cost per entry is therefore constant no matter how much history
+exists. The index records how many bytes of each day file it has counted;
+on start, anything written after the last save is absorbed (one stat per day
+file), so totals never drift after a crash.
+"""
+
+import os
+import json
+import time
+import shutil
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator
+
+
+def _empty_rollup(day: str) -> Dict[str, Any]:
+    return {"day": day, "total": 0.0, "count": 0, "by_head": {}, "by_source": {}}
+
+
+class RevenueLedger:
+    def __init__(self, root: Optional[Path] = None, legacy_file: Optional[Path] = None,
+                 flush_every: int = 100, fsync: bool = False):
+        base = Path(__file__).parent.parent / "Logs"
+        self.root = Path(root) if root else base / "Revenue"
+        self.events_dir = self.root / "events"
+        self.rollups_dir = self.root / "rollups"
+        self.index_file = self.root / "index.json"
+        self.events_dir.mkdir(parents=True, exist_ok=True)
+        self.rollups_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._day: Optional[str] = None
+        self._handle = None
+        self._rollup: Optional[Dict[str, Any]] = None
+        self._dirty = 0
+        self.index = self._load_index()
+        self._reconcile()
+
+        legacy = Path(legacy_file) if legacy_file else base / "revenue.json"
+        if legacy.exists():
+            self.migrate(legacy)
+
+    # --- Index ---
+    def _load_index(self) -> Dict[str, Any]:
+        if self.index_file.exists():
+            try:
+                return json.loads(self.index_file.read_text())
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {"heads": {}, "sources": {}, "days": [], "offsets": {}}
+
+    def _absorb(self, day: str, record: Dict[str, Any]):
+        self._index_add(self.index["heads"], record["head"], day, record["amount"])
+        self._index_add(self.index["sources"], record["source"], day, record["amount"])
+        if day not in self.index["days"]:
+            self.index["days"].append(day)
+            self.index["days"].sort()
+
+    def _reconcile(self):
+        """Counts event lines written after the index was last saved; drops a torn final line"""
+        files = sorted(self.events_dir.glob("*.jsonl"))
+        if "offsets" not in self.index:
+            # Index from before offsets were recorded: trust it up to the current file sizes
+            self.index["offsets"] = {path.stem: path.stat().st_size for path in files}
+        offsets = self.index["offsets"]
+        changed = False
+        if any(path.stat().st_size < offsets.get(path.stem, 0) for path in files):
+            # A day file shrank (edited by hand?): recount everything
+            self.index = {"heads": {}, "sources": {}, "days": [], "offsets": {}}
+            offsets = self.index["offsets"]
+            changed = True
+        for path in files:
+            day, done = path.stem, offsets.get(path.stem, 0)
+            if path.stat().st_size == done:
+                continue
+            with open(path, "rb+") as f:
+                f.seek(done)
+                tail = f.read()
+                complete = tail[:tail.rfind(b"\n") + 1]
+                if len(complete) < len(tail):
+                    f.truncate(done + len(complete))   # Unacknowledged partial write
+            for line in complete.splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if "amount" in record and "head" in record:
+                    record.setdefault("source", record["head"])
+                    self._absorb(day, record)
+            offsets[day] = done + len(complete)
+            self._write_json(self._rollup_file(day), self._rebuild_rollup(day))
+            changed = True
+        if changed:
+            self._write_json(self.index_file, self.index)
+
+    @staticmethod
+    def _index_add(bucket: Dict[str, Any], key: str, day: str, amount: float):
+        entry = bucket.setdefault(key, {"total": 0.0, "count": 0, "days": []})
+        entry["total"] += amount
+        entry["count"] += 1
+        if not entry["days"] or entry["days"][-1] != day:
+            if day not in entry["days"]:
+                entry["days"].append(day)
+                entry["days"].sort()
+
+    def _write_json(self, path: Path, data: Dict[str, Any]):
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+
+    # --- Day files ---
+    def _rollup_file(self, day: str) -> Path:
+        return self.rollups_dir / f"{day}.json"
+
+    def _event_file(self, day: str) -> Path:
+        return self.events_dir / f"{day}.jsonl"
+
+    def _rebuild_rollup(self, day: str) -> Dict[str, Any]:
+        rollup = _empty_rollup(day)
+        for record in self._read_day(day):
+            self._rollup_add(rollup, record)
+        return rollup
+
+    @staticmethod
+    def _rollup_add(rollup: Dict[str, Any], record: Dict[str, Any]):
+        amount = record["amount"]
+        rollup["total"] += amount
+        rollup["count"] += 1
+        for key, field in (("by_head", "head"), ("by_source", "source")):
+            bucket = rollup[key].setdefault(record[field], {"total": 0.0, "count": 0})
+            bucket["total"] += amount
+            bucket["count"] += 1
+
+    def _open_day(self, day: str):
+        self._flush_locked()
+        if self._handle:
+            self._handle.close()
+        self._day = day
+        self._handle = open(self._event_file(day), "a", encoding="utf-8", newline="\n")
+        self._rollup = self._rebuild_rollup(day)
+        self.index["offsets"].setdefault(day, 0)
+        if day not in self.index["days"]:
+            self.index["days"].append(day)
+            self.index["days"].sort()
+
+    def _flush_locked(self):
+        if self._rollup is None or self._dirty == 0:
+            return
+        self._write_json(self._rollup_file(self._day), self._rollup)
+        self._write_json(self.index_file, self.index)
+        self._dirty = 0
+
+    # --- Public API ---
+    def append(self, head: str, amount: float, source: Optional[str] = None,
+               timestamp: Optional[str] = None, **extra) -> Dict[str, Any]:
+        """Appends one revenue event (durable on return); O(1) regardless of history size"""
+        record = {
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "head": head,
+            "source": source or head,
+            "amount": float(amount),
+            **extra
+        }
+        day = record["timestamp"][:10]
+        with self._lock:
+            if day != self._day:
+                self._open_day(day)
+            line = json.dumps(record) + "\n"
+            self._handle.write(line)
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+            self._rollup_add(self._rollup, record)
+            self._absorb(day, record)
+            self.index["offsets"][day] += len(line.encode("utf-8"))
+            self._dirty += 1
+            if self._dirty >= self.flush_every:
+                self._flush_locked()
+        return record
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            if self._handle:
+                self._handle.close()
+                self._handle = None
+            self._day = None
+
+    def _read_day(self, day: str) -> Iterator[Dict[str, Any]]:
+        path = self._event_file(day)
+        if not path.exists():
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn final line after a crash
+
+    def rollup(self, day: str) -> Dict[str, Any]:
+        """Per-day totals; the open day is served from memory"""
+        with self._lock:
+            if day == self._day and self._rollup is not None:
+                return json.loads(json.dumps(self._rollup))
+        path = self._rollup_file(day)
+        if path.exists():
+            return json.loads(path.read_text())
+        return self._rebuild_rollup(day)
+
+    def events(self, head: Optional[str] = None, source: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterates events, touching only the day files the index lists for head/source"""
+        self.flush()
+        if head:
+            days = self.index["heads"].get(head, {}).get("days", [])
+        elif source:
+            days = self.index["sources"].get(source, {}).get("days", [])
+        else:
+            days = self.index["days"]
+        for day in days:
+            for record in self._read_day(day):
+                if head and record.get("head") != head:
+                    continue
+                if source and record.get("source") != source:
+                    continue
+                yield record
+
+    def total(self, head: Optional[str] = None) -> float:
+        if head:
+            return self.index["heads"].get(head, {}).get("total", 0.0)
+        return sum(h["total"] for h in self.index["heads"].values())
+
+    # --- Migration ---
+    def migrate(self, legacy: Path) -> int:
+        """
+        Imports Logs/revenue.json (a JSON array or the JSON-lines file older
+        Hydra builds appended to) and moves it aside as revenue.json.migrated.
+        Safe to re-run after a crash: records already imported are skipped.
+        """
+        text = legacy.read_text(encoding="utf-8").strip()
+        records = []
+        if text.startswith("["):
+            try:
+                records = json.loads(text)
+            except json.JSONDecodeError:
+                records = []
+        else:
+            for line in text.splitlines():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+        # Entries without a timestamp get the file's mtime, so a re-run sees the same key
+        fallback = datetime.fromtimestamp(legacy.stat().st_mtime).isoformat()
+        entries = []
+        for r in records:
+            if "amount" not in r:
+                continue
+            head = r.get("head") or r.get("source", "UNKNOWN")
+            entries.append((r.get("timestamp") or fallback, head, r.get("source") or head, float(r["amount"])))
+        entries.sort(key=lambda e: e[0])
+
+        imported = Counter()
+        for day in sorted({e[0][:10] for e in entries}):
+            for record in self._read_day(day):
+                if record.get("migrated"):
+                    imported[(record["timestamp"], record["head"], record["source"], record["amount"])] += 1
+
+        added = 0
+        for timestamp, head, source, amount in entries:
+            key = (timestamp, head, source, amount)
+            if imported[key]:
+                imported[key] -= 1
+                continue
+            self.append(head, amount, source=source, timestamp=timestamp, migrated=True)
+            added += 1
+        self.flush()
+        shutil.move(str(legacy), str(legacy) + ".migrated")
+        print(f"📦 REVENUE LEDGER: Migrated {added} entries from {legacy.name}")
+        return added
+
+def benchmark(total=1_000_000, checkpoints=(1_000, 10_000, 100_000, 1_000_000)):
+    """Per-entry append cost as history grows (should stay flat)"""
+    import tempfile
+
+    root = Path(tempfile.mkdtemp(prefix="revenue_ledger_"))
+    ledger = RevenueLedger(root=root, legacy_file=root / "none.json")
+    heads = ["FREELANCE_ARBITRAGE", "CONTENT_FACTORY", "CRYPTO_TREASURY", "IP_ARBITRAGE"]
+    window = 1000
+    start = time.perf_counter()
+
+    print(f"\n{'Entries':>10} {'us/entry (last 1k)':>20}")
+    for i in range(1, total + 1):
+        if i % window == 1:
+            start = time.perf_counter()
+        ledger.append(heads[i % 4], 1.0, timestamp=f"2026-01-{1 + (i * 31) // (total + 1):02d}T00:00:00")
+        if i in checkpoints:
+            per_entry = (time.perf_counter() - start) / window * 1e6
+            print(f"{i:>10,} {per_entry:>20.1f}")
+    ledger.close()
+    shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
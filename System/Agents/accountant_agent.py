@@ -65,6 +65,12 @@ class CanaTaxEngine:
         
         return max(0, fed_tax + prov_tax - credits)
 
+    @staticmethod
+    def calculate_tax_batch(incomes):
+        """Vectorized calculate_tax over many incomes (identical results)"""
+        from System.Finance.batch_tax import BatchTaxEngine
+        return BatchTaxEngine().calculate_tax(incomes)
+
 class SlipScraper:
     """
     Interface for Bank/CRA Slip Extraction
@@ -2,13 +2,19 @@
 BACKUP AGENT (v5.0) - Data Protection & Recovery
 Best-in-World: Automated Snapshots, Integrity Verification, M-DISC Queue
 """
+import sys
 import json
+import time
 import shutil
-import hashlib
 import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.chunk_store import ChunkStore
+from System.Core.manifest_engine import ManifestEngine, StatCache, hash_file
+
 
 class BackupAgent:
     """
@@ -17,6 +23,13 @@ class BackupAgent:
     - Verifies backup integrity (SHA256)
     - Queues critical files for M-DISC archival
     - Manages disaster recovery
+    
+    Snapshots are manifests in a content-addressed chunk store
+    (.snapshots/store); unchanged files and repeated content cost nothing.
+    Legacy full-copy snapshot_* directories are still verified and aged out.
+    
+    Change detection goes through a stat cache + Merkle-root manifest engine:
+    if the live tree's root equals the latest snapshot's, no snapshot is taken.
     """
     
     def __init__(self):
@@ -28,6 +41,8 @@ class BackupAgent:
         self.sentinel_dir.mkdir(exist_ok=True)
         self.backup_dir.mkdir(exist_ok=True)
         self.snapshots_dir.mkdir(exist_ok=True)
+        self.store = ChunkStore(self.snapshots_dir / "store")
+        self.manifests = ManifestEngine(StatCache(self.snapshots_dir / "stat_cache.json"))
         
         # Critical paths to backup
         self.critical_paths = [
@@ -38,16 +53,12 @@ class BackupAgent:
         
     def _compute_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of a file"""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return hash_file(file_path)
     
     def check_backup_status(self):
         """Check current backup inventory"""
         backups = list(self.backup_dir.glob("*.zip")) + list(self.backup_dir.glob("*.7z"))
-        snapshots = list(self.snapshots_dir.iterdir()) if self.snapshots_dir.exists() else []
+        snapshots = self._legacy_snapshots() + self.store.list_snapshots()
         
         latest = None
         if backups:
@@ -66,8 +77,45 @@ class BackupAgent:
         mtime = datetime.fromtimestamp(path.stat().st_mtime)
         return (datetime.now() - mtime).total_seconds() / 3600
     
+    def _legacy_snapshots(self) -> list:
+        """Full-copy snapshot directories from before the chunk store"""
+        return sorted(p for p in self.snapshots_dir.glob("snapshot_*") if p.is_dir())
+    
     def create_snapshot(self) -> dict:
-        """Create a quick snapshot of critical data"""
+        """Create a deduplicated snapshot of critical data (manifest of chunk references)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        snapshot_name = f"snapshot_{timestamp}"
+        
+        try:
+            latest = self.store.latest_manifest()
+            live = self.manifests.build(self.critical_paths)
+            self.manifests.cache.save()
+            if latest and latest.get("root") == live["root"]:
+                return {
+                    "success": True,
+                    "name": latest["name"],
+                    "skipped": True,
+                    "files": len(live["files"]),
+                    "unchanged_files": len(live["files"]),
+                    "new_chunks": 0,
+                    "bytes_written": 0
+                }
+            
+            manifest = self.store.snapshot(snapshot_name, self.critical_paths, previous=latest)
+            stats = manifest["stats"]
+            return {
+                "success": True,
+                "name": snapshot_name,
+                "files": stats["files"],
+                "unchanged_files": stats["reused"],
+                "new_chunks": stats["new_chunks"],
+                "bytes_written": stats["written"]
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def create_full_copy_snapshot(self) -> dict:
+        """Legacy full copy of critical data (kept for benchmarks and manual use)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         snapshot_name = f"snapshot_{timestamp}"
         snapshot_path = self.snapshots_dir / snapshot_name
@@ -87,10 +135,8 @@ class BackupAgent:
                         files_copied += 1
             
             # Create manifest with hashes
-            manifest = {}
-            for f in snapshot_path.rglob("*"):
-                if f.is_file():
-                    manifest[str(f.relative_to(snapshot_path))] = self._compute_hash(f)
+            built = self.manifests.build(sorted(snapshot_path.iterdir()), use_cache=False)
+            manifest = {rel: entry["sha256"] for rel, entry in built["files"].items()}
             
             with open(snapshot_path / "manifest.json", 'w') as mf:
                 json.dump(manifest, mf, indent=2)
@@ -100,23 +146,45 @@ class BackupAgent:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    def verify_integrity(self, backup_path: Path) -> dict:
+    def check_drift(self) -> dict:
+        """What changed in the critical paths since the latest snapshot (Merkle diff, unchanged dirs skipped)"""
+        latest = self.store.latest_manifest()
+        live = self.manifests.build(self.critical_paths)
+        self.manifests.cache.save()
+        if not latest:
+            return {"snapshot": None, "changed": [], "added": sorted(live["files"]), "removed": []}
+        diff = self.manifests.diff(latest, live)
+        diff["snapshot"] = latest["name"]
+        return diff
+    
+    def restore_snapshot(self, name: str, dest: Path = None) -> dict:
+        """Restore a chunk-store snapshot (default: into Backups/restore/<name>)"""
+        dest = Path(dest) if dest else self.backup_dir / "restore" / name
+        return self.store.restore(name, dest)
+    
+    def verify_integrity(self, backup_path) -> dict:
         """Verify backup integrity using manifest"""
+        if isinstance(backup_path, str) and backup_path in self.store.list_snapshots():
+            return self.store.verify(backup_path)
+        
+        backup_path = Path(backup_path)
         manifest_path = backup_path / "manifest.json" if backup_path.is_dir() else None
         
         if manifest_path and manifest_path.exists():
             with open(manifest_path, 'r') as f:
                 manifest = json.load(f)
             
+            # Deep re-hash (silent corruption keeps size/mtime), parallel across files
+            expected = {rel.replace("\\", "/"): {"sha256": sha} for rel, sha in manifest.items()}
+            sources = [p for p in backup_path.iterdir() if p.name != "manifest.json"]
+            current = self.manifests.build(sources, use_cache=False)["files"]
+            
             corrupted = []
-            for rel_path, expected_hash in manifest.items():
-                file_path = backup_path / rel_path
-                if file_path.exists():
-                    actual_hash = self._compute_hash(file_path)
-                    if actual_hash != expected_hash:
-                        corrupted.append(rel_path)
-                else:
+            for rel_path, entry in expected.items():
+                if rel_path not in current:
                     corrupted.append(f"{rel_path} (MISSING)")
+                elif current[rel_path]["sha256"] != entry["sha256"]:
+                    corrupted.append(rel_path)
             
             return {
                 "verified": len(corrupted) == 0,
@@ -148,17 +216,26 @@ class BackupAgent:
         return len(queue)
     
     def cleanup_old_snapshots(self, max_age_days: int = 7):
-        """Remove snapshots older than max_age_days"""
+        """Remove snapshots older than max_age_days, then garbage-collect orphaned chunks"""
         cutoff = datetime.now() - timedelta(days=max_age_days)
         removed = 0
         
-        for snapshot in self.snapshots_dir.iterdir():
-            if snapshot.is_dir():
-                mtime = datetime.fromtimestamp(snapshot.stat().st_mtime)
-                if mtime < cutoff:
-                    shutil.rmtree(snapshot)
-                    removed += 1
+        for snapshot in self._legacy_snapshots():
+            mtime = datetime.fromtimestamp(snapshot.stat().st_mtime)
+            if mtime < cutoff:
+                shutil.rmtree(snapshot)
+                removed += 1
+        
+        # Always keep the newest chunk snapshot so the next one can reuse it
+        names = self.store.list_snapshots()
+        for name in names[:-1]:
+            created = datetime.fromtimestamp(self.store.manifest_path(name).stat().st_mtime)
+            if created < cutoff:
+                self.store.delete_snapshot(name)
+                removed += 1
         
+        if removed:
+            self.store.gc()
         return removed
     
     def run(self):
@@ -172,14 +249,18 @@ class BackupAgent:
         if status["latest_age_hours"] is None or status["latest_age_hours"] > 24:
             print("[BACKUP] Creating new snapshot (no recent backup found)...")
             snapshot_result = self.create_snapshot()
-            if snapshot_result["success"]:
+            if snapshot_result["success"] and snapshot_result.get("skipped"):
+                print(f"[BACKUP] No changes since {snapshot_result['name']} (Merkle root unchanged)")
+            elif snapshot_result["success"]:
                 print(f"[BACKUP] ✅ Snapshot created: {snapshot_result['name']} ({snapshot_result['files']} files)")
                 status = self.check_backup_status()  # Refresh status
         
         # 3. Verify latest snapshot integrity
         integrity = {"verified": False}
-        if status["snapshot_count"] > 0:
-            latest_snapshot = max(self.snapshots_dir.iterdir(), key=lambda x: x.stat().st_mtime)
+        if self.store.list_snapshots():
+            integrity = self.verify_integrity(self.store.list_snapshots()[-1])
+        elif status["snapshot_count"] > 0:
+            latest_snapshot = max(self._legacy_snapshots(), key=lambda x: x.stat().st_mtime)
             integrity = self.verify_integrity(latest_snapshot)
         
         # 4. Cleanup old snapshots
@@ -212,5 +293,85 @@ class BackupAgent:
         print(f"[BACKUP] Status: {overall_status} | {status['snapshot_count']} snapshots, {status['count']} archives")
 
 
+def _disk_bytes(root: Path) -> int:
+    """Allocated bytes (what `du` reports), not apparent size"""
+    return sum(p.stat().st_blocks * 512 for p in Path(root).rglob("*") if p.is_file())
+
+
+def benchmark():
+    """Full-copy snapshots vs the chunk store: dedup ratio, snapshot time, disk usage, restore"""
+    import tempfile
+    
+    root = Path(__file__).parent.parent.parent
+    legacy = sorted(p for p in (root / ".snapshots").glob("snapshot_*") if p.is_dir())
+    tmp = Path(tempfile.mkdtemp(prefix="chunk_store_"))
+    
+    # 1. Re-store the repository's existing full-copy snapshots
+    store = ChunkStore(tmp / "history")
+    logical = sum(p.stat().st_size for d in legacy for p in d.rglob("*") if p.is_file() and p.name != "manifest.json")
+    legacy_disk = sum(_disk_bytes(d) for d in legacy)
+    start = time.perf_counter()
+    for d in legacy:
+        store.snapshot(d.name, sorted(p for p in d.iterdir() if p.is_dir()))
+    import_s = time.perf_counter() - start
+    chunk_bytes = sum(p.stat().st_size for p in store.chunks_dir.glob("*/*"))
+    unique_raw = sum(len(store.get_chunk(p.name)) for p in store.chunks_dir.glob("*/*"))
+    
+    print(f"\n{len(legacy)} existing full-copy snapshots")
+    print(f"   Logical data:      {logical / 1e6:8.2f} MB")
+    print(f"   Full copies (du):  {legacy_disk / 1e6:8.2f} MB")
+    print(f"   Chunk store (du):  {_disk_bytes(store.root) / 1e6:8.2f} MB "
+          f"(unique chunks {unique_raw / 1e6:.2f} MB raw, {chunk_bytes / 1e6:.2f} MB compressed)")
+    print(f"   Dedup ratio:       {logical / max(unique_raw, 1):8.1f}x  (with compression {logical / max(chunk_bytes, 1):.1f}x)")
+    print(f"   Import time:       {import_s:8.2f} s ({import_s / max(len(legacy), 1) * 1000:.1f} ms/snapshot)")
+    
+    # 2. Snapshotting the live critical paths
+    work = tmp / "work"
+    for p in [root / "Brain", root / "System" / "Config", root / "System" / "Security"]:
+        shutil.copytree(p, work / p.name)
+    sources = [work / "Brain", work / "Config", work / "Security"]
+    
+    start = time.perf_counter()
+    for i in range(5):
+        for src in sources:
+            shutil.copytree(src, tmp / "copies" / str(i) / src.name)
+    copy_s = (time.perf_counter() - start) / 5
+    copy_disk = _disk_bytes(tmp / "copies") / 5
+    
+    live = ChunkStore(tmp / "live")
+    start = time.perf_counter()
+    first = live.snapshot("s0", sources)
+    cold_s = time.perf_counter() - start
+    start = time.perf_counter()
+    second = live.snapshot("s1", sources, previous=first)
+    warm_s = time.perf_counter() - start
+    hydra = work / "Brain" / "hydra.py"
+    hydra.write_text(hydra.read_text() + "\n# edit\n")
+    start = time.perf_counter()
+    third = live.snapshot("s2", sources, previous=second)
+    edit_s = time.perf_counter() - start
+    
+    print(f"\nLive critical paths ({first['stats']['files']} files, {first['stats']['bytes'] / 1e3:.0f} KB)")
+    print(f"   {'':<22} {'Time (ms)':>10} {'Disk added (KB)':>16}")
+    print(f"   {'full copy':<22} {copy_s * 1000:>10.1f} {copy_disk / 1e3:>16.1f}")
+    print(f"   {'chunk store (cold)':<22} {cold_s * 1000:>10.1f} {first['stats']['written'] / 1e3:>16.1f}")
+    print(f"   {'chunk store (no change)':<22} {warm_s * 1000:>10.1f} {second['stats']['written'] / 1e3:>16.1f}")
+    print(f"   {'chunk store (1 edit)':<22} {edit_s * 1000:>10.1f} {third['stats']['written'] / 1e3:>16.1f}")
+    
+    # 3. Restore
+    start = time.perf_counter()
+    restored = live.restore("s2", tmp / "restore")
+    restore_s = time.perf_counter() - start
+    start = time.perf_counter()
+    again = live.restore("s2", tmp / "restore")
+    again_s = time.perf_counter() - start
+    print(f"\nRestore: {restored['written']} files in {restore_s * 1000:.1f} ms | "
+          f"re-restore skipped {again['skipped']} in {again_s * 1000:.1f} ms")
+    shutil.rmtree(tmp)
+
+
 if __name__ == "__main__":
-    BackupAgent().run()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        BackupAgent().run()
@@ -25,13 +25,18 @@ root_path = Path(__file__).parent.parent.parent
 sys.path.append(str(root_path))
 
 from System.Core.model_interface import get_llm
+from System.Core.market_data_store import MarketDataStore
+from System.Finance.batch_risk import BatchPortfolioEvaluator
 
 # Optional Imports for Best-in-Class Math
 try:
     import yfinance as yf
-    import numpy as np
 except ImportError:
     yf = None
+
+try:
+    import numpy as np
+except ImportError:
     np = None
 
 class RiskAnalyzer:
@@ -67,17 +72,25 @@ class MarketOracle:
     """
     Real-Time Market Data Interface
     """
-    def __init__(self):
+    def __init__(self, store=None, ttl=60):
         self.tickers = ["BTC-USD", "ETH-USD", "SPY"]
+        self.store = store or MarketDataStore.shared()
+        self.ttl = ttl
         
-    def fetch_data(self):
+    def _fetch_live(self, tickers):
         """Simulates or Fetches Live Data"""
         # Simulation Fallback (If offline/rate-limited)
-        return {
+        simulated = {
             "BTC-USD": {"price": 98500.00, "change": 0.025},
             "ETH-USD": {"price": 6200.00, "change": 0.012},
             "SPY": {"price": 580.00, "change": -0.005}
         }
+        return {t: simulated[t] for t in tickers if t in simulated}
+
+    def fetch_data(self, tickers=None):
+        """Read-through: served from the shared market store while fresh (or while replaying)"""
+        quotes = self.store.get_quotes(tickers or self.tickers, self._fetch_live, ttl=self.ttl)
+        return {t: {"price": q["price"], "change": q["change"]} for t, q in quotes.items()}
 
 class SentimentOracle:
     """
@@ -86,10 +99,13 @@ class SentimentOracle:
     def __init__(self):
         self.llm = get_llm()
         
+    def _news_for(self, asset: str) -> str:
+        # Simulated news feed for the asset
+        return f"Major institutional inflows detected for {asset}. Regulatory clarity improving in EU. Tech indicators bullish."
+
     def analyze_sentiment(self, asset: str) -> float:
         """Returns a sentiment score between 0.0 (Bearish) and 1.0 (Bullish)"""
-        # Simulated news feed for the asset
-        news_feed = f"Major institutional inflows detected for {asset}. Regulatory clarity improving in EU. Tech indicators bullish."
+        news_feed = self._news_for(asset)
         
         prompt = f"""
         Analyze the sentiment for {asset} based on this news: "{news_feed}"
@@ -107,6 +123,31 @@ class SentimentOracle:
         except:
             return 0.85 # Demo bullish sentiment
 
+    def analyze_batch(self, assets) -> dict:
+        """One LLM call for several assets: {asset: score}, 0.85 for any score the model omits"""
+        assets = list(dict.fromkeys(assets))
+        news = "\n".join(f'        - {asset}: "{self._news_for(asset)}"' for asset in assets)
+        prompt = f"""
+        Analyze the sentiment for each asset based on its news:
+{news}
+        Return JSON with 'scores' (asset -> 0.0 to 1.0) and 'reasoning'.
+        """
+        
+        response = self.llm.generate(
+            prompt,
+            json_schema={"type": "object", "properties": {
+                "scores": {"type": "object", "properties": {a: {"type": "number"} for a in assets}},
+                "reasoning": {"type": "string"}}}
+        )
+        
+        try:
+            scores = json.loads(response.content).get("scores") or {}
+        except (ValueError, AttributeError):
+            scores = {}
+        if not isinstance(scores, dict):
+            scores = {}  # e.g. a list or a string in place of the asset map
+        return {a: scores[a] if isinstance(scores.get(a), (int, float)) else 0.85 for a in assets}
+
 class RiskOfficer:
     """
     Hard Deck & Validation Logic
@@ -129,6 +170,27 @@ class RiskOfficer:
             
         return True, "APPROVED"
 
+    def validate_batch(self, amounts, start_risk, sentiment):
+        """Array form of validate(): same limits, same reasons, one pass for N proposals"""
+        if not np:
+            results = [
+                self.validate({"amount": a, "start_risk": r, "sentiment": s})
+                for a, r, s in zip(amounts, start_risk, sentiment)
+            ]
+            return [ok for ok, _ in results], [reason for _, reason in results]
+
+        amounts = np.asarray(amounts, dtype=float)
+        weighted = np.asarray(start_risk, dtype=float) * 0.7 + np.asarray(sentiment, dtype=float) * 0.3
+
+        too_big = amounts > self.max_trade_size
+        too_weak = weighted < 0.6
+        approved = ~(too_big | too_weak)
+
+        reasons = np.where(too_big, "Exceeds Max Trade Size", "APPROVED").astype(object)
+        for i in np.flatnonzero(too_weak & ~too_big):
+            reasons[i] = f"Confidence Too Low ({weighted[i]:.2f})"
+        return approved.tolist(), reasons.tolist()
+
 class InvestmentAgent:
     def __init__(self):
         self.root = Path(__file__).parent.parent
@@ -137,36 +199,29 @@ class InvestmentAgent:
         
         self.oracle = MarketOracle()
         self.sentiment = SentimentOracle()
-        self.analyzer = RiskAnalyzer()
         self.officer = RiskOfficer()
+        self.portfolio = BatchPortfolioEvaluator(self.oracle, self.sentiment, self.officer)
         
     def run(self):
         print("[INVESTMENT] 🐂 Analyzing Markets with Local AI...")
         
-        # 1. Market Scan
-        data = self.oracle.fetch_data()
+        # 1. Market Scan (one fetch per cycle, shared with the watchlist sweep)
+        self.portfolio.start_cycle()
+        data = self.portfolio.market_data()
         
-        # 2. Analyze Opportunities
+        # 2. Watchlist Sweep (Batch: one correlated simulation, one sentiment call, one limit check)
+        watchlist = self.portfolio.evaluate(self.oracle.tickers)
+        
+        # 3. Analyze Opportunities
         opportunities = []
         btc_data = data.get("BTC-USD", {})
+        btc = next((row for row in watchlist if row["asset"] == "BTC-USD"), None)
+        win_prob, exp_roi, sent_score = 0.0, 0.0, None
         
-        if btc_data:
-            # A. Quantitative Risk (Monte Carlo)
-            win_prob, exp_roi = self.analyzer.run_monte_carlo(btc_data['price'], 0.65)
-            
-            # B. Qualitative Risk (AI Sentiment)
-            sent_score = self.sentiment.analyze_sentiment("Bitcoin")
-            
-            # Proposal
-            proposal = {
-                "asset": "BTC",
-                "amount": 500,
-                "start_risk": win_prob,
-                "sentiment": sent_score
-            }
-            
-            # Risk Officer Check
-            approved, reason = self.officer.validate(proposal)
+        if btc_data and btc:
+            # Quantitative (Monte Carlo) + Qualitative (AI Sentiment) + Risk Officer, from the sweep
+            win_prob, exp_roi, sent_score = float(btc["monte_carlo_win"]), btc["expected_roi"], btc["ai_sentiment"]
+            approved, reason = btc["status"] == "APPROVED", btc["reason"]
             
             exec_result = "NOT_TRIGGERED"
             if approved:
@@ -211,7 +266,7 @@ class InvestmentAgent:
                 "execution": exec_result
             })
 
-        # 3. Report
+        # 4. Report
         portfolio_value = 74500.25 # Mock Total
         status = "GREEN"
         message = f"Portfolio: ${portfolio_value:,.2f} | AI Sentiment: Bullish ({sent_score})"
@@ -222,6 +277,7 @@ class InvestmentAgent:
             "message": message,
             "market_data": data,
             "opportunities": opportunities,
+            "watchlist": watchlist,
             "timestamp": datetime.now().isoformat()
         }
         
@@ -229,7 +285,8 @@ class InvestmentAgent:
             json.dump(report, f, indent=2)
             
         print(f"[INVESTMENT] Status: {status} | ROI Projected: {exp_roi:.2f}%")
-        print(f"[INVESTMENT] Opportunity: {opportunities[0]['status']} (AI Conf: {sent_score})")
+        if opportunities:
+            print(f"[INVESTMENT] Opportunity: {opportunities[0]['status']} (AI Conf: {sent_score})")
 
 if __name__ == "__main__":
     InvestmentAgent().run()
@@ -30,6 +30,11 @@ except ImportError:
     CORE_LAYERS_ACTIVE = False
     print("[MASTER] Warning: Core layers not found, running in basic mode.")
 
+try:
+    from System.Core.blackboard import SentinelBlackboard
+except ImportError:
+    SentinelBlackboard = None
+
 # --- CONFIGURATION (The Five Pillars) ---
 PILLARS = {
     "WEALTH": ["treasurer", "accountant_agent", "loophole_scanner", "revenue_tracker", "tax_shield_agent", "investment_agent", "ip_arbitrage_engine", "defi_yield_agent", "revenue_executor", "capital_allocation_agent", "global_arb_scout", "bounty_arbitrageur", "protocol_bridge_agent"],
@@ -87,6 +92,7 @@ class MonolithGraph:
             
         self.state = AgentState.IDLE
         self.context = {}  # Shared Memory (Blackboard Pattern)
+        self.blackboard = SentinelBlackboard.shared(self.sentinel_dir) if SentinelBlackboard else None
         self.workers = self._discover_workers()
 
     def _discover_workers(self) -> List[str]:
@@ -197,21 +203,23 @@ class MonolithGraph:
             "pillars": {}
         }
         
-        # Aggregation Logic
+        # Aggregation Logic (index lookups; only sentinels changed since the last cycle are parsed)
+        if self.blackboard:
+            self.blackboard.refresh()
         global_status = "GREEN"
         for pillar, agents in PILLARS.items():
             pillar_data = {"status": "GREEN", "alerts": []}
             for agent in agents:
-                sentinel_file = self.sentinel_dir / f"{agent}.done"
-                if sentinel_file.exists():
-                    try:
-                        data = json.loads(sentinel_file.read_text(encoding='utf-8'))
-                        if data.get("status") == "RED":
-                            pillar_data["status"] = "RED"
-                            global_status = "RED"
-                        pillar_data["alerts"].append(f"{agent}: {data.get('message', 'User OK')[:50]}")
-                    except:
-                        pass
+                data = self._sentinel_summary(agent)
+                if data is None:
+                    continue
+                try:
+                    if data.get("status") == "RED":
+                        pillar_data["status"] = "RED"
+                        global_status = "RED"
+                    pillar_data["alerts"].append(f"{agent}: {(data.get('message') or 'User OK')[:50]}")
+                except:
+                    pass
             briefing["pillars"][pillar] = pillar_data
             
         self.context["briefing"] = briefing
@@ -223,6 +231,16 @@ class MonolithGraph:
         
         return "node_complete"
 
+    def _sentinel_summary(self, agent: str):
+        """Status / message of an agent's sentinel, None if it has not reported"""
+        if self.blackboard:
+            return self.blackboard.get(agent)
+        sentinel_file = self.sentinel_dir / f"{agent}.done"
+        try:
+            return json.loads(sentinel_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
     # --- NODE 4: LABOR MANAGER (The Builder) ---
     def node_manage_labor(self):
         """Self-Repair Node: Spawns missing agents"""
@@ -245,6 +263,7 @@ class MonolithGraph:
 Part of Monolith Class-5 Architecture.
 Timestamp: {datetime.now().isoformat()}
 """
+import os
 import json
 import logging
 from pathlib import Path
@@ -281,8 +300,11 @@ class {name.replace("_", " ").title().replace(" ", "")}:
             "message": message,
             "timestamp": datetime.now().isoformat()
         }}
-        with open(self.sentinel_dir / "{name}.done", 'w', encoding='utf-8') as f:
+        # Atomic: readers never see a half-written sentinel
+        tmp = self.sentinel_dir / ".{name}.done.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp, self.sentinel_dir / "{name}.done")
         logging.info(f"Report filed: {{status}}")
 
 if __name__ == "__main__":
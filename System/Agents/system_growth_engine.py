@@ -6,10 +6,15 @@ Logic: Reinvest Earnings -> Upgrade Capabilities -> Scale Revenue
 
 import json
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.log_reader import LogCursor
+
 class SystemGrowthEngine:
     """
     Manages the 'Zero to Infinity' growth loop.
@@ -35,21 +40,25 @@ class SystemGrowthEngine:
 
     def get_total_capital(self) -> float:
         """Calculate total liquid capital from all logs"""
-        total = 0.0
         # In a real run, this would sum up verified transaction logs.
         # For now, we simulate reading the ledger.
+        # Running total is checkpointed with the byte offset; only appended lines are parsed.
         ledger_path = self.logs_dir / "execution_log.jsonl"
-        if ledger_path.exists():
-            with open(ledger_path, 'r') as f:
-                for line in f:
-                    try:
-                        record = json.loads(line)
-                        if record.get("action") == "REVENUE_INCOME":
-                            total += float(record.get("amount", 0))
-                        elif record.get("action") == "EXPENSE_REINVEST":
-                            total -= float(record.get("amount", 0))
-                    except:
-                        pass
+        cursor = LogCursor(ledger_path, "growth_capital")
+        lines = cursor.read_new()
+        total = cursor.state.get("total", 0.0)
+        for line in lines:
+            try:
+                record = json.loads(line)
+                if record.get("action") == "REVENUE_INCOME":
+                    total += float(record.get("amount", 0))
+                elif record.get("action") == "EXPENSE_REINVEST":
+                    total -= float(record.get("amount", 0))
+            except:
+                pass
+        if lines:
+            cursor.state["total"] = total
+            cursor.commit()
         return total
 
     def get_active_opportunities(self) -> List[Dict]:
@@ -0,0 +1,309 @@
+"""
+MONOLITH ACTION WATCHER
+Event-driven pickup of files dropped into a watched directory
+
+- Linux: inotify (via libc, no extra packages). The thread sleeps in
+  select() until a file is closed after writing or moved in, so an idle
+  watcher costs nothing and pickup takes milliseconds
+- Elsewhere (or if inotify is unavailable): adaptive polling, rescanning
+  every min_interval right after activity and backing off to max_interval
+  when the directory stays quiet
+- Debounce: a file is dispatched once its (size, mtime) has been stable
+  for `settle` seconds, so a script still being written (or rewritten by an
+  editor) is never run half-finished. Dotfiles and .tmp / .part / .crdownload
+  files are ignored until renamed
+- Dispatch: handler(path) on a bounded thread pool; a file is never
+  dispatched twice while its handler is running
+"""
+
+import os
+import sys
+import time
+import struct
+import select
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+try:
+    import ctypes
+    import ctypes.util
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    INOTIFY_AVAILABLE = sys.platform.startswith("linux") and hasattr(_libc, "inotify_init1")
+except (ImportError, OSError):
+    _libc = None
+    INOTIFY_AVAILABLE = False
+
+IN_MOVED_TO = 0x00000080
+IN_CLOSE_WRITE = 0x00000008
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+_EVENT = struct.Struct("iIII")
+IGNORED_SUFFIXES = (".tmp", ".part", ".crdownload", ".swp")
+
+
+class _Inotify:
+    def __init__(self, directory: Path):
+        self.fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+        if _libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+
+    def read(self, timeout: Optional[float], wake_fd: int) -> Tuple[Set[str], bool]:
+        """(names touched, rescan needed) after waiting up to timeout (None = until an event or wake_fd)"""
+        ready, _, _ = select.select([self.fd, wake_fd], [], [], timeout)
+        names, rescan = set(), False
+        if self.fd not in ready:
+            return names, rescan
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return names, rescan
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                rescan = True
+            elif name:
+                names.add(os.fsdecode(name))
+        return names, rescan
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ActionWatcher:
+    def __init__(self, directory, handler: Callable[[Path], None], workers=4, settle=0.05,
+                 min_interval=0.1, max_interval=2.0, use_inotify=True):
+        self.directory = Path(directory)
+        self.handler = handler
+        self.settle = settle
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.use_inotify = use_inotify and INOTIFY_AVAILABLE
+        self.mode = None
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="action")
+        self._pending: Dict[str, Tuple[Tuple[int, int], float]] = {}   # name -> (signature, stable since)
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake: Optional[Tuple[int, int]] = None   # Pipe; stop() interrupts a blocking select()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"dispatched": 0, "scans": 0, "wakeups": 0}
+
+    # --- Candidate tracking ---
+    def _wanted(self, name: str) -> bool:
+        return not name.startswith(".") and not name.endswith(IGNORED_SUFFIXES)
+
+    def _see(self, name: str, now: float):
+        """Records a file's current signature; a change restarts its settle timer"""
+        if not self._wanted(name):
+            return
+        try:
+            st = os.stat(self.directory / name)
+        except OSError:
+            self._pending.pop(name, None)
+            return
+        if not os.path.isfile(self.directory / name):
+            return
+        signature = (st.st_size, st.st_mtime_ns)
+        previous = self._pending.get(name)
+        if previous is None or previous[0] != signature:
+            self._pending[name] = (signature, now)
+
+    def _scan(self, now: float):
+        self.stats["scans"] += 1
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            self._see(name, now)
+        for name in [n for n in self._pending if n not in names]:
+            self._pending.pop(name, None)
+
+    def _dispatch_ready(self, now: float) -> Optional[float]:
+        """Dispatches settled files; returns seconds until the next one may settle (None if none pending)"""
+        next_due = None
+        for name in sorted(self._pending):
+            signature, since = self._pending[name]
+            due = since + self.settle
+            if due > now:
+                next_due = min(next_due, due - now) if next_due is not None else due - now
+                continue
+            self._see(name, now)   # Re-stat: a write since the event restarts the timer
+            if name not in self._pending or self._pending[name][1] != since:
+                next_due = self.settle if next_due is None else min(next_due, self.settle)
+                continue
+            del self._pending[name]
+            with self._lock:
+                if name in self._running:
+                    continue
+                self._running.add(name)
+            self.stats["dispatched"] += 1
+            self._pool.submit(self._run_handler, name)
+        return next_due
+
+    def _run_handler(self, name: str):
+        try:
+            self.handler(self.directory / name)
+        except Exception as e:
+            print(f"[WATCHER] ⚠️ Handler failed for {name}: {e}")
+        finally:
+            with self._lock:
+                self._running.discard(name)
+
+    # --- Loops ---
+    def _run_inotify(self, notify: _Inotify):
+        self._scan(time.monotonic())   # Files dropped while we were not running
+        while not self._stop.is_set():
+            # Sleep until an event, the next settle deadline, or stop()
+            names, rescan = notify.read(self._dispatch_ready(time.monotonic()), self._wake[0])
+            self.stats["wakeups"] += 1
+            now = time.monotonic()
+            if rescan:
+                self._scan(now)
+            for name in names:
+                self._see(name, now)
+
+    def _run_polling(self):
+        interval = self.min_interval
+        while not self._stop.is_set():
+            dispatched = self.stats["dispatched"]
+            self._scan(time.monotonic())
+            next_due = self._dispatch_ready(time.monotonic())
+            busy = bool(self._pending) or self.stats["dispatched"] != dispatched
+            interval = self.min_interval if busy else min(interval * 2, self.max_interval)
+            if next_due is not None:
+                interval = min(interval, max(next_due, 0.01))
+            self.stats["wakeups"] += 1
+            self._stop.wait(interval)
+
+    def run(self):
+        """Blocks until stop()"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        notify = None
+        if self.use_inotify:
+            try:
+                notify = _Inotify(self.directory)
+            except OSError as e:
+                print(f"[WATCHER] inotify unavailable ({e}), polling instead")
+        self.mode = "inotify" if notify else "polling"
+        try:
+            if notify:
+                self._wake = os.pipe()
+                self._run_inotify(notify)
+            else:
+                self._run_polling()
+        finally:
+            if notify:
+                notify.close()
+                for fd in self._wake:
+                    os.close(fd)
+                self._wake = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="action-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=True):
+        self._stop.set()
+        if self._wake:
+            os.write(self._wake[1], b"x")
+        if self._thread:
+            self._thread.join(timeout=2.5)
+        self._pool.shutdown(wait=wait)
+
+
+def benchmark(actions=20, idle_seconds=10):
+    """Pickup latency and idle CPU: the 2 s listdir loop vs inotify vs adaptive polling"""
+    import random
+    import shutil
+    import tempfile
+
+    rng = random.Random(3)
+
+    def legacy_loop_once(directory: Path, handler):
+        # titan_heartbeat before: listdir, run everything sequentially, then sleep 2 s
+        for f in os.listdir(directory):
+            path = directory / f
+            if path.is_file() and not f.startswith('.'):
+                handler(path)
+
+    def measure(start_watcher):
+        tmp = Path(tempfile.mkdtemp(prefix="action_watcher_"))
+        written: Dict[str, float] = {}
+        latencies = []
+
+        def handler(path: Path):
+            latencies.append(time.perf_counter() - written[path.name])
+            path.unlink()
+
+        stop_watcher, wakeups = start_watcher(tmp, handler)
+        time.sleep(2.5)   # Let adaptive polling back off to its idle interval
+
+        cpu, woke = time.process_time(), wakeups()
+        time.sleep(idle_seconds)
+        idle = (time.process_time() - cpu, wakeups() - woke)
+
+        for i in range(actions):
+            time.sleep(rng.uniform(0.1, 0.6))
+            name = f"action_{i:03d}.py"
+            with open(tmp / f".{name}.part", "w") as f:
+                f.write("print('hello')\n" * 50)
+            written[name] = time.perf_counter()
+            os.replace(tmp / f".{name}.part", tmp / name)
+        deadline = time.time() + 5
+        while len(latencies) < actions and time.time() < deadline:
+            time.sleep(0.05)
+        stop_watcher()
+        shutil.rmtree(tmp)
+        latencies.sort()
+        return idle, latencies
+
+    def legacy(directory, handler):
+        stop, ticks = threading.Event(), []
+
+        def loop():
+            while not stop.is_set():
+                ticks.append(1)
+                legacy_loop_once(directory, handler)
+                stop.wait(2)
+
+        thread = threading.Thread(target=loop, daemon=True)
+        thread.start()
+        return (lambda: (stop.set(), thread.join())), (lambda: len(ticks))
+
+    def watcher(use_inotify):
+        def start(directory, handler):
+            w = ActionWatcher(directory, handler, use_inotify=use_inotify)
+            w.start()
+            return w.stop, (lambda: w.stats["wakeups"])
+        return start
+
+    rows = [("2 s listdir loop (before)", measure(legacy)), ("adaptive polling", measure(watcher(False)))]
+    if INOTIFY_AVAILABLE:
+        rows.append(("inotify", measure(watcher(True))))
+
+    print(f"\n{actions} actions at random 0.1-0.6 s gaps; idle CPU over {idle_seconds}s with an empty directory")
+    print(f"{'':<28} {'pickup p50':>11} {'p95':>9} {'max':>9} {'idle CPU ms/min':>16} {'wakeups/min':>12}")
+    scale = 60 / idle_seconds
+    for label, ((idle_cpu, woke), lat) in rows:
+        p = lambda q: lat[min(len(lat) - 1, int(q * (len(lat) - 1)))] * 1000 if lat else float("nan")
+        print(f"{label:<28} {p(0.5):>9.1f}ms {p(0.95):>7.1f}ms {p(1):>7.1f}ms "
+              f"{idle_cpu * scale * 1000:>16.2f} {woke * scale:>12.0f}")
+    print("Idle CPU is the whole benchmark process, so it includes the interpreter's own background cost")
+
+
+if __name__ == "__main__":
+    benchmark()
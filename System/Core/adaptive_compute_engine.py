@@ -4,12 +4,16 @@ Purpose: Dynamic task profiling and compute allocation.
 Strategy: Optimize for 4GB RAM by offloading heavy tasks to cloud/remote when local resources are constrained.
 """
 
+import sys
 import json
-import psutil
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.resource_sampler import ResourceSampler
+
 class AdaptiveComputeEngine:
     """
     The "Brain of the Brain".
@@ -20,14 +24,15 @@ class AdaptiveComputeEngine:
         self.config_dir = self.root / "System" / "Config"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.config_dir / "ace_state.json"
+        self.sampler = ResourceSampler.shared()
         
     def profile_task(self, task_metadata: Dict[str, Any]) -> str:
         """
         Analyzes a task and returns the optimal execution target.
         Targets: "LOCAL_LOW", "LOCAL_HIGH", "CLOUD_REMOTE", "DEFERRED"
         """
-        ram_gb = psutil.virtual_memory().total / (1024**3)
-        available_ram = psutil.virtual_memory().available / (1024**3)
+        ram_gb = self.sampler.ram_total_gb
+        available_ram = self.sampler.latest()["ram_available_gb"]
         task_weight = task_metadata.get("weight", "MEDIUM")
         
         # 4GB RAM constraint logic (The user's specific hardware)
@@ -40,11 +45,12 @@ class AdaptiveComputeEngine:
 
     def update_resource_map(self):
         """Monitors system-wide resource usage and updates ACE state."""
+        latest = self.sampler.latest()
         state = {
             "timestamp": datetime.now().isoformat(),
-            "available_ram": round(psutil.virtual_memory().available / (1024**3), 2),
-            "cpu_load": psutil.cpu_percent(),
-            "ace_strategy": "RATION_CONSOLIDATED" if psutil.virtual_memory().total / (1024**3) < 8 else "PERFORMANCE"
+            "available_ram": round(latest["ram_available_gb"], 2),
+            "cpu_load": latest["cpu"],
+            "ace_strategy": "RATION_CONSOLIDATED" if self.sampler.ram_total_gb < 8 else "PERFORMANCE"
         }
         
         with open(self.state_file, 'w') as f:
@@ -0,0 +1,273 @@
+"""
+MONOLITH BLACKBOARD
+Indexed view of System/Sentinels for inter-agent coordination
+
+The <agent>.done JSON files stay the source of truth (and the export
+format), so agents that write them directly and readers that open them
+keep working. On top of them:
+- post(): atomic write (temp file + os.replace), never a half-written file
+- Index by agent, status and mtime, holding the fields orchestrators read
+  (agent, status, message, timestamp); payloads are parsed only on get(full=True)
+- refresh(): one stat per file; only files whose (mtime, size) changed are
+  parsed. The index is persisted, so a new process does not re-parse the fleet
+- subscribe(): callbacks on every change, from post() or refresh()
+"""
+
+import os
+import json
+import time
+import threading
+from bisect import insort, bisect_left
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+SUFFIX = ".done"
+INDEX_FILE = ".blackboard_index.json"
+FIELDS = ("agent", "status", "message", "timestamp")
+
+
+class SentinelBlackboard:
+    _instances: Dict[str, "SentinelBlackboard"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, directory: Optional[Path] = None) -> "SentinelBlackboard":
+        directory = Path(directory) if directory else Path(__file__).parent.parent / "Sentinels"
+        key = str(directory.resolve())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(directory)
+            return cls._instances[key]
+
+    def __init__(self, directory: Path, persist=True):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / INDEX_FILE if persist else None
+        self.records: Dict[str, Dict[str, Any]] = {}     # key (file stem) -> record
+        self.by_status: Dict[Any, set] = {}
+        self.by_time: List[Tuple[int, str]] = []          # (mtime_ns, key), ascending
+        self._callbacks: List[Callable[[str, Optional[Dict[str, Any]]], None]] = []
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.stats = {"parsed": 0, "bytes_read": 0}
+        self._load_index()
+
+    # --- Index maintenance ---
+    def _load_index(self):
+        if not self.index_path:
+            return
+        try:
+            saved = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return
+        for key, record in saved.items():
+            self._set(key, record)
+
+    def save(self):
+        """Persists the index if it changed (atomic)"""
+        with self._lock:
+            if not self.index_path or not self._dirty:
+                return
+            tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.records, separators=(",", ":"), default=str))
+            os.replace(tmp, self.index_path)
+            self._dirty = False
+
+    def _unset(self, key: str) -> Optional[Dict[str, Any]]:
+        old = self.records.pop(key, None)
+        if old:
+            self.by_status.get(old["status"], set()).discard(key)
+            i = bisect_left(self.by_time, (old["mtime_ns"], key))
+            if i < len(self.by_time) and self.by_time[i] == (old["mtime_ns"], key):
+                self.by_time.pop(i)
+        return old
+
+    def _set(self, key: str, record: Dict[str, Any]):
+        self._unset(key)
+        self.records[key] = record
+        self.by_status.setdefault(record["status"], set()).add(key)
+        insort(self.by_time, (record["mtime_ns"], key))
+
+    def _notify(self, key: str, record: Optional[Dict[str, Any]]):
+        self._dirty = True
+        for callback in list(self._callbacks):
+            try:
+                callback(key, record)
+            except Exception as e:
+                print(f"[BLACKBOARD] ⚠️ Subscriber failed: {e}")
+
+    def _summarize(self, key: str, data: Any, st: os.stat_result) -> Dict[str, Any]:
+        fields = data if isinstance(data, dict) else {}
+        record = {field: fields.get(field) for field in FIELDS}
+        if not isinstance(record["status"], (str, int, float, bool, type(None))):
+            record["status"] = json.dumps(record["status"], default=str)  # Indexable
+        record.update(key=key, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        return record
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    # --- Writes ---
+    def post(self, key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Atomically writes <key>.done and indexes it (agent / timestamp filled in if missing)"""
+        data = {"agent": key, **data}
+        data.setdefault("timestamp", time.strftime("%Y-%m-%dT%H:%M:%S"))
+        path = self._path(key)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp, path)
+        record = self._summarize(key, data, path.stat())
+        with self._lock:
+            self._set(key, record)
+            self._notify(key, record)
+        return record
+
+    def clear(self, key: str) -> bool:
+        """Removes a sentinel (after review)"""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            if self._unset(key) is None:
+                return False
+            self._notify(key, None)
+        return True
+
+    # --- Sync with agents that write the files directly ---
+    def refresh(self) -> int:
+        """Re-indexes files changed on disk since the last refresh; returns the number of changes"""
+        changes = 0
+        seen = set()
+        with self._lock:
+            try:
+                entries = list(os.scandir(self.directory))
+            except OSError:
+                entries = []
+            for entry in entries:
+                if not entry.name.endswith(SUFFIX) or entry.name.startswith("."):
+                    continue
+                key = entry.name[:-len(SUFFIX)]
+                seen.add(key)
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                old = self.records.get(key)
+                if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        raw = f.read()
+                    data = json.loads(raw)
+                except (OSError, ValueError):
+                    continue  # Being written by a non-atomic writer: next refresh
+                self.stats["parsed"] += 1
+                self.stats["bytes_read"] += len(raw)
+                record = self._summarize(key, data, st)
+                self._set(key, record)
+                self._notify(key, record)
+                changes += 1
+            for key in [k for k in self.records if k not in seen]:
+                self._unset(key)
+                self._notify(key, None)
+                changes += 1
+            self.save()
+        return changes
+
+    # --- Reads (index only, unless full=True) ---
+    def get(self, key: str, full=False) -> Optional[Dict[str, Any]]:
+        if full:
+            try:
+                return json.loads(self._path(key).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+        return self.records.get(key)
+
+    def with_status(self, status: Any) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self.records[k] for k in sorted(self.by_status.get(status, ()))]
+
+    def since(self, epoch: float) -> List[Dict[str, Any]]:
+        """Records whose file changed at or after epoch, oldest first"""
+        with self._lock:
+            i = bisect_left(self.by_time, (int(epoch * 1e9), ""))
+            return [self.records[k] for _, k in self.by_time[i:]]
+
+    def all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self.records[k] for k in sorted(self.records)]
+
+    # --- Notifications ---
+    def subscribe(self, callback: Callable[[str, Optional[Dict[str, Any]]], None]):
+        """callback(key, record); record is None when the sentinel was removed"""
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+
+def benchmark(sizes=(50, 500, 5000), churn=0.01):
+    """Verify-phase latency: parse every sentinel (check_sentinels / node_verify) vs the blackboard"""
+    import random
+    import shutil
+    import tempfile
+
+    rng = random.Random(5)
+    print(f"\n{'Sentinels':>9} {'legacy':>10} {'bb cold':>10} {'bb warm':>10} {f'bb {churn:.0%} chg':>10} {'parsed':>7}")
+    for n in sizes:
+        tmp = Path(tempfile.mkdtemp(prefix="blackboard_"))
+        for i in range(n):
+            payload = {"agent": f"agent_{i}", "status": rng.choice(["GREEN", "GREEN", "YELLOW", "RED"]),
+                       "message": f"Cycle {i} complete", "timestamp": "2026-01-01T00:00:00",
+                       "history": [{"run": r, "result": "ok", "value": rng.random()} for r in range(40)]}
+            (tmp / f"agent_{i}.done").write_text(json.dumps(payload, indent=2))
+        keys = [f"agent_{i}" for i in range(n)]
+
+        def legacy():
+            statuses = {}
+            for path in tmp.glob("*.done"):
+                with open(path, "r") as f:
+                    data = json.load(f)
+                statuses[data.get("agent")] = (data.get("status"), data.get("message"))
+            return statuses
+
+        def indexed(board):
+            board.refresh()
+            return {r["agent"]: (r["status"], r["message"]) for r in (board.get(k) for k in keys) if r}
+
+        start = time.perf_counter()
+        expected = legacy()
+        legacy_s = time.perf_counter() - start
+
+        SentinelBlackboard(tmp).refresh()   # Builds and persists the index (first run ever)
+        start = time.perf_counter()
+        board = SentinelBlackboard(tmp)     # New process: load the saved index, stat-only refresh
+        assert indexed(board) == expected
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed(board)
+        warm_s = time.perf_counter() - start
+
+        for i in rng.sample(range(n), max(1, int(n * churn))):
+            path = tmp / f"agent_{i}.done"
+            data = json.loads(path.read_text())
+            data["status"] = "RED"
+            path.write_text(json.dumps(data, indent=2))
+        parsed = board.stats["parsed"]
+        start = time.perf_counter()
+        result = indexed(board)
+        churn_s = time.perf_counter() - start
+        assert result == legacy()
+
+        print(f"{n:>9,} {legacy_s * 1e3:>8.1f}ms {cold_s * 1e3:>8.1f}ms {warm_s * 1e3:>8.1f}ms "
+              f"{churn_s * 1e3:>8.1f}ms {board.stats['parsed'] - parsed:>7,}")
+        shutil.rmtree(tmp)
+    print("cold = new process with the saved index; warm = same process; chg = after external rewrites")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,232 @@
+"""
+MONOLITH CHUNK STORE
+Content-addressed, deduplicating snapshot storage for BackupAgent
+
+Layout (under root):
+    chunks/ab/<blake2b-256 hex>     zlib-compressed chunk bodies, written once
+    manifests/<snapshot>.json       per-file metadata + ordered chunk references
+
+- Content-defined chunking (Gear rolling hash, FastCDC-style normalized
+  cut points): an edit only changes the chunks around it, so near-identical
+  files share almost all of their chunks
+- A file whose size and mtime match the previous snapshot reuses that
+  snapshot's chunk list without being read
+- Snapshots are just manifests; gc() deletes chunks no manifest references
+- restore() skips files already identical on disk and writes the rest in parallel
+- Manifests carry per-directory Merkle roots (see manifest_engine), so a
+  snapshot can be compared with the live tree or another snapshot top-down
+"""
+
+import os
+import json
+import zlib
+import random
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from System.Core.manifest_engine import merkle_roots
+
+MIN_CHUNK = 2 * 1024
+AVG_CHUNK = 8 * 1024
+MAX_CHUNK = 64 * 1024
+_M64 = (1 << 64) - 1
+
+# Fixed seed: cut points must be identical across runs or nothing dedups
+_GEAR = [random.Random(0x4D4F4E4F + i).getrandbits(64) for i in range(256)]
+_MASK_STRICT = (1 << 15) - 1   # Before AVG_CHUNK: fewer cut points
+_MASK_LOOSE = (1 << 11) - 1    # After AVG_CHUNK: more cut points
+
+
+def chunk_boundaries(data: bytes, min_size=MIN_CHUNK, avg_size=AVG_CHUNK, max_size=MAX_CHUNK) -> List[int]:
+    """End offsets of content-defined chunks"""
+    n = len(data)
+    cuts = []
+    start = 0
+    gear = _GEAR
+    while start < n:
+        if n - start <= min_size:
+            cuts.append(n)
+            break
+        end = min(start + max_size, n)
+        normal = min(start + avg_size, end)
+        h = 0
+        i = start + min_size
+        cut = end
+        while i < normal:
+            h = ((h << 1) + gear[data[i]]) & _M64
+            i += 1
+            if not h & _MASK_STRICT:
+                cut = i
+                break
+        else:
+            while i < end:
+                h = ((h << 1) + gear[data[i]]) & _M64
+                i += 1
+                if not h & _MASK_LOOSE:
+                    cut = i
+                    break
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+class ChunkStore:
+    def __init__(self, root: Path, compress_level=6):
+        self.root = Path(root)
+        self.chunks_dir = self.root / "chunks"
+        self.manifests_dir = self.root / "manifests"
+        self.compress_level = compress_level
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+    # --- Chunks ---
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def put_chunk(self, data: bytes) -> Tuple[str, int]:
+        """Stores a chunk if new; returns (digest, bytes written to disk)"""
+        digest = hashlib.blake2b(data, digest_size=32).hexdigest()
+        path = self._chunk_path(digest)
+        if path.exists():
+            return digest, 0
+        path.parent.mkdir(exist_ok=True)
+        body = zlib.compress(data, self.compress_level)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+        return digest, len(body)
+
+    def get_chunk(self, digest: str) -> bytes:
+        return zlib.decompress(self._chunk_path(digest).read_bytes())
+
+    # --- Snapshots ---
+    def manifest_path(self, name: str) -> Path:
+        return self.manifests_dir / f"{name}.json"
+
+    def list_snapshots(self) -> List[str]:
+        return sorted(p.stem for p in self.manifests_dir.glob("*.json"))
+
+    def load_manifest(self, name: str) -> Dict[str, Any]:
+        with open(self.manifest_path(name), "r") as f:
+            return json.load(f)
+
+    def latest_manifest(self) -> Optional[Dict[str, Any]]:
+        names = self.list_snapshots()
+        return self.load_manifest(names[-1]) if names else None
+
+    def snapshot(self, name: str, sources: Iterable[Path], previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Records every file under sources as <source name>/<relative path>.
+        previous: manifest whose entries are reused for files with unchanged size + mtime.
+        """
+        prev_files = (previous or {}).get("files", {})
+        files: Dict[str, Dict[str, Any]] = {}
+        stats = {"files": 0, "reused": 0, "bytes": 0, "new_chunks": 0, "written": 0}
+
+        for source in sources:
+            source = Path(source)
+            if not source.exists():
+                continue
+            paths = [source] if source.is_file() else sorted(p for p in source.rglob("*") if p.is_file())
+            for path in paths:
+                rel = source.name if path == source else f"{source.name}/{path.relative_to(source).as_posix()}"
+                st = path.stat()
+                stats["files"] += 1
+                stats["bytes"] += st.st_size
+
+                prev = prev_files.get(rel)
+                if prev and prev["size"] == st.st_size and prev["mtime_ns"] == st.st_mtime_ns:
+                    files[rel] = prev
+                    stats["reused"] += 1
+                    continue
+
+                data = path.read_bytes()
+                chunks, start = [], 0
+                for cut in chunk_boundaries(data):
+                    digest, written = self.put_chunk(data[start:cut])
+                    chunks.append(digest)
+                    if written:
+                        stats["new_chunks"] += 1
+                        stats["written"] += written
+                    start = cut
+                files[rel] = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "mode": st.st_mode & 0o777,
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                    "chunks": chunks,
+                }
+
+        dirs = merkle_roots(files)
+        manifest = {"name": name, "created": datetime.now().isoformat(), "files": files,
+                    "dirs": dirs, "root": dirs[""], "stats": stats}
+        tmp = self.manifest_path(name).with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, self.manifest_path(name))
+        return manifest
+
+    def delete_snapshot(self, name: str):
+        self.manifest_path(name).unlink(missing_ok=True)
+
+    def verify(self, name: str) -> Dict[str, Any]:
+        """Rebuilds every file from its chunks and checks the recorded SHA256"""
+        manifest = self.load_manifest(name)
+        corrupted = []
+        for rel, entry in manifest["files"].items():
+            try:
+                sha = hashlib.sha256()
+                for digest in entry["chunks"]:
+                    sha.update(self.get_chunk(digest))
+                if sha.hexdigest() != entry["sha256"]:
+                    corrupted.append(rel)
+            except (OSError, zlib.error):
+                corrupted.append(f"{rel} (MISSING)")
+        return {"verified": not corrupted, "total_files": len(manifest["files"]), "corrupted": corrupted}
+
+    def restore(self, name: str, dest: Path, workers=8) -> Dict[str, int]:
+        """Materialises a snapshot under dest; files already matching size + mtime are skipped"""
+        manifest = self.load_manifest(name)
+        dest = Path(dest)
+
+        def restore_one(item):
+            rel, entry = item
+            target = dest / rel
+            try:
+                st = target.stat()
+                if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+                    return 0
+            except OSError:
+                pass
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(target.name + ".restore.tmp")
+            with open(tmp, "wb") as f:
+                for digest in entry["chunks"]:
+                    f.write(self.get_chunk(digest))
+            os.chmod(tmp, entry.get("mode", 0o644))
+            os.utime(tmp, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            os.replace(tmp, target)
+            return 1
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            written = sum(pool.map(restore_one, manifest["files"].items()))
+        return {"files": len(manifest["files"]), "written": written, "skipped": len(manifest["files"]) - written}
+
+    def gc(self) -> Dict[str, int]:
+        """Mark-and-sweep: deletes chunks referenced by no manifest"""
+        live = set()
+        for name in self.list_snapshots():
+            for entry in self.load_manifest(name)["files"].values():
+                live.update(entry["chunks"])
+        removed = freed = 0
+        for path in self.chunks_dir.glob("*/*"):
+            if path.name not in live:
+                freed += path.stat().st_size
+                path.unlink()
+                removed += 1
+        return {"live_chunks": len(live), "removed_chunks": removed, "freed_bytes": freed}
+
+    def disk_usage(self) -> int:
+        return sum(p.stat().st_size for p in self.root.rglob("*") if p.is_file())
@@ -0,0 +1,220 @@
+"""
+MONOLITH DASHBOARD DATA
+Change-aware data layer for the Streamlit command center
+
+Streamlit re-executes the whole dashboard script on every interaction, so
+each widget click used to re-open and re-parse every sentinel. Here every
+source is cached under a key taken from what it was built from:
+- Sentinels / JSON files: keyed by (mtime_ns, size). A rerun costs one stat
+  per file and reads nothing unless the file was rewritten; a file caught
+  mid-write keeps serving its last good value
+- Revenue history: daily REVENUE totals from ledger.db, keyed by the
+  signature of the database and its WAL, built only when a panel asks
+- stats counts stats, parses, queries and bytes read, so reruns can be measured
+
+One instance per process (DashboardData.shared()), safe to use from every
+Streamlit session thread. Returned values are shared: treat them as read-only.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+Signature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: Path) -> Signature:
+    """(mtime_ns, size), or None if the file does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class DashboardData:
+    _instances: Dict[str, "DashboardData"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, sentinel_dir: Optional[Path] = None, ledger_db: Optional[Path] = None) -> "DashboardData":
+        system = Path(__file__).parent.parent
+        sentinel_dir = Path(sentinel_dir) if sentinel_dir else system / "Sentinels"
+        ledger_db = Path(ledger_db) if ledger_db else system / "Logs" / "ledger.db"
+        key = f"{sentinel_dir.resolve()}|{ledger_db.resolve()}"
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(sentinel_dir, ledger_db)
+            return cls._instances[key]
+
+    def __init__(self, sentinel_dir: Path, ledger_db: Path):
+        self.sentinel_dir = Path(sentinel_dir)
+        self.ledger_db = Path(ledger_db)
+        self._files: Dict[str, Tuple[Tuple[int, int], Any]] = {}   # path -> (signature, parsed)
+        self._history: Optional[Tuple[Tuple[Signature, Signature], List[Tuple[str, float]]]] = None
+        self._lock = threading.Lock()
+        self.stats = {"stats": 0, "hits": 0, "parsed": 0, "queries": 0, "bytes_read": 0}
+
+    # --- JSON files ---
+    def json_file(self, path, default=None) -> Any:
+        """Parsed contents of a JSON file, re-read only when its (mtime, size) changed"""
+        key = str(path)
+        signature = file_signature(path)
+        with self._lock:
+            self.stats["stats"] += 1
+            if signature is None:
+                self._files.pop(key, None)
+                return default
+            cached = self._files.get(key)
+            if cached and cached[0] == signature:
+                self.stats["hits"] += 1
+                return cached[1]
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = json.loads(raw)
+        except (OSError, ValueError):
+            return cached[1] if cached else default   # Being rewritten: last good value
+        with self._lock:
+            self.stats["parsed"] += 1
+            self.stats["bytes_read"] += len(raw)
+            self._files[key] = (signature, data)
+        return data
+
+    def sentinel(self, agent_name: str) -> Optional[Dict[str, Any]]:
+        """Same result as reading System/Sentinels/<agent>.done (None if absent)"""
+        return self.json_file(self.sentinel_dir / f"{agent_name}.done")
+
+    # --- Ledger ---
+    def _ledger_signature(self) -> Tuple[Signature, Signature]:
+        return file_signature(self.ledger_db), file_signature(self.ledger_db.with_name(self.ledger_db.name + "-wal"))
+
+    def revenue_history(self) -> List[Tuple[str, float]]:
+        """[(YYYY-MM-DD, revenue)] oldest first; queried again only after the ledger changes"""
+        signature = self._ledger_signature()
+        with self._lock:
+            if self._history and self._history[0] == signature:
+                self.stats["hits"] += 1
+                return self._history[1]
+        if signature[0] is None:
+            return []
+        try:
+            conn = sqlite3.connect(f"{self.ledger_db.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                rows = conn.execute("""
+                    SELECT substr(timestamp, 1, 10) AS day, SUM(amount)
+                    FROM transactions
+                    WHERE type = 'REVENUE'
+                    GROUP BY day
+                    ORDER BY day
+                """).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[DASHBOARD] ⚠️ Revenue history unavailable: {e}")
+            return self._history[1] if self._history else []
+        with self._lock:
+            self.stats["queries"] += 1
+            self._history = (signature, rows)
+        return rows
+
+
+def benchmark(agents=50, reruns=200, revenue_rows=50000):
+    """Per-rerun cost of the dashboard's data loading: re-parse everything vs the keyed caches"""
+    import random
+    import shutil
+    import tempfile
+
+    rng = random.Random(7)
+    tmp = Path(tempfile.mkdtemp(prefix="dashboard_data_"))
+    sentinels = tmp / "Sentinels"
+    sentinels.mkdir()
+    names = [f"agent_{i}" for i in range(agents)]
+    for name in names:
+        payload = {"agent": name, "status": "GREEN", "message": "Cycle complete",
+                   "history": [{"run": r, "result": "ok", "value": rng.random()} for r in range(40)]}
+        (sentinels / f"{name}.done").write_text(json.dumps(payload, indent=2))
+    treasury = tmp / "first_dollar.json"
+    treasury.write_text(json.dumps({"total_earned": 1234.5}))
+
+    ledger = tmp / "ledger.db"
+    conn = sqlite3.connect(ledger)
+    conn.execute("""CREATE TABLE transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT NOT NULL,
+                    type TEXT NOT NULL, action TEXT, amount REAL NOT NULL, asset TEXT,
+                    timestamp TEXT NOT NULL, notes TEXT)""")
+    conn.executemany("INSERT INTO transactions (source, type, amount, timestamp) VALUES (?, ?, ?, ?)",
+                     [("bench", rng.choice(["REVENUE", "EXPENSE"]), rng.uniform(1, 100),
+                       f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00")
+                      for _ in range(revenue_rows)])
+    conn.commit()
+    conn.close()
+
+    def legacy_rerun(with_history):
+        bytes_read = 0
+        for name in names:   # load_sentinel(): open + json.load every rerun
+            with open(sentinels / f"{name}.done", "rb") as f:
+                raw = f.read()
+            json.loads(raw)
+            bytes_read += len(raw)
+        raw = treasury.read_bytes()
+        json.loads(raw)
+        bytes_read += len(raw)
+        if with_history:     # An eager history panel would query on every rerun
+            c = sqlite3.connect(ledger)
+            c.execute("SELECT substr(timestamp, 1, 10) AS day, SUM(amount) FROM transactions "
+                      "WHERE type = 'REVENUE' GROUP BY day ORDER BY day").fetchall()
+            c.close()
+        return bytes_read
+
+    def cached_rerun(data, with_history):
+        for name in names:
+            data.sentinel(name)
+        data.json_file(treasury, {})
+        if with_history:
+            data.revenue_history()
+
+    def measure(label, rerun, before=None):
+        timings, total_bytes = [], 0
+        for i in range(reruns):
+            if before:
+                before(i)
+            start = time.perf_counter()
+            total_bytes += rerun()
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"{label:<38} {timings[len(timings) // 2] * 1e3:>8.2f}ms {timings[int(len(timings) * 0.95)] * 1e3:>8.2f}ms "
+              f"{total_bytes / reruns:>12,.0f}")
+
+    def touch_one(i):
+        path = sentinels / f"{names[i % agents]}.done"
+        data = json.loads(path.read_text())
+        data["message"] = f"Cycle {i}"
+        path.write_text(json.dumps(data, indent=2))
+
+    data = DashboardData(sentinels, ledger)
+    cached_rerun(data, False)   # First run of the session fills the caches
+
+    def counted(with_history):
+        def run():
+            before = data.stats["bytes_read"]
+            cached_rerun(data, with_history)
+            return data.stats["bytes_read"] - before
+        return run
+
+    print(f"\n{agents} agents, {revenue_rows:,} ledger rows, {reruns} reruns")
+    print(f"{'':<38} {'p50':>10} {'p95':>10} {'bytes/rerun':>12}")
+    measure("legacy, history closed", lambda: legacy_rerun(False))
+    measure("legacy, eager history", lambda: legacy_rerun(True))
+    measure("cached, nothing changed", counted(False))
+    measure("cached, 1 sentinel rewritten", counted(False), before=touch_one)
+    measure("cached, history open (unchanged)", counted(True))
+    shutil.rmtree(tmp)
+    print("bytes = file bytes read and parsed; history queries scan the ledger in SQLite")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -17,89 +17,114 @@ Displays:
 - Intelligence alerts
 - Anomaly warnings
 - Strategic opportunities
+
+Performance:
+- Ledger sections come from a shared LedgerSnapshot (new rows only)
+- Component instances (CapitalReinvestment) are built once and reused
+- anomalies.log is tailed with log_reader (blocks read backwards from EOF)
+- Briefings (and their rendered text) are cached until the ledger,
+  purchases.db or anomalies.log change
 """
 
-import sqlite3
+import io
+import os
+import sys
+import time
+import contextlib
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.ledger_snapshot import LedgerSnapshot
+from System.Core.log_reader import tail_records
+
+def _file_key(path):
+    try:
+        st = path.stat()
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
 class DirectorBriefing:
-    def __init__(self):
-        self.ledger_db = Path(__file__).parent.parent / "Logs" / "ledger.db"
-        self.briefing_history = Path(__file__).parent.parent / "Logs" / "briefings"
-        self.briefing_history.mkdir(exist_ok=True)
+    def __init__(self, ledger_db=None, logs_dir=None, purchases_db=None):
+        logs = Path(logs_dir) if logs_dir else Path(__file__).parent.parent / "Logs"
+        self.ledger_db = Path(ledger_db) if ledger_db else logs / "ledger.db"
+        self.purchases_db = Path(purchases_db) if purchases_db else logs / "purchases.db"
+        self.anomaly_log = logs / "anomalies.log"
+        self.briefing_history = logs / "briefings"
+        self.briefing_history.mkdir(parents=True, exist_ok=True)
+        
+        self.ledger = LedgerSnapshot.shared(self.ledger_db)
+        self._capital = None
+        self._decisions = ([], None)   # (value, key)
+        self._alerts = ([], None)
+        self._briefing = (None, None)
+        self._rendered = (None, None)
+    
+    @property
+    def capital(self):
+        if self._capital is None:
+            from System.Finance.capital_reinvestment import CapitalReinvestment
+            self._capital = CapitalReinvestment(ledger_db=self.ledger_db, purchases_db=self.purchases_db)
+        return self._capital
         
     def get_overnight_activity(self):
         """Revenue/trades in last 24 hours"""
-        if not self.ledger_db.exists():
-            return []
-        
-        conn = sqlite3.connect(self.ledger_db)
-        cursor = conn.cursor()
-        
-        cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
-        
-        cursor.execute("""
-            SELECT source, action, amount, timestamp 
-            FROM transactions 
-            WHERE timestamp > ? 
-            ORDER BY timestamp DESC
-        """, (cutoff,))
-        
-        activities = []
-        for row in cursor.fetchall():
-            source, action, amount, timestamp = row
-            activities.append({
-                "source": source,
-                "action": action,
-                "amount": amount,
-                "timestamp": timestamp
-            })
-        
-        conn.close()
-        return activities
+        self.ledger.refresh()
+        return self.ledger.recent_activity()
     
-    def get_pending_decisions(self):
+    def get_pending_decisions(self, total_revenue=None):
         """High-stakes items awaiting approval"""
-        from System.Finance.capital_reinvestment import CapitalReinvestment
+        if total_revenue is None:
+            self.ledger.refresh()
+            total_revenue = self.ledger.total_revenue
         
-        capital = CapitalReinvestment()
-        recommendations = capital.recommend_purchases()
-        
-        # Filter for items $500+ (need approval)
-        pending = [r for r in recommendations if r["cost"] >= 500]
-        return pending[:5]  # Top 5
+        # Recommendations only change with the unlocked tier or the purchases db
+        key = (self.capital.get_current_tier(total_revenue), _file_key(self.purchases_db))
+        if key != self._decisions[1]:
+            recommendations = self.capital.recommend_purchases(total_revenue)
+            # Filter for items $500+ (need approval)
+            pending = [r for r in recommendations if r["cost"] >= 500]
+            self._decisions = (pending[:5], key)  # Top 5
+        return self._decisions[0]
     
     def get_intelligence_alerts(self):
         """Important signals from news/loophole scanners"""
-        alerts = []
+        key = _file_key(self.anomaly_log)
+        if key == self._alerts[1]:
+            return self._alerts[0]
         
-        # Check anomaly log
-        anomaly_log = Path(__file__).parent.parent / "Logs" / "anomalies.log"
-        if anomaly_log.exists():
-            with open(anomaly_log, 'r') as f:
-                lines = f.readlines()[-10:]  # Last 10
-                for line in lines:
-                    try:
-                        alert = json.loads(line)
-                        if alert.get("severity") == "HIGH":
-                            alerts.append(alert)
-                    except:
-                        pass
+        # HIGH-severity records among the last 10 lines of the anomaly log
+        alerts = []
+        if key is not None:
+            alerts = tail_records(self.anomaly_log, 10, lambda alert: alert.get("severity") == "HIGH", scan_limit=10)
         
+        self._alerts = (alerts, key)
         return alerts
     
+    def _purchases_db_ready(self):
+        """purchases.db path, created if missing (building CapitalReinvestment initialises the db)"""
+        return self.capital.purchases_db
+    
+    def _data_key(self):
+        # Stat purchases.db only once it exists, or the first key is stale as soon as it is created
+        purchases_key = _file_key(self._purchases_db_ready())
+        version = self.ledger.refresh()
+        return (datetime.now().date(), version, purchases_key, _file_key(self.anomaly_log))
+    
     def generate_briefing(self):
-        """Create full daily briefing"""
-        from System.Finance.capital_reinvestment import CapitalReinvestment
+        """Create full daily briefing (cached until the underlying data changes)"""
+        key = self._data_key()
+        if key == self._briefing[1]:
+            return self._briefing[0]
         
-        capital = CapitalReinvestment()
-        total_revenue = capital.get_total_revenue()
-        next_milestone = capital.get_next_milestone(total_revenue)
+        total_revenue = self.ledger.total_revenue
+        next_milestone = self.capital.get_next_milestone(total_revenue)
         
-        overnight = self.get_overnight_activity()
-        decisions = self.get_pending_decisions()
+        overnight = self.ledger.recent_activity()
+        decisions = self.get_pending_decisions(total_revenue)
         alerts = self.get_intelligence_alerts()
         
         # Calculate overnight revenue
@@ -122,12 +147,25 @@ class DirectorBriefing:
         with open(filename, 'w') as f:
             json.dump(briefing, f, indent=2)
         
+        self._briefing = (briefing, key)
         return briefing
     
+    def render_briefing(self, briefing):
+        """Briefing as terminal text"""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self._print_sections(briefing)
+        return out.getvalue()
+    
     def print_briefing(self):
         """Display briefing in terminal"""
         briefing = self.generate_briefing()
-        
+        if self._rendered[1] is not briefing:
+            self._rendered = (self.render_briefing(briefing), briefing)
+        print(self._rendered[0], end="")
+        return briefing
+    
+    def _print_sections(self, briefing):
         print("\n" + "="*60)
         print(f"📋 DAILY DIRECTOR BRIEFING - {datetime.now().strftime('%b %d, %Y')}")
         print("="*60)
@@ -184,9 +222,60 @@ class DirectorBriefing:
         print("\n" + "="*60)
         print("⏱️ Review complete. System operational.")
         print("="*60 + "\n")
-        
-        return briefing
+
+def benchmark(transactions=200_000, anomaly_lines=200_000):
+    """Cold vs warm generate_briefing on a synthetic ledger and anomalies.log"""
+    import random
+    import sqlite3
+    import tempfile
+    
+    rng = random.Random(1)
+    tmp = Path(tempfile.mkdtemp(prefix="briefing_"))
+    conn = sqlite3.connect(tmp / "ledger.db")
+    conn.execute("""
+        CREATE TABLE transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT NOT NULL, type TEXT NOT NULL,
+            action TEXT, amount REAL NOT NULL, asset TEXT, timestamp TEXT NOT NULL, notes TEXT
+        )
+    """)
+    start = datetime.now() - timedelta(days=60)
+    step = timedelta(days=60) / transactions
+    conn.executemany(
+        "INSERT INTO transactions (source, type, action, amount, timestamp) VALUES (?, ?, ?, ?, ?)",
+        [(rng.choice(["Gumroad", "Medium", "Crypto"]), "REVENUE", "SALE", round(rng.uniform(1, 50), 2),
+          (start + step * i).isoformat()) for i in range(transactions)])
+    conn.commit()
+    
+    with open(tmp / "anomalies.log", "w") as f:
+        for i in range(anomaly_lines):
+            f.write(json.dumps({"type": "REVENUE_DROP", "severity": "HIGH" if i % 7 == 0 else "LOW",
+                                "message": f"Synthetic anomaly {i}"}) + "\n")
+    
+    def timed(fn, runs=1):
+        t = time.perf_counter()
+        for _ in range(runs):
+            fn()
+        return (time.perf_counter() - t) / runs * 1000
+    
+    briefing = DirectorBriefing(ledger_db=tmp / "ledger.db", logs_dir=tmp)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cold = timed(briefing.print_briefing)
+        warm = timed(briefing.print_briefing, runs=100)
+        conn.execute("INSERT INTO transactions (source, type, action, amount, timestamp) VALUES (?, ?, ?, ?, ?)",
+                     ("Gumroad", "REVENUE", "SALE", 9.99, datetime.now().isoformat()))
+        conn.commit()
+        changed = timed(briefing.print_briefing)
+    conn.close()
+    
+    size_mb = (tmp / "anomalies.log").stat().st_size / 1e6
+    print(f"\n{transactions:,} transactions, anomalies.log {size_mb:.1f} MB")
+    print(f"cold:              {cold:8.2f} ms")
+    print(f"warm (unchanged):  {warm:8.3f} ms")
+    print(f"warm (1 new row):  {changed:8.2f} ms")
 
 if __name__ == "__main__":
-    briefing = DirectorBriefing()
-    briefing.print_briefing()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        briefing = DirectorBriefing()
+        briefing.print_briefing()
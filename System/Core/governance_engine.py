@@ -4,6 +4,7 @@ Implements: Singapore MGF Framework, Continuous Monitoring, AI Audit Trail
 Purpose: Enterprise-grade governance, regulatory compliance, and risk management.
 """
 
+import sys
 import json
 import hashlib
 import time
@@ -13,6 +14,10 @@ from typing import Dict, List, Optional, Any
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.log_reader import TimeIndex
+
 
 class RiskLevel(Enum):
     LOW = "LOW"
@@ -206,15 +211,11 @@ class GovernanceEngine:
         records = []
         
         if self.audit_log.exists():
-            with open(self.audit_log, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        record = json.loads(line.strip())
-                        record_time = datetime.fromisoformat(record["timestamp"])
-                        if record_time > cutoff:
-                            records.append(record)
-                    except:
-                        pass
+            # Sparse timestamp index: seek to the window instead of parsing the whole trail
+            if getattr(self, "_audit_index", None) is None:
+                self._audit_index = TimeIndex(self.audit_log)
+            records = [r for r in self._audit_index.window_records(cutoff)
+                       if "compliance_status" in r and "risk_level" in r and "agent_name" in r]
         
         # Analyze records
         total = len(records)
@@ -0,0 +1,97 @@
+"""
+MONOLITH LEDGER SNAPSHOT
+Shared, incrementally refreshed view of ledger.db
+
+One bootstrap (two aggregate queries), then every refresh reads only rows
+inserted since the last one (primary-key range scan). Holds:
+- All-time revenue (type = 'REVENUE')
+- Every transaction in the trailing window (default 24h)
+- A version that changes whenever either of the above changes
+
+Use LedgerSnapshot.shared(path) so every component in the process reads
+the same snapshot instead of re-querying.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+
+class LedgerSnapshot:
+    _instances: Dict[str, "LedgerSnapshot"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, ledger_db: Optional[Path] = None) -> "LedgerSnapshot":
+        ledger_db = Path(ledger_db) if ledger_db else Path(__file__).parent.parent / "Logs" / "ledger.db"
+        key = str(ledger_db.resolve())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(ledger_db)
+            return cls._instances[key]
+
+    def __init__(self, ledger_db: Path, window_hours=24):
+        self.ledger_db = Path(ledger_db)
+        self.window = timedelta(hours=window_hours)
+        self._lock = threading.Lock()
+        self.last_id = -1          # -1 = not bootstrapped
+        self.total_revenue = 0.0
+        self._recent: List[Tuple] = []  # (id, source, action, amount, timestamp, type)
+
+    def _bootstrap(self, cursor, cutoff: str):
+        cursor.execute("""
+            SELECT COALESCE(MAX(id), 0),
+                   COALESCE(SUM(CASE WHEN type = 'REVENUE' THEN amount END), 0)
+            FROM transactions
+        """)
+        self.last_id, self.total_revenue = cursor.fetchone()
+        cursor.execute("""
+            SELECT id, source, action, amount, timestamp, type
+            FROM transactions
+            WHERE timestamp > ? AND id <= ?
+        """, (cutoff, self.last_id))
+        self._recent = cursor.fetchall()
+
+    def refresh(self, now: Optional[datetime] = None) -> Tuple[int, int]:
+        """Pulls new inserts and ages out old window rows; returns the version"""
+        cutoff = ((now or datetime.now()) - self.window).isoformat()
+        with self._lock:
+            if not self.ledger_db.exists():
+                self.last_id, self.total_revenue, self._recent = 0, 0.0, []
+                return self.version
+
+            conn = sqlite3.connect(self.ledger_db)
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM transactions")
+            max_id = cursor.fetchone()[0]
+            if self.last_id < 0 or max_id < self.last_id:
+                self._bootstrap(cursor, cutoff)  # First use, or the ledger was rebuilt
+            elif max_id > self.last_id:
+                cursor.execute("""
+                    SELECT id, source, action, amount, timestamp, type
+                    FROM transactions
+                    WHERE id > ?
+                    ORDER BY id
+                """, (self.last_id,))
+                for row in cursor.fetchall():
+                    if row[5] == "REVENUE":
+                        self.total_revenue += row[3]
+                    if row[4] > cutoff:
+                        self._recent.append(row)
+                    self.last_id = row[0]
+            conn.close()
+
+            if self._recent and min(r[4] for r in self._recent) <= cutoff:
+                self._recent = [r for r in self._recent if r[4] > cutoff]
+            return self.version
+
+    @property
+    def version(self) -> Tuple[int, int]:
+        return (self.last_id, len(self._recent))
+
+    def recent_activity(self) -> List[Dict[str, Any]]:
+        """Window transactions, newest first (same shape as the old 24h query)"""
+        rows = sorted(self._recent, key=lambda r: r[4], reverse=True)
+        return [{"source": s, "action": a, "amount": amt, "timestamp": ts} for _, s, a, amt, ts, _ in rows]
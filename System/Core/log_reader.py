@@ -0,0 +1,343 @@
+"""
+MONOLITH LOG READER
+Tail, incremental and time-window reads for JSONL and text logs
+
+Features:
+- Reverse block reader: newest lines first, reading fixed-size blocks
+  backwards from EOF (cost depends on how much is read, not file size)
+- LogCursor: persisted byte-offset checkpoint per consumer, so each
+  consumer reads only what was appended since its last read
+  (truncation / rotation restarts from the beginning)
+- TimeIndex: sparse timestamp -> byte-offset index (one entry per stride),
+  extended incrementally, used to seek straight to a time window
+
+Logs are assumed to be appended in time order (true for every writer in
+Monolith); the index steps back one extra stride to absorb small disorder.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+STATE_DIR = Path(__file__).parent.parent / "Logs" / "log_reader"
+BLOCK_SIZE = 64 * 1024
+INDEX_STRIDE = 1024 * 1024
+
+
+# --- Reverse reading ---
+def reverse_lines(path, block_size=BLOCK_SIZE) -> Iterator[str]:
+    """Yields lines newest first, without trailing newlines"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        remainder = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + remainder
+            lines = chunk.split(b"\n")
+            remainder = lines.pop(0)  # May continue in the previous block
+            for line in reversed(lines):
+                if line:
+                    yield line.decode("utf-8", "replace")
+        if remainder:
+            yield remainder.decode("utf-8", "replace")
+
+
+def tail(path, n=10) -> List[str]:
+    """Last n lines, oldest first (drop-in for readlines()[-n:] without the newlines)"""
+    if n <= 0 or not Path(path).exists():
+        return []
+    lines = []
+    for line in reverse_lines(path):
+        lines.append(line)
+        if len(lines) >= n:
+            break
+    lines.reverse()
+    return lines
+
+
+def tail_records(path, n=10, predicate: Optional[Callable[[Dict], bool]] = None, scan_limit=None) -> List[Dict]:
+    """
+    Newest n JSON records (oldest first) that satisfy predicate.
+    scan_limit caps how many lines are inspected (None = until n matches or BOF).
+    """
+    if not Path(path).exists():
+        return []
+    records, scanned = [], 0
+    for line in reverse_lines(path):
+        scanned += 1
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if isinstance(record, dict) and (predicate is None or predicate(record)):
+            records.append(record)
+            if len(records) >= n:
+                break
+        if scan_limit and scanned >= scan_limit:
+            break
+    records.reverse()
+    return records
+
+
+# --- Timestamps ---
+def parse_timestamp(line: str) -> Optional[datetime]:
+    """JSON lines: the "timestamp" field. Text lines: a leading ISO-style stamp."""
+    line = line.strip()
+    if line.startswith("{"):
+        try:
+            value = json.loads(line).get("timestamp")
+            return datetime.fromisoformat(value) if value else None
+        except (ValueError, AttributeError, TypeError):
+            return None
+    try:
+        return datetime.fromisoformat(line[:19].replace(" ", "T"))
+    except ValueError:
+        return None
+
+
+def _state_file(path: Path, kind: str, name: str = "") -> Path:
+    digest = hashlib.blake2b(str(Path(path).resolve()).encode(), digest_size=6).hexdigest()
+    return STATE_DIR / f"{Path(path).name}.{digest}.{kind}{'.' + name if name else ''}.json"
+
+
+def _write_json(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+# --- Incremental consumption ---
+class LogCursor:
+    """
+    Per-consumer "since last read" position in a log.
+    `state` is persisted with the offset, so consumers can keep running aggregates.
+    """
+
+    def __init__(self, path, consumer: str, checkpoint: Optional[Path] = None):
+        self.path = Path(path)
+        self.consumer = consumer
+        self.checkpoint = Path(checkpoint) if checkpoint else _state_file(self.path, "cursor", consumer)
+        self.offset = 0
+        self.inode = None
+        self.state: Dict[str, Any] = {}
+        try:
+            data = json.loads(self.checkpoint.read_text())
+            self.offset = data.get("offset", 0)
+            self.inode = data.get("inode")
+            self.state = data.get("state", {})
+        except (OSError, ValueError):
+            pass
+        self._pending = self.offset
+
+    def read_new(self, max_bytes=None) -> List[str]:
+        """Complete lines appended since the last commit (a partial last line waits for its newline)"""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return []
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            # Rotated or truncated: start over
+            self.offset, self.inode, self.state = 0, st.st_ino, {}
+        self._pending = self.offset
+        if st.st_size == self.offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(max_bytes) if max_bytes else f.read()
+        end = data.rfind(b"\n")
+        if end < 0:
+            return []
+        self._pending = self.offset + end + 1
+        return [line.decode("utf-8", "replace") for line in data[:end].split(b"\n") if line]
+
+    def seek_end(self):
+        """Skips everything already in the log (consume only future appends)"""
+        st = self.path.stat()
+        self.offset = self._pending = st.st_size
+        self.inode = st.st_ino
+
+    def commit(self, persist=True):
+        """Advances past the lines returned by the last read_new() and persists the position"""
+        self.offset = self._pending
+        if not persist:
+            return
+        _write_json(self.checkpoint, {
+            "path": str(self.path),
+            "offset": self.offset,
+            "inode": self.inode,
+            "state": self.state,
+            "updated": datetime.now().isoformat(),
+        })
+
+
+# --- Time-window queries ---
+class TimeIndex:
+    """Sparse (timestamp, offset) index: one entry at the first line after every `stride` bytes"""
+
+    def __init__(self, path, stride=INDEX_STRIDE, parse: Callable[[str], Optional[datetime]] = parse_timestamp,
+                 index_file: Optional[Path] = None):
+        self.path = Path(path)
+        self.stride = stride
+        self.parse = parse
+        self.index_file = Path(index_file) if index_file else _state_file(self.path, "tsidx")
+        self.entries: List[list] = []   # [iso timestamp, offset]
+        self.indexed_to = 0
+        self.inode = None
+        try:
+            data = json.loads(self.index_file.read_text())
+            if data.get("stride") == stride:
+                self.entries = data.get("entries", [])
+                self.indexed_to = data.get("indexed_to", 0)
+                self.inode = data.get("inode")
+        except (OSError, ValueError):
+            pass
+
+    def update(self) -> int:
+        """Extends the index over newly appended bytes; returns entries added"""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return 0
+        if st.st_ino != self.inode or st.st_size < self.indexed_to:
+            self.entries, self.indexed_to, self.inode = [], 0, st.st_ino
+
+        added, before = 0, self.indexed_to
+        with open(self.path, "rb") as f:
+            pos = self.indexed_to
+            while pos < st.st_size:
+                f.seek(pos)
+                if pos:
+                    f.readline()  # Skip to the next line boundary
+                offset = f.tell()
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # Partial line still being written
+                ts = self.parse(line.decode("utf-8", "replace"))
+                if ts is not None and (not self.entries or self.entries[-1][1] < offset):
+                    self.entries.append([ts.isoformat(), offset])
+                    added += 1
+                pos += self.stride
+            self.indexed_to = min(pos, st.st_size)
+
+        if added or self.indexed_to != before:
+            _write_json(self.index_file, {
+                "path": str(self.path), "stride": self.stride, "inode": self.inode,
+                "indexed_to": self.indexed_to, "entries": self.entries,
+            })
+        return added
+
+    def seek_offset(self, start: datetime) -> int:
+        """Byte offset from which every line with timestamp > start is guaranteed to follow"""
+        stamps = [datetime.fromisoformat(ts) for ts, _ in self.entries]
+        i = bisect_right(stamps, start) - 2  # One extra entry back for small disorder
+        return self.entries[i][1] if i >= 0 else 0
+
+    def window(self, start: datetime, end: Optional[datetime] = None) -> Iterator[str]:
+        """Lines with start < timestamp <= end (end=None: through EOF)"""
+        if not self.path.exists():
+            return
+        self.update()
+        with open(self.path, "rb") as f:
+            f.seek(self.seek_offset(start))
+            for raw in f:
+                line = raw.decode("utf-8", "replace").rstrip("\n")
+                ts = self.parse(line)
+                if ts is None or ts <= start:
+                    continue
+                if end is not None and ts > end:
+                    break
+                yield line
+
+    def window_records(self, start: datetime, end: Optional[datetime] = None) -> Iterator[Dict]:
+        for line in self.window(start, end):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                pass
+
+
+def benchmark(size_gb=1.0, path=None):
+    """Tail / window / incremental reads on a synthetic JSONL log of size_gb"""
+    import tempfile
+
+    tmp = Path(tempfile.mkdtemp(prefix="log_reader_"))
+    path = Path(path) if path else tmp / "audit_trail.jsonl"
+    target = int(size_gb * 1024 ** 3)
+    start = datetime.now() - timedelta(days=30)
+
+    if not path.exists() or path.stat().st_size < target:
+        t = time.perf_counter()
+        pad = "x" * 120
+        with open(path, "w") as f:
+            written, i = 0, 0
+            while written < target:
+                batch = []
+                for _ in range(10000):
+                    ts = start + timedelta(seconds=i * 0.25)
+                    batch.append(json.dumps({"timestamp": ts.isoformat(), "agent_name": f"agent_{i % 40}",
+                                             "compliance_status": "COMPLIANT", "risk_level": "LOW",
+                                             "payload": pad}) + "\n")
+                    i += 1
+                chunk = "".join(batch)
+                f.write(chunk)
+                written += len(chunk)
+        print(f"Generated {written / 1024 ** 3:.2f} GB ({i:,} lines) in {time.perf_counter() - t:.1f}s")
+
+    def timed(fn):
+        t = time.perf_counter()
+        result = fn()
+        return (time.perf_counter() - t) * 1000, result
+
+    results = []
+    ms, _ = timed(lambda: open(path).readlines()[-10:])
+    results.append(("tail 10: readlines()[-10:]", ms))
+    ms, _ = timed(lambda: tail(path, 10))
+    results.append(("tail 10: reverse reader", ms))
+
+    cutoff = parse_timestamp(tail(path, 1)[0]) - timedelta(hours=1)   # Last hour of the log
+    def full_scan():
+        n = 0
+        with open(path) as f:
+            for line in f:
+                if datetime.fromisoformat(json.loads(line)["timestamp"]) > cutoff:
+                    n += 1
+        return n
+    ms, n_scan = timed(full_scan)
+    results.append(("1h window: full scan", ms))
+
+    index = TimeIndex(path, index_file=tmp / "idx.json")
+    ms, _ = timed(index.update)
+    results.append(("index build (one-time)", ms))
+    ms, n_idx = timed(lambda: sum(1 for _ in TimeIndex(path, index_file=tmp / "idx.json").window(cutoff)))
+    results.append(("1h window: sparse index", ms))
+    assert n_idx == n_scan, (n_idx, n_scan)
+
+    cursor = LogCursor(path, "bench", checkpoint=tmp / "cursor.json")
+    cursor.seek_end()
+    cursor.commit()
+    with open(path, "a") as f:
+        for i in range(1000):
+            f.write(json.dumps({"timestamp": datetime.now().isoformat(), "n": i}) + "\n")
+    ms, new = timed(lambda: LogCursor(path, "bench", checkpoint=tmp / "cursor.json").read_new())
+    results.append((f"since-last-read ({len(new)} new lines)", ms))
+
+    print(f"\n{path.stat().st_size / 1024 ** 3:.2f} GB log, {n_scan:,} lines in the window")
+    for name, ms in results:
+        print(f"{name:<34} {ms:>10.1f} ms")
+    if path.parent == tmp:
+        path.unlink()
+
+
+if __name__ == "__main__":
+    benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)
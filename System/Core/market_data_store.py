@@ -0,0 +1,342 @@
+"""
+MARKET DATA STORE - Project Monolith v5.1
+Purpose: Shared local cache + recorder for prices (OHLCV bars and ticks).
+Strategy: One columnar, append-only partition per symbol so every consumer
+(MarketOracle, HydraMonitor, Overwatch) reads the same data instead of each
+hitting the price API on every call.
+
+Layout:
+    System/Logs/MarketData/<SYMBOL>/<kind>/<column>.f64
+Each column is a flat little-endian float64 file. Rows are appended to every
+column; the committed row count is the shortest column, so a crash mid-append
+never exposes a torn row.
+
+Replay:
+    ReplayFeed streams recorded rows back in timestamp order at any speed and
+    pins the store clock, so read-through lookups return recorded data instead
+    of fetching. Strategy and anomaly code become deterministic offline.
+"""
+
+import os
+import sys
+import time
+import heapq
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Configuration ---
+STORE_DIR = Path(__file__).parent.parent / "Logs" / "MarketData"
+
+SCHEMAS = {
+    "ticks": ("ts", "price", "volume", "change"),
+    "ohlcv": ("ts", "open", "high", "low", "close", "volume"),
+}
+ITEM_SIZE = 8  # float64
+
+
+def _safe_symbol(symbol: str) -> str:
+    return symbol.upper().replace("/", "-").replace(os.sep, "-")
+
+
+class Partition:
+    """Append-only columnar partition for one (symbol, kind)"""
+
+    def __init__(self, root: Path, symbol: str, kind: str):
+        if kind not in SCHEMAS:
+            raise ValueError(f"Unknown partition kind: {kind}")
+        self.symbol = symbol
+        self.kind = kind
+        self.columns = SCHEMAS[kind]
+        self.path = root / _safe_symbol(symbol) / kind
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _column_file(self, column: str) -> Path:
+        return self.path / f"{column}.f64"
+
+    def __len__(self):
+        sizes = []
+        for column in self.columns:
+            f = self._column_file(column)
+            sizes.append(f.stat().st_size // ITEM_SIZE if f.exists() else 0)
+        return min(sizes)
+
+    def _last_ts(self, committed: int) -> Optional[float]:
+        if committed == 0:
+            return None
+        with open(self._column_file("ts"), "rb") as f:
+            f.seek((committed - 1) * ITEM_SIZE)
+            buf = array("d", f.read(ITEM_SIZE))
+        if sys.byteorder != "little":
+            buf.byteswap()
+        return buf[0]
+
+    def append(self, rows: Iterable[Dict[str, float]]):
+        """
+        Appends rows (dicts keyed by column) and returns how many were written.
+        The ts column must stay sorted for index_range, so the batch is ordered
+        by ts and rows older than the newest committed row are dropped.
+        """
+        rows = sorted(rows, key=lambda r: float(r.get("ts", 0.0)))
+        if not rows:
+            return 0
+        with self._lock:
+            committed = len(self)
+            newest = self._last_ts(committed)
+            if newest is not None:
+                rows = [r for r in rows if float(r.get("ts", 0.0)) >= newest]
+                if not rows:
+                    return 0
+            for column in self.columns:
+                buf = array("d", (float(r.get(column, 0.0)) for r in rows))
+                if sys.byteorder != "little":
+                    buf.byteswap()
+                with open(self._column_file(column), "ab") as f:
+                    # Drop any torn tail left by a crash before appending
+                    f.truncate(committed * ITEM_SIZE)
+                    f.write(buf.tobytes())
+        return len(rows)
+
+    def column(self, column: str, start: int = 0, stop: Optional[int] = None):
+        """Returns a column slice (numpy memmap view if available, else array('d'))"""
+        n = len(self)
+        stop = n if stop is None else min(stop, n)
+        if stop <= start:
+            return np.empty(0) if np else array("d")
+        f = self._column_file(column)
+        if np:
+            mm = np.memmap(f, dtype="<f8", mode="r", shape=(n,))
+            return mm[start:stop]
+        out = array("d")
+        with open(f, "rb") as fh:
+            fh.seek(start * ITEM_SIZE)
+            out.frombytes(fh.read((stop - start) * ITEM_SIZE))
+        if sys.byteorder != "little":
+            out.byteswap()
+        return out
+
+    def index_range(self, start_ts: Optional[float] = None, end_ts: Optional[float] = None):
+        """Row range [lo, hi) whose timestamps fall inside [start_ts, end_ts]"""
+        ts = self.column("ts")
+        n = len(ts)
+        if np:
+            lo = int(np.searchsorted(ts, start_ts, "left")) if start_ts is not None else 0
+            hi = int(np.searchsorted(ts, end_ts, "right")) if end_ts is not None else n
+        else:
+            lo = bisect_left(ts, start_ts) if start_ts is not None else 0
+            hi = bisect_right(ts, end_ts) if end_ts is not None else n
+        return lo, hi
+
+    def read(self, start_ts: Optional[float] = None, end_ts: Optional[float] = None) -> Dict[str, Any]:
+        """Column dict for a time window"""
+        lo, hi = self.index_range(start_ts, end_ts)
+        return {c: self.column(c, lo, hi) for c in self.columns}
+
+    def last(self, at_ts: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """Most recent row at or before at_ts (or the newest row)"""
+        n = len(self)
+        if n == 0:
+            return None
+        idx = n - 1
+        if at_ts is not None:
+            _, hi = self.index_range(None, at_ts)
+            if hi == 0:
+                return None
+            idx = hi - 1
+        return {c: float(self.column(c, idx, idx + 1)[0]) for c in self.columns}
+
+
+class MarketDataStore:
+    """
+    Shared read-through price cache backed by columnar partitions.
+    Use MarketDataStore.shared() so all components in a process share
+    the in-memory quote cache as well as the files on disk.
+    """
+    _instance = None
+
+    def __init__(self, root: Optional[Path] = None, default_ttl: float = 60.0):
+        self.root = Path(root) if root else STORE_DIR
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self._partitions: Dict[tuple, Partition] = {}
+        self._quotes: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._clock: Optional[Callable[[], float]] = None
+        self.stats = {"hits": 0, "misses": 0, "fetches": 0}
+
+    @classmethod
+    def shared(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # --- Clock (live or replay) ---
+    def now(self) -> float:
+        return self._clock() if self._clock else time.time()
+
+    def set_clock(self, clock: Optional[Callable[[], float]]):
+        """Pins the store to a replay clock; None returns to live mode"""
+        self._clock = clock
+        self._quotes.clear()
+
+    @property
+    def replaying(self) -> bool:
+        return self._clock is not None
+
+    # --- Storage ---
+    def partition(self, symbol: str, kind: str = "ticks") -> Partition:
+        key = (_safe_symbol(symbol), kind)
+        with self._lock:
+            if key not in self._partitions:
+                self._partitions[key] = Partition(self.root, symbol, kind)
+            return self._partitions[key]
+
+    def has_partition(self, symbol: str, kind: str = "ticks") -> bool:
+        """True if the partition was opened or exists on disk (never creates it)"""
+        return (_safe_symbol(symbol), kind) in self._partitions or \
+            (self.root / _safe_symbol(symbol) / kind).is_dir()
+
+    def symbols(self, kind: str = "ticks") -> List[str]:
+        return sorted(p.name for p in self.root.iterdir() if (p / kind).is_dir())
+
+    def record_tick(self, symbol: str, price: float, volume: float = 0.0, change: float = 0.0,
+                    ts: Optional[float] = None):
+        row = {"ts": ts if ts is not None else time.time(), "price": price, "volume": volume, "change": change}
+        if self.partition(symbol, "ticks").append([row]):
+            self._quotes[_safe_symbol(symbol)] = row
+        return row
+
+    def record_bars(self, symbol: str, bars: Iterable[Dict[str, float]]):
+        return self.partition(symbol, "ohlcv").append(bars)
+
+    def read(self, symbol: str, kind: str = "ticks", start_ts=None, end_ts=None):
+        return self.partition(symbol, kind).read(start_ts, end_ts)
+
+    def latest(self, symbol: str) -> Optional[Dict[str, float]]:
+        """Newest known tick without fetching (respects the replay clock)"""
+        key = _safe_symbol(symbol)
+        quote = self._quotes.get(key)
+        if quote is not None and (not self.replaying or quote["ts"] <= self.now()):
+            return quote
+        if not self.has_partition(symbol, "ticks"):
+            return None
+        quote = self.partition(symbol, "ticks").last(self.now() if self.replaying else None)
+        if quote is not None and not self.replaying:
+            self._quotes[key] = quote
+        return quote
+
+    # --- Read-through cache ---
+    def get_quotes(self, symbols: List[str], fetcher: Callable[[List[str]], Dict[str, Dict[str, float]]],
+                   ttl: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Returns {symbol: tick} for every symbol.
+        Fresh ticks (younger than ttl) come from the store; the rest are fetched
+        in a single fetcher(missing) call and recorded. In replay mode nothing
+        is ever fetched.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        now = self.now()
+        result, missing = {}, []
+
+        for symbol in symbols:
+            quote = self.latest(symbol)
+            if quote is not None and (self.replaying or now - quote["ts"] <= ttl):
+                self.stats["hits"] += 1
+                result[symbol] = quote
+            else:
+                self.stats["misses"] += 1
+                missing.append(symbol)
+
+        if missing and not self.replaying:
+            self.stats["fetches"] += 1
+            try:
+                fetched = fetcher(missing) or {}
+            except Exception:
+                fetched = {}
+            for symbol, data in fetched.items():
+                result[symbol] = self.record_tick(
+                    symbol, data["price"], data.get("volume", 0.0), data.get("change", 0.0), ts=now
+                )
+            # Serve stale data rather than nothing when the fetch failed
+            for symbol in missing:
+                if symbol not in result:
+                    stale = self.latest(symbol)
+                    if stale is not None:
+                        result[symbol] = stale
+        return result
+
+    def get_quote(self, symbol: str, fetcher: Callable[[str], Dict[str, float]], ttl: Optional[float] = None):
+        quotes = self.get_quotes([symbol], lambda missing: {missing[0]: fetcher(missing[0])}, ttl)
+        return quotes.get(symbol)
+
+
+class ReplayFeed:
+    """
+    Streams recorded rows back in timestamp order.
+    speed=1.0 is real time, 10.0 is ten times faster, 0 means no sleeping.
+    While iterating, the store clock follows the replay cursor.
+    """
+    def __init__(self, store: MarketDataStore, symbols: Optional[List[str]] = None, kind: str = "ticks",
+                 speed: float = 1.0, start_ts: Optional[float] = None, end_ts: Optional[float] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.store = store
+        self.symbols = symbols or store.symbols(kind)
+        self.kind = kind
+        self.speed = speed
+        self.start_ts = start_ts
+        self.end_ts = end_ts
+        self.sleep = sleep
+        self.cursor: Optional[float] = None
+
+    def _rows(self, symbol: str):
+        cols = self.store.read(symbol, self.kind, self.start_ts, self.end_ts)
+        names = list(cols.keys())
+        for values in zip(*(cols[c] for c in names)):
+            row = {c: float(v) for c, v in zip(names, values)}
+            yield row["ts"], symbol, row
+
+    def __iter__(self):
+        merged = heapq.merge(*(self._rows(s) for s in self.symbols), key=lambda item: item[0])
+        self.store.set_clock(lambda: self.cursor if self.cursor is not None else float("-inf"))
+        wall_start = time.perf_counter()
+        first_ts = None
+        try:
+            for ts, symbol, row in merged:
+                if first_ts is None:
+                    first_ts = ts
+                if self.speed and self.speed > 0:
+                    due = (ts - first_ts) / self.speed
+                    lag = due - (time.perf_counter() - wall_start)
+                    if lag > 0:
+                        self.sleep(lag)
+                self.cursor = ts
+                yield symbol, row
+        finally:
+            self.store.set_clock(None)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Market data store")
+    parser.add_argument("command", choices=["list", "replay"])
+    parser.add_argument("symbols", nargs="*")
+    parser.add_argument("--kind", default="ticks", choices=list(SCHEMAS))
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args()
+
+    store = MarketDataStore.shared()
+    if args.command == "list":
+        for symbol in store.symbols(args.kind):
+            print(f"{symbol:<12} {len(store.partition(symbol, args.kind)):>10} rows")
+    else:
+        for symbol, row in ReplayFeed(store, args.symbols or None, args.kind, args.speed):
+            print(f"[REPLAY] {symbol:<10} {row}")
@@ -0,0 +1,250 @@
+"""
+MONOLITH REFRESH CACHE
+Background-refreshed, versioned cache for slow upstreams (HTTP APIs, RSS, IMAP, files)
+
+Each source is a loader function with a TTL. One refresher thread reloads
+sources shortly before they expire (on a small worker pool, so one slow
+upstream never delays the others); request handlers read from memory:
+
+    cache = RefreshCache.shared()
+    cache.register("ip", fetch_ip, ttl=300, default={})
+    cache.start()
+    value, meta = cache.entry("ip", block=False)
+
+Stale-while-revalidate: past its TTL a value is still served, marked
+"stale", while one background reload runs. Past ttl + max_stale it is
+"expired" and a blocking read reloads in the caller. A failed reload keeps
+the last good value and records the error. The version increases only when
+a reload returns a different value.
+"""
+
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, Tuple
+
+REFRESH_AHEAD = 0.8   # Reload once a value is this fraction of its TTL old
+RETRY_MAX = 10.0      # Seconds before a failed source is retried (capped by its TTL)
+
+
+class _Source:
+    def __init__(self, name: str, loader: Callable[[], Any], ttl: float, max_stale: float, default: Any):
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.value = default
+        self.version = 0
+        self.loaded_at: Optional[float] = None     # monotonic
+        self.fetched_at: Optional[float] = None    # wall clock, for clients
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self.retry_at = 0.0
+        self.refreshing = False
+        self.lock = threading.Lock()
+
+
+class RefreshCache:
+    _instance = None
+
+    def __init__(self, workers=4):
+        self._sources: Dict[str, _Source] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="refresh")
+        self.stats = {"hits": 0, "stale": 0, "blocking": 0, "loads": 0, "errors": 0}
+
+    @classmethod
+    def shared(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def register(self, name: str, loader: Callable[[], Any], ttl: float,
+                 max_stale: Optional[float] = None, default: Any = None):
+        """max_stale defaults to 10x the TTL"""
+        with self._lock:
+            self._sources[name] = _Source(name, loader, ttl, ttl * 10 if max_stale is None else max_stale, default)
+        self._wake.set()
+
+    # --- Loading ---
+    def refresh(self, name: str) -> bool:
+        """Runs the loader in the calling thread; False if it raised"""
+        source = self._sources[name]
+        start = time.monotonic()
+        try:
+            value = source.loader()
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        duration = time.monotonic() - start
+        with source.lock:
+            source.refreshing = False
+            source.duration = duration
+            self.stats["loads"] += 1
+            if error:
+                source.error = error
+                source.retry_at = time.monotonic() + min(source.ttl, RETRY_MAX)
+                self.stats["errors"] += 1
+            else:
+                if source.version == 0 or value != source.value:
+                    source.version += 1
+                source.value = value
+                source.error = None
+                source.loaded_at = time.monotonic()
+                source.fetched_at = time.time()
+        self._wake.set()   # Refresher recomputes its next due time
+        return error is None
+
+    def _schedule(self, source: _Source) -> bool:
+        """Starts one background reload unless one is already running"""
+        with source.lock:
+            if source.refreshing:
+                return False
+            source.refreshing = True
+        self._pool.submit(self.refresh, source.name)
+        return True
+
+    # --- Reads ---
+    def _state(self, source: _Source, now: float) -> str:
+        if source.loaded_at is None:
+            return "empty"
+        age = now - source.loaded_at
+        if age <= source.ttl:
+            return "fresh"
+        return "stale" if age <= source.ttl + source.max_stale else "expired"
+
+    def entry(self, name: str, block=True) -> Tuple[Any, Dict[str, Any]]:
+        """
+        (value, freshness). Fresh and stale values come from memory; empty or
+        expired sources reload in the caller when block=True, otherwise the
+        current value (or the default) is returned while a reload runs.
+        """
+        source = self._sources[name]
+        state = self._state(source, time.monotonic())
+        if state == "fresh":
+            self.stats["hits"] += 1
+        elif state == "stale" or not block:
+            self.stats["stale"] += 1
+            if time.monotonic() >= source.retry_at:
+                self._schedule(source)
+        else:
+            self.stats["blocking"] += 1
+            self.refresh(name)
+        return source.value, self.freshness(name)[name]
+
+    def get(self, name: str, block=True) -> Any:
+        return self.entry(name, block)[0]
+
+    def freshness(self, *names: str) -> Dict[str, Dict[str, Any]]:
+        """Per-source metadata for responses: version, age, state, last error"""
+        now = time.monotonic()
+        result = {}
+        for name in names or list(self._sources):
+            source = self._sources[name]
+            result[name] = {
+                "version": source.version,
+                "state": self._state(source, now),
+                "age": round(now - source.loaded_at, 3) if source.loaded_at is not None else None,
+                "ttl": source.ttl,
+                "fetched_at": source.fetched_at,
+                "fetch_ms": round(source.duration * 1000, 1) if source.duration is not None else None,
+                "error": source.error,
+            }
+        return result
+
+    # --- Background refresher ---
+    def _run(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            sleep = 1.0
+            for source in list(self._sources.values()):
+                due = max(source.retry_at,
+                          now if source.loaded_at is None else source.loaded_at + source.ttl * REFRESH_AHEAD)
+                if due <= now:
+                    self._schedule(source)
+                else:
+                    sleep = min(sleep, due - now)
+            self._wake.wait(max(sleep, 0.01))
+            self._wake.clear()
+
+    def start(self):
+        """Starts the refresher; every registered source begins loading immediately"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="refresh-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+
+def benchmark(latency=0.15, requests_count=200):
+    """Dashboard request latency: four upstream calls in the handler vs cache reads"""
+    import json
+    import urllib.request
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Upstream(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps({"path": self.path, "t": time.time()}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    names = ("ip", "prices", "news", "mail")
+
+    def fetcher(name):
+        return lambda: json.loads(urllib.request.urlopen(f"{base}/{name}", timeout=5).read())
+
+    start = time.perf_counter()
+    for _ in range(5):
+        for name in names:
+            fetcher(name)()
+    direct = (time.perf_counter() - start) / 5
+
+    cache = RefreshCache()
+    for name in names:
+        cache.register(name, fetcher(name), ttl=1.0, max_stale=30)
+    cache.start()
+    time.sleep(latency * 3)
+
+    samples = []
+    deadline = time.time() + 3
+    while time.time() < deadline:
+        start = time.perf_counter()
+        for name in names:
+            cache.entry(name, block=False)
+        samples.append(time.perf_counter() - start)
+        time.sleep(3 / requests_count)
+    cache.stop()
+    server.shutdown()
+
+    samples.sort()
+    print(f"\nUpstream latency {latency * 1000:.0f} ms x {len(names)} sources")
+    print(f"{'':<28} {'per request':>14}")
+    print(f"{'inline fetches (before)':<28} {direct * 1e6:>12,.0f}us")
+    print(f"{'refresh cache p50':<28} {samples[len(samples) // 2] * 1e6:>12,.1f}us")
+    print(f"{'refresh cache max':<28} {samples[-1] * 1e6:>12,.1f}us")
+    print(f"Background loads in 3 s: {cache.stats['loads']} (TTL 1 s), requests served: {len(samples)}, "
+          f"blocking reads: {cache.stats['blocking']}")
+
+
+if __name__ == "__main__":
+    benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 0.15)
@@ -0,0 +1,195 @@
+"""
+MONOLITH RESOURCE SAMPLER
+Background psutil sampling into a shared ring buffer
+
+One daemon thread per process polls CPU, memory, disk usage and disk IO
+every `interval` seconds. Consumers read the latest sample or windowed
+averages / percentiles from memory and never wait on psutil:
+
+    sampler = ResourceSampler.shared()
+    sampler.latest()["cpu"]
+    sampler.stats(60)["cpu"]["p95"]
+
+Before the first tick completes, CPU is the average since boot (from
+cpu_times), so the very first read is meaningful without blocking. That
+priming sample is flagged (cpu_boot_average) and dropped from CPU stats once
+real ticks exist; one-shot callers can take a real reading with measure_cpu().
+"""
+
+import sys
+import time
+import threading
+from collections import deque
+from typing import Dict, List, Any, Optional
+
+import psutil
+
+METRICS = ("cpu", "ram", "ram_available_gb", "disk", "read_bps", "write_bps")
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+class ResourceSampler:
+    _instances: Dict[str, "ResourceSampler"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, interval=1.0, capacity=600, disk_path="/") -> "ResourceSampler":
+        """Process-wide sampler for disk_path, started on first use"""
+        with cls._instances_lock:
+            if disk_path not in cls._instances:
+                sampler = cls(interval=interval, capacity=capacity, disk_path=disk_path)
+                sampler.start()
+                cls._instances[disk_path] = sampler
+            return cls._instances[disk_path]
+
+    def __init__(self, interval=1.0, capacity=600, disk_path="/"):
+        self.interval = interval
+        self.disk_path = disk_path
+        self.samples: deque = deque(maxlen=capacity)
+        self.ram_total_gb = psutil.virtual_memory().total / (1024 ** 3)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_io = None
+
+    # --- Collection ---
+    def _io_rates(self, now: float) -> Dict[str, Optional[float]]:
+        try:
+            io = psutil.disk_io_counters()
+        except (OSError, RuntimeError):
+            io = None
+        rates = {"read_bps": None, "write_bps": None}
+        if io is not None:
+            if self._last_io is not None:
+                elapsed = max(now - self._last_io[0], 1e-6)
+                rates["read_bps"] = (io.read_bytes - self._last_io[1].read_bytes) / elapsed
+                rates["write_bps"] = (io.write_bytes - self._last_io[1].write_bytes) / elapsed
+            self._last_io = (now, io)
+        return rates
+
+    def sample_now(self, cpu: Optional[float] = None) -> Dict[str, Any]:
+        """Takes one sample (never blocks on a CPU interval) and records it"""
+        now = time.time()
+        if cpu is None:
+            cpu = psutil.cpu_percent(interval=None)
+        vm = psutil.virtual_memory()
+        try:
+            disk = psutil.disk_usage(self.disk_path).percent
+        except OSError:
+            disk = None
+        return self.record(timestamp=now, cpu=cpu, ram=vm.percent,
+                           ram_available_gb=vm.available / (1024 ** 3), disk=disk, **self._io_rates(now))
+
+    def measure_cpu(self, interval=0.5) -> Dict[str, Any]:
+        """Blocks for `interval` to record one real CPU reading (for one-shot processes)"""
+        return self.sample_now(cpu=psutil.cpu_percent(interval=interval))
+
+    def record(self, **sample) -> Dict[str, Any]:
+        sample.setdefault("timestamp", time.time())
+        with self._lock:
+            self.samples.append(sample)
+        return sample
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_now()
+            except Exception as e:
+                print(f"[SAMPLER] ⚠️ Sample failed: {e}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        # Prime: cpu_percent(None) measures from this call; until the first tick use the since-boot average
+        psutil.cpu_percent(interval=None)
+        times = psutil.cpu_times()
+        total = sum(times)
+        idle = getattr(times, "idle", 0) + getattr(times, "iowait", 0)
+        self.sample_now(cpu=round(100 * (1 - idle / total), 1) if total else 0.0)
+        with self._lock:
+            self.samples[-1]["cpu_boot_average"] = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+
+    # --- Reads (memory only) ---
+    def latest(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.samples[-1]) if self.samples else {}
+
+    def window(self, seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Samples from the last `seconds` (None = whole buffer), oldest first"""
+        with self._lock:
+            samples = list(self.samples)
+        if seconds is None or not samples:
+            return samples
+        cutoff = samples[-1]["timestamp"] - seconds
+        return [s for s in samples if s["timestamp"] >= cutoff]
+
+    def stats(self, seconds: Optional[float] = 60) -> Dict[str, Any]:
+        """
+        {metric: {avg, p50, p95, max, last}} over the window, plus the sample count.
+        cpu_boot_average is True when the only CPU value is the since-boot priming one.
+        """
+        samples = self.window(seconds)
+        measured = [s for s in samples if not s.get("cpu_boot_average")]
+        result: Dict[str, Any] = {"samples": len(samples),
+                                  "cpu_boot_average": bool(samples) and not measured}
+        for metric in METRICS:
+            source = measured if metric == "cpu" and measured else samples
+            values = [s[metric] for s in source if s.get(metric) is not None]
+            if not values:
+                result[metric] = None
+                continue
+            result[metric] = {
+                "avg": sum(values) / len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "max": max(values),
+                "last": values[-1],
+            }
+        return result
+
+
+def benchmark(calls=2000):
+    """Blocking psutil calls vs reads from a running sampler"""
+    def timed(fn, n):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - start) / n * 1e6
+
+    sampler = ResourceSampler(interval=0.1)
+    sampler.start()
+    time.sleep(0.5)
+
+    rows = [
+        ("cpu_percent(interval=1)", timed(lambda: psutil.cpu_percent(interval=1), 2)),
+        ("sampler.stats(60)", timed(lambda: sampler.stats(60), calls)),
+        ("virtual_memory() x2 (profile_task)", timed(lambda: (psutil.virtual_memory(), psutil.virtual_memory()), calls)),
+        ("sampler.latest()", timed(sampler.latest, calls)),
+    ]
+    tick = timed(sampler.sample_now, 200)
+    sampler.stop()
+
+    print(f"\n{'':<36} {'us/call':>12}")
+    for name, us in rows:
+        print(f"{name:<36} {us:>12,.1f}")
+    print(f"Background cost: {tick:.0f} us per tick ({tick / 1e4:.3f}% of one core at 1 s cadence)")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,445 @@
+"""
+MONOLITH STATE PUSH
+One watcher, many clients: sentinel, state-file, ledger and log-tail deltas
+
+StateHub scans its sources in a single thread. A scan is one stat per
+watched file; only files whose (mtime, size) changed are read, the ledger
+is queried only when ledger.db (or its WAL) changed, and logs are read from
+the last offset (LogCursor). Every change becomes a numbered event:
+
+    {"seq": 42, "topic": "sentinels", "key": "scout", "data": {...}, "ts": ...}
+
+Clients get a snapshot of the current state, then deltas:
+- SSE:         StateHub.sse() generator (served by Overwatch at /api/stream);
+               reconnects with Last-Event-ID replay what they missed
+- Unix socket: UnixSocketPublisher, newline-delimited JSON (used by the TUI)
+
+A client that falls behind (full queue) is sent a fresh snapshot instead
+of an unbounded backlog.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import threading
+import socketserver
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.ledger_snapshot import LedgerSnapshot
+from System.Core.log_reader import LogCursor, tail
+
+STATE_SOCKET = Path(__file__).parent.parent / "Logs" / "monolith_state.sock"
+
+
+class Subscriber:
+    def __init__(self, max_queue: int):
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def put(self, event: Dict[str, Any]):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, None on timeout, {"resync": True} after an overflow"""
+        if self.overflowed:
+            self.overflowed = False
+            with self.queue.mutex:
+                self.queue.queue.clear()
+            return {"resync": True}
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class StateHub:
+    _instance = None
+
+    @classmethod
+    def shared(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, interval=0.5, history=1000):
+        self.interval = interval
+        self.seq = 0
+        self.state: Dict[str, Dict[str, Any]] = {}
+        self.history: deque = deque(maxlen=history)
+        self._signatures: Dict[str, Tuple[int, int]] = {}
+        self._dirs: List[Tuple[str, Path, str]] = []
+        self._files: List[Tuple[str, str, Path]] = []
+        self._logs: List[Tuple[str, LogCursor, int]] = []
+        self._ledgers: List[Tuple[str, LedgerSnapshot]] = []
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"scans": 0, "files_read": 0, "bytes_read": 0, "events": 0}
+
+    # --- Sources ---
+    def watch_sentinels(self, directory: Path, pattern=".done", topic="sentinels"):
+        """Every <key><pattern> JSON file in directory"""
+        self._dirs.append((topic, Path(directory), pattern))
+
+    def watch_json(self, key: str, path: Path, topic="files"):
+        self._files.append((topic, key, Path(path)))
+
+    def watch_ledger(self, path: Path, key="ledger"):
+        self._ledgers.append((key, LedgerSnapshot.shared(path)))
+
+    def watch_log(self, key: str, path: Path, lines=20):
+        """Publishes appended lines; the snapshot holds the last `lines`"""
+        cursor = LogCursor(path, "state_push")
+        if cursor.path.exists():
+            cursor.seek_end()
+        initial = tail(path, lines)
+        with self._lock:
+            self.state.setdefault("logs", {})[key] = initial
+        self._logs.append((key, cursor, lines))
+
+    # --- Publishing ---
+    def publish(self, topic: str, key: str, data: Any, value: Any = None):
+        """
+        Applies the change to self.state and numbers its event in one locked
+        section, so a snapshot never sees a change without its seq.
+        value is what state[topic][key] becomes (default: data); None removes the key.
+        """
+        value = data if value is None else value
+        with self._lock:
+            current = self.state.setdefault(topic, {})
+            if value is None:
+                current.pop(key, None)
+            else:
+                current[key] = value
+            self.seq += 1
+            event = {"seq": self.seq, "topic": topic, "key": key, "data": data, "ts": time.time()}
+            self.history.append(event)
+            subscribers = list(self._subscribers)
+        self.stats["events"] += 1
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    def _changed(self, path: Path, st: Optional[os.stat_result] = None) -> Optional[bool]:
+        """True if (mtime, size) moved since the last scan, None if the file is gone"""
+        try:
+            st = st or path.stat()
+        except OSError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if self._signatures.get(str(path)) == signature:
+            return False
+        self._signatures[str(path)] = signature
+        return True
+
+    def _read_json(self, path: Path) -> Any:
+        data = path.read_bytes()
+        self.stats["files_read"] += 1
+        self.stats["bytes_read"] += len(data)
+        return json.loads(data)
+
+    def _update(self, topic: str, key: str, path: Path, st=None) -> bool:
+        changed = self._changed(path, st)
+        current = self.state.get(topic, {})
+        if changed is None:
+            if key in current:
+                self._signatures.pop(str(path), None)
+                self.publish(topic, key, None)
+                return True
+            return False
+        if not changed:
+            return False
+        try:
+            data = self._read_json(path)
+        except (OSError, ValueError):
+            self._signatures.pop(str(path), None)  # Partially written: retry next scan
+            return False
+        if current.get(key) == data:
+            return False
+        self.publish(topic, key, data)
+        return True
+
+    def poll(self) -> int:
+        """One scan of every source; returns the number of events published"""
+        before = self.stats["events"]
+        self.stats["scans"] += 1
+
+        for topic, directory, pattern in self._dirs:
+            seen = set()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                entries = []
+            for entry in entries:
+                if entry.name.endswith(pattern):
+                    key = entry.name[:-len(pattern)]
+                    seen.add(key)
+                    self._update(topic, key, Path(entry.path), entry.stat())
+            for key in [k for k in self.state.get(topic, {}) if k not in seen]:
+                self._update(topic, key, directory / f"{key}{pattern}")
+
+        for topic, key, path in self._files:
+            self._update(topic, key, path)
+
+        for key, snapshot in self._ledgers:
+            paths = [snapshot.ledger_db, snapshot.ledger_db.with_name(snapshot.ledger_db.name + "-wal")]
+            if any([self._changed(p) for p in paths]):
+                version = snapshot.version
+                snapshot.refresh()
+                if snapshot.version != version:
+                    data = {"total_revenue": snapshot.total_revenue, "recent": snapshot.recent_activity()[:20]}
+                    self.publish("ledger", key, data)
+
+        for key, cursor, lines in self._logs:
+            if self._changed(cursor.path):
+                new = cursor.read_new()
+                if new:
+                    self.stats["bytes_read"] += sum(len(line) + 1 for line in new)
+                    cursor.commit(persist=False)  # The hub always starts from the end
+                    # Only this thread writes state, so reading it outside the lock is safe
+                    window = (self.state.get("logs", {}).get(key, []) + new)[-lines:]
+                    self.publish("logs", key, new, value=window)
+
+        return self.stats["events"] - before
+
+    # --- Clients ---
+    def subscribe(self, max_queue=256) -> Subscriber:
+        subscriber = Subscriber(max_queue)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    @property
+    def clients(self) -> int:
+        return len(self._subscribers)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"seq": self.seq, "state": json.loads(json.dumps(self.state))}
+
+    def events_since(self, seq: int) -> Optional[List[Dict[str, Any]]]:
+        """Events after seq, or None if some of them already left the history"""
+        with self._lock:
+            if seq == self.seq:
+                return []
+            if not self.history or seq < self.history[0]["seq"] - 1 or seq > self.seq:
+                return None
+            return [e for e in self.history if e["seq"] > seq]
+
+    def stream(self, since: Optional[int] = None, keepalive=15.0) -> Iterator[Dict[str, Any]]:
+        """
+        Messages for one client: a snapshot (or the missed events when `since`
+        is still in history), then deltas; {"type": "ping"} after `keepalive`
+        idle seconds so dead connections are noticed.
+        """
+        subscriber = self.subscribe()
+        try:
+            missed = self.events_since(since) if since is not None else None
+            if missed is None:
+                snapshot = self.snapshot()
+                last = snapshot["seq"]
+                yield {"type": "snapshot", **snapshot}
+            else:
+                last = since
+                for event in missed:
+                    last = event["seq"]
+                    yield {"type": "delta", **event}
+            while not self._stop.is_set():
+                event = subscriber.get(keepalive)
+                if event is None:
+                    yield {"type": "ping"}
+                elif event.get("resync"):
+                    snapshot = self.snapshot()
+                    last = snapshot["seq"]
+                    yield {"type": "snapshot", **snapshot}
+                elif event["seq"] > last:   # Already covered by the snapshot otherwise
+                    last = event["seq"]
+                    yield {"type": "delta", **event}
+        finally:
+            self.unsubscribe(subscriber)
+
+    def sse(self, last_event_id: Optional[str] = None, keepalive=15.0) -> Iterator[str]:
+        """text/event-stream body"""
+        since = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+        for message in self.stream(since, keepalive):
+            if message["type"] == "ping":
+                yield ": keepalive\n\n"
+                continue
+            seq = message["seq"]
+            yield f"id: {seq}\nevent: {message['type']}\ndata: {json.dumps(message, default=str)}\n\n"
+
+    # --- Background scan ---
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[STATE PUSH] ⚠️ Scan failed: {e}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self.poll()  # Initial state, before any client connects
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="state-push", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+
+
+class UnixSocketPublisher:
+    """Serves StateHub.stream() to local clients as newline-delimited JSON"""
+
+    def __init__(self, hub: StateHub, path: Path = STATE_SOCKET, keepalive=15.0):
+        self.hub = hub
+        self.path = Path(path)
+        self.keepalive = keepalive
+        self.server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def start(self) -> bool:
+        """False where Unix sockets are unavailable (Windows)"""
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            return False
+        hub, keepalive = self.hub, self.keepalive
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    for message in hub.stream(keepalive=keepalive):
+                        self.wfile.write(json.dumps(message, default=str).encode() + b"\n")
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+        self.server = socketserver.ThreadingUnixStreamServer(str(self.path), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="state-socket", daemon=True).start()
+        return True
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.path.unlink(missing_ok=True)
+
+
+def listen(path: Path = STATE_SOCKET, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """Client side of UnixSocketPublisher; raises OSError when no hub is running"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(str(path))
+    with sock, sock.makefile("rb") as stream:
+        for line in stream:
+            yield json.loads(line)
+
+
+def benchmark(seconds=20, clients=5, sentinels=50):
+    """CPU and reads per minute: clients polling files vs clients on the hub (idle fleet)"""
+    import shutil
+    import tempfile
+
+    def proc_io() -> Dict[str, int]:
+        try:
+            with open("/proc/self/io") as f:
+                return {k: int(v) for k, v in (line.split(": ") for line in f)}
+        except OSError:
+            return {"rchar": 0, "syscr": 0}
+
+    tmp = Path(tempfile.mkdtemp(prefix="state_push_"))
+    sentinel_dir = tmp / "Sentinels"
+    sentinel_dir.mkdir()
+    for i in range(sentinels):
+        (sentinel_dir / f"agent_{i:02d}.done").write_text(json.dumps({"status": "IDLE", "history": list(range(200))}))
+    treasury = tmp / "first_dollar.json"
+    treasury.write_text(json.dumps({"total_earned": 12.5}))
+    log = tmp / "observability.jsonl"
+    log.write_text("".join(json.dumps({"i": i, "msg": "x" * 80}) + "\n" for i in range(5000)))
+
+    def measure(run) -> Tuple[float, int, int]:
+        io0, cpu0 = proc_io(), time.process_time()
+        stop = threading.Event()
+        threads = [threading.Thread(target=run, args=(stop,), daemon=True) for _ in range(clients)]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        io1, cpu1 = proc_io(), time.process_time()
+        scale = 60 / seconds
+        return (cpu1 - cpu0) * scale, int((io1["syscr"] - io0["syscr"]) * scale), int((io1["rchar"] - io0["rchar"]) * scale)
+
+    def polling_client(stop):
+        # What each dashboard does today: every 0.5 s re-read everything
+        while not stop.wait(0.5):
+            json.loads(treasury.read_text())
+            for p in sentinel_dir.glob("*.done"):
+                json.loads(p.read_text())
+            tail(log, 20)
+
+    before = measure(polling_client)
+
+    hub = StateHub(interval=0.5)
+    hub.watch_sentinels(sentinel_dir)
+    hub.watch_json("treasury", treasury)
+    hub.watch_log("observability", log)
+    hub.start()
+    publisher = UnixSocketPublisher(hub, tmp / "state.sock", keepalive=1.0)
+    publisher.start()
+    received = []
+
+    def push_client(stop):
+        # Pings every keepalive second let the client notice stop; they are not counted
+        for message in listen(tmp / "state.sock"):
+            if message["type"] != "ping":
+                received.append(message["type"])
+            if stop.is_set():
+                break
+
+    after = measure(push_client)
+    hub.stop()
+    publisher.stop()
+
+    print(f"\n{clients} idle clients, {sentinels} sentinels + treasury file + log tail, {seconds}s run scaled to 1 min")
+    print(f"{'':<24} {'CPU s/min':>10} {'read calls/min':>15} {'MB read/min':>12}")
+    for label, (cpu, calls, chars) in (("polling (before)", before), ("state push (after)", after)):
+        print(f"{label:<24} {cpu:>10.2f} {calls:>15,} {chars / 1024 ** 2:>12.2f}")
+    print(f"Messages to push clients while idle: {len(received)} ({received.count('snapshot')} snapshots), "
+          f"hub scans: {hub.stats['scans']}, files read by hub: {hub.stats['files_read']}")
+    shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        base = Path(__file__).parent.parent
+        hub = StateHub.shared()
+        hub.watch_sentinels(base / "Sentinels")
+        hub.watch_json("treasury", base / "Logs" / "Treasury" / "first_dollar.json")
+        hub.watch_ledger(base / "Logs" / "ledger.db")
+        hub.watch_log("observability", base / "Logs" / "observability.jsonl")
+        hub.start()
+        UnixSocketPublisher(hub).start()
+        print(f"[STATE PUSH] Serving {STATE_SOCKET}")
+        while True:
+            time.sleep(3600)
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,255 @@
+"""
+BATCH RISK ENGINE
+Portfolio-wide risk evaluation for large watchlists
+
+Features:
+- Correlated Monte Carlo for many assets at once (covariance + Cholesky)
+- Vectorized Risk Officer limits (one array pass instead of N validate() calls)
+- Per-cycle market input cache (prices, volatility, sentiment fetched once;
+  sentiment for every uncached asset in one batched oracle call)
+- Scaling benchmark against the per-asset RiskAnalyzer loop
+"""
+
+import sys
+import time
+import math
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+# Add root to path for imports
+root_path = Path(__file__).parent.parent.parent
+sys.path.append(str(root_path))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TRADING_DAYS = 252
+DEFAULT_DRIFT = 0.05         # Assumed 5% annual drift (matches RiskAnalyzer)
+DEFAULT_VOLATILITY = 0.65    # Crypto-grade default when no history is known
+DEFAULT_CORRELATION = 0.3    # Cross-asset correlation when no matrix is supplied
+
+
+class MarketInputCache:
+    """
+    Per-cycle cache for market inputs.
+    Every oracle call made during one cycle is answered from memory;
+    starting a new cycle drops the previous snapshot.
+    """
+    def __init__(self):
+        self.cycle_id = 0
+        self._store: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def new_cycle(self):
+        """Invalidates all cached inputs"""
+        self.cycle_id += 1
+        self._store.clear()
+        return self.cycle_id
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._store
+
+    def get(self, key: str, loader: Callable[[], Any]):
+        """Returns cached value for key, calling loader once per cycle"""
+        if key in self._store:
+            self.hits += 1
+            return self._store[key]
+        self.misses += 1
+        value = loader()
+        self._store[key] = value
+        return value
+
+
+class BatchRiskEngine:
+    """
+    Correlated Geometric Brownian Motion for an entire watchlist.
+    Terminal log-returns are drawn directly (exact GBM solution), so a
+    30-day horizon costs one matrix multiply instead of 30 Python steps.
+    """
+    def __init__(self, simulations=1000, days=30, drift=DEFAULT_DRIFT, seed: Optional[int] = None):
+        self.simulations = simulations
+        self.days = days
+        self.drift = drift
+        self.rng = np.random.default_rng(seed) if np else None
+
+    def build_covariance(self, volatilities, correlation=None):
+        """
+        Builds an annualized covariance matrix.
+        correlation may be a full matrix or a scalar applied off-diagonal.
+        """
+        vol = np.asarray(volatilities, dtype=float)
+        n = vol.shape[0]
+        if correlation is None:
+            correlation = DEFAULT_CORRELATION
+        if np.isscalar(correlation):
+            corr = np.full((n, n), float(correlation))
+            np.fill_diagonal(corr, 1.0)
+        else:
+            corr = np.asarray(correlation, dtype=float)
+        return corr * np.outer(vol, vol)
+
+    def cholesky(self, covariance):
+        """Cholesky factor with diagonal jitter for near-singular matrices"""
+        jitter = 0.0
+        n = covariance.shape[0]
+        for _ in range(6):
+            try:
+                return np.linalg.cholesky(covariance + jitter * np.eye(n))
+            except np.linalg.LinAlgError:
+                jitter = 1e-10 if jitter == 0.0 else jitter * 100
+        # Fall back to independent assets rather than failing the cycle
+        return np.diag(np.sqrt(np.clip(np.diag(covariance), 0, None)))
+
+    def simulate(self, prices, volatilities, correlation=None):
+        """
+        Simulates terminal prices for every asset.
+        Returns: (win_prob[n], expected_roi_pct[n], terminal_prices[sims, n])
+        """
+        if not np:
+            n = len(prices)
+            # Same optimistic fallback as RiskAnalyzer.run_monte_carlo
+            return [0.55] * n, [5.0] * n, None
+
+        prices = np.asarray(prices, dtype=float)
+        vol = np.asarray(volatilities, dtype=float)
+        t = self.days / TRADING_DAYS
+
+        chol = self.cholesky(self.build_covariance(vol, correlation))
+        shocks = self.rng.standard_normal((self.simulations, prices.shape[0])) @ chol.T
+
+        log_drift = (self.drift - 0.5 * vol ** 2) * t
+        terminal = prices * np.exp(log_drift + shocks * math.sqrt(t))
+
+        expected_roi = (terminal.mean(axis=0) - prices) / prices
+        win_prob = (terminal > prices).mean(axis=0)
+        return win_prob, expected_roi * 100, terminal
+
+    def value_at_risk(self, prices, terminal, weights=None, confidence=0.95):
+        """Portfolio VaR (as a fraction of portfolio value) from simulated paths"""
+        if not np or terminal is None:
+            return 0.0
+        prices = np.asarray(prices, dtype=float)
+        if weights is None:
+            weights = np.full(prices.shape[0], 1.0 / prices.shape[0])
+        returns = (terminal / prices - 1.0) @ np.asarray(weights, dtype=float)
+        return float(-np.percentile(returns, (1 - confidence) * 100))
+
+
+class BatchPortfolioEvaluator:
+    """
+    Glue between the Investment Agent components and the batch engine.
+    One cycle = one market fetch, one sentiment pass, one simulation, one limit check.
+    The caller starts each cycle (start_cycle()); every read until the next one,
+    including the caller's own, is served from the cycle cache.
+    """
+    def __init__(self, oracle, sentiment, officer, engine: Optional[BatchRiskEngine] = None,
+                 cache: Optional[MarketInputCache] = None):
+        self.oracle = oracle
+        self.sentiment = sentiment
+        self.officer = officer
+        self.engine = engine or BatchRiskEngine()
+        self.cache = cache or MarketInputCache()
+
+    def start_cycle(self) -> int:
+        """Drops the previous cycle's inputs; the next reads go to the oracles once"""
+        return self.cache.new_cycle()
+
+    def market_data(self):
+        return self.cache.get("market", self.oracle.fetch_data)
+
+    def sentiment_for(self, asset: str) -> float:
+        return self.cache.get(f"sentiment:{asset}", lambda: self.sentiment.analyze_sentiment(asset))
+
+    def sentiments_for(self, assets: List[str]) -> List[float]:
+        """Scores for assets; the uncached ones come from one analyze_batch() call when the oracle has it"""
+        missing = [a for a in dict.fromkeys(assets) if f"sentiment:{a}" not in self.cache]
+        if len(missing) > 1 and hasattr(self.sentiment, "analyze_batch"):
+            scores = self.sentiment.analyze_batch(missing)
+            for asset in missing:
+                self.cache.get(f"sentiment:{asset}", lambda: scores[asset])
+        return [self.sentiment_for(a) for a in assets]
+
+    def evaluate(self, tickers: Optional[List[str]] = None, amount=500, volatilities=None, correlation=None):
+        """
+        Evaluates every ticker in one pass, using the current cycle's inputs.
+        Returns a list of opportunity dicts in the same shape InvestmentAgent reports.
+        """
+        data = self.market_data()
+        tickers = [t for t in (tickers or list(data.keys())) if t in data]
+        if not tickers:
+            return []
+
+        prices = [data[t]["price"] for t in tickers]
+        if volatilities is None:
+            volatilities = [data[t].get("volatility", DEFAULT_VOLATILITY) for t in tickers]
+        sentiments = self.sentiments_for([t.split("-")[0] for t in tickers])
+        amounts = [amount] * len(tickers)
+
+        win_prob, exp_roi, _ = self.engine.simulate(prices, volatilities, correlation)
+        approved, reasons = self.officer.validate_batch(amounts, win_prob, sentiments)
+
+        return [
+            {
+                "asset": ticker,
+                "price": prices[i],
+                "monte_carlo_win": f"{float(win_prob[i]):.2f}",
+                "expected_roi": round(float(exp_roi[i]), 2),
+                "ai_sentiment": sentiments[i],
+                "status": "APPROVED" if approved[i] else "DENIED",
+                "reason": reasons[i],
+            }
+            for i, ticker in enumerate(tickers)
+        ]
+
+
+def benchmark_scaling(asset_counts=(1, 10, 100, 500), simulations=1000, baseline_limit=10):
+    """
+    Compares batch wall time against the per-asset RiskAnalyzer loop.
+    The baseline is only run up to baseline_limit assets and extrapolated beyond.
+    """
+    from System.Agents.investment_agent import RiskAnalyzer, RiskOfficer
+
+    if not np:
+        print("[BATCH-RISK] numpy not installed - benchmark unavailable")
+        return []
+
+    analyzer = RiskAnalyzer(simulations=simulations)
+    officer = RiskOfficer()
+    engine = BatchRiskEngine(simulations=simulations, seed=7)
+
+    start = time.perf_counter()
+    analyzer.run_monte_carlo(100.0, DEFAULT_VOLATILITY)
+    per_asset = time.perf_counter() - start
+
+    results = []
+    for n in asset_counts:
+        prices = np.linspace(10, 1000, n)
+        vols = np.full(n, DEFAULT_VOLATILITY)
+
+        start = time.perf_counter()
+        win_prob, _, _ = engine.simulate(prices, vols)
+        officer.validate_batch(np.full(n, 500.0), win_prob, np.full(n, 0.85))
+        batch_s = time.perf_counter() - start
+
+        if n <= baseline_limit:
+            start = time.perf_counter()
+            for p in prices:
+                analyzer.run_monte_carlo(p, DEFAULT_VOLATILITY)
+            loop_s = time.perf_counter() - start
+        else:
+            loop_s = per_asset * n
+
+        results.append({"assets": n, "batch_s": batch_s, "loop_s": loop_s,
+                        "speedup": loop_s / batch_s if batch_s else float("inf")})
+
+    print(f"\n{'Assets':>8} {'Batch (s)':>12} {'Loop (s)':>12} {'Speedup':>10}")
+    for r in results:
+        print(f"{r['assets']:>8} {r['batch_s']:>12.4f} {r['loop_s']:>12.3f} {r['speedup']:>9.0f}x")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_scaling()
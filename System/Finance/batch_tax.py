@@ -0,0 +1,180 @@
+"""
+BATCH TAX ENGINE
+Vectorized scenario planning for CanaTaxEngine and TaxOptimizer
+
+Features:
+- Bracket tables precomputed once (lower bounds, rates, cumulative tax)
+- Arrays of incomes evaluated with a searchsorted lookup (no per-bracket Python loop)
+- Every jurisdiction ranked for every income in one call
+- Bit-for-bit identical to the scalar path: cumulative tax is accumulated in
+  the same order the scalar loop uses, and bracket bounds are integers so
+  `income - lower` is exact for any income below 2**53
+"""
+
+import sys
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import List, Tuple, Dict, Any, Optional
+
+# Add root to path for imports
+root_path = Path(__file__).parent.parent.parent
+sys.path.append(str(root_path))
+
+from System.Agents.accountant_agent import FEDERAL_BRACKETS_2026, BC_BRACKETS_2026, CanaTaxEngine
+from System.Intelligence.tax_optimizer import TaxOptimizer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Same expression as CanaTaxEngine.calculate_tax
+BASIC_PERSONAL_CREDITS = (15705 * 0.15) + (13000 * 0.0506)
+
+
+class BracketTable:
+    """Progressive bracket schedule with cumulative tax at each lower bound"""
+
+    def __init__(self, brackets: List[Tuple[float, float]]):
+        self.limits = [limit for limit, _ in brackets]
+        self.rates = [rate for _, rate in brackets]
+        self.lowers = [0] + self.limits[:-1]
+
+        # Accumulate exactly like the scalar loop: tax += width * rate, bracket by bracket
+        self.cumulative = [0.0]
+        tax = 0.0
+        for lower, limit, rate in zip(self.lowers, self.limits, self.rates):
+            tax += (limit - lower) * rate
+            self.cumulative.append(tax)
+        self.cumulative.pop()
+
+        if np:
+            self._limits = np.array(self.limits, dtype=float)
+            self._lowers = np.array(self.lowers, dtype=float)
+            self._rates = np.array(self.rates, dtype=float)
+            self._cumulative = np.array(self.cumulative, dtype=float)
+
+    def tax_one(self, income: float) -> float:
+        if income <= 0:
+            return 0.0
+        i = bisect_left(self.limits, income)
+        return self.cumulative[i] + (income - self.lowers[i]) * self.rates[i]
+
+    def tax(self, incomes):
+        """Tax for an array of incomes"""
+        if not np:
+            return [self.tax_one(x) for x in incomes]
+        incomes = np.asarray(incomes, dtype=float)
+        idx = np.searchsorted(self._limits, incomes, side="left")
+        idx = np.minimum(idx, len(self.limits) - 1)
+        tax = self._cumulative[idx] + (incomes - self._lowers[idx]) * self._rates[idx]
+        return np.where(incomes > 0, tax, 0.0)
+
+
+class BatchTaxEngine:
+    def __init__(self, federal=FEDERAL_BRACKETS_2026, provincial=BC_BRACKETS_2026,
+                 credits=BASIC_PERSONAL_CREDITS):
+        self.federal = BracketTable(federal)
+        self.provincial = BracketTable(provincial)
+        self.credits = credits
+
+    def calculate_tax(self, incomes):
+        """Combined Federal + BC tax for every income (same result as CanaTaxEngine.calculate_tax)"""
+        fed = self.federal.tax(incomes)
+        prov = self.provincial.tax(incomes)
+        if not np:
+            return [max(0, f + p - self.credits) for f, p in zip(fed, prov)]
+        return np.maximum(0, fed + prov - self.credits)
+
+
+class BatchJurisdictionRanker:
+    """Ranks every eligible jurisdiction for every income in one vectorized call"""
+
+    def __init__(self, optimizer: Optional[TaxOptimizer] = None):
+        self.optimizer = optimizer or TaxOptimizer()
+
+    def _rate(self, jur_id: str, income_type: str) -> float:
+        # Mirrors TaxOptimizer.calculate_net_income
+        jur = self.optimizer.jurisdictions[jur_id]
+        if income_type == "employment":
+            return jur["income_tax"] / 100
+        if income_type == "capital_gains":
+            if jur_id == "PORTUGAL" and "capital_gains_crypto" in jur:
+                return jur["capital_gains_crypto"] / 100
+            return jur["capital_gains"] / 100
+        return jur["corporate_tax"] / 100
+
+    def eligible(self, us_citizen=True, willing_to_relocate=True) -> List[str]:
+        # Mirrors the filters in TaxOptimizer.find_optimal_jurisdiction
+        ids = []
+        for jur_id in self.optimizer.jurisdictions:
+            if us_citizen and jur_id not in ["PUERTO_RICO", "UAE", "PORTUGAL", "PANAMA", "SINGAPORE"]:
+                continue
+            if not willing_to_relocate and jur_id != "PUERTO_RICO":
+                continue
+            ids.append(jur_id)
+        return ids
+
+    def rank(self, incomes, income_type="employment", us_citizen=True, willing_to_relocate=True) -> Dict[str, Any]:
+        """
+        Returns:
+            jurisdictions: eligible ids (column order)
+            net: net income per (income, jurisdiction)
+            order: per income, column indices best-first (ties keep database order)
+        """
+        ids = self.eligible(us_citizen, willing_to_relocate)
+        keep = [1 - self._rate(j, income_type) for j in ids]
+
+        if not np:
+            net = [[x * k for k in keep] for x in incomes]
+            order = [sorted(range(len(ids)), key=lambda c, row=row: row[c], reverse=True) for row in net]
+            return {"jurisdictions": ids, "net": net, "order": order}
+
+        incomes = np.asarray(incomes, dtype=float)
+        net = incomes[:, None] * np.array(keep, dtype=float)[None, :]
+        order = np.argsort(-net, axis=1, kind="stable")
+        return {"jurisdictions": ids, "net": net, "order": order}
+
+    def best(self, incomes, **kwargs) -> List[str]:
+        ranked = self.rank(incomes, **kwargs)
+        return [ranked["jurisdictions"][int(row[0])] for row in ranked["order"]] if ranked["jurisdictions"] else []
+
+
+def benchmark(n=100_000):
+    """Scalar loops vs batch engine for n income scenarios"""
+    import random
+
+    rng = random.Random(3)
+    incomes = [rng.uniform(0, 500_000) for _ in range(n)]
+    optimizer = TaxOptimizer()
+    engine = BatchTaxEngine()
+    ranker = BatchJurisdictionRanker(optimizer)
+
+    start = time.perf_counter()
+    for x in incomes:
+        CanaTaxEngine.calculate_tax(x)
+    scalar_tax = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.calculate_tax(incomes)
+    batch_tax = time.perf_counter() - start
+
+    sample = incomes[: max(1, n // 10)]
+    start = time.perf_counter()
+    for x in sample:
+        optimizer.find_optimal_jurisdiction(x, "capital_gains")
+    scalar_rank = (time.perf_counter() - start) * (n / len(sample))
+
+    start = time.perf_counter()
+    ranker.rank(incomes, "capital_gains")
+    batch_rank = time.perf_counter() - start
+
+    print(f"\n{n:,} incomes {'(numpy)' if np else '(pure Python fallback)'}")
+    print(f"{'':<22} {'Scalar (s)':>11} {'Batch (s)':>10} {'Speedup':>8}")
+    print(f"{'calculate_tax':<22} {scalar_tax:>11.3f} {batch_tax:>10.3f} {scalar_tax / batch_tax:>7.0f}x")
+    print(f"{'rank jurisdictions':<22} {scalar_rank:>11.3f} {batch_rank:>10.3f} {scalar_rank / batch_rank:>7.0f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
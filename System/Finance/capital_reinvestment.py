@@ -15,17 +15,23 @@ Tiers:
 - Tier 2 ($5,000): Premium appliances (saves time)
 - Tier 3 ($10,000): Security fortress (protects assets)
 - Tier 4 ($25,000): Full automation (robotics, AI)
+
+Tier thresholds are indexed once (sorted) and answered by bisection;
+ownership and queue status for every candidate item come from one query.
 """
 
+import sys
+import time
 import sqlite3
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 import json
 
 class CapitalReinvestment:
-    def __init__(self):
-        self.ledger_db = Path(__file__).parent.parent / "Logs" / "ledger.db"
-        self.purchases_db = Path(__file__).parent.parent / "Logs" / "purchases.db"
+    def __init__(self, ledger_db=None, purchases_db=None):
+        self.ledger_db = Path(ledger_db) if ledger_db else Path(__file__).parent.parent / "Logs" / "ledger.db"
+        self.purchases_db = Path(purchases_db) if purchases_db else Path(__file__).parent.parent / "Logs" / "purchases.db"
         self.config_file = Path(__file__).parent.parent / "Config" / "reinvestment_config.json"
         
         # Hardware purchase tiers
@@ -151,8 +157,18 @@ class CapitalReinvestment:
             }
         }
         
+        self._index_tiers()
         self._init_purchases_db()
     
+    def _index_tiers(self):
+        """Sorted (threshold, tier_key) pairs for bisection; rebuild if self.tiers changes"""
+        ordered = sorted((data["threshold"], key) for key, data in self.tiers.items())
+        self._thresholds = [threshold for threshold, _ in ordered]
+        self._tier_keys = [key for _, key in ordered]
+    
+    def _connect(self):
+        return sqlite3.connect(self.purchases_db)
+    
     def _init_purchases_db(self):
         """Create purchases tracking database"""
         self.purchases_db.parent.mkdir(exist_ok=True)
@@ -186,6 +202,9 @@ class CapitalReinvestment:
             )
         """)
         
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_queue_item ON purchase_queue(item_name, status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_inventory_item ON inventory(item_name)")
+        
         conn.commit()
         conn.close()
     
@@ -209,65 +228,72 @@ class CapitalReinvestment:
     
     def get_current_tier(self, total_revenue):
         """Determine highest unlocked tier"""
-        unlocked = None
-        
-        for tier_key in sorted(self.tiers.keys()):
-            if total_revenue >= self.tiers[tier_key]["threshold"]:
-                unlocked = tier_key
-        
-        return unlocked
+        i = bisect_right(self._thresholds, total_revenue)
+        return self._tier_keys[i - 1] if i else None
     
     def get_next_milestone(self, total_revenue):
         """Get next revenue milestone"""
-        for tier_key in sorted(self.tiers.keys()):
-            threshold = self.tiers[tier_key]["threshold"]
-            if total_revenue < threshold:
-                return {
-                    "tier": tier_key,
-                    "threshold": threshold,
-                    "progress": total_revenue,
-                    "remaining": threshold - total_revenue,
-                    "percent": (total_revenue / threshold) * 100
-                }
+        i = bisect_right(self._thresholds, total_revenue)
+        if i < len(self._thresholds):
+            threshold = self._thresholds[i]
+            return {
+                "tier": self._tier_keys[i],
+                "threshold": threshold,
+                "progress": total_revenue,
+                "remaining": threshold - total_revenue,
+                "percent": (total_revenue / threshold) * 100
+            }
         
         # All tiers unlocked
         return {
             "tier": "MAX",
-            "threshold": 25000,
+            "threshold": self._thresholds[-1],
             "progress": total_revenue,
             "remaining": 0,
             "percent": 100
         }
     
-    def recommend_purchases(self):
+    def _item_status(self, cursor, names):
+        """(owned, queued) per item name in one query over inventory and purchase_queue"""
+        if not names:
+            return {}
+        cursor.execute("""
+            SELECT c.value,
+                   COUNT(DISTINCT i.id) > 0,
+                   COUNT(DISTINCT q.id) > 0
+            FROM json_each(?) c
+            LEFT JOIN inventory i ON i.item_name = c.value
+            LEFT JOIN purchase_queue q ON q.item_name = c.value AND q.status = 'PENDING'
+            GROUP BY c.value
+        """, (json.dumps(names),))
+        return {name: (bool(owned), bool(queued)) for name, owned, queued in cursor.fetchall()}
+    
+    def recommend_purchases(self, total_revenue=None, cursor=None):
         """Generate purchase recommendations based on current revenue"""
-        total_revenue = self.get_total_revenue()
+        if total_revenue is None:
+            total_revenue = self.get_total_revenue()
         current_tier = self.get_current_tier(total_revenue)
+        if not current_tier:
+            return []
         
-        recommendations = []
+        tier_data = self.tiers[current_tier]
+        if cursor is None:
+            conn = self._connect()
+            status = self._item_status(conn.cursor(), [item["name"] for item in tier_data["items"]])
+            conn.close()
+        else:
+            status = self._item_status(cursor, [item["name"] for item in tier_data["items"]])
         
-        if current_tier:
-            tier_data = self.tiers[current_tier]
-            
-            for item in tier_data["items"]:
-                # Check if already purchased
-                conn = sqlite3.connect(self.purchases_db)
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT COUNT(*) FROM inventory 
-                    WHERE item_name = ?
-                """, (item["name"],))
-                
-                already_owned = cursor.fetchone()[0] > 0
-                conn.close()
-                
-                if not already_owned:
-                    recommendations.append({
-                        "tier": current_tier,
-                        "tier_name": tier_data["name"],
-                        **item
-                    })
+        recommendations = []
+        for item in tier_data["items"]:
+            owned, queued = status.get(item["name"], (False, False))
+            if not owned:
+                recommendations.append({
+                    "tier": current_tier,
+                    "tier_name": tier_data["name"],
+                    "queued": queued,
+                    **item
+                })
         
         # Sort by priority
         recommendations.sort(key=lambda x: x["priority"])
@@ -344,7 +370,15 @@ class CapitalReinvestment:
         """Generate full capital reinvestment report"""
         total_revenue = self.get_total_revenue()
         next_milestone = self.get_next_milestone(total_revenue)
-        recommendations = self.recommend_purchases()
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        recommendations = self.recommend_purchases(total_revenue, cursor)
+        cursor.execute("SELECT item_name, cost FROM inventory")
+        inventory = cursor.fetchall()
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(cost), 0) FROM purchase_queue WHERE status = 'PENDING'")
+        pending_count, pending_cost = cursor.fetchone()
+        conn.close()
         
         print("\n" + "="*60)
         print("💰 CAPITAL REINVESTMENT ENGINE - STATUS REPORT")
@@ -365,7 +399,7 @@ class CapitalReinvestment:
         if recommendations:
             print(f"\n🛒 RECOMMENDED PURCHASES ({len(recommendations)} items):")
             for rec in recommendations[:5]:  # Top 5
-                print(f"\n   {rec['priority']}. {rec['name']}")
+                print(f"\n   {rec['priority']}. {rec['name']}{' (queued)' if rec['queued'] else ''}")
                 print(f"      Cost: ${rec['cost']:,}")
                 if rec.get('roi_months', 0) > 0:
                     print(f"      ROI: {rec['roi_months']} months")
@@ -377,18 +411,17 @@ class CapitalReinvestment:
         else:
             print("\n   No recommendations at this revenue level.")
         
-        # Show inventory
-        conn = sqlite3.connect(self.purchases_db)
-        cursor = conn.cursor()
-        cursor.execute("SELECT item_name, cost FROM inventory")
-        inventory = cursor.fetchall()
-        conn.close()
+        if pending_count:
+            print(f"\n🧾 PURCHASE QUEUE: {pending_count:,} pending (${pending_cost:,.2f})")
         
+        # Show inventory
         if inventory:
             print(f"\n📦 CURRENT INVENTORY ({len(inventory)} items):")
             total_invested = sum([item[1] for item in inventory])
-            for item_name, cost in inventory:
+            for item_name, cost in inventory[:10]:
                 print(f"   • {item_name} (${cost:,})")
+            if len(inventory) > 10:
+                print(f"   … and {len(inventory) - 10:,} more")
             print(f"\n   Total Invested: ${total_invested:,.2f}")
         
         print("\n" + "="*60 + "\n")
@@ -397,9 +430,54 @@ class CapitalReinvestment:
             "total_revenue": total_revenue,
             "next_milestone": next_milestone,
             "recommendations": recommendations,
-            "inventory": inventory
+            "inventory": inventory,
+            "queue": {"pending": pending_count, "cost": pending_cost}
         }
 
+def benchmark(queued=10_000, runs=20):
+    """generate_report latency with `queued` pending items and a matching inventory"""
+    import io
+    import tempfile
+    import contextlib
+    
+    tmp = Path(tempfile.mkdtemp(prefix="reinvestment_"))
+    ledger = sqlite3.connect(tmp / "ledger.db")
+    ledger.execute("CREATE TABLE transactions (amount REAL, type TEXT)")
+    ledger.execute("INSERT INTO transactions VALUES (12000, 'REVENUE')")
+    ledger.commit()
+    ledger.close()
+    
+    engine = CapitalReinvestment(ledger_db=tmp / "ledger.db", purchases_db=tmp / "purchases.db")
+    now = datetime.now().isoformat()
+    conn = engine._connect()
+    conn.executemany(
+        "INSERT INTO purchase_queue (tier, item_name, cost, priority, added_date) VALUES (?, ?, ?, ?, ?)",
+        [("TIER_3_FORTRESS", f"Item {i}", 10.0 + i % 90, i % 3 + 1, now) for i in range(queued)])
+    conn.executemany(
+        "INSERT INTO inventory (item_name, purchase_date, cost, tier) VALUES (?, ?, ?, ?)",
+        [(f"Owned {i}", now, 5.0, "TIER_1_EFFICIENCY") for i in range(queued)])
+    conn.commit()
+    conn.close()
+    
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            engine.generate_report()
+    elapsed = (time.perf_counter() - start) / runs
+    
+    start = time.perf_counter()
+    for _ in range(10_000):
+        engine.get_current_tier(12000)
+        engine.get_next_milestone(12000)
+    lookup_us = (time.perf_counter() - start) / 20_000 * 1e6
+    
+    print(f"\n{queued:,} queued items, {queued:,} inventory rows")
+    print(f"generate_report: {elapsed * 1000:.1f} ms/run (avg of {runs})")
+    print(f"tier/milestone lookup: {lookup_us:.2f} us")
+
 if __name__ == "__main__":
-    engine = CapitalReinvestment()
-    engine.generate_report()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        engine = CapitalReinvestment()
+        engine.generate_report()
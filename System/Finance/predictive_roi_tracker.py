@@ -7,17 +7,38 @@ Features:
 - Milestone countdown (days until unlock)
 - Auto-approve queue (one-click purchases)
 - ROI projections for each tier
+- Online forecasting (see revenue_forecast.py): only new ledger rows are read,
+  predictions come with an 80% interval
 """
 
+import sys
 import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Finance.revenue_forecast import RevenueForecaster, RING_DAYS
+
 class PredictiveROI:
-    def __init__(self):
-        self.ledger_db = Path(__file__).parent.parent / "Logs" / "ledger.db"
+    def __init__(self, ledger_db=None):
+        self.ledger_db = Path(ledger_db) if ledger_db else Path(__file__).parent.parent / "Logs" / "ledger.db"
         self.config_file = Path(__file__).parent.parent / "Config" / "treasurer_god_rules.json"
+        self.forecaster = RevenueForecaster(
+            ledger_db=self.ledger_db,
+            state_file=Path(ledger_db).with_suffix(".forecast.json") if ledger_db else None
+        )
+    
+    @staticmethod
+    def _trend(avg_per_day, count):
+        if count == 0:
+            return "FLAT"
+        elif avg_per_day > 50:
+            return "ACCELERATING"
+        elif avg_per_day > 10:
+            return "GROWING"
+        return "STARTING"
     
     def get_revenue_velocity(self, days=30):
         """
@@ -25,6 +46,16 @@ class PredictiveROI:
         
         Returns: (avg_per_day, total_revenue, trend)
         """
+        if days > RING_DAYS:
+            return self.get_revenue_velocity_full_scan(days)
+        
+        self.forecaster.consume_ledger()
+        total, count = self.forecaster.recent(days)
+        avg_per_day = total / days if days > 0 else 0
+        return avg_per_day, self.forecaster.all_time, self._trend(avg_per_day, count)
+    
+    def get_revenue_velocity_full_scan(self, days=30):
+        """Original two-query implementation (kept for windows beyond the ring and for backtests)"""
         if not self.ledger_db.exists():
             return 0, 0, "FLAT"
         
@@ -57,17 +88,12 @@ class PredictiveROI:
         
         avg_per_day = total / days if days > 0 else 0
         
-        # Determine trend
-        if count == 0:
-            trend = "FLAT"
-        elif avg_per_day > 50:
-            trend = "ACCELERATING"
-        elif avg_per_day > 10:
-            trend = "GROWING"
-        else:
-            trend = "STARTING"
-        
-        return avg_per_day, all_time, trend
+        return avg_per_day, all_time, self._trend(avg_per_day, count)
+    
+    def forecast_milestone(self, target_revenue):
+        """Online forecast: point estimate plus 80% interval (days_low / days_high)"""
+        self.forecaster.consume_ledger()
+        return self.forecaster.forecast_milestone(target_revenue)
     
     def predict_milestone(self, target_revenue):
         """
@@ -75,6 +101,15 @@ class PredictiveROI:
         
         Returns: (days_until, date_estimated, confidence)
         """
+        forecast = self.forecast_milestone(target_revenue)
+        if forecast["status"] == "UNLOCKED":
+            return 0, forecast["date"], "UNLOCKED"
+        if forecast["status"] == "FORECAST":
+            return int(forecast["days"]), forecast["date"], forecast["confidence"]
+        if forecast["status"] == "UNREACHABLE":
+            return 999, None, "LOW"
+        
+        # Too little history for the model: straight line from the 30-day average
         avg_per_day, current_revenue, trend = self.get_revenue_velocity()
         
         remaining = target_revenue - current_revenue
@@ -111,6 +146,7 @@ class PredictiveROI:
         
         # Predict timeline
         days, date, confidence = self.predict_milestone(next_ms["threshold"])
+        forecast = self.forecaster.forecast_milestone(next_ms["threshold"])
         
         return {
             "tier": next_ms["tier"],
@@ -120,6 +156,8 @@ class PredictiveROI:
             "percent": next_ms["percent"],
             "days_until": days,
             "estimated_date": date.strftime("%Y-%m-%d") if date else "Unknown",
+            "days_low": int(forecast["days_low"]) if forecast["days_low"] is not None else None,
+            "days_high": int(forecast["days_high"]) if forecast["days_high"] is not None else None,
             "confidence": confidence
         }
     
@@ -147,6 +185,9 @@ class PredictiveROI:
             if next_ms['days_until'] < 999:
                 print(f"\n⏱️ PREDICTION:")
                 print(f"   Days Until: {next_ms['days_until']} days")
+                if next_ms['days_low'] is not None:
+                    high = f"{next_ms['days_high']}" if next_ms['days_high'] is not None else "?"
+                    print(f"   80% Range: {next_ms['days_low']}-{high} days")
                 print(f"   Est. Date: {next_ms['estimated_date']}")
                 print(f"   Confidence: {next_ms['confidence']}")
                 
@@ -0,0 +1,367 @@
+"""
+REVENUE FORECAST ENGINE
+Online milestone forecasting for PredictiveROI
+
+Tails the ledger by transaction id (only new inserts are read) and keeps
+sufficient statistics that survive restarts:
+- Damped Holt linear trend (level, trend) over closed daily revenue totals
+- Exponentially weighted one-step residual variance (confidence intervals)
+- 90-day ring of daily totals and counts (velocity without range scans)
+- Running all-time revenue
+
+Every prediction is O(1) in ledger size: the cumulative forecast over h days
+has a closed form, and milestone dates are found by bisecting h.
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+RING_DAYS = 90
+MAX_HORIZON = 3650  # Days; milestones further out are reported as unreachable
+Z_80 = 1.2816       # Two-sided 80% interval
+
+
+class RevenueForecaster:
+    def __init__(self, ledger_db: Optional[Path] = None, state_file: Optional[Path] = None,
+                 alpha=0.1, beta=0.01, phi=0.98, var_alpha=0.05):
+        logs = Path(__file__).parent.parent / "Logs"
+        self.ledger_db = Path(ledger_db) if ledger_db else logs / "ledger.db"
+        self.state_file = Path(state_file) if state_file else logs / "revenue_forecast.json"
+        self.alpha = alpha
+        self.beta = beta
+        self.phi = phi
+        self.var_alpha = var_alpha
+        self.reset()
+        self.load_state()
+
+    def reset(self):
+        self.last_id = 0
+        self.all_time = 0.0
+        self.day: Optional[int] = None     # ordinal of the open (current) day
+        self.level: Optional[float] = None
+        self.trend = 0.0
+        self.resid_var = 0.0
+        self.days_seen = 0                 # closed days fed to the model
+        self.ring: Dict[int, list] = {}    # ordinal -> [total, count]
+
+    # --- Persistence ---
+    def load_state(self):
+        if not self.state_file.exists():
+            return
+        try:
+            data = json.loads(self.state_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        self.last_id = data.get("last_id", 0)
+        self.all_time = data.get("all_time", 0.0)
+        self.day = data.get("day")
+        self.level = data.get("level")
+        self.trend = data.get("trend", 0.0)
+        self.resid_var = data.get("resid_var", 0.0)
+        self.days_seen = data.get("days_seen", 0)
+        self.ring = {int(k): v for k, v in data.get("ring", {}).items()}
+
+    def save_state(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "last_id": self.last_id,
+            "updated": datetime.now().isoformat(),
+            "all_time": self.all_time,
+            "day": self.day,
+            "level": self.level,
+            "trend": self.trend,
+            "resid_var": self.resid_var,
+            "days_seen": self.days_seen,
+            "ring": self.ring,
+        }))
+        tmp.replace(self.state_file)
+
+    # --- Model updates ---
+    def _close_day(self, total: float):
+        """Feeds one finished day into the damped Holt model"""
+        if self.level is None:
+            self.level = total
+        else:
+            expected = self.level + self.phi * self.trend
+            resid = total - expected
+            self.resid_var = resid * resid if self.days_seen == 1 else \
+                (1 - self.var_alpha) * self.resid_var + self.var_alpha * resid * resid
+            prev_level = self.level
+            self.level = expected + self.alpha * resid
+            self.trend = self.phi * self.trend + self.beta * (self.level - prev_level - self.phi * self.trend)
+        self.days_seen += 1
+
+    def _roll(self, day: int):
+        if self.day is None:
+            self.day = day
+            return
+        while self.day < day:
+            self._close_day(self.ring.get(self.day, [0.0, 0])[0])
+            self.day += 1
+        for old in [d for d in self.ring if d <= day - RING_DAYS]:
+            del self.ring[old]
+
+    def observe(self, event: Dict[str, Any]):
+        """Consumes one ledger insert: {type, amount, timestamp[, id]}"""
+        if event.get("id"):
+            self.last_id = max(self.last_id, int(event["id"]))
+        if event.get("type") != "REVENUE":
+            return
+
+        amount = float(event.get("amount", 0.0))
+        day = datetime.fromisoformat(event.get("timestamp") or datetime.now().isoformat()).toordinal()
+        self.all_time += amount
+        self._roll(day)
+        if self.day is not None and day <= self.day - RING_DAYS:
+            return  # Too old for the ring; only the all-time total moves
+        bucket = self.ring.setdefault(day, [0.0, 0])
+        bucket[0] += amount
+        bucket[1] += 1
+
+    def advance_to(self, now: Optional[datetime] = None):
+        """Closes silent days so zero-revenue days still count"""
+        day = (now or datetime.now()).toordinal()
+        if self.day is not None and self.day < day:
+            self._roll(day)
+
+    def consume_ledger(self, batch_size=5000, now: Optional[datetime] = None) -> int:
+        """Reads only transactions inserted since the last call (primary-key range scan)"""
+        consumed = 0
+        if self.ledger_db.exists():
+            conn = sqlite3.connect(self.ledger_db)
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM transactions")
+            if cursor.fetchone()[0] < self.last_id:
+                self.reset()  # Ledger was rebuilt; replay from scratch
+            while True:
+                cursor.execute("""
+                    SELECT id, type, amount, timestamp
+                    FROM transactions
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                """, (self.last_id, batch_size))
+                rows = cursor.fetchall()
+                for row_id, tx_type, amount, timestamp in rows:
+                    self.observe({"id": row_id, "type": tx_type, "amount": amount, "timestamp": timestamp})
+                consumed += len(rows)
+                if len(rows) < batch_size:
+                    break
+            conn.close()
+
+        self.advance_to(now)
+        if consumed:
+            self.save_state()
+        return consumed
+
+    # --- Queries (O(1) in ledger size) ---
+    def recent(self, days=30, now: Optional[datetime] = None) -> Tuple[float, int]:
+        """(revenue, transaction count) over the last `days` calendar days including today"""
+        today = (now or datetime.now()).toordinal()
+        total, count = 0.0, 0
+        for d, (t, c) in self.ring.items():
+            if today - days < d <= today:
+                total += t
+                count += c
+        return total, count
+
+    def daily_forecast(self, h: int) -> float:
+        """Expected revenue on day h (1 = tomorrow's first closed day)"""
+        if self.level is None:
+            return 0.0
+        damp = self.phi * (1 - self.phi ** h) / (1 - self.phi)
+        return max(0.0, self.level + damp * self.trend)
+
+    def cumulative(self, h: float) -> Tuple[float, float]:
+        """(expected revenue, std dev) summed over the next h days"""
+        if self.level is None or h <= 0:
+            return 0.0, 0.0
+        p = self.phi
+        damped_sum = p / (1 - p) * (h - p * (1 - p ** h) / (1 - p))
+        mean = max(0.0, h * self.level + damped_sum * self.trend)
+
+        # An error on day j also lifts the level for every later day in the window,
+        # so its weight in the sum is 1 + alpha*m (m = days left after it):
+        # Var = sigma^2 * sum_{m<h} (1 + alpha*m)^2, in closed form. Trend
+        # propagation is left out; it made 80% intervals cover ~100% in backtests.
+        a, n = self.alpha, h
+        s1 = n * (n - 1) / 2
+        s2 = (n - 1) * n * (2 * n - 1) / 6
+        weight = n + 2 * a * s1 + a * a * s2
+        return mean, math.sqrt(max(self.resid_var, 0.0) * max(weight, 0.0))
+
+    def _days_to_reach(self, remaining: float, z: float) -> Optional[float]:
+        """Smallest h with cumulative mean + z*sd >= remaining (None if beyond MAX_HORIZON)"""
+        def reached(h):
+            mean, sd = self.cumulative(h)
+            return mean + z * sd >= remaining
+        if not reached(MAX_HORIZON):
+            return None
+        lo, hi = 0.0, float(MAX_HORIZON)
+        for _ in range(40):
+            mid = (lo + hi) / 2
+            if reached(mid):
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    def forecast_milestone(self, target: float, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Point estimate and 80% interval for the day all-time revenue reaches target"""
+        now = now or datetime.now()
+        remaining = target - self.all_time
+        if remaining <= 0:
+            return {"status": "UNLOCKED", "days": 0, "days_low": 0, "days_high": 0,
+                    "date": now, "confidence": "UNLOCKED"}
+        if self.days_seen < 3 or self.level is None:
+            return {"status": "INSUFFICIENT_DATA", "days": None, "days_low": None, "days_high": None,
+                    "date": None, "confidence": "INSUFFICIENT_DATA"}
+
+        days = self._days_to_reach(remaining, 0.0)
+        low = self._days_to_reach(remaining, Z_80)     # optimistic edge -> earliest date
+        high = self._days_to_reach(remaining, -Z_80)   # pessimistic edge -> latest date
+
+        if days is None:
+            confidence = "LOW"
+        elif high is None:
+            confidence = "LOW"
+        else:
+            spread = (high - low) / max(days, 1.0)
+            confidence = "HIGH" if spread < 0.5 else "MEDIUM" if spread < 1.0 else "LOW"
+
+        return {
+            "status": "FORECAST" if days is not None else "UNREACHABLE",
+            "days": days,
+            "days_low": low,
+            "days_high": high,
+            "date": now + timedelta(days=days) if days is not None else None,
+            "confidence": confidence,
+        }
+
+
+# --- Backtest harness ---
+def synthetic_ledger(path: Path, days=365, seed=5, start: Optional[datetime] = None) -> Path:
+    """Ledger with a growing, weekly-seasonal revenue stream ending today (unless start is given)"""
+    rng = random.Random(seed)
+    start = start or datetime.combine(datetime.now().date(), datetime.min.time()) - timedelta(days=days)
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source TEXT NOT NULL, type TEXT NOT NULL, action TEXT,
+            amount REAL NOT NULL, asset TEXT, timestamp TEXT NOT NULL, notes TEXT
+        )
+    """)
+    rows = []
+    for d in range(days):
+        day = start + timedelta(days=d)
+        rate = 2 + d * 0.08 + (3 if day.weekday() < 5 else -1)
+        for _ in range(max(0, int(rng.gauss(rate, rate ** 0.5)))):
+            ts = day + timedelta(seconds=rng.randint(0, 86399))
+            rows.append(("Gumroad", "REVENUE", round(rng.uniform(5, 40), 2), ts.isoformat()))
+        if rng.random() < 0.3:
+            rows.append(("Ops", "EXPENSE", 20.0, (day + timedelta(hours=12)).isoformat()))
+    rows.sort(key=lambda r: r[3])
+    conn.executemany("INSERT INTO transactions (source, type, amount, timestamp) VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def backtest(ledger_db: Path, horizon=30, step=7, warmup=30):
+    """
+    Replays a historical ledger day by day. Every `step` days, both methods
+    predict revenue over the next `horizon` days:
+    - legacy: trailing 30-day average x horizon (PredictiveROI.get_revenue_velocity)
+    - online: damped Holt cumulative forecast, with an 80% interval
+    Accuracy is scored against what the ledger actually recorded; cost is
+    the time per prediction on the full ledger.
+    """
+    import tempfile
+
+    conn = sqlite3.connect(ledger_db)
+    rows = conn.execute("""
+        SELECT id, type, amount, timestamp FROM transactions ORDER BY timestamp
+    """).fetchall()
+    conn.close()
+    if not rows:
+        print("Ledger is empty")
+        return {}
+
+    daily: Dict[int, float] = {}
+    for _, tx_type, amount, ts in rows:
+        if tx_type == "REVENUE":
+            d = datetime.fromisoformat(ts).toordinal()
+            daily[d] = daily.get(d, 0.0) + amount
+    first = datetime.fromisoformat(rows[0][3]).toordinal()
+    last = datetime.fromisoformat(rows[-1][3]).toordinal()
+
+    model = RevenueForecaster(ledger_db=ledger_db, state_file=Path(tempfile.mkdtemp()) / "f.json")
+    errors = {"legacy": [], "online": []}
+    covered = 0
+    i = 0
+    for cut in range(first + warmup, last - horizon + 1, step):
+        while i < len(rows) and datetime.fromisoformat(rows[i][3]).toordinal() < cut:
+            _, tx_type, amount, ts = rows[i]
+            model.observe({"type": tx_type, "amount": amount, "timestamp": ts})
+            i += 1
+        model.advance_to(datetime.fromordinal(cut))
+
+        actual = sum(daily.get(d, 0.0) for d in range(cut, cut + horizon))
+        legacy = sum(daily.get(d, 0.0) for d in range(cut - 30, cut)) / 30 * horizon
+        mean, sd = model.cumulative(horizon)
+        errors["legacy"].append(abs(legacy - actual) / max(actual, 1.0))
+        errors["online"].append(abs(mean - actual) / max(actual, 1.0))
+        covered += (mean - Z_80 * sd) <= actual <= (mean + Z_80 * sd)
+
+    # Cost per prediction against the full ledger
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from System.Finance.predictive_roi_tracker import PredictiveROI
+
+    legacy_roi = PredictiveROI.__new__(PredictiveROI)
+    legacy_roi.ledger_db = ledger_db
+    start = time.perf_counter()
+    for _ in range(20):
+        legacy_roi.get_revenue_velocity_full_scan()
+    legacy_ms = (time.perf_counter() - start) / 20 * 1000
+
+    online = RevenueForecaster(ledger_db=ledger_db, state_file=Path(tempfile.mkdtemp()) / "f.json")
+    start = time.perf_counter()
+    online.consume_ledger()
+    replay_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for _ in range(1000):
+        online.consume_ledger()
+        online.forecast_milestone(online.all_time * 2)
+    online_ms = (time.perf_counter() - start)
+
+    n = len(errors["online"])
+    mape = {k: sum(v) / len(v) * 100 for k, v in errors.items() if v}
+    print(f"\nBacktest: {len(rows):,} transactions over {last - first + 1} days, "
+          f"{n} forecasts of {horizon}-day revenue every {step} days")
+    print(f"{'Method':<8} {'MAPE':>7} {'ms/prediction':>14}")
+    print(f"{'legacy':<8} {mape.get('legacy', 0):>6.1f}% {legacy_ms:>14.3f}")
+    print(f"{'online':<8} {mape.get('online', 0):>6.1f}% {online_ms:>14.3f}")
+    print(f"80% interval coverage: {covered / max(n, 1) * 100:.0f}% | one-time replay: {replay_ms:.0f} ms")
+    return {"mape": mape, "coverage": covered / max(n, 1), "legacy_ms": legacy_ms, "online_ms": online_ms}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--backtest":
+        if len(sys.argv) > 2:
+            backtest(Path(sys.argv[2]))
+        else:
+            import tempfile
+            backtest(synthetic_ledger(Path(tempfile.mkdtemp()) / "ledger.db", start=datetime(2025, 1, 1)))
+    else:
+        forecaster = RevenueForecaster()
+        forecaster.consume_ledger()
+        print(json.dumps(forecaster.forecast_milestone(forecaster.all_time + 1000), default=str, indent=2))
@@ -0,0 +1,366 @@
+"""
+MONOLITH INTELLIGENCE LAYER - Feed Ingestion Engine
+Shared fetcher for every news / social / RSS source
+
+Features:
+- Concurrent fetching (asyncio) with a global cap and per-host connection limits
+- Conditional GET (ETag / Last-Modified) with a persistent validator cache
+- Content-hash dedup: items already seen are never returned twice
+- Per-cycle stats: bytes downloaded, bytes saved by 304s, duplicates skipped
+- Validator and seen files are shared by every engine (Hydra, NewsScanner):
+  saves merge this process's changes into the file under a lock, never
+  overwrite what another engine wrote
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+from urllib.parse import urlparse
+
+import requests
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# --- Configuration ---
+LOG_DIR = Path(__file__).parent.parent / "Logs"
+VALIDATOR_FILE = LOG_DIR / "feed_validators.json"
+SEEN_FILE = LOG_DIR / "feed_seen.json"
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive lock on <path>.lock shared by every process (and engine) saving path"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a+b") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        elif msvcrt:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            elif msvcrt:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_json(path: Path, default):
+    try:
+        return json.loads(path.read_text()) if path.exists() else default
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+def _write_json(path: Path, data):
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass
+class FeedSource:
+    """One endpoint to poll. name is the cache key (never the URL, which may carry API keys)."""
+    name: str
+    url: str
+    parse: Callable[[bytes], List[Any]]
+    key: Callable[[Any], str] = str
+    params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout: float = 10.0
+
+
+@dataclass
+class FeedResult:
+    name: str
+    items: List[Any] = field(default_factory=list)   # new (unseen) items only
+    status: int = 0
+    not_modified: bool = False
+    bytes_received: int = 0
+    bytes_saved: int = 0
+    duplicates: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+class ValidatorCache:
+    """Persists ETag / Last-Modified per source between runs"""
+    def __init__(self, path: Path = VALIDATOR_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.data = _read_json(path, {})
+        self._loaded = _mtime(path)
+        self._changed = set()   # Sources updated since the last save
+
+    def headers_for(self, name: str) -> Dict[str, str]:
+        entry = self.data.get(name, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, name: str, response_headers, size: int):
+        with self._lock:
+            self.data[name] = {
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "size": size,
+                "fetched_at": time.time(),
+            }
+            self._changed.add(name)
+
+    def last_size(self, name: str) -> int:
+        return self.data.get(name, {}).get("size", 0)
+
+    def _merge_disk(self):
+        merged = _read_json(self.path, {})
+        for name in self._changed:
+            ours, theirs = self.data[name], merged.get(name) or {}
+            if ours["fetched_at"] >= theirs.get("fetched_at", 0):   # Newest fetch wins
+                merged[name] = ours
+        self.data = merged
+
+    def refresh(self):
+        """Picks up validators other engines saved since we last read the file"""
+        with self._lock:
+            if _mtime(self.path) != self._loaded:
+                self._merge_disk()
+                self._loaded = _mtime(self.path)
+
+    def save(self):
+        """Merges this engine's updates into the file instead of overwriting it"""
+        with self._lock, _file_lock(self.path):
+            self._merge_disk()
+            _write_json(self.path, self.data)
+            self._loaded = _mtime(self.path)
+            self._changed.clear()
+
+
+class SeenStore:
+    """Bounded, persistent set of item content hashes (oldest evicted first)"""
+    def __init__(self, path: Path = SEEN_FILE, capacity: int = 50000):
+        self.path = path
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._hashes: "OrderedDict[str, None]" = OrderedDict.fromkeys(_read_json(path, []))
+        self._loaded = _mtime(path)
+        self._added: List[str] = []   # Hashes recorded since the last save
+
+    @staticmethod
+    def digest(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=12).hexdigest()
+
+    def check_and_add(self, text: str) -> bool:
+        """True if the item is new"""
+        h = self.digest(text)
+        with self._lock:
+            if h in self._hashes:
+                return False
+            self._hashes[h] = None
+            self._added.append(h)
+            while len(self._hashes) > self.capacity:
+                self._hashes.popitem(last=False)
+            return True
+
+    def _merge_disk(self):
+        merged = OrderedDict.fromkeys(_read_json(self.path, []))
+        for h in self._added:
+            merged[h] = None
+        while len(merged) > self.capacity:
+            merged.popitem(last=False)
+        self._hashes = merged
+
+    def refresh(self):
+        """Picks up hashes other engines saved since we last read the file"""
+        with self._lock:
+            if _mtime(self.path) != self._loaded:
+                self._merge_disk()
+                self._loaded = _mtime(self.path)
+
+    def save(self):
+        """Appends this engine's new hashes to whatever the file holds now"""
+        with self._lock, _file_lock(self.path):
+            self._merge_disk()
+            _write_json(self.path, list(self._hashes))
+            self._loaded = _mtime(self.path)
+            self._added.clear()
+
+
+class FeedEngine:
+    def __init__(self, max_concurrency: int = 8, per_host: int = 2,
+                 validators: Optional[ValidatorCache] = None, seen: Optional[SeenStore] = None,
+                 conditional: bool = True, dedup: bool = True):
+        self.max_concurrency = max_concurrency
+        self.per_host = per_host
+        self.validators = validators or ValidatorCache()
+        self.seen = seen or SeenStore()
+        self.conditional = conditional
+        self.dedup = dedup
+        self.last_cycle: Dict[str, Any] = {}
+
+    def _fetch_one(self, source: FeedSource) -> FeedResult:
+        result = FeedResult(name=source.name)
+        headers = dict(source.headers)
+        if self.conditional:
+            headers.update(self.validators.headers_for(source.name))
+
+        start = time.perf_counter()
+        try:
+            response = requests.get(source.url, params=source.params or None,
+                                    headers=headers, timeout=source.timeout)
+            result.status = response.status_code
+            if response.status_code == 304:
+                result.not_modified = True
+                result.bytes_saved = self.validators.last_size(source.name)
+            else:
+                body = response.content
+                result.bytes_received = len(body)
+                response.raise_for_status()
+                items = source.parse(body)
+                keys = [source.key(item) for item in items]
+                # Only now: a validator stored for an unparsed body would turn the next fetch into a 304
+                self.validators.update(source.name, response.headers, len(body))
+                for item, key in zip(items, keys):
+                    if not self.dedup or self.seen.check_and_add(key):
+                        result.items.append(item)
+                    else:
+                        result.duplicates += 1
+        except Exception as e:
+            result.error = str(e)
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    async def fetch_all_async(self, sources: List[FeedSource]) -> Dict[str, FeedResult]:
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def guarded(source: FeedSource):
+            host = urlparse(source.url).netloc
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+            async with global_limit, host_limit:
+                return await asyncio.to_thread(self._fetch_one, source)
+
+        results = await asyncio.gather(*(guarded(s) for s in sources))
+        return {r.name: r for r in results}
+
+    def fetch_all(self, sources: List[FeedSource]) -> Dict[str, FeedResult]:
+        """Fetches every source concurrently and persists validators + seen hashes"""
+        start = time.perf_counter()
+        self.validators.refresh()
+        self.seen.refresh()
+        results = asyncio.run(self.fetch_all_async(sources))
+        self.validators.save()
+        self.seen.save()
+
+        self.last_cycle = {
+            "sources": len(sources),
+            "seconds": time.perf_counter() - start,
+            "bytes_received": sum(r.bytes_received for r in results.values()),
+            "bytes_saved": sum(r.bytes_saved for r in results.values()),
+            "not_modified": sum(1 for r in results.values() if r.not_modified),
+            "new_items": sum(len(r.items) for r in results.values()),
+            "duplicates": sum(r.duplicates for r in results.values()),
+            "errors": sum(1 for r in results.values() if r.error),
+        }
+        return results
+
+
+# --- Benchmark: local stub server with synthetic feeds ---
+def _start_stub_server(feeds: int, items: int, latency: float, churn: int):
+    import email.utils
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    state = {"version": 0}
+
+    def body_for(feed_id: int) -> bytes:
+        # Only `churn` feeds change per version; the rest stay byte-identical
+        version = state["version"] if feed_id < churn else 0
+        posts = [{"id": f"{feed_id}-{version}-{i}" if i == 0 else f"{feed_id}-{i}",
+                  "title": f"Synthetic headline {feed_id}/{i} " + "x" * 200}
+                 for i in range(items)]
+        return json.dumps({"items": posts}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            feed_id = int(self.path.strip("/").split("?")[0] or 0)
+            body = body_for(feed_id)
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", email.utils.formatdate(usegmt=True))
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def benchmark(feeds=20, items=50, latency=0.2, churn=2, cycles=3):
+    import tempfile
+
+    server, state = _start_stub_server(feeds, items, latency, churn)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    parse = lambda body: json.loads(body)["items"]
+    key = lambda item: item["id"]
+    sources = [FeedSource(f"stub-{i}", f"{base}/{i}", parse, key) for i in range(feeds)]
+
+    # Baseline: what the scanners did before (sequential, unconditional)
+    start = time.perf_counter()
+    baseline_bytes = sum(len(requests.get(s.url, timeout=10).content) for s in sources)
+    baseline_s = time.perf_counter() - start
+
+    tmp = Path(tempfile.mkdtemp(prefix="feed_engine_"))
+    engine = FeedEngine(per_host=feeds, validators=ValidatorCache(tmp / "v.json"), seen=SeenStore(tmp / "s.json"))
+
+    print(f"\nStub: {feeds} feeds x {items} items, {latency*1000:.0f}ms latency, {churn} feeds change per cycle")
+    print(f"{'Cycle':<10} {'Seconds':>8} {'Bytes':>10} {'Saved(s)':>9} {'Saved(B)':>10} {'New':>5} {'Dup':>5} {'304':>5}")
+    print(f"{'baseline':<10} {baseline_s:>8.2f} {baseline_bytes:>10,}")
+    for cycle in range(cycles):
+        engine.fetch_all(sources)
+        c = engine.last_cycle
+        print(f"{'engine#'+str(cycle+1):<10} {c['seconds']:>8.2f} {c['bytes_received']:>10,} "
+              f"{baseline_s - c['seconds']:>9.2f} {baseline_bytes - c['bytes_received']:>10,} "
+              f"{c['new_items']:>5} {c['duplicates']:>5} {c['not_modified']:>5}")
+        state["version"] += 1
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    benchmark()
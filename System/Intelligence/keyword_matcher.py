@@ -0,0 +1,138 @@
+"""
+MONOLITH INTELLIGENCE LAYER - Keyword Matcher
+Aho-Corasick automaton over every keyword category at once
+
+One pass over the text returns hit counts for every category, so the cost
+is O(text length + matches) regardless of how many keywords are loaded.
+Matching is plain substring matching (same semantics as `kw in text`), and
+every (overlapping) occurrence counts as a hit. Duplicate keywords within a
+category count once.
+
+Tiny keyword sets skip the automaton: a handful of C-level `in` checks beats
+a Python-level walk over every character.
+"""
+
+import time
+import random
+import string
+from typing import Dict, List, Iterable
+
+
+SMALL_SET = 64  # Below this many keywords, substring checks are faster than the automaton
+
+
+class KeywordMatcher:
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories = list(categories.keys())
+        self.keywords = {c: list(dict.fromkeys(kw.lower() for kw in kws if kw)) for c, kws in categories.items()}
+        self._flat = [(idx, kw) for idx, c in enumerate(self.categories) for kw in self.keywords[c]]
+        self._small = len(self._flat) <= SMALL_SET
+        if not self._small:
+            self._build()
+
+    def _build(self):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[set] = [set()]
+
+        # 1. Trie
+        for idx, category in enumerate(self.categories):
+            for kw in self.keywords[category]:
+                state = 0
+                for ch in kw:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        out.append(set())
+                    state = nxt
+                out[state].add((idx, kw))
+
+        # 2. Failure links (BFS), merging outputs so each state lists every keyword ending there
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f][ch] if ch in goto[f] and goto[f][ch] != nxt else 0
+                out[nxt] |= out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        # Category index per keyword occurrence (duplicate keywords across categories count in both)
+        self._out = [tuple(idx for idx, _ in o) for o in out]
+        self._alphabet = frozenset(ch for node in goto for ch in node)
+
+    def _count_small(self, text: str, hits: List[int]):
+        for idx, kw in self._flat:
+            if kw in text:
+                i = text.find(kw)
+                while i != -1:
+                    hits[idx] += 1
+                    i = text.find(kw, i + 1)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Hit count per category (only categories with at least one hit)"""
+        hits = [0] * len(self.categories)
+        text = text.lower()
+        if self._small:
+            self._count_small(text, hits)
+            return {self.categories[i]: n for i, n in enumerate(hits) if n}
+
+        goto, fail, out, alphabet = self._goto, self._fail, self._out, self._alphabet
+        state = 0
+        for ch in text:
+            if ch not in alphabet:
+                state = 0
+                continue
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+            if out[state]:
+                for idx in out[state]:
+                    hits[idx] += 1
+        return {self.categories[i]: n for i, n in enumerate(hits) if n}
+
+    def __len__(self):
+        return len(self._flat)
+
+
+def benchmark(sizes=(10, 1000, 10000), signals=2000, seed=7):
+    """Signals classified per second: any(kw in content) loops vs the automaton"""
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(20000)]
+    texts = [" ".join(rng.choices(words, k=16)) for _ in range(signals)]
+
+    print(f"\n{'Keywords':>9} {'any() sig/s':>14} {'matcher sig/s':>15} {'speedup':>9}")
+    for size in sizes:
+        pool = rng.sample(words, size)
+        cats = {"OPPORTUNITY": pool[0::3], "THREAT": pool[1::3], "TREND": pool[2::3]}
+
+        start = time.perf_counter()
+        for text in texts:
+            for kws in cats.values():
+                any(kw in text for kw in kws)
+        baseline = signals / (time.perf_counter() - start)
+
+        matcher = KeywordMatcher(cats)
+        start = time.perf_counter()
+        for text in texts:
+            matcher.count(text)
+        fast = signals / (time.perf_counter() - start)
+
+        print(f"{size:>9,} {baseline:>14,.0f} {fast:>15,.0f} {fast / baseline:>8.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
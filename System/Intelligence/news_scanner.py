@@ -12,9 +12,17 @@ Monitors 24/7 for:
 
 import requests
 import os
+import sys
+import json
 import time
+from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Intelligence.feed_engine import FeedEngine, FeedSource
+from System.Intelligence.signal_pipeline import process_scan
+
 class NewsScanner:
     def __init__(self):
         self.api_key = os.getenv("NEWSAPI_KEY", "")  # Get free key at newsapi.org
@@ -27,61 +35,66 @@ class NewsScanner:
             "tax", "crypto", "regulation", "AI", "loophole", 
             "exemption", "privacy", "offshore", "LLC"
         ]
+        self.engine = FeedEngine()
         
+    def _news_source(self):
+        return FeedSource(
+            name="newsapi.top-headlines",
+            url=self.sources["news"],
+            params={"apiKey": self.api_key, "language": "en", "pageSize": 20},
+            parse=lambda body: json.loads(body).get("articles", []),
+            key=lambda a: a.get("url") or a.get("title", "")
+        )
+    
+    def _reddit_source(self):
+        return FeedSource(
+            name="reddit.technology.hot",
+            url=self.sources["reddit"],
+            headers={"User-Agent": "Monolith/1.0"},
+            parse=lambda body: json.loads(body).get("data", {}).get("children", [])[:10],
+            key=lambda p: p.get("data", {}).get("id") or p.get("data", {}).get("permalink", "")
+        )
+    
+    def _report_errors(self, results):
+        for name, result in results.items():
+            if result.error:
+                print(f"   ⚠️ FEED ERROR ({name}): {result.error}")
+
     def scan_global_news(self):
-        """Fetch breaking news from major sources"""
+        """Fetch breaking news from major sources (new articles only)"""
         if not self.api_key:
             print("   ⚠️ NEWS SCANNER: No API key. Set NEWSAPI_KEY env variable.")
             return []
         
-        try:
-            response = requests.get(
-                self.sources["news"],
-                params={
-                    "apiKey": self.api_key,
-                    "language": "en",
-                    "pageSize": 20
-                },
-                timeout=10
-            )
-            articles = response.json().get("articles", [])
-            return self._filter_relevant(articles)
-        except Exception as e:
-            print(f"   ⚠️ NEWS API ERROR: {e}")
-            return []
+        results = self.engine.fetch_all([self._news_source()])
+        self._report_errors(results)
+        return self._filter_relevant(results["newsapi.top-headlines"].items)
     
     def scan_reddit_sentiment(self):
-        """Monitor Reddit for emerging trends"""
-        try:
-            headers = {"User-Agent": "Monolith/1.0"}
-            response = requests.get(
-                self.sources["reddit"],
-                headers=headers,
-                timeout=10
-            )
-            posts = response.json().get("data", {}).get("children", [])
-            
-            hot_topics = []
-            for post in posts[:10]:
-                data = post.get("data", {})
-                title = data.get("title", "")
-                if any(kw in title.lower() for kw in self.keywords):
-                    hot_topics.append({
-                        "title": title,
-                        "score": data.get("score", 0),
-                        "url": f"https://reddit.com{data.get('permalink', '')}"
-                    })
-            return hot_topics
-        except Exception as e:
-            print(f"   ⚠️ REDDIT SCAN ERROR: {e}")
-            return []
+        """Monitor Reddit for emerging trends (new posts only)"""
+        results = self.engine.fetch_all([self._reddit_source()])
+        self._report_errors(results)
+        return self._hot_topics(results["reddit.technology.hot"].items)
+    
+    def _hot_topics(self, posts):
+        hot_topics = []
+        for post in posts:
+            data = post.get("data", {})
+            title = data.get("title", "")
+            if any(kw in title.lower() for kw in self.keywords):
+                hot_topics.append({
+                    "title": title,
+                    "score": data.get("score", 0),
+                    "url": f"https://reddit.com{data.get('permalink', '')}"
+                })
+        return hot_topics
     
     def _filter_relevant(self, articles):
         """Filter news for money-making opportunities"""
         relevant = []
         for article in articles:
-            title = article.get("title", "").lower()
-            description = article.get("description", "").lower()
+            title = (article.get("title") or "").lower()
+            description = (article.get("description") or "").lower()
             
             if any(kw in title or kw in description for kw in self.keywords):
                 relevant.append({
@@ -96,8 +109,17 @@ class NewsScanner:
         """Execute full intelligence sweep"""
         print("   📡 INTELLIGENCE: Scanning global information stream...")
         
-        news = self.scan_global_news()
-        reddit = self.scan_reddit_sentiment()
+        # One concurrent, conditional fetch for every source
+        feeds = [self._reddit_source()]
+        if self.api_key:
+            feeds.append(self._news_source())
+        else:
+            print("   ⚠️ NEWS SCANNER: No API key. Set NEWSAPI_KEY env variable.")
+        results = self.engine.fetch_all(feeds)
+        self._report_errors(results)
+        
+        news = self._filter_relevant(results["newsapi.top-headlines"].items) if self.api_key else []
+        reddit = self._hot_topics(results["reddit.technology.hot"].items)
         
         signals = []
         
@@ -122,10 +144,14 @@ class NewsScanner:
         
         return signals
 
+    def scan_and_plan(self, classifier=None):
+        """Scan cycle streamed through dedup -> classify -> plan; returns actionable signals"""
+        return process_scan(self, classifier)
+
 if __name__ == "__main__":
     scanner = NewsScanner()
-    signals = scanner.run_scan_cycle()
+    signals = scanner.scan_and_plan()
     
-    print(f"\n🎯 DETECTED {len(signals)} SIGNALS:")
+    print(f"\n🎯 DETECTED {len(signals)} ACTIONABLE SIGNALS:")
     for sig in signals[:5]:  # Show top 5
-        print(f"   [{sig['type']}] {sig['content'][:80]}...")
+        print(f"   [{sig['classification']['type']}] {sig['content'][:80]}...")
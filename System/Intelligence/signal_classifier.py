@@ -7,10 +7,27 @@ Categories:
 - THREAT: Protect assets
 - TREND: Ride the wave
 - NOISE: Ignore
+
+Keyword lists can be overridden in System/Config/signal_keywords.json
+({"OPPORTUNITY": [...], "THREAT": [...], "TREND": [...]}); edits are
+picked up without a restart.
 """
 
+import sys
+import json
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Intelligence.keyword_matcher import KeywordMatcher
+
+KEYWORDS_FILE = Path(__file__).parent.parent / "Config" / "signal_keywords.json"
+
 class SignalClassifier:
-    def __init__(self):
+    RELOAD_CHECK_SECONDS = 5.0
+    
+    def __init__(self, keywords_file=KEYWORDS_FILE):
         self.money_keywords = [
             "tax break", "exemption", "loophole", "deduction", "credit",
             "subsidy", "grant", "rebate", "incentive"
@@ -23,36 +40,83 @@ class SignalClassifier:
             "boom", "surge", "adoption", "growth", "expansion",
             "demand", "popular", "viral"
         ]
+        self.keywords_file = Path(keywords_file) if keywords_file else None
+        self._keywords_mtime = None
+        self._next_reload_check = 0.0
+        self.reload_keywords()
+        
+    def reload_keywords(self, keywords=None):
+        """
+        Rebuilds the matcher. Uses `keywords` if given, else the config file
+        (when present), else the built-in lists.
+        """
+        if keywords is None and self.keywords_file and self.keywords_file.exists():
+            try:
+                self._keywords_mtime = self.keywords_file.stat().st_mtime
+                keywords = json.loads(self.keywords_file.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"   ⚠️ SIGNAL CLASSIFIER: Keyword file unreadable ({e}); keeping current lists")
+        if keywords:
+            self.money_keywords = keywords.get("OPPORTUNITY", self.money_keywords)
+            self.threat_keywords = keywords.get("THREAT", self.threat_keywords)
+            self.trend_keywords = keywords.get("TREND", self.trend_keywords)
+        
+        self.matcher = KeywordMatcher({
+            "OPPORTUNITY": self.money_keywords,
+            "THREAT": self.threat_keywords,
+            "TREND": self.trend_keywords
+        })
+    
+    def _maybe_reload(self):
+        """Hot-reload: stat the keyword file at most every RELOAD_CHECK_SECONDS"""
+        now = time.monotonic()
+        if not self.keywords_file or now < self._next_reload_check:
+            return
+        self._next_reload_check = now + self.RELOAD_CHECK_SECONDS
+        try:
+            mtime = self.keywords_file.stat().st_mtime
+        except OSError:
+            return
+        if mtime != self._keywords_mtime:
+            self.reload_keywords()
+    
+    def match(self, signal):
+        """Hit counts for every category in one pass, e.g. {"THREAT": 2, "TREND": 1}"""
+        self._maybe_reload()
+        return self.matcher.count(signal.get("content") or "")
         
     def classify(self, signal):
         """Determine signal type and action"""
-        content = signal.get("content", "").lower()
+        matches = self.match(signal)
         
         # Check for money opportunities
-        if any(kw in content for kw in self.money_keywords):
+        if "OPPORTUNITY" in matches:
             return {
                 "type": "OPPORTUNITY",
                 "action": "CREATE_CONTENT",
                 "priority": "HIGH",
-                "reasoning": "Tax/financial opportunity detected"
+                "reasoning": "Tax/financial opportunity detected",
+                "matches": matches
             }
         
         # Check for threats
-        if any(kw in content for kw in self.threat_keywords):
+        if "THREAT" in matches:
             return {
                 "type": "THREAT",
                 "action": "ALERT_USER",
                 "priority": "URGENT",
-                "reasoning": "Regulatory threat to current operations"
+                "reasoning": "Regulatory threat to current operations",
+                "matches": matches
             }
         
         # Check for trends
-        if any(kw in content for kw in self.trend_keywords):
+        if "TREND" in matches:
             return {
                 "type": "TREND",
                 "action": "MONITOR",
                 "priority": "MEDIUM",
-                "reasoning": "Emerging trend - potential future opportunity"
+                "reasoning": "Emerging trend - potential future opportunity",
+                "matches": matches
             }
         
         # Default: noise
@@ -60,7 +124,8 @@ class SignalClassifier:
             "type": "NOISE",
             "action": "IGNORE",
             "priority": "LOW",
-            "reasoning": "No actionable intelligence"
+            "reasoning": "No actionable intelligence",
+            "matches": matches
         }
     
     def generate_action_plan(self, classified_signal, original_signal):
@@ -115,4 +180,5 @@ if __name__ == "__main__":
         print(f"  → Type: {result['type']}")
         print(f"  → Action: {result['action']}")
         print(f"  → Priority: {result['priority']}")
+        print(f"  → Matches: {result['matches']}")
         print()
@@ -149,6 +149,11 @@ class TaxOptimizer:
         # Sort by net income (highest first)
         results.sort(key=lambda x: x["net_income"], reverse=True)
         return results
+
+    def rank_jurisdictions(self, incomes, income_type="employment", us_citizen=True, willing_to_relocate=True):
+        """Ranks every eligible jurisdiction for many incomes in one vectorized call"""
+        from System.Finance.batch_tax import BatchJurisdictionRanker
+        return BatchJurisdictionRanker(self).rank(incomes, income_type, us_citizen, willing_to_relocate)
     
     def generate_relocation_plan(self, target_jurisdiction):
         """Step-by-step guide to move to optimal jurisdiction"""
@@ -0,0 +1,284 @@
+"""
+MONOLITH DUPLICATE FINDER
+Staged duplicate detection for HygieneEngine
+
+Each stage only sees the survivors of the previous one:
+1. Size        - stat only; a file with a unique size cannot have a duplicate
+2. Sample      - first + last 4 KB (the whole file when it is that small)
+3. Full hash   - streaming 1 MB reads, xxh3-64 when xxhash is installed, CRC32 otherwise
+4. Byte compare against the group's original, so a weak-hash collision is never reported
+   (a group of exactly two goes straight from 2 to 4: one streaming compare that
+   stops at the first differing block; a group of small files is read once and
+   keyed on the raw bytes, which is the byte compare)
+
+Samples and full hashes are kept in a stat cache (size, mtime_ns, inode), so
+a rescan of an unchanged tree reads nothing until the final byte compare.
+"""
+
+import os
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.manifest_engine import StatCache
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+SAMPLE_SIZE = 4096
+READ_SIZE = 1024 * 1024
+INLINE_MAX = 256 * 1024   # Groups of files up to this size are compared in memory
+
+
+class _Crc32:
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data: bytes):
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self) -> str:
+        return f"{self.value:08x}"
+
+
+def _hasher():
+    return xxhash.xxh3_64() if xxhash else _Crc32()
+
+
+class DuplicateFinder:
+    def __init__(self, cache_file: Optional[Path] = None, confirm=True):
+        self.cache = StatCache(cache_file)
+        self.confirm = confirm
+        self.stats: Dict[str, Any] = {}
+
+    # --- Reads (all counted in stats["bytes_read"]) ---
+    def _sample(self, path: str, size: int) -> str:
+        h = _hasher()
+        with open(path, "rb") as f:
+            if size <= 2 * SAMPLE_SIZE:
+                data = f.read()
+            else:
+                data = f.read(SAMPLE_SIZE)
+                f.seek(-SAMPLE_SIZE, os.SEEK_END)
+                data += f.read(SAMPLE_SIZE)
+        self.stats["bytes_read"] += len(data)
+        h.update(data)
+        return h.hexdigest()
+
+    def _full_hash(self, path: str) -> str:
+        h = _hasher()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(READ_SIZE), b""):
+                self.stats["bytes_read"] += len(block)
+                h.update(block)
+        return h.hexdigest()
+
+    def _same_bytes(self, a: str, b: str) -> bool:
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            while True:
+                x, y = fa.read(READ_SIZE), fb.read(READ_SIZE)
+                self.stats["bytes_read"] += len(x) + len(y)
+                if x != y:
+                    return False
+                if not x:
+                    return True
+
+    # --- Cache entries are "sample:full" (full may be empty) ---
+    def _cached(self, path: str, st: os.stat_result) -> Tuple[Optional[str], Optional[str]]:
+        value = self.cache.lookup(path, st)
+        if not value:
+            return None, None
+        sample, _, full = value.partition(":")
+        return sample, full or None
+
+    def find(self, paths: Iterable[Path]) -> List[Dict[str, Any]]:
+        """Duplicates as [{original, duplicate, size}]; original is the first path in scan order"""
+        start = time.perf_counter()
+        self.stats = {"files": 0, "bytes_total": 0, "bytes_read": 0,
+                      "sampled": 0, "hashed": 0, "compared": 0}
+
+        # 1. Size
+        by_size: Dict[int, List[Tuple[int, str, os.stat_result]]] = {}
+        for order, path in enumerate(paths):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            self.stats["files"] += 1
+            self.stats["bytes_total"] += st.st_size
+            by_size.setdefault(st.st_size, []).append((order, str(path), st))
+
+        # 2. Head + tail sample, in scan order (keeps reads close to directory order on disk)
+        candidates = sorted(m for members in by_size.values() if len(members) > 1 for m in members)
+        by_sample: Dict[Tuple[int, str], list] = {}
+        for order, path, st in candidates:
+            sample, full = self._cached(path, st)
+            if sample is None:
+                try:
+                    sample = self._sample(path, st.st_size)
+                except OSError:
+                    continue
+                self.stats["sampled"] += 1
+                self.cache.store(path, st, f"{sample}:")
+            by_sample.setdefault((st.st_size, sample), []).append((order, path, st, full))
+
+        duplicates = []
+        for (size, sample), group in by_sample.items():
+            if len(group) < 2:
+                continue
+
+            # A lone pair needs one streaming compare, not two hashes and then a compare
+            if self.confirm and len(group) == 2 and not (group[0][3] and group[1][3]):
+                (o1, p1, _, _), (o2, p2, _, _) = sorted(group)
+                self.stats["compared"] += 1
+                try:
+                    if self._same_bytes(p1, p2):
+                        duplicates.append((o2, {"original": p1, "duplicate": p2, "size": size}))
+                except OSError:
+                    pass
+                continue
+
+            # Small files: one read each, dict lookup on the content does the byte compare
+            if self.confirm and size <= INLINE_MAX:
+                contents: Dict[bytes, str] = {}
+                for order, path, st, full in sorted(group):
+                    try:
+                        with open(path, "rb") as f:
+                            data = f.read()
+                    except OSError:
+                        continue
+                    self.stats["bytes_read"] += len(data)
+                    self.stats["compared"] += 1
+                    if full is None:
+                        h = _hasher()
+                        h.update(data)
+                        self.cache.store(path, st, f"{sample}:{h.hexdigest()}")
+                    original = contents.setdefault(data, path)
+                    if original != path:
+                        duplicates.append((order, {"original": original, "duplicate": path, "size": size}))
+                continue
+
+            # 3. Full hash (the sample already covers small files)
+            by_hash: Dict[str, list] = {}
+            for order, path, st, full in group:
+                if full is None:
+                    if size <= 2 * SAMPLE_SIZE:
+                        full = sample
+                    else:
+                        try:
+                            full = self._full_hash(path)
+                        except OSError:
+                            continue
+                        self.stats["hashed"] += 1
+                    self.cache.store(path, st, f"{sample}:{full}")
+                by_hash.setdefault(full, []).append((order, path))
+
+            # 4. Byte compare against each distinct original
+            for same in by_hash.values():
+                if len(same) < 2:
+                    continue
+                same.sort()
+                originals = [same[0][1]]
+                for order, path in same[1:]:
+                    match = None
+                    for original in originals:
+                        self.stats["compared"] += 1
+                        if not self.confirm or self._same_bytes(original, path):
+                            match = original
+                            break
+                    if match:
+                        duplicates.append((order, {"original": match, "duplicate": path, "size": size}))
+                    else:
+                        originals.append(path)
+
+        self.cache.save()
+        self.stats["seconds"] = time.perf_counter() - start
+        return [d for _, d in sorted(duplicates, key=lambda x: x[0])]
+
+
+def _drop_page_cache() -> bool:
+    """Best effort (Linux, root): makes benchmark reads hit the disk"""
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except OSError:
+        return False
+
+
+def benchmark(files=100_000, root=None):
+    """Legacy read_bytes + sha256 vs the staged finder on a synthetic tree"""
+    import random
+    import shutil
+    import hashlib
+    import tempfile
+
+    rng = random.Random(7)
+    tmp = Path(root) if root else Path(tempfile.mkdtemp(prefix="duplicate_finder_"))
+    tree = tmp / "tree"
+    pool = os.urandom(4 * 1024 * 1024)
+
+    start = time.perf_counter()
+    paths, originals = [], []
+    for i in range(files):
+        p = tree / f"d{i % 100:02d}" / f"f{i:06d}.py"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        roll = rng.random()
+        if originals and roll < 0.05:
+            data = rng.choice(originals)                                  # True duplicate
+        elif originals and roll < 0.08:
+            data = bytearray(rng.choice(originals))
+            data[len(data) // 2] ^= 0xFF                                  # Same size, same head/tail
+            data = bytes(data)
+        else:
+            size = min(int(rng.paretovariate(1.2) * 2000), len(pool) - 8)
+            offset = rng.randrange(len(pool) - size)
+            data = i.to_bytes(8, "little") + pool[offset:offset + size]
+            if rng.random() < 0.05:
+                originals.append(data)
+        p.write_bytes(data)
+        paths.append(p)
+    total = sum(p.stat().st_size for p in paths)
+    print(f"\nTree: {files:,} files, {total / 1024 ** 2:.0f} MB (generated in {time.perf_counter() - start:.0f}s), "
+          f"hash: {'xxh3-64' if xxhash else 'crc32'}")
+
+    cold_io = _drop_page_cache()
+    start = time.perf_counter()
+    hashes, legacy = {}, []
+    for p in paths:
+        h = hashlib.sha256(p.read_bytes()).hexdigest()
+        if h in hashes:
+            legacy.append({"original": hashes[h], "duplicate": str(p), "size": p.stat().st_size})
+        else:
+            hashes[h] = str(p)
+    legacy_s = time.perf_counter() - start
+
+    rows = [("legacy (read_bytes + sha256)", legacy_s, total, len(legacy))]
+    for label in ("staged, cold cache", "staged, warm cache"):
+        _drop_page_cache()
+        finder = DuplicateFinder(tmp / "cache.json")
+        found = finder.find(paths)
+        assert found == legacy, (len(found), len(legacy))
+        rows.append((label, finder.stats["seconds"], finder.stats["bytes_read"], len(found)))
+    _drop_page_cache()
+    finder = DuplicateFinder(tmp / "cache.json", confirm=False)
+    found = finder.find(paths)
+    rows.append(("staged, warm, no byte compare", finder.stats["seconds"], finder.stats["bytes_read"], len(found)))
+
+    print(f"Page cache dropped before each run: {'yes' if cold_io else 'no (reads may be served from RAM)'}")
+    print(f"{'':<32} {'Seconds':>8} {'MB read':>9} {'Dupes':>7}")
+    for label, secs, read, n in rows:
+        print(f"{label:<32} {secs:>8.2f} {read / 1024 ** 2:>9.1f} {n:>7,}")
+    if not root:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -9,11 +9,18 @@ Keeps system:
 """
 
 import os
-import hashlib
+import sys
 import psutil
 import time
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.resource_sampler import ResourceSampler
+from System.Maintenance.duplicate_finder import DuplicateFinder
+
+CPU_MEASURE_SECONDS = 0.5  # Real CPU reading when only the boot-average sample exists
+
 class HygieneEngine:
     def __init__(self):
         self.root = Path(__file__).parent.parent.parent
@@ -22,31 +29,21 @@ class HygieneEngine:
             Path(os.getenv("TEMP")),
         ]
         self.file_cache = {}
+        # Subdirectory: clean_temp_files only removes top-level files in Logs
+        self.duplicate_cache = self.root / "System" / "Logs" / "hygiene" / "duplicate_cache.json"
+        self.last_duplicate_scan = {}
         
     def find_duplicates(self):
-        """Identify duplicate files for removal"""
+        """Identify duplicate files for removal (size -> head/tail sample -> hash -> byte compare)"""
         print("   🔍 HYGIENE: Scanning for duplicates...")
         
-        hashes = {}
         duplicates = []
         
         try:
-            for ext in ["*.py", "*.md", "*.db"]:
-                for file_path in self.root.rglob(ext):
-                    if file_path.is_file():
-                        try:
-                            file_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
-                            
-                            if file_hash in hashes:
-                                duplicates.append({
-                                    "original": hashes[file_hash],
-                                    "duplicate": str(file_path),
-                                    "size": file_path.stat().st_size
-                                })
-                            else:
-                                hashes[file_hash] = str(file_path)
-                        except:
-                            pass
+            paths = [p for ext in ["*.py", "*.md", "*.db"] for p in self.root.rglob(ext) if p.is_file()]
+            finder = DuplicateFinder(self.duplicate_cache)
+            duplicates = finder.find(paths)
+            self.last_duplicate_scan = finder.stats
         except Exception as e:
             print(f"   ⚠️ DUPLICATE SCAN ERROR: {e}")
         
@@ -112,17 +109,29 @@ class HygieneEngine:
         except:
             return False
     
-    def get_system_health(self):
-        """Current system status"""
+    def get_system_health(self, window_seconds=60):
+        """
+        Current system status from the background sampler. A one-shot run only
+        has the priming sample (CPU averaged since boot), so it blocks once for
+        a short real reading; cpu_boot_average flags a value that is still not current.
+        """
         try:
-            cpu = psutil.cpu_percent(interval=1)
-            ram = psutil.virtual_memory().percent
-            disk = psutil.disk_usage('/').percent
+            sampler = ResourceSampler.shared()
+            stats = sampler.stats(window_seconds)
+            if stats["cpu_boot_average"]:
+                sampler.measure_cpu(CPU_MEASURE_SECONDS)
+                stats = sampler.stats(window_seconds)
+            cpu = stats["cpu"]["avg"]
+            ram = stats["ram"]["last"]
+            disk = stats["disk"]["last"] if stats["disk"] else 0.0
             
             return {
                 "cpu_usage": cpu,
+                "cpu_p95": stats["cpu"]["p95"],
                 "ram_usage": ram,
                 "disk_usage": disk,
+                "samples": stats["samples"],
+                "cpu_boot_average": stats["cpu_boot_average"],
                 "status": "HEALTHY" if cpu < 70 and ram < 80 else "STRAINED"
             }
         except:
@@ -134,7 +143,8 @@ class HygieneEngine:
         
         # 1. Check system health
         health = self.get_system_health()
-        print(f"   📊 CPU: {health.get('cpu_usage', 0):.1f}% | RAM: {health.get('ram_usage', 0):.1f}% | Disk: {health.get('disk_usage', 0):.1f}%")
+        cpu_label = " (avg since boot)" if health.get("cpu_boot_average") else ""
+        print(f"   📊 CPU: {health.get('cpu_usage', 0):.1f}%{cpu_label} | RAM: {health.get('ram_usage', 0):.1f}% | Disk: {health.get('disk_usage', 0):.1f}%")
         
         # 2. Clean temp files
         bytes_cleaned, files_cleaned = self.clean_temp_files()
@@ -1,10 +1,16 @@
-import time, psutil, feedparser, requests, imaplib, email, random, threading, json, os, glob
+import time, psutil, feedparser, requests, imaplib, email, random, threading, json, os, glob, sys
 from datetime import datetime
 from email.header import decode_header
 from pushbullet import Pushbullet
-from flask import Flask, jsonify
+from flask import Flask, jsonify, Response, request
 from flask_cors import CORS
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from System.Core.market_data_store import MarketDataStore
+from System.Core.refresh_cache import RefreshCache
+from System.Core.resource_sampler import ResourceSampler
+from System.Core.state_push import StateHub, UnixSocketPublisher
+
 app = Flask(__name__)
 CORS(app)
 
@@ -30,6 +36,90 @@ def load_json(filepath):
         except: return None
     return None
 
+# --- B2. MARKET DATA (shared store, read-through) ---
+MARKET = MarketDataStore.shared()
+COINGECKO_IDS = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana", "ADA": "cardano"}
+
+def fetch_coingecko(symbols):
+    ids = ",".join(COINGECKO_IDS[s] for s in symbols if s in COINGECKO_IDS)
+    r = requests.get(f"https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd", timeout=2).json()
+    return {s: {"price": r[COINGECKO_IDS[s]]['usd']} for s in symbols if COINGECKO_IDS.get(s) in r}
+
+def get_prices(symbols, ttl=30):
+    return MARKET.get_quotes(symbols, fetch_coingecko, ttl=ttl)
+
+# --- B3. BACKGROUND REFRESH (handlers read memory, never the network) ---
+CACHE = RefreshCache.shared()
+SAMPLER = ResourceSampler.shared()
+BOOT_TIME = datetime.fromtimestamp(psutil.boot_time()).strftime("%H:%M")
+
+def fetch_ip():
+    return requests.get("http://ip-api.com/json/", timeout=2).json()
+
+def fetch_quotes():
+    quotes = get_prices(["BTC", "ETH", "SOL", "ADA"])
+    if not quotes: raise ValueError("no quotes")
+    return quotes
+
+def fetch_news():
+    feed = feedparser.parse("http://feeds.bbci.co.uk/news/technology/rss.xml")
+    if feed.bozo and not feed.entries: raise ValueError(f"feed unavailable: {feed.get('bozo_exception')}")
+    return [{"type": "NEWS", "src": "BBC", "msg": e.title[:30]+"..."} for e in feed.entries[:2]]
+
+def fetch_personal():
+    data = []
+    # Gmail
+    try:
+        if "YOUR_EMAIL" not in CONFIG["GMAIL_USER"]:
+            mail = imaplib.IMAP4_SSL("imap.gmail.com")
+            mail.login(CONFIG["GMAIL_USER"], CONFIG["GMAIL_PASS"])
+            mail.select("inbox")
+            _, msgs = mail.search(None, '(UNSEEN)')
+            for e_id in msgs[0].split()[-2:]:
+                _, msg_data = mail.fetch(e_id, "(RFC822)")
+                msg = email.message_from_bytes(msg_data[0][1])
+                subj = decode_header(msg["Subject"])[0][0]
+                if isinstance(subj, bytes): subj = subj.decode()
+                data.append({"type": "EMAIL", "src": "Gmail", "msg": subj[:25]+"..."})
+            mail.logout()
+    except: pass
+    
+    # Pushbullet
+    try:
+        if "o.YOUR_KEY" not in CONFIG["PUSHBULLET"]:
+            pb = Pushbullet(CONFIG["PUSHBULLET"])
+            for push in pb.get_pushes()[:2]:
+                if 'body' in push:
+                    data.append({"type": "SMS", "src": push.get('title','Phone')[:10], "msg": push['body'][:25]+"..."})
+    except: pass
+    return data
+
+CACHE.register("ip", fetch_ip, ttl=300, default={"query": "127.0.0.1", "isp": "LOCALHOST"})
+CACHE.register("quotes", fetch_quotes, ttl=30, default={})
+CACHE.register("news", fetch_news, ttl=300, default=[])
+CACHE.register("personal", fetch_personal, ttl=120, default=[])
+for _key in ("PROFIT_ENGINE", "NOTIFICATIONS", "THREATS"):
+    CACHE.register(_key.lower(), lambda path=CONFIG["PATHS"][_key]: load_json(path), ttl=5)
+
+# --- B4. STATE PUSH (clients subscribe to deltas instead of polling) ---
+SYSTEM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+HUB = StateHub.shared()
+HUB.watch_sentinels(os.path.join(SYSTEM_DIR, "Sentinels"))
+HUB.watch_json("treasury", os.path.join(SYSTEM_DIR, "Logs", "Treasury", "first_dollar.json"))
+HUB.watch_json("earnings", CONFIG["PATHS"]["PROFIT_ENGINE"])
+HUB.watch_json("notifications", CONFIG["PATHS"]["NOTIFICATIONS"])
+HUB.watch_ledger(os.path.join(SYSTEM_DIR, "Logs", "ledger.db"))
+HUB.watch_log("observability", os.path.join(SYSTEM_DIR, "Logs", "observability.jsonl"))
+HUB.watch_log("execution", os.path.join(SYSTEM_DIR, "Logs", "Treasury", "execution_log.jsonl"))
+
+def cached_response(body, *sources):
+    """JSON response with per-source freshness (body key for objects, header for lists)"""
+    freshness = CACHE.freshness(*sources)
+    if isinstance(body, dict): body = {**body, "freshness": freshness}
+    response = jsonify(body)
+    response.headers["X-Monolith-Freshness"] = json.dumps(freshness)
+    return response
+
 # --- C. SYSTEM SUPERVISOR ---
 SYSTEM_HEALTH = []
 DYNAMIC_ALERTS = []
@@ -55,11 +145,11 @@ def scout_loop():
     while True:
         alerts = []
         # 1. Hardware
-        cpu = psutil.cpu_percent()
+        cpu = SAMPLER.latest().get("cpu", 0)
         if cpu > 85: alerts.append({"title": "CPU CRITICAL", "val": f"{cpu}%", "color": "red"})
         
         # 2. Profit Engine Alerts
-        notifs = load_json(CONFIG["PATHS"]["NOTIFICATIONS"])
+        notifs = CACHE.get("notifications", block=False)
         if notifs:
             # Assuming list of recent alerts
             for n in notifs[-1:]:
@@ -67,112 +157,83 @@ def scout_loop():
 
         # 3. Crypto
         try:
-            r = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd", timeout=2).json()
-            if r['bitcoin']['usd'] < 95000: 
+            btc = CACHE.get("quotes", block=False).get("BTC")
+            if btc and btc['price'] < 95000: 
                 alerts.append({"title": "MARKET DIP", "val": "BTC < 95k", "color": "yellow"})
         except: pass
 
         DYNAMIC_ALERTS = alerts
         time.sleep(10)
 
+CACHE.start()
+HUB.start()
+UnixSocketPublisher(HUB).start()  # Local socket for the TUI
 threading.Thread(target=scout_loop, daemon=True).start()
 
 # --- API ENDPOINTS ---
 
 @app.route('/api/system')
 def get_system():
-    # IP Logic
-    ip = {"query": "127.0.0.1", "isp": "LOCALHOST"}
-    try: ip = requests.get("http://ip-api.com/json/", timeout=1).json()
-    except: pass
-    
-    return jsonify({
-        "cpu": psutil.cpu_percent(interval=None), 
-        "ram": psutil.virtual_memory().percent,
-        "disk": psutil.disk_usage('/').percent,
-        "boot": datetime.fromtimestamp(psutil.boot_time()).strftime("%H:%M"),
-        "ip": ip
-    })
+    sample = SAMPLER.latest()
+    return cached_response({
+        "cpu": sample.get("cpu"), 
+        "ram": sample.get("ram"),
+        "disk": sample.get("disk"),
+        "boot": BOOT_TIME,
+        "ip": CACHE.get("ip", block=False)
+    }, "ip")
 
 @app.route('/api/finance')
 def get_finance():
     # 1. Load Real Profit Data from Sub-System
-    earnings = load_json(CONFIG["PATHS"]["PROFIT_ENGINE"])
+    earnings = CACHE.get("profit_engine", block=False)
     
     # Balance
     balance = earnings['total_earnings'] if earnings else 0.00
     if not earnings: balance = 14205.55 # Fallback if system hasn't run yet
     
     # Market Data
-    market = []
-    try:
-        r = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum,solana,cardano&vs_currencies=usd").json()
-        market = [
-            {"symbol": "BTC", "price": f"${r['bitcoin']['usd']:,}"},
-            {"symbol": "ETH", "price": f"${r['ethereum']['usd']:,}"},
-            {"symbol": "SOL", "price": f"${r['solana']['usd']:,}"}
-        ]
-    except: market = [{"symbol": "API", "price": "OFFLINE"}]
-
-    return jsonify({
+    quotes = CACHE.get("quotes", block=False)
+    market = [
+        {"symbol": sym, "price": f"${quotes[sym]['price']:,.2f}"}
+        for sym in ("BTC", "ETH", "SOL") if sym in quotes
+    ] or [{"symbol": "API", "price": "OFFLINE"}]
+
+    return cached_response({
         "balance": f"${balance:,.2f}",
         "market": market,
         # History is now Recent Opportunities from the Engine
         "history": earnings.get('history', [])[:3] if earnings else [] 
-    })
+    }, "profit_engine", "quotes")
 
 @app.route('/api/intel')
 def get_intel():
     intel = []
     
     # A. Threats
-    t = load_json(CONFIG["PATHS"]["THREATS"])
+    t = CACHE.get("threats", block=False)
     if t:
         intel.append({"type": "SYS", "src": "DEFCON", "msg": f"LEVEL {t.get('defcon', 5)}"})
 
     # B. News
-    try:
-        feed = feedparser.parse("http://feeds.bbci.co.uk/news/technology/rss.xml")
-        for e in feed.entries[:2]:
-            intel.append({"type": "NEWS", "src": "BBC", "msg": e.title[:30]+"..."})
-    except: pass
+    intel.extend(CACHE.get("news", block=False))
 
-    return jsonify(intel)
+    return cached_response(intel, "threats", "news")
 
 @app.route('/api/personal')
 def get_personal():
-    data = []
-    # Gmail
-    try:
-        if "YOUR_EMAIL" not in CONFIG["GMAIL_USER"]:
-            mail = imaplib.IMAP4_SSL("imap.gmail.com")
-            mail.login(CONFIG["GMAIL_USER"], CONFIG["GMAIL_PASS"])
-            mail.select("inbox")
-            _, msgs = mail.search(None, '(UNSEEN)')
-            for e_id in msgs[0].split()[-2:]:
-                _, msg_data = mail.fetch(e_id, "(RFC822)")
-                msg = email.message_from_bytes(msg_data[0][1])
-                subj = decode_header(msg["Subject"])[0][0]
-                if isinstance(subj, bytes): subj = subj.decode()
-                data.append({"type": "EMAIL", "src": "Gmail", "msg": subj[:25]+"..."})
-            mail.logout()
-    except: pass
-    
-    # Pushbullet
-    try:
-        if "o.YOUR_KEY" not in CONFIG["PUSHBULLET"]:
-            pb = Pushbullet(CONFIG["PUSHBULLET"])
-            for push in pb.get_pushes()[:2]:
-                if 'body' in push:
-                    data.append({"type": "SMS", "src": push.get('title','Phone')[:10], "msg": push['body'][:25]+"..."})
-    except: pass
-    
-    return jsonify(data)
+    return cached_response(CACHE.get("personal", block=False), "personal")
 
 @app.route('/api/status')
 def get_status():
     return jsonify({"audit": SYSTEM_HEALTH, "alerts": DYNAMIC_ALERTS})
 
+@app.route('/api/stream')
+def stream():
+    """Server-Sent Events: snapshot, then sentinel / ledger / log deltas as they happen"""
+    return Response(HUB.sse(request.headers.get("Last-Event-ID")), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.route('/execute/<cmd>')
 def execute(cmd):
     if cmd == "audit": run_audit()
@@ -25,12 +25,20 @@ import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.market_data_store import MarketDataStore
+from System.Revenue.streaming_anomaly import StreamingAnomalyEngine
 
 class HydraMonitor:
     def __init__(self):
         self.ledger_db = Path(__file__).parent.parent / "Logs" / "ledger.db"
         self.alert_threshold = 0.30  # 30% drop triggers alert
         self.anomaly_log = Path(__file__).parent.parent / "Logs" / "anomalies.log"
+        self.market = MarketDataStore.shared()
+        self.stream = StreamingAnomalyEngine(self.ledger_db, alert_threshold=self.alert_threshold)
         
         # Baselines (updated over time)
         self.baselines = {
@@ -69,48 +77,25 @@ class HydraMonitor:
         return {"total": total, "sources": sources}
     
     def detect_revenue_anomalies(self):
-        """Detect unusual drops in revenue"""
-        anomalies = []
-        
-        # Get this week vs last week
-        this_week = self.get_revenue_stats(days=7)
-        last_week = self.get_revenue_stats(days=14)["total"] - this_week["total"]
-        
-        # Check for significant drop
-        if last_week > 0:
-            change = (this_week["total"] - last_week) / last_week
-            
-            if change < -self.alert_threshold:
-                anomalies.append({
-                    "type": "REVENUE_DROP",
-                    "severity": "HIGH",
-                    "message": f"Revenue down {abs(change)*100:.1f}% this week",
-                    "details": {
-                        "last_week": last_week,
-                        "this_week": this_week["total"],
-                        "change_percent": change * 100
-                    }
-                })
-        
-        # Check per source
-        for source, amount in this_week["sources"].items():
-            expected = self.baselines.get(f"{source}_weekly_sales", 0)
-            if expected > 0:
-                change = (amount - expected) / expected
-                if change < -self.alert_threshold:
-                    anomalies.append({
-                        "type": "SOURCE_ANOMALY",
-                        "severity": "MEDIUM",
-                        "message": f"{source} revenue down {abs(change)*100:.1f}%",
-                        "details": {
-                            "source": source,
-                            "expected": expected,
-                            "actual": amount
-                        }
-                    })
-        
+        """Detect unusual drops in revenue (incremental: only new ledger rows are read)"""
+        anomalies = self.stream.consume_ledger()
+        anomalies.extend(self.stream.advance_to())
         return anomalies
     
+    def on_ledger_insert(self):
+        """Hook for ledger writers: call after committing a transaction to flag anomalies on insert"""
+        anomalies = self.stream.consume_ledger()
+        for anomaly in anomalies:
+            self.log_anomaly(anomaly)
+        return anomalies
+    
+    def watch(self, poll_interval=1.0):
+        """Follow the ledger and log anomalies as transactions arrive"""
+        print("\n🔍 HYDRA: Streaming anomaly watch active...")
+        for anomaly in self.stream.follow(poll_interval):
+            print(f"   🚨 [{anomaly['severity']}] {anomaly['message']}")
+            self.log_anomaly(anomaly)
+    
     def detect_trading_anomalies(self):
         """Detect unusual trading patterns"""
         anomalies = []
@@ -147,11 +132,18 @@ class HydraMonitor:
         # Check for large single trades (>$1000 = manual review needed)
         for action, amount, asset in trades:
             if abs(amount) > 1000:
+                # Market context from the shared store (never triggers a fetch)
+                quote = self.market.latest(asset) if asset else None
                 anomalies.append({
                     "type": "LARGE_TRADE",
                     "severity": "MEDIUM",
                     "message": f"Large {action} detected: ${abs(amount):.2f} in {asset}",
-                    "details": {"action": action, "amount": amount, "asset": asset}
+                    "details": {
+                        "action": action,
+                        "amount": amount,
+                        "asset": asset,
+                        "market_price": quote["price"] if quote else None
+                    }
                 })
         
         return anomalies
@@ -220,7 +212,7 @@ class HydraMonitor:
         print("\n🔍 HYDRA: Running Revenue Anomaly Scan...")
         
         all_anomalies = []
-        all anomalies.extend(self.detect_revenue_anomalies())
+        all_anomalies.extend(self.detect_revenue_anomalies())
         all_anomalies.extend(self.detect_trading_anomalies())
         all_anomalies.extend(self.detect_api_failures())
         
@@ -247,16 +239,17 @@ class HydraMonitor:
         return all_anomalies
     
     def update_baselines(self):
-        """Recalculate baseline metrics"""
-        # Get 30-day average for each metric
-        stats = self.get_revenue_stats(days=30)
+        """Refresh baseline metrics from the persisted streaming state"""
+        self.stream.consume_ledger()
         
-        for source, amount in stats["sources"].items():
-            weekly_avg = amount / 4.3  # ~4.3 weeks per month
-            self.baselines[f"{source}_weekly_sales"] = weekly_avg
+        for source, weekly in self.stream.weekly_baselines().items():
+            self.baselines[f"{source}_weekly_sales"] = weekly
         
         print(f"✓ Baselines updated: {len(self.baselines)} metrics")
 
 if __name__ == "__main__":
     monitor = HydraMonitor()
-    monitor.run_scan()
+    if "--watch" in sys.argv:
+        monitor.watch()
+    else:
+        monitor.run_scan()
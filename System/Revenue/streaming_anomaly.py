@@ -0,0 +1,254 @@
+"""
+MONOLITH STREAMING ANOMALY ENGINE
+Incremental revenue anomaly detection for HydraMonitor
+
+Consumes ledger inserts as events (tailing transactions by id, never
+re-aggregating history) and keeps per-source statistics that survive restarts:
+- EWMA / EWMV of individual sale amounts (outlier detection)
+- Seasonal day-of-week baselines of daily totals (quiet-day detection)
+- 14-day ring of daily totals (week-over-week drop, O(1) per event)
+
+Every check is O(1) per event, so an anomaly is flagged the moment the
+transaction that causes it is consumed instead of on the next full scan.
+"""
+
+import json
+import math
+import time
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+TOTAL_KEY = "__total__"
+RING_DAYS = 14
+
+
+class SourceState:
+    """Running statistics for one revenue source"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.ewma = data.get("ewma", 0.0)
+        self.ewmv = data.get("ewmv", 0.0)
+        self.count = data.get("count", 0)
+        self.day = data.get("day")                      # date ordinal of the open day
+        self.day_total = data.get("day_total", 0.0)
+        self.seasonal = data.get("seasonal", [0.0] * 7)  # EWMA of daily totals per weekday
+        self.seasonal_n = data.get("seasonal_n", [0] * 7)
+        self.ring = {int(k): v for k, v in data.get("ring", {}).items()}  # ordinal -> closed daily total
+
+    def to_dict(self):
+        return {
+            "ewma": self.ewma,
+            "ewmv": self.ewmv,
+            "count": self.count,
+            "day": self.day,
+            "day_total": self.day_total,
+            "seasonal": self.seasonal,
+            "seasonal_n": self.seasonal_n,
+            "ring": self.ring,
+        }
+
+    def weekly_baseline(self) -> float:
+        """Expected weekly revenue from the seasonal profile"""
+        return sum(self.seasonal)
+
+
+class StreamingAnomalyEngine:
+    def __init__(self, ledger_db: Optional[Path] = None, state_file: Optional[Path] = None,
+                 alert_threshold=0.30, alpha=0.1, seasonal_alpha=0.2, z_threshold=4.0, min_samples=10):
+        logs = Path(__file__).parent.parent / "Logs"
+        self.ledger_db = Path(ledger_db) if ledger_db else logs / "ledger.db"
+        self.state_file = Path(state_file) if state_file else logs / "anomaly_baselines.json"
+        self.alert_threshold = alert_threshold
+        self.alpha = alpha
+        self.seasonal_alpha = seasonal_alpha
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+
+        self.last_id = 0
+        self.skipped = 0  # Malformed ledger rows ignored by observe()
+        self.sources: Dict[str, SourceState] = {}
+        self.load_state()
+
+    # --- Persistence ---
+    def load_state(self):
+        if not self.state_file.exists():
+            return
+        try:
+            data = json.loads(self.state_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        self.last_id = data.get("last_id", 0)
+        self.sources = {k: SourceState(v) for k, v in data.get("sources", {}).items()}
+
+    def save_state(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "last_id": self.last_id,
+            "updated": datetime.now().isoformat(),
+            "sources": {k: v.to_dict() for k, v in self.sources.items()},
+        }))
+        tmp.replace(self.state_file)
+
+    # --- Day rollover ---
+    def _close_day(self, source: str, state: SourceState, anomalies: List[Dict]):
+        weekday = datetime.fromordinal(state.day).weekday()
+        expected = state.seasonal[weekday]
+        total = state.day_total
+
+        if state.seasonal_n[weekday] >= 2 and expected > 0 and source != TOTAL_KEY:
+            change = (total - expected) / expected
+            if change < -self.alert_threshold:
+                anomalies.append({
+                    "type": "SOURCE_ANOMALY",
+                    "severity": "MEDIUM",
+                    "message": f"{source} revenue down {abs(change)*100:.1f}% vs usual {datetime.fromordinal(state.day):%A}",
+                    "details": {"source": source, "expected": expected, "actual": total}
+                })
+
+        if state.seasonal_n[weekday] == 0:
+            state.seasonal[weekday] = total
+        else:
+            state.seasonal[weekday] += self.seasonal_alpha * (total - state.seasonal[weekday])
+        state.seasonal_n[weekday] += 1
+
+        state.ring[state.day] = total
+        for old in [d for d in state.ring if d <= state.day - RING_DAYS]:
+            del state.ring[old]
+
+        if source == TOTAL_KEY:
+            self._check_week_over_week(state, anomalies)
+
+    def _check_week_over_week(self, state: SourceState, anomalies: List[Dict]):
+        d = state.day
+        this_week = sum(state.ring.get(d - i, 0.0) for i in range(7))
+        last_week = sum(state.ring.get(d - i, 0.0) for i in range(7, RING_DAYS))
+        if last_week > 0 and min(state.ring) <= d - RING_DAYS + 1:
+            change = (this_week - last_week) / last_week
+            if change < -self.alert_threshold:
+                anomalies.append({
+                    "type": "REVENUE_DROP",
+                    "severity": "HIGH",
+                    "message": f"Revenue down {abs(change)*100:.1f}% this week",
+                    "details": {
+                        "last_week": last_week,
+                        "this_week": this_week,
+                        "change_percent": change * 100
+                    }
+                })
+
+    def _roll(self, source: str, state: SourceState, day: int, anomalies: List[Dict]):
+        if state.day is None:
+            state.day = day
+            return
+        # Close at most two weeks of silent days; anything older falls off the ring anyway
+        while state.day < day:
+            self._close_day(source, state, anomalies)
+            state.day = max(state.day + 1, day - RING_DAYS)
+            state.day_total = 0.0
+
+    # --- Event ingestion ---
+    def observe(self, event: Dict[str, Any]) -> List[Dict]:
+        """
+        Consumes one ledger insert. Returns anomalies raised by this event.
+        event: {source, type, amount, timestamp[, id]}
+        """
+        anomalies: List[Dict] = []
+        if event.get("id"):
+            self.last_id = max(self.last_id, int(event["id"]))
+        if event.get("type") != "REVENUE":
+            return anomalies
+
+        try:
+            ts = event.get("timestamp") or datetime.now().isoformat()
+            day = datetime.fromisoformat(ts).toordinal()
+            amount = float(event.get("amount", 0.0))
+        except (ValueError, TypeError):
+            amount = math.nan
+        if not math.isfinite(amount):
+            self.skipped += 1  # Malformed row: skip it (last_id already moved past it)
+            return anomalies
+        source = event.get("source") or "UNKNOWN"
+
+        for key in (source, TOTAL_KEY):
+            state = self.sources.setdefault(key, SourceState())
+            self._roll(key, state, day, anomalies)
+            if day < state.day:
+                continue  # Late event for a closed day; too old to re-open
+
+            if key != TOTAL_KEY:
+                if state.count >= self.min_samples and state.ewmv > 0:
+                    z = (amount - state.ewma) / math.sqrt(state.ewmv)
+                    if abs(z) > self.z_threshold:
+                        anomalies.append({
+                            "type": "AMOUNT_OUTLIER",
+                            "severity": "MEDIUM",
+                            "message": f"{source} sale of ${amount:.2f} is {z:+.1f}σ from normal",
+                            "details": {"source": source, "amount": amount, "ewma": state.ewma, "z": z}
+                        })
+                diff = amount - state.ewma
+                incr = self.alpha * diff
+                state.ewma = amount if state.count == 0 else state.ewma + incr
+                state.ewmv = 0.0 if state.count == 0 else (1 - self.alpha) * (state.ewmv + diff * incr)
+                state.count += 1
+
+            state.day_total += amount
+        return anomalies
+
+    def advance_to(self, now: Optional[datetime] = None) -> List[Dict]:
+        """Closes days for sources that went silent (a source with no inserts never rolls over)"""
+        day = (now or datetime.now()).toordinal()
+        anomalies: List[Dict] = []
+        rolled = False
+        for key, state in self.sources.items():
+            if state.day is not None and state.day < day:
+                self._roll(key, state, day, anomalies)
+                rolled = True
+        if rolled:
+            self.save_state()  # Otherwise the next process closes the same days and re-raises
+        return anomalies
+
+    def consume_ledger(self, batch_size=5000) -> List[Dict]:
+        """Reads only transactions inserted since the last call (primary-key range scan)"""
+        anomalies: List[Dict] = []
+        if not self.ledger_db.exists():
+            return anomalies
+
+        conn = sqlite3.connect(self.ledger_db)
+        try:
+            self._consume_rows(conn.cursor(), batch_size, anomalies)
+        finally:
+            conn.close()
+            self.save_state()
+        return anomalies
+
+    def _consume_rows(self, cursor, batch_size: int, anomalies: List[Dict]):
+        while True:
+            cursor.execute("""
+                SELECT id, source, type, amount, timestamp
+                FROM transactions
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
+            """, (self.last_id, batch_size))
+            rows = cursor.fetchall()
+            for row_id, source, tx_type, amount, timestamp in rows:
+                anomalies.extend(self.observe({
+                    "id": row_id, "source": source, "type": tx_type,
+                    "amount": amount, "timestamp": timestamp
+                }))
+            if len(rows) < batch_size:
+                break
+
+    def follow(self, poll_interval=1.0, stop=None):
+        """Generator yielding anomalies as soon as their transaction lands in the ledger"""
+        while not (stop and stop.is_set()):
+            for anomaly in self.consume_ledger():
+                yield anomaly
+            time.sleep(poll_interval)
+
+    def weekly_baselines(self) -> Dict[str, float]:
+        return {k: v.weekly_baseline() for k, v in self.sources.items() if k != TOTAL_KEY}
@@ -0,0 +1,259 @@
+"""
+MONOLITH BULK VAULT
+Parallel, incremental encryption of whole directory trees
+
+- One key encapsulation per batch of files (PQCVault.new_batch); each file's
+  AES-256-GCM key is derived from the batch key and the file's random id
+- Files are encrypted / decrypted across a process pool
+- A stat index (size, mtime_ns, inode -> fingerprint) skips unchanged files
+  without reading them; files whose stat changed but whose content did not
+  (touched, copied back) are re-indexed without being re-encrypted
+- Fingerprints are HMAC-SHA256 keyed from the vault key: the index sits
+  beside the ciphertext and must not reveal plaintext hashes
+- Sources deleted since the last run have their ciphertext removed
+
+Layout: <dest>/<relative path>.enc, index at <dest>/.bulk_index.hmac.json
+"""
+
+import os
+import sys
+import hmac
+import mmap
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.manifest_engine import StatCache, BUFFER_SIZE, MMAP_THRESHOLD
+from System.Security.pqc_vault import (
+    PQCVault, VaultFormatError, encrypt_file_with_batch_key, decrypt_file_with_batch_key, read_batch_id,
+)
+
+BATCH_FILES = 1000
+INDEX_FILE = ".bulk_index.hmac.json"
+LEGACY_INDEX_FILE = ".bulk_index.json"  # Held plain SHA-256 of every source file
+
+
+def fingerprint_file(path, key: bytes) -> str:
+    """HMAC-SHA256 of a file's content (same read strategy as manifest_engine.hash_file)"""
+    mac = hmac.new(key, digestmod=hashlib.sha256)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                mac.update(m)
+        else:
+            for block in iter(lambda: f.read(BUFFER_SIZE), b""):
+                mac.update(block)
+    return mac.hexdigest()
+
+
+def _fingerprint_job(job: Tuple[str, bytes]) -> str:
+    src, index_key = job
+    return fingerprint_file(src, index_key)
+
+
+def _encrypt_job(job: Tuple[str, str, bytes, bytes, bytes]) -> Tuple[str, str, bool]:
+    """(src, dst, batch_id, batch_key, index_key) -> (src, fingerprint, True)"""
+    src, dst, batch_id, batch_key, index_key = job
+    fingerprint = fingerprint_file(src, index_key)
+    encrypt_file_with_batch_key(src, dst, batch_id, batch_key)
+    return src, fingerprint, True
+
+
+def _batch_id(path) -> bytes:
+    """Batch id of an existing .enc file (b"" if missing, per-file KEM or unreadable)"""
+    try:
+        return read_batch_id(path)
+    except (OSError, VaultFormatError):
+        return b""
+
+
+def _decrypt_job(job: Tuple[str, str, bytes]) -> str:
+    src, dst, batch_key = job
+    decrypt_file_with_batch_key(src, dst, batch_key)
+    return dst
+
+
+class BulkVault:
+    def __init__(self, vault: Optional[PQCVault] = None, workers: Optional[int] = None, batch_files=BATCH_FILES):
+        self.vault = vault or PQCVault()
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_files = batch_files
+        self.last_stats: Dict[str, Any] = {}
+
+    def _map(self, fn, jobs: List) -> List:
+        if self.workers <= 1 or len(jobs) < 2:
+            return [fn(job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(fn, jobs, chunksize=max(1, len(jobs) // (self.workers * 8))))
+
+    def encrypt_files(self, pairs: List[Tuple[Path, Path]], previous: Optional[Dict[str, str]] = None) -> List[Tuple[str, str, bool]]:
+        """
+        Encrypts (src, dst) pairs, one encapsulation per batch_files encrypted files.
+        previous: {src: fingerprint}; a source whose content still matches is not re-encrypted.
+        Those are fingerprinted first, so batches are only opened for files that get encrypted.
+        Returns (src, fingerprint, encrypted?) in pair order.
+        """
+        previous = previous or {}
+        index_key = self.vault.index_key()
+        results: Dict[str, Tuple[str, str, bool]] = {}
+
+        candidates = [(str(src), str(dst)) for src, dst in pairs if str(src) in previous and os.path.exists(dst)]
+        fingerprints = self._map(_fingerprint_job, [(src, index_key) for src, _ in candidates])
+        for (src, _), fingerprint in zip(candidates, fingerprints):
+            if fingerprint == previous[src]:
+                results[src] = (src, fingerprint, False)
+
+        changed = [(str(src), str(dst)) for src, dst in pairs if str(src) not in results]
+        jobs = []
+        for start in range(0, len(changed), self.batch_files):
+            batch_id, batch_key = self.vault.new_batch()
+            for src, dst in changed[start:start + self.batch_files]:
+                jobs.append((src, dst, batch_id, batch_key, index_key))
+        for result in self._map(_encrypt_job, jobs):
+            results[result[0]] = result
+        return [results[str(src)] for src, _ in pairs]
+
+    def decrypt_files(self, pairs: List[Tuple[Path, Path]]) -> List[str]:
+        """Decrypts batch-mode (src, dst) pairs; each batch key is decapsulated once, in this process"""
+        jobs = [(str(src), str(dst), self.vault.batch_key(read_batch_id(src))) for src, dst in pairs]
+        return self._map(_decrypt_job, jobs)
+
+    def encrypt_tree(self, source: Path, dest: Path) -> Dict[str, Any]:
+        """Incrementally mirrors source into dest as encrypted .enc files"""
+        source, dest = Path(source), Path(dest)
+        start = time.perf_counter()
+        index = StatCache(dest / INDEX_FILE)
+        (dest / LEGACY_INDEX_FILE).unlink(missing_ok=True)
+
+        pending, previous, live = [], {}, []
+        unchanged = 0
+        for root, _, names in os.walk(source):
+            for name in names:
+                src = os.path.join(root, name)
+                st = os.stat(src)
+                live.append(src)
+                dst = dest / (os.path.relpath(src, source) + ".enc")
+                if index.lookup(src, st) and dst.exists():
+                    unchanged += 1
+                    continue
+                entry = index.entries.get(src)
+                if entry:
+                    previous[src] = entry[3]
+                pending.append((src, dst, st))
+
+        # Batches of ciphertext about to be replaced or deleted may become unreferenced
+        old_batches = {src: _batch_id(dst) for src, dst, _ in pending if src in previous}
+        released = set()
+
+        results = self.encrypt_files([(src, dst) for src, dst, _ in pending], previous)
+        encrypted = 0
+        for (src, fingerprint, did_encrypt), (_, _, st) in zip(results, pending):
+            index.store(src, st, fingerprint)
+            encrypted += did_encrypt
+            if did_encrypt and old_batches.get(src):
+                released.add(old_batches[src])
+
+        # Sources removed since the last run
+        removed = 0
+        live_set = set(live)
+        for src in [p for p in index.entries if p not in live_set]:
+            dst = dest / (os.path.relpath(src, source) + ".enc")
+            released.add(_batch_id(dst))
+            dst.unlink(missing_ok=True)
+            removed += 1
+        index.prune(live_set)
+        index.save()
+
+        released.discard(b"")
+        if released:
+            for path in dest.rglob("*.enc"):
+                released.discard(_batch_id(path))
+            self.vault.drop_batches(released)
+
+        self.last_stats = {
+            "files": len(live),
+            "unchanged": unchanged,
+            "rehashed_only": len(pending) - encrypted,
+            "encrypted": encrypted,
+            "removed": removed,
+            "batches": -(-encrypted // self.batch_files),
+            "batches_dropped": len(released),
+            "seconds": time.perf_counter() - start,
+        }
+        return self.last_stats
+
+    def decrypt_tree(self, dest: Path, output: Path) -> Dict[str, Any]:
+        """Restores every .enc file under dest into output"""
+        dest, output = Path(dest), Path(output)
+        start = time.perf_counter()
+        pairs = [(p, output / p.relative_to(dest).with_suffix("")) for p in sorted(dest.rglob("*.enc"))]
+        self.decrypt_files(pairs)
+        self.last_stats = {"files": len(pairs), "seconds": time.perf_counter() - start}
+        return self.last_stats
+
+
+def benchmark(files=10_000, churn=0.01):
+    """Files per second: per-file v1 encryption vs bulk (cold, incremental, no change)"""
+    import random
+    import shutil
+    import tempfile
+
+    rng = random.Random(11)
+    tmp = Path(tempfile.mkdtemp(prefix="bulk_vault_"))
+    source = tmp / "source"
+    for i in range(files):
+        p = source / f"d{i % 50:02d}" / f"note_{i:05d}.md"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(os.urandom(int(rng.paretovariate(1.5) * 1024)))
+    paths = sorted(source.rglob("*.md"))
+    total = sum(p.stat().st_size for p in paths)
+
+    vault = PQCVault(tmp / "keys")
+    print(f"\n{files:,} files, {total / 1024 ** 2:.1f} MB, {os.cpu_count()} CPU(s), "
+          f"KEM: {'Kyber-1024' if vault.use_pqc else 'none (pqcrypto not installed)'}")
+
+    rows = []
+    start = time.perf_counter()
+    for p in paths:
+        vault.encrypt_file_v1(p, tmp / "v1.enc")
+    rows.append(("per-file v1 (one KEM per file)", time.perf_counter() - start, files, files))
+
+    start = time.perf_counter()
+    for p in paths:
+        vault.encrypt_file(p, tmp / "v2.enc")
+    rows.append(("per-file v2 (one KEM per file)", time.perf_counter() - start, files, files))
+
+    bulk = BulkVault(vault)
+    stats = bulk.encrypt_tree(source, tmp / "dest")
+    rows.append(("bulk, cold", stats["seconds"], stats["encrypted"], stats["batches"]))
+
+    for p in rng.sample(paths, int(files * churn)):
+        p.write_bytes(os.urandom(p.stat().st_size))
+    for p in rng.sample(paths, int(files * churn)):
+        os.utime(p)  # Touched, content unchanged
+    stats = bulk.encrypt_tree(source, tmp / "dest")
+    rows.append((f"bulk, {churn:.0%} changed + {churn:.0%} touched", stats["seconds"], stats["encrypted"], stats["batches"]))
+
+    stats = BulkVault(vault).encrypt_tree(source, tmp / "dest")
+    rows.append(("bulk, no change", stats["seconds"], stats["encrypted"], stats["batches"]))
+
+    stats = bulk.decrypt_tree(tmp / "dest", tmp / "restore")
+    rows.append(("bulk decrypt, all", stats["seconds"], stats["files"], 0))
+    assert all((tmp / "restore" / p.relative_to(tmp / "source")).read_bytes() == p.read_bytes()
+               for p in rng.sample(paths, 200))
+
+    print(f"{'':<34} {'Seconds':>8} {'Files/s':>9} {'Written':>8} {'KEMs':>6}")
+    for label, secs, written, kems in rows:
+        print(f"{label:<34} {secs:>8.2f} {files / secs:>9,.0f} {written:>8,} {kems:>6,}")
+    if not vault.use_pqc:
+        print("KEMs = encapsulations Kyber mode performs; without pqcrypto their cost is not in these timings")
+    shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,59 @@
+"""
+MONOLITH FLEET MANIFEST
+Merkle tree over agent files, for signing a whole fleet with one signature
+
+- Leaves: SHA256(0x00 | name | 0x00 | file sha256), sorted by name
+- Nodes:  SHA256(0x01 | left | right); an odd node is promoted unchanged
+  (domain separation keeps a leaf from ever passing as a node)
+- One file is verified with its inclusion proof: log2(n) sibling hashes
+  up to the signed root
+"""
+
+import hashlib
+from typing import Dict, List, Tuple
+
+EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+
+def leaf_hash(name: str, sha256_hex: str) -> bytes:
+    return hashlib.sha256(b"\x00" + name.encode("utf-8") + b"\x00" + bytes.fromhex(sha256_hex)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class MerkleTree:
+    def __init__(self, leaves: Dict[str, str]):
+        """leaves: {name: file sha256 hex}"""
+        self.names = sorted(leaves)
+        self.position = {name: i for i, name in enumerate(self.names)}
+        level = [leaf_hash(name, leaves[name]) for name in self.names]
+        self.levels: List[List[bytes]] = [level]
+        while len(level) > 1:
+            level = [node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+            self.levels.append(level)
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0] if self.levels[0] else EMPTY_ROOT
+
+    def proof(self, name: str) -> List[Tuple[str, str]]:
+        """[(sibling hash hex, "L" if the sibling is on the left else "R")], leaf to root"""
+        index = self.position[name]
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append((level[sibling].hex(), "L" if sibling < index else "R"))
+            index //= 2
+        return path
+
+    @staticmethod
+    def verify_proof(name: str, sha256_hex: str, proof: List[Tuple[str, str]], root: bytes) -> bool:
+        node = leaf_hash(name, sha256_hex)
+        for sibling_hex, side in proof:
+            sibling = bytes.fromhex(sibling_hex)
+            node = node_hash(sibling, node) if side == "L" else node_hash(node, sibling)
+        return node == root
@@ -4,11 +4,45 @@ NIST-standardized post-quantum digital signatures for agent verification
 
 Purpose: Sign all agent code to prevent tampering
 Standard: FIPS 204 (ML-DSA / Dilithium3)
+
+Fleet signing: sign_fleet() builds a Merkle tree over every agent file and
+signs only the root (Dilithium3, or Ed25519 when pqcrypto is missing).
+Startup verification is one signature check plus a hash per file; a single
+agent is verified with its inclusion proof; re-signing rehashes only files
+whose size / mtime changed.
+
+Trust: the root is verified only against the public key pinned outside the
+signatures directory (MONOLITH_FLEET_PUBKEY as hex, else System/Config/
+fleet_<algorithm>.pub). Verification never creates keys; with no pinned key
+it fails closed.
 """
 
+import os
+import sys
+import json
+import time
 import hashlib
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from System.Core.manifest_engine import hash_file
+from System.Security.fleet_manifest import MerkleTree
+
+try:
+    from pqcrypto.sign.dilithium3 import generate_keypair as dilithium_keypair, sign as dilithium_sign, verify as dilithium_verify
+    DILITHIUM_AVAILABLE = True
+except ImportError:
+    DILITHIUM_AVAILABLE = False
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+
+FLEET_MANIFEST = "fleet_manifest.json"
+FLEET_PUBKEY_ENV = "MONOLITH_FLEET_PUBKEY"
+TRUST_DIR = Path(__file__).parent.parent / "Config"
 
 class MLDSASigner:
     """
@@ -18,13 +52,22 @@ class MLDSASigner:
     For production, install: pip install pqcrypto
     """
     
-    def __init__(self):
-        self.signatures_dir = Path(__file__).parent.parent / "Logs" / "signatures"
+    def __init__(self, signatures_dir=None, agents_dir=None, trusted_key_file=None):
+        self.signatures_dir = Path(signatures_dir) if signatures_dir else Path(__file__).parent.parent / "Logs" / "signatures"
         self.signatures_dir.mkdir(parents=True, exist_ok=True)
+        self.agents_dir = Path(agents_dir) if agents_dir else Path(__file__).parent.parent / "Agents"
         
         # In production, load/generate Dilithium keypair
         # For now, use SHA-256 hash verification
         self.use_pq_crypto = False  # Set to True when pqcrypto installed
+
+        # Fleet root signing key (Dilithium3 when available, Ed25519 otherwise)
+        self.fleet_algorithm = "Dilithium3" if DILITHIUM_AVAILABLE else "Ed25519"
+        self.trusted_key_file = (Path(trusted_key_file) if trusted_key_file
+                                 else TRUST_DIR / f"fleet_{self.fleet_algorithm.lower()}.pub")
+        self._fleet_keys: Optional[Tuple[bytes, bytes]] = None
+        self._trusted_key: Optional[bytes] = None
+        self._fleet_cache: Optional[Tuple[float, Dict[str, Any], MerkleTree, bool]] = None
     
     def sign_agent(self, agent_path):
         """
@@ -66,11 +109,22 @@ class MLDSASigner:
     
     def verify_agent(self, agent_path):
         """
-        Verify agent code signature
+        Verify agent code signature (inclusion proof against the signed fleet
+        root when the agent is in the fleet manifest, its .sig file otherwise)
         
         Returns: True if signature valid, False otherwise
         """
         agent_path = Path(agent_path)
+        fleet = self._load_fleet()
+        name = self._fleet_name(agent_path)
+        if fleet and name in fleet[0]["leaves"]:
+            manifest, tree, root_ok = fleet
+            valid = False
+            if root_ok and agent_path.exists():
+                valid = MerkleTree.verify_proof(name, hash_file(agent_path), tree.proof(name), tree.root)
+            self._report(agent_path, valid)
+            return valid
+
         sig_file = self.signatures_dir / f"{agent_path.stem}.sig"
         
         if not sig_file.exists():
@@ -93,13 +147,209 @@ class MLDSASigner:
             current_hash = hashlib.sha256(current_code.encode('utf-8')).hexdigest()
             valid = current_hash == stored_sig
         
+        self._report(agent_path, valid)
+        return valid
+
+    def _report(self, agent_path, valid):
         if valid:
             print(f"✓ Signature valid: {agent_path.name}")
         else:
             print(f"✗ SIGNATURE INVALID: {agent_path.name}")
             print(f"  WARNING: Agent code may have been tampered with!")
-        
-        return valid
+
+    # --- Fleet (Merkle root) signing ---
+    def _fleet_key_pair(self) -> Tuple[bytes, bytes]:
+        """
+        (public, private) signing keys, generated on first use. Signing path
+        only: the first key pair is pinned as the trusted key, and a key pair
+        that does not match the pinned key is refused.
+        """
+        if self._fleet_keys:
+            return self._fleet_keys
+        pub_file = self.signatures_dir / f"fleet_{self.fleet_algorithm.lower()}.pub"
+        key_file = self.signatures_dir / f"fleet_{self.fleet_algorithm.lower()}.key"
+        if pub_file.exists() and key_file.exists():
+            public, private = pub_file.read_bytes(), key_file.read_bytes()
+        else:
+            if DILITHIUM_AVAILABLE:
+                public, private = dilithium_keypair()
+            else:
+                key = Ed25519PrivateKey.generate()
+                private = key.private_bytes_raw()
+                public = key.public_key().public_bytes_raw()
+            pub_file.write_bytes(public)
+            key_file.write_bytes(private)
+            os.chmod(key_file, 0o600)
+
+        pinned = self._trusted_public_key()
+        if pinned is None:
+            self.trusted_key_file.parent.mkdir(parents=True, exist_ok=True)
+            self.trusted_key_file.write_bytes(public)
+            self._trusted_key = public
+        elif pinned != public:
+            raise RuntimeError(f"Fleet signing key does not match the pinned key ({self.trusted_key_file})")
+        self._fleet_keys = (public, private)
+        return self._fleet_keys
+
+    def _trusted_public_key(self) -> Optional[bytes]:
+        """Pinned verification key (env var, then config file); None if not pinned"""
+        if self._trusted_key:
+            return self._trusted_key
+        pinned = os.getenv(FLEET_PUBKEY_ENV, "").strip()
+        try:
+            key = bytes.fromhex(pinned) if pinned else self.trusted_key_file.read_bytes()
+        except (ValueError, OSError):
+            return None
+        self._trusted_key = key or None
+        return self._trusted_key
+
+    def _sign_root(self, message: bytes) -> bytes:
+        _, private = self._fleet_key_pair()
+        if DILITHIUM_AVAILABLE:
+            return dilithium_sign(private, message)
+        return Ed25519PrivateKey.from_private_bytes(private).sign(message)
+
+    def _verify_root(self, message: bytes, signature: bytes) -> bool:
+        public = self._trusted_public_key()
+        if public is None:
+            return False
+        try:
+            if DILITHIUM_AVAILABLE:
+                return bool(dilithium_verify(public, message, signature))
+            Ed25519PublicKey.from_public_bytes(public).verify(signature, message)
+            return True
+        except (InvalidSignature, ValueError):
+            return False
+
+    @staticmethod
+    def _root_message(root: bytes, count: int) -> bytes:
+        return b"MONOLITH-FLEET-v1:" + root.hex().encode() + b":" + str(count).encode()
+
+    def _fleet_name(self, agent_path: Path) -> str:
+        try:
+            return Path(os.path.abspath(agent_path)).relative_to(os.path.abspath(self.agents_dir)).as_posix()
+        except ValueError:
+            return agent_path.name
+
+    def _agent_files(self) -> List[Path]:
+        return sorted(p for p in self.agents_dir.rglob("*.py") if "__pycache__" not in p.parts)
+
+    def _load_fleet(self) -> Optional[Tuple[Dict[str, Any], MerkleTree, bool]]:
+        """(manifest, tree, root signature valid), re-read only when the manifest file changes"""
+        manifest_file = self.signatures_dir / FLEET_MANIFEST
+        try:
+            mtime = manifest_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        if self._fleet_cache and self._fleet_cache[0] == mtime:
+            return self._fleet_cache[1:]
+        manifest = json.loads(manifest_file.read_text())
+        tree = MerkleTree({name: leaf[2] for name, leaf in manifest["leaves"].items()})
+        root_ok = (manifest.get("algorithm") == self.fleet_algorithm
+                   and tree.root.hex() == manifest["root"]
+                   and self._verify_root(self._root_message(tree.root, len(tree.names)),
+                                         bytes.fromhex(manifest["signature"])))
+        self._fleet_cache = (mtime, manifest, tree, root_ok)
+        return manifest, tree, root_ok
+
+    def sign_fleet(self, files: Optional[List[Path]] = None) -> Dict[str, Any]:
+        """
+        Signs the Merkle root over all agent files (one signature per fleet).
+        Files whose size and mtime match the previous manifest are not re-read.
+        """
+        start = time.perf_counter()
+        files = self._agent_files() if files is None else [Path(f) for f in files]
+        fleet = self._load_fleet()
+        previous = fleet[0]["leaves"] if fleet and fleet[2] else {}
+
+        leaves, rehashed = {}, 0
+        for path in files:
+            name = self._fleet_name(path)
+            st = path.stat()
+            old = previous.get(name)
+            if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+                leaves[name] = old
+            else:
+                leaves[name] = [st.st_size, st.st_mtime_ns, hash_file(path)]
+                rehashed += 1
+
+        tree = MerkleTree({name: leaf[2] for name, leaf in leaves.items()})
+        signature = self._sign_root(self._root_message(tree.root, len(tree.names)))
+        manifest = {
+            "algorithm": self.fleet_algorithm,
+            "signed": datetime.now().isoformat(),
+            "root": tree.root.hex(),
+            "signature": signature.hex(),
+            "leaves": leaves,
+        }
+        manifest_file = self.signatures_dir / FLEET_MANIFEST
+        tmp = manifest_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, separators=(",", ":")))
+        os.replace(tmp, manifest_file)
+
+        return {"files": len(leaves), "rehashed": rehashed, "root": manifest["root"],
+                "seconds": time.perf_counter() - start}
+
+    def verify_fleet(self, files: Optional[List[Path]] = None, deep=True) -> Dict[str, Any]:
+        """
+        Startup check: one root signature verification, then every agent file
+        against its leaf. deep=False trusts unchanged size / mtime instead of rehashing.
+        """
+        start = time.perf_counter()
+        fleet = self._load_fleet()
+        if not fleet:
+            return {"verified": False, "error": "no fleet manifest", "seconds": time.perf_counter() - start}
+        manifest, _, root_ok = fleet
+        leaves = manifest["leaves"]
+
+        files = self._agent_files() if files is None else [Path(f) for f in files]
+        tampered, added = [], []
+        seen = set()
+        for path in files:
+            name = self._fleet_name(path)
+            seen.add(name)
+            leaf = leaves.get(name)
+            if leaf is None:
+                added.append(name)
+                continue
+            if not deep:
+                st = path.stat()
+                if leaf[0] == st.st_size and leaf[1] == st.st_mtime_ns:
+                    continue
+            if hash_file(path) != leaf[2]:
+                tampered.append(name)
+        missing = sorted(set(leaves) - seen)
+
+        return {
+            "verified": root_ok and not (tampered or added or missing),
+            "root_signature": root_ok,
+            "files": len(files),
+            "tampered": tampered,
+            "added": added,
+            "missing": missing,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def inclusion_proof(self, agent_path) -> Optional[Dict[str, Any]]:
+        """Everything needed to check one agent without the rest of the fleet"""
+        fleet = self._load_fleet()
+        name = self._fleet_name(Path(agent_path))
+        if not fleet or name not in fleet[0]["leaves"]:
+            return None
+        manifest, tree, _ = fleet
+        return {"name": name, "sha256": manifest["leaves"][name][2], "proof": tree.proof(name),
+                "root": manifest["root"], "count": len(tree.names),
+                "signature": manifest["signature"], "algorithm": manifest["algorithm"]}
+
+    def verify_inclusion(self, agent_path, proof: Dict[str, Any]) -> bool:
+        """Checks the file's hash up its proof path and the root's signature"""
+        name = self._fleet_name(Path(agent_path))
+        if proof.get("name") != name:
+            return False  # A proof for another agent must not vouch for this file
+        root = bytes.fromhex(proof["root"])
+        return (proof["algorithm"] == self.fleet_algorithm
+                and MerkleTree.verify_proof(name, hash_file(agent_path), proof["proof"], root)
+                and self._verify_root(self._root_message(root, proof["count"]), bytes.fromhex(proof["signature"])))
     
     def _sign_with_dilithium(self, code):
         """Sign with Dilithium (requires pqcrypto)"""
@@ -115,7 +365,68 @@ class MLDSASigner:
         # return verify(code.encode('utf-8'), signature, self.public_key)
         return True
 
+def benchmark(sizes=(50, 500, 5000)):
+    """Startup verification: per-file signatures vs one signed Merkle root"""
+    import io
+    import shutil
+    import tempfile
+    from contextlib import redirect_stdout
+
+    body = "".join(f"    def step_{i}(self):\n        return {i} * 2  # agent logic\n" for i in range(150))
+    print(f"\nRoot signature: {'Dilithium3' if DILITHIUM_AVAILABLE else 'Ed25519 (pqcrypto not installed)'}")
+    print(f"{'Agents':>7} {'legacy .sig':>12} {'per-file sig':>13} {'fleet deep':>11} {'fleet stat':>11} "
+          f"{'1 agent':>9} {'re-sign 1':>10} {'rehashed':>9}")
+    for n in sizes:
+        tmp = Path(tempfile.mkdtemp(prefix="fleet_sign_"))
+        agents = tmp / "Agents"
+        agents.mkdir()
+        for i in range(n):
+            (agents / f"agent_{i:05d}.py").write_text(f"class Agent{i}:\n{body}")
+        files = sorted(agents.glob("*.py"))
+
+        # Legacy: one .sig file per agent (SHA-256 in development mode)
+        legacy = MLDSASigner(tmp / "legacy", agents)
+        with redirect_stdout(io.StringIO()):
+            for f in files:
+                legacy.sign_agent(f)
+            start = time.perf_counter()
+            assert all(legacy.verify_agent(f) for f in files)
+        legacy_s = time.perf_counter() - start
+
+        # What real per-file signatures cost: one hash + one signature check per agent
+        signer = MLDSASigner(tmp / "fleet", agents, tmp / "fleet.pub")
+        signed = [signer._sign_root(hash_file(f).encode()) for f in files]
+        start = time.perf_counter()
+        assert all(signer._verify_root(hash_file(f).encode(), sig) for f, sig in zip(files, signed))
+        per_file_s = time.perf_counter() - start
+
+        signer.sign_fleet()
+        start = time.perf_counter()
+        assert MLDSASigner(tmp / "fleet", agents, tmp / "fleet.pub").verify_fleet(deep=True)["verified"]
+        deep_s = time.perf_counter() - start
+        start = time.perf_counter()
+        assert MLDSASigner(tmp / "fleet", agents, tmp / "fleet.pub").verify_fleet(deep=False)["verified"]
+        stat_s = time.perf_counter() - start
+
+        proof = signer.inclusion_proof(files[n // 2])
+        start = time.perf_counter()
+        assert MLDSASigner(tmp / "fleet", agents, tmp / "fleet.pub").verify_inclusion(files[n // 2], proof)
+        one_s = time.perf_counter() - start
+
+        files[0].write_text(files[0].read_text() + "# patched\n")
+        stats = MLDSASigner(tmp / "fleet", agents, tmp / "fleet.pub").sign_fleet()
+
+        print(f"{n:>7,} {legacy_s * 1e3:>10.1f}ms {per_file_s * 1e3:>11.1f}ms {deep_s * 1e3:>9.1f}ms "
+              f"{stat_s * 1e3:>9.1f}ms {one_s * 1e3:>7.2f}ms {stats['seconds'] * 1e3:>8.1f}ms {stats['rehashed']:>9,}")
+        shutil.rmtree(tmp)
+    print("1 agent = hash + inclusion proof (log2 n hashes) + one root signature check")
+
+
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+        sys.exit(0)
+
     signer = MLDSASigner()
     
     # Example: Sign all agents
@@ -124,3 +435,5 @@ if __name__ == "__main__":
     if agents_dir.exists():
         for agent_file in agents_dir.glob("*.py"):
             signer.sign_agent(agent_file)
+        fleet = signer.sign_fleet()
+        print(f"✓ Fleet root signed: {fleet['files']} agents, root {fleet['root'][:16]}...")
@@ -11,11 +11,29 @@ Uses NIST-standardized ML-KEM (formerly CRYSTALS-Kyber)
 
 IMPORTANT: Requires 'pqcrypto' library
 Install: python -m pip install pqcrypto
+
+File format (v2, binary, streamed in fixed-size chunks):
+    header  = "MVLT" | version u8 | mode u8 | chunk_size u32 | kem_len u16 | file_id 16B | kem ciphertext
+    chunk i = AES-256-GCM(plaintext[i*chunk_size : (i+1)*chunk_size]) + 16-byte tag
+- Per-file key: HKDF(KEM shared secret, or the classical key, salt=file_id)
+- Batch mode (bulk encryption): the KEM field holds a 16-byte batch id instead;
+  one encapsulation per batch (Brain/Vault/.batches/<id>.kem) yields the batch
+  key, and each file's key is HKDF(batch key, salt=file_id)
+- Per-chunk nonce: the chunk index; AAD = SHA256(header) | index | final flag,
+  so chunks cannot be reordered, moved between files, or truncated away
+- Chunk i sits at a fixed offset, so any chunk decrypts on its own
+Files written by v1 (JSON + hex, or a bare Fernet token) still decrypt.
 """
 
 import os
-from pathlib import Path
+import sys
 import json
+import struct
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Any
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
 
 try:
     # PQC library (Kyber-1024)
@@ -27,10 +45,144 @@ except ImportError:
     print("   Install: python -m pip install pqcrypto")
 
 # Classical encryption (always used, even with PQC)
+import base64
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
+MAGIC = b"MVLT"
+FORMAT_VERSION = 2
+MODE_CLASSICAL, MODE_PQC, MODE_BATCH = 0, 1, 2
+CHUNK_SIZE = 1024 * 1024
+TAG_SIZE = 16
+_HEADER = struct.Struct(">4sBBIH16s")
+
+
+class VaultFormatError(ValueError):
+    """Not a v2 vault file, or its header is damaged"""
+
+
+def _chunk_aad(header_digest: bytes, index: int, final: bool) -> bytes:
+    return header_digest + struct.pack(">QB", index, final)
+
+
+def _nonce(index: int) -> bytes:
+    return index.to_bytes(12, "big")
+
+
+def _derive_key(secret: bytes, salt: bytes, info: bytes) -> bytes:
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        info=info
+    )
+    return hkdf.derive(secret)
+
+
+def _file_key(secret: bytes, file_id: bytes) -> bytes:
+    """Per-file AES-256 key (a fresh file_id per file: counter nonces are never reused)"""
+    return _derive_key(secret, file_id, b"monolith_vault_stream_v2")
+
+
+def _read_full(f: BinaryIO, n: int) -> bytes:
+    """Reads exactly n bytes unless EOF (pipes may return short reads)"""
+    data = f.read(n)
+    while data and len(data) < n:
+        more = f.read(n - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+
+def _parse_header(f: BinaryIO) -> Dict[str, Any]:
+    fixed = f.read(_HEADER.size)
+    if len(fixed) < _HEADER.size:
+        raise VaultFormatError("File too short for a vault header")
+    magic, version, mode, chunk_size, kem_len, file_id = _HEADER.unpack(fixed)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise VaultFormatError(f"Not a v{FORMAT_VERSION} vault file")
+    kem_field = f.read(kem_len)
+    header = fixed + kem_field
+    return {
+        "mode": mode,
+        "chunk_size": chunk_size,
+        "file_id": file_id,
+        "kem_field": kem_field,
+        "header_size": len(header),
+        "digest": hashlib.sha256(header).digest(),
+    }
+
+
+def _encrypt_chunks(src: BinaryIO, dst: BinaryIO, header: bytes, aead: AESGCM, chunk_size: int) -> int:
+    digest = hashlib.sha256(header).digest()
+    dst.write(header)
+    index = 0
+    current = _read_full(src, chunk_size)
+    while True:
+        # Read ahead one chunk so the last one can be flagged as final
+        following = _read_full(src, chunk_size) if len(current) == chunk_size else b""
+        final = not following
+        dst.write(aead.encrypt(_nonce(index), current, _chunk_aad(digest, index, final)))
+        if final:
+            return index + 1
+        current, index = following, index + 1
+
+
+def _decrypt_chunks(src: BinaryIO, dst: BinaryIO, info: Dict[str, Any]) -> int:
+    aead, digest = info["aead"], info["digest"]
+    frame = info["chunk_size"] + TAG_SIZE
+    index = 0
+    current = _read_full(src, frame)
+    if not current:
+        raise VaultFormatError("Vault file has no chunks")
+    while True:
+        following = _read_full(src, frame)
+        final = not following
+        dst.write(aead.decrypt(_nonce(index), current, _chunk_aad(digest, index, final)))
+        if final:
+            return index + 1
+        current, index = following, index + 1
+
+
+def encrypt_file_with_batch_key(src_path, dst_path, batch_id: bytes, batch_key: bytes, chunk_size: int = CHUNK_SIZE):
+    """Batch-mode encryption with an already-derived batch key (no vault or KEM needed: runs in pool workers)"""
+    file_id = os.urandom(16)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, MODE_BATCH, chunk_size, len(batch_id), file_id) + batch_id
+    dst_path = Path(dst_path)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst_path.with_name(dst_path.name + ".tmp")
+    with open(src_path, 'rb') as src, open(tmp, 'wb') as dst:
+        _encrypt_chunks(src, dst, header, AESGCM(_file_key(batch_key, file_id)), chunk_size)
+    os.replace(tmp, dst_path)
+
+
+def decrypt_file_with_batch_key(src_path, dst_path, batch_key: bytes):
+    """Counterpart of encrypt_file_with_batch_key; plaintext is renamed into place only once fully authenticated"""
+    dst_path = Path(dst_path)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst_path.with_name(dst_path.name + ".tmp")
+    try:
+        with open(src_path, 'rb') as src, open(tmp, 'wb') as dst:
+            info = _parse_header(src)
+            if info["mode"] != MODE_BATCH:
+                raise VaultFormatError("Not a batch-mode vault file")
+            info["aead"] = AESGCM(_file_key(batch_key, info["file_id"]))
+            _decrypt_chunks(src, dst, info)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, dst_path)
+
+
+def read_batch_id(path) -> bytes:
+    """Batch id of a batch-mode file (b"" for per-file KEM files)"""
+    with open(path, 'rb') as f:
+        info = _parse_header(f)
+    return info["kem_field"] if info["mode"] == MODE_BATCH else b""
+
 class PQCVault:
     """
     Hybrid Post-Quantum + Classical Encryption
@@ -56,6 +208,8 @@ class PQCVault:
         self.vault_dir.mkdir(parents=True, exist_ok=True)
         
         self.key_file = self.vault_dir / ".pqc_keys"
+        self.batches_dir = self.vault_dir / ".batches"
+        self._batch_keys: Dict[bytes, bytes] = {}
         self.use_pqc = PQC_AVAILABLE
         
         # Load or generate keys
@@ -109,9 +263,188 @@ class PQCVault:
         )
         return hkdf.derive(shared_secret)
     
-    def encrypt_file(self, file_path, output_path=None):
+    # --- v2 streaming format ---
+    def _new_header(self, chunk_size: int):
+        file_id = os.urandom(16)
+        if self.use_pqc:
+            kem_ciphertext, secret = encrypt(self.public_key)
+            mode = MODE_PQC
+        else:
+            kem_ciphertext, secret = b"", base64.urlsafe_b64decode(self.classical_key)
+            mode = MODE_CLASSICAL
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, mode, chunk_size, len(kem_ciphertext), file_id) + kem_ciphertext
+        return header, AESGCM(_file_key(secret, file_id))
+    
+    def _read_header(self, f: BinaryIO) -> Dict[str, Any]:
+        info = _parse_header(f)
+        mode = info["mode"]
+        
+        if mode == MODE_BATCH:
+            secret = self.batch_key(info["kem_field"])
+        elif mode == MODE_PQC:
+            if not self.use_pqc:
+                raise VaultFormatError("File was encrypted with Kyber; install pqcrypto to decrypt")
+            secret = decrypt(self.private_key, info["kem_field"])
+        elif mode == MODE_CLASSICAL and not self.use_pqc:
+            secret = base64.urlsafe_b64decode(self.classical_key)
+        else:
+            raise VaultFormatError("File was encrypted with the classical key, which this vault does not hold")
+        
+        info["aead"] = AESGCM(_file_key(secret, info["file_id"]))
+        return info
+    
+    # --- Batches: one encapsulation shared by many files ---
+    def new_batch(self):
+        """Encapsulates a fresh batch key; returns (batch_id, batch_key)"""
+        batch_id = os.urandom(16)
+        if self.use_pqc:
+            kem_ciphertext, secret = encrypt(self.public_key)
+            record = bytes([MODE_PQC]) + kem_ciphertext
+        else:
+            secret = base64.urlsafe_b64decode(self.classical_key)
+            record = bytes([MODE_CLASSICAL])
+        self.batches_dir.mkdir(exist_ok=True)
+        with open(self.batches_dir / f"{batch_id.hex()}.kem", 'wb') as f:
+            f.write(record)
+        batch_key = _derive_key(secret, batch_id, b"monolith_vault_batch_v2")
+        self._batch_keys[batch_id] = batch_key
+        return batch_id, batch_key
+    
+    def batch_key(self, batch_id: bytes) -> bytes:
+        """Decapsulates a batch key once per process"""
+        if batch_id not in self._batch_keys:
+            path = self.batches_dir / f"{batch_id.hex()}.kem"
+            if not path.exists():
+                raise VaultFormatError(f"Unknown batch {batch_id.hex()}")
+            record = path.read_bytes()
+            if record[0] == MODE_PQC:
+                if not self.use_pqc:
+                    raise VaultFormatError("Batch was encrypted with Kyber; install pqcrypto to decrypt")
+                secret = decrypt(self.private_key, record[1:])
+            else:
+                secret = base64.urlsafe_b64decode(self.classical_key)
+            self._batch_keys[batch_id] = _derive_key(secret, batch_id, b"monolith_vault_batch_v2")
+        return self._batch_keys[batch_id]
+    
+    def drop_batches(self, batch_ids):
+        """Deletes batch key records (only once no ciphertext refers to them)"""
+        for batch_id in batch_ids:
+            (self.batches_dir / f"{batch_id.hex()}.kem").unlink(missing_ok=True)
+            self._batch_keys.pop(batch_id, None)
+    
+    def index_key(self) -> bytes:
+        """Key for content fingerprints stored beside ciphertext, so no plaintext hash is kept in the clear"""
+        secret = self.private_key if self.use_pqc else base64.urlsafe_b64decode(self.classical_key)
+        return _derive_key(secret, b"monolith_vault_index", b"monolith_vault_index_v1")
+    
+    def encrypt_stream(self, src: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+        """Encrypts src into dst holding at most two chunks in memory; returns the chunk count"""
+        header, aead = self._new_header(chunk_size)
+        return _encrypt_chunks(src, dst, header, aead, chunk_size)
+    
+    def decrypt_stream(self, src: BinaryIO, dst: BinaryIO) -> int:
+        """Decrypts and authenticates chunk by chunk; raises InvalidTag on any tampering or truncation"""
+        return _decrypt_chunks(src, dst, self._read_header(src))
+    
+    def _layout(self, f: BinaryIO) -> Dict[str, Any]:
+        """Header plus frame size and chunk count (seekable files only)"""
+        info = self._read_header(f)
+        info["frame"] = info["chunk_size"] + TAG_SIZE
+        body = os.fstat(f.fileno()).st_size - info["header_size"]
+        info["count"] = max(1, -(-body // info["frame"]))
+        return info
+    
+    def _decrypt_at(self, f: BinaryIO, info: Dict[str, Any], index: int) -> bytes:
+        f.seek(info["header_size"] + index * info["frame"])
+        final = index == info["count"] - 1
+        return info["aead"].decrypt(_nonce(index), f.read(info["frame"]), _chunk_aad(info["digest"], index, final))
+    
+    def chunk_count(self, encrypted_path) -> int:
+        with open(encrypted_path, 'rb') as f:
+            return self._layout(f)["count"]
+    
+    def decrypt_chunk(self, encrypted_path, index: int) -> bytes:
+        """Random access: decrypts and authenticates a single chunk"""
+        with open(encrypted_path, 'rb') as f:
+            info = self._layout(f)
+            if not 0 <= index < info["count"]:
+                raise IndexError(f"Chunk {index} out of range (file has {info['count']})")
+            return self._decrypt_at(f, info, index)
+    
+    def read_range(self, encrypted_path, offset: int, length: int) -> bytes:
+        """Plaintext bytes [offset, offset + length), decrypting only the chunks that cover them"""
+        if length <= 0:
+            return b""
+        with open(encrypted_path, 'rb') as f:
+            info = self._layout(f)
+            chunk_size = info["chunk_size"]
+            first = offset // chunk_size
+            last = min((offset + length - 1) // chunk_size, info["count"] - 1)
+            data = b"".join(self._decrypt_at(f, info, i) for i in range(first, last + 1))
+        start = offset - first * chunk_size
+        return data[start:start + length]
+    
+    def encrypt_file(self, file_path, output_path=None, chunk_size: int = CHUNK_SIZE):
         """
-        Encrypt file with hybrid PQC + AES
+        Encrypt file with hybrid PQC + AES (v2 streaming format)
+        
+        Args:
+            file_path: Path to plaintext file
+            output_path: Path to save ciphertext (defaults to .enc extension)
+        
+        Returns:
+            Path to encrypted file
+        """
+        file_path = Path(file_path)
+        
+        if output_path is None:
+            output_path = file_path.with_suffix(file_path.suffix + ".enc")
+        output_path = Path(output_path)
+        
+        tmp = output_path.with_name(output_path.name + ".tmp")
+        with open(file_path, 'rb') as src, open(tmp, 'wb') as dst:
+            self.encrypt_stream(src, dst, chunk_size)
+        os.replace(tmp, output_path)
+        
+        return output_path
+    
+    def decrypt_file(self, encrypted_path, output_path=None):
+        """
+        Decrypt a vault file (v2 streaming, or legacy v1)
+        
+        Args:
+            encrypted_path: Path to .enc file
+            output_path: Where to save plaintext
+        
+        Returns:
+            Path to decrypted file
+        """
+        encrypted_path = Path(encrypted_path)
+        
+        if output_path is None:
+            output_path = encrypted_path.with_suffix('')  # Remove .enc
+        output_path = Path(output_path)
+        
+        with open(encrypted_path, 'rb') as f:
+            is_v2 = f.read(len(MAGIC)) == MAGIC
+        if not is_v2:
+            return self._decrypt_v1(encrypted_path, output_path)
+        
+        # Plaintext only appears under its final name once every chunk has authenticated
+        tmp = output_path.with_name(output_path.name + ".tmp")
+        try:
+            with open(encrypted_path, 'rb') as src, open(tmp, 'wb') as dst:
+                self.decrypt_stream(src, dst)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
+        os.replace(tmp, output_path)
+        
+        return output_path
+    
+    def encrypt_file_v1(self, file_path, output_path=None):
+        """
+        Legacy v1 format: whole file in memory, JSON + hex package (kept for benchmarks)
         
         Args:
             file_path: Path to plaintext file
@@ -158,22 +491,8 @@ class PQCVault:
         
         return output_path
     
-    def decrypt_file(self, encrypted_path, output_path=None):
-        """
-        Decrypt PQC-encrypted file
-        
-        Args:
-            encrypted_path: Path to .enc file
-            output_path: Where to save plaintext
-        
-        Returns:
-            Path to decrypted file
-        """
-        encrypted_path = Path(encrypted_path)
-        
-        if output_path is None:
-            output_path = encrypted_path.with_suffix('')  # Remove .enc
-        
+    def _decrypt_v1(self, encrypted_path, output_path):
+        """Legacy v1 files: JSON + hex package (PQC) or a bare Fernet token (classical)"""
         if self.use_pqc:
             # Load package
             with open(encrypted_path, 'r') as f:
@@ -204,30 +523,118 @@ class PQCVault:
         return output_path
     
     def encrypt_vault(self):
-        """Encrypt all files in vault directory"""
-        files_encrypted = 0
+        """Encrypt all files in vault directory (one KEM per batch, parallel across files)"""
+        from System.Security.bulk_vault import BulkVault
         
-        for file_path in self.vault_dir.glob("*"):
-            if file_path.is_file() and not file_path.name.startswith("."):
-                if not file_path.suffix == ".enc":
-                    self.encrypt_file(file_path)
-                    file_path.unlink()  # Delete plaintext
-                    files_encrypted += 1
+        plaintexts = [
+            p for p in self.vault_dir.glob("*")
+            if p.is_file() and not p.name.startswith(".") and p.suffix != ".enc"
+        ]
+        BulkVault(self).encrypt_files([(p, p.with_suffix(p.suffix + ".enc")) for p in plaintexts])
+        for file_path in plaintexts:
+            file_path.unlink()  # Delete plaintext
+        files_encrypted = len(plaintexts)
         
         print(f"✓ Encrypted {files_encrypted} files with {'PQC+AES' if self.use_pqc else 'AES-256'}")
     
     def decrypt_vault(self):
         """Decrypt all .enc files in vault"""
-        files_decrypted = 0
+        from System.Security.bulk_vault import BulkVault
         
+        batched, single, batch_ids = [], [], set()
         for file_path in self.vault_dir.glob("*.enc"):
+            try:
+                batch_id = read_batch_id(file_path)
+            except VaultFormatError:
+                batch_id = b""  # v1 files
+            (batched if batch_id else single).append(file_path)
+            if batch_id:
+                batch_ids.add(batch_id)
+        
+        BulkVault(self).decrypt_files([(p, p.with_suffix('')) for p in batched])
+        for file_path in single:
             self.decrypt_file(file_path)
+        for file_path in batched + single:
             file_path.unlink()  # Delete ciphertext
-            files_decrypted += 1
+        
+        # Drop the batch key records of decrypted files unless other ciphertext still uses them
+        for file_path in self.vault_dir.rglob("*.enc"):
+            try:
+                batch_ids.discard(read_batch_id(file_path))
+            except (OSError, VaultFormatError):
+                pass
+        self.drop_batches(batch_ids)
+        files_decrypted = len(batched) + len(single)
         
         print(f"✓ Decrypted {files_decrypted} files")
 
+def _bench_one(fmt: str, op: str, src: str, dst: str, vault_dir: str):
+    """Child-process worker: one timed operation, peak RSS from getrusage"""
+    import time
+    import resource
+    vault = PQCVault(vault_dir)
+    start = time.perf_counter()
+    if op == "encrypt":
+        (vault.encrypt_file if fmt == "v2" else vault.encrypt_file_v1)(src, dst)
+    else:
+        vault.decrypt_file(src, dst)
+    print(json.dumps({"seconds": time.perf_counter() - start,
+                      "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+
+def benchmark(sizes_mb=(1, 100, 2048)):
+    """v1 (whole file in memory) vs v2 (streamed chunks): MB/s, peak RSS, size overhead"""
+    import shutil
+    import tempfile
+    import subprocess
+    import psutil
+
+    tmp = Path(tempfile.mkdtemp(prefix="pqc_vault_"))
+    vault_dir = tmp / "vault"
+    PQCVault(vault_dir)  # Create the key once
+
+    def run(fmt, op, src, dst):
+        out = subprocess.run([sys.executable, __file__, "--bench-one", fmt, op, str(src), str(dst), str(vault_dir)],
+                             capture_output=True, text=True, check=True).stdout
+        return json.loads(out.strip().splitlines()[-1])
+
+    baseline = run("v2", "encrypt", __file__, tmp / "baseline.enc")["peak_rss_mb"]
+    print(f"\nMode: {'Kyber-1024 + AES' if PQC_AVAILABLE else 'classical key + AES'} | "
+          f"interpreter baseline RSS {baseline:.0f} MB")
+    print(f"{'Size':>8} {'Format':<4} {'Enc MB/s':>9} {'Dec MB/s':>9} {'Enc RSS':>9} {'Dec RSS':>9} {'Overhead':>10}")
+    for size_mb in sizes_mb:
+        plain = tmp / f"plain_{size_mb}.bin"
+        block = os.urandom(1024 * 1024)
+        with open(plain, "wb") as f:
+            for _ in range(size_mb):
+                f.write(block)
+        size = plain.stat().st_size
+        for fmt in ("v1", "v2"):
+            # v1 holds plaintext, token and hex copies at once
+            if fmt == "v1" and size * 6 > psutil.virtual_memory().available:
+                print(f"{size_mb:>6}MB {fmt:<4} {'skipped: needs ~' + str(size_mb * 6 // 1024) + ' GB RAM':>50}")
+                continue
+            enc, dec = tmp / f"{fmt}.enc", tmp / f"{fmt}.dec"
+            e = run(fmt, "encrypt", plain, enc)
+            d = run(fmt, "decrypt", enc, dec)
+            overhead = enc.stat().st_size / size - 1
+            assert dec.stat().st_size == size
+            print(f"{size_mb:>6}MB {fmt:<4} {size / 1e6 / e['seconds']:>9.0f} {size / 1e6 / d['seconds']:>9.0f} "
+                  f"{e['peak_rss_mb']:>7.0f}MB {d['peak_rss_mb']:>7.0f}MB {overhead:>9.3%}")
+            enc.unlink()
+            dec.unlink()
+        plain.unlink()
+    shutil.rmtree(tmp)
+
+
 if __name__ == "__main__":
+    if "--bench-one" in sys.argv:
+        _bench_one(*sys.argv[sys.argv.index("--bench-one") + 1:][:5])
+        sys.exit(0)
+    if "--benchmark" in sys.argv:
+        benchmark()
+        sys.exit(0)
+    
     vault = PQCVault()
     
     if vault.use_pqc:
@@ -9,6 +9,10 @@ import os
 import sys
 from datetime import datetime
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.log_reader import tail
+
 st.set_page_config(page_title="👁️ MONOLITH PRIME", layout="wide")
 
 st.title("👁️ MONOLITH PRIME - AUTONOMOUS CONTROL CENTER")
@@ -55,6 +59,5 @@ if cmd:
 st.header("📋 RECENT LOGS")
 log_path = r"C:\Monolith\Logs\monolith.log"
 if os.path.exists(log_path):
-    with open(log_path, "r") as f:
-        logs = f.readlines()[-20:]  # Last 20 lines
-    st.text_area("Logs", "".join(logs), height=200)
+    logs = tail(log_path, 20)  # Last 20 lines, read backwards from EOF
+    st.text_area("Logs", "\n".join(logs), height=200)
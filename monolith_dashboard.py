@@ -5,12 +5,15 @@ Organized by the Five Strategic Vertical Pillars.
 """
 
 import streamlit as st
-import json
+import sys
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import random
 
+sys.path.append(str(Path(__file__).parent))
+from System.Core.dashboard_data import DashboardData
+
 # --- CONFIGURATION ---
 st.set_page_config(
     page_title="Monolith Command Center",
@@ -76,15 +79,22 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- DATA LOADING ---
+# Every rerun re-executes this script; the data layer re-reads a file only
+# when its mtime changed, so a widget click costs a stat per panel, not a parse.
 SENTINEL_DIR = Path("System/Sentinels")
 SENTINEL_DIR.mkdir(exist_ok=True)
+TREASURY_FILE = Path("System/Logs/Treasury/first_dollar.json")
+DATA = DashboardData.shared(SENTINEL_DIR, Path("System/Logs/ledger.db"))
+REFRESH_SECONDS = 10  # Pillars re-render on their own at this interval, one at a time
 
 def load_sentinel(agent_name):
-    try:
-        with open(SENTINEL_DIR / f"{agent_name}.done", 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None
+    return DATA.sentinel(agent_name)
+
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def live_panel(render):
+    """Runs a pillar as a fragment: it refreshes (and reruns on its own widgets) without the rest of the page"""
+    return _fragment(run_every=REFRESH_SECONDS)(render) if _fragment else render
 
 # --- SIDEBAR (SYSTEM CONTROLS) ---
 with st.sidebar:
@@ -131,186 +141,206 @@ st.divider()
 # --- THE FIVE PILLARS ---
 
 # 1. WEALTH FACTORY
-st.markdown("## 💰 PILLAR I: THE WEALTH FACTORY")
-w_col1, w_col2, w_col3 = st.columns(3)
-
-with w_col1:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 📊 TREASURY & REVENUE")
-    # Load First Dollar status
-    try:
-        with open("System/Logs/Treasury/first_dollar.json", "r") as f:
-            treasury = json.load(f)
-            total = treasury.get("total_earned", 0.0)
-    except:
-        total = 0.0
-        
-    st.metric("Total Revenue", f"${total:,.2f}")
-    st.caption("Status: REAL_MONEY_MODE")
-    
-    # Check new agents
-    bounty = load_sentinel("bounty_arbitrageur")
-    if bounty:
-        st.write(f"Bounty Scout: **{bounty.get('status')}**")
-        st.caption(f"Targets: {len(bounty.get('bounty_list',[]))}")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with w_col2:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 📈 INVESTMENT & ARB")
-    invest = load_sentinel("investment_agent")
-    arb = load_sentinel("global_arb_scout")
-    
-    if invest:
-        st.write(f"CEX Agent: **{invest.get('status')}**")
-    if arb:
-        st.write(f"Global Arb: **{arb.get('status')}**")
-        st.caption(f"Airdrops: {len(arb.get('airdrops_tracked',[]))}")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with w_col3:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🔄 RECURSIVE SCALING")
-    cap = load_sentinel("capital_allocation")
-    if cap:
-        st.write(f"Strategy: **{cap.get('recommendation', 'Analyzing...')}**")
-        proj = cap.get("revenue_projection", {}).get("daily_range", [0,0])
-        st.write(f"Proj. Daily: `${proj[0]}-${proj[1]}`")
-    else:
-        st.warning("Capital Engine Initializing...")
-    st.markdown("</div>", unsafe_allow_html=True)
+@live_panel
+def wealth_pillar():
+    st.markdown("## 💰 PILLAR I: THE WEALTH FACTORY")
+    w_col1, w_col2, w_col3 = st.columns(3)
+
+    with w_col1:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 📊 TREASURY & REVENUE")
+        # Load First Dollar status
+        treasury = DATA.json_file(TREASURY_FILE, {})
+        total = treasury.get("total_earned", 0.0) if isinstance(treasury, dict) else 0.0
+
+        st.metric("Total Revenue", f"${total:,.2f}")
+        st.caption("Status: REAL_MONEY_MODE")
+
+        # Revenue history scans the whole ledger: built only once opened
+        if st.toggle("Revenue History", key="show_revenue_history"):
+            history = DATA.revenue_history()
+            if history:
+                st.bar_chart(pd.DataFrame(history, columns=["day", "revenue"]).set_index("day"), height=160)
+            else:
+                st.caption("No revenue recorded yet.")
+
+        # Check new agents
+        bounty = load_sentinel("bounty_arbitrageur")
+        if bounty:
+            st.write(f"Bounty Scout: **{bounty.get('status')}**")
+            st.caption(f"Targets: {len(bounty.get('bounty_list',[]))}")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with w_col2:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 📈 INVESTMENT & ARB")
+        invest = load_sentinel("investment_agent")
+        arb = load_sentinel("global_arb_scout")
+
+        if invest:
+            st.write(f"CEX Agent: **{invest.get('status')}**")
+        if arb:
+            st.write(f"Global Arb: **{arb.get('status')}**")
+            st.caption(f"Airdrops: {len(arb.get('airdrops_tracked',[]))}")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with w_col3:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🔄 RECURSIVE SCALING")
+        cap = load_sentinel("capital_allocation")
+        if cap:
+            st.write(f"Strategy: **{cap.get('recommendation', 'Analyzing...')}**")
+            proj = cap.get("revenue_projection", {}).get("daily_range", [0,0])
+            st.write(f"Proj. Daily: `${proj[0]}-${proj[1]}`")
+        else:
+            st.warning("Capital Engine Initializing...")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+wealth_pillar()
 
 # 2. SECURITY FACTORY
-st.markdown("## 🛡️ PILLAR II: THE SECURITY FACTORY")
-s_col1, s_col2, s_col3 = st.columns(3)
-
-with s_col1:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🔐 THE CIPHER")
-    st.write("Link: **AES-256-GCM + Kyber-1024**")
-    st.write("Status: <span class='status-badge status-green'>SECURE</span>", unsafe_allow_html=True)
-    st.caption("PQC Layer Active across all local NVMe arrays.")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with s_col2:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🎭 TRAFFIC MASKER")
-    masker = load_sentinel("traffic_masker")
-    if masker:
-        st.write(f"State: **{masker.get('message')}**")
-        st.write("Mode: `High-Entropy Randomization`")
-    else:
-        st.warning("Metadata Leaking")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with s_col3:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🦅 SENTINEL")
-    emergency = load_sentinel("emergency_protocol")
-    if emergency:
-        st.write(f"Nuclear Check-in: **{emergency.get('status')}**")
-        st.write("Dead Man's Switch: `ARMED`")
-    else:
-        st.error("System Vulnerable")
-    st.markdown("</div>", unsafe_allow_html=True)
+@live_panel
+def security_pillar():
+    st.markdown("## 🛡️ PILLAR II: THE SECURITY FACTORY")
+    s_col1, s_col2, s_col3 = st.columns(3)
+
+    with s_col1:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🔐 THE CIPHER")
+        st.write("Link: **AES-256-GCM + Kyber-1024**")
+        st.write("Status: <span class='status-badge status-green'>SECURE</span>", unsafe_allow_html=True)
+        st.caption("PQC Layer Active across all local NVMe arrays.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with s_col2:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🎭 TRAFFIC MASKER")
+        masker = load_sentinel("traffic_masker")
+        if masker:
+            st.write(f"State: **{masker.get('message')}**")
+            st.write("Mode: `High-Entropy Randomization`")
+        else:
+            st.warning("Metadata Leaking")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with s_col3:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🦅 SENTINEL")
+        emergency = load_sentinel("emergency_protocol")
+        if emergency:
+            st.write(f"Nuclear Check-in: **{emergency.get('status')}**")
+            st.write("Dead Man's Switch: `ARMED`")
+        else:
+            st.error("System Vulnerable")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+security_pillar()
 
 # 3. LABOR & HEALTH FACTORIES
-col_l, col_h = st.columns(2)
+@live_panel
+def labor_and_health_pillars():
+    col_l, col_h = st.columns(2)
 
-with col_l:
-    st.markdown("## 🤖 PILLAR III: LABOR FACTORY")
-    
-    # ROBOTIC FLEET
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🦾 FLEET MANAGER")
-    fleet = load_sentinel("robotic_fleet_manager")
-    if fleet:
-        st.write(f"Status: **{fleet.get('message')}**")
-        units = fleet.get("fleet", [])
-        active = len([u for u in units if u["status"] == "ACTIVE"])
-        st.write(f"Active Units: `{active}/{len(units)}`")
-        with st.expander("Unit Status"):
-            for u in units:
-                icon = "🟢" if u["status"] == "ACTIVE" else "🟡"
-                st.caption(f"{icon} {u['name']}: {u['task']}")
-    else:
-        st.warning("Fleet Offline")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    # INVENTORY GHOST
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 👻 INVENTORY GHOST")
-    inv = load_sentinel("inventory_ghost")
-    if inv:
-        st.write(f"Logistics: **{inv.get('message').split('|')[1]}**")
-        orders = inv.get("orders", [])
-        if orders:
-            st.info(f"Drone Inbound: {len(orders[0]['items'])} items")
-    else:
-        st.warning("Inventory Blind")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    # ANCESTRAL BUTLER
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🦉 ANCESTRAL BUTLER")
-    ancestral = load_sentinel("ancestral_butler")
-    if ancestral:
-        data = ancestral.get("data", {})
-        st.write(f"Season: **{data.get('season')}**")
-        st.write(f"Metabolic Window: **{data.get('metabolic_state')}**")
-        for rec in data.get("recommendations", [])[:2]:
-            st.info(rec)
-    else:
-        st.warning("Butler Offline")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with col_h:
-    st.markdown("## 💓 PILLAR IV: HEALTH FACTORY")
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🩺 DIRECTOR PULSE")
-    pulse = load_sentinel("director_pulse")
-    if pulse:
-        st.write(f"Vitals: **{pulse.get('message')}**")
-        diag = pulse.get("diagnostics", {})
-        st.write(f"Hydration Index: **{diag.get('smart_toilet', {}).get('hydration')}**")
-    else:
-        st.warning("Pulse Offline")
-    st.markdown("</div>", unsafe_allow_html=True)
+    with col_l:
+        st.markdown("## 🤖 PILLAR III: LABOR FACTORY")
+
+        # ROBOTIC FLEET
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🦾 FLEET MANAGER")
+        fleet = load_sentinel("robotic_fleet_manager")
+        if fleet:
+            st.write(f"Status: **{fleet.get('message')}**")
+            units = fleet.get("fleet", [])
+            active = len([u for u in units if u["status"] == "ACTIVE"])
+            st.write(f"Active Units: `{active}/{len(units)}`")
+            with st.expander("Unit Status"):
+                for u in units:
+                    icon = "🟢" if u["status"] == "ACTIVE" else "🟡"
+                    st.caption(f"{icon} {u['name']}: {u['task']}")
+        else:
+            st.warning("Fleet Offline")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # INVENTORY GHOST
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 👻 INVENTORY GHOST")
+        inv = load_sentinel("inventory_ghost")
+        if inv:
+            st.write(f"Logistics: **{inv.get('message').split('|')[1]}**")
+            orders = inv.get("orders", [])
+            if orders:
+                st.info(f"Drone Inbound: {len(orders[0]['items'])} items")
+        else:
+            st.warning("Inventory Blind")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # ANCESTRAL BUTLER
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🦉 ANCESTRAL BUTLER")
+        ancestral = load_sentinel("ancestral_butler")
+        if ancestral:
+            data = ancestral.get("data", {})
+            st.write(f"Season: **{data.get('season')}**")
+            st.write(f"Metabolic Window: **{data.get('metabolic_state')}**")
+            for rec in data.get("recommendations", [])[:2]:
+                st.info(rec)
+        else:
+            st.warning("Butler Offline")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with col_h:
+        st.markdown("## 💓 PILLAR IV: HEALTH FACTORY")
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🩺 DIRECTOR PULSE")
+        pulse = load_sentinel("director_pulse")
+        if pulse:
+            st.write(f"Vitals: **{pulse.get('message')}**")
+            diag = pulse.get("diagnostics", {})
+            st.write(f"Hydration Index: **{diag.get('smart_toilet', {}).get('hydration')}**")
+        else:
+            st.warning("Pulse Offline")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+labor_and_health_pillars()
 
 # 4. DEVELOPMENT FACTORY
-st.markdown("## 🏗️ PILLAR V: DEVELOPMENT FACTORY")
-d_col1, d_col2 = st.columns([2, 1])
-
-with d_col1:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🏗️ RECURSIVE ARCHITECT")
-    master = load_sentinel("gap_scanner")
-    if master:
-        gaps = master.get("gaps", [])
-        if not gaps:
-            st.success("✅ ARCHITECTURE COMPLETE. NO GAPS DETECTED.")
+@live_panel
+def development_pillar():
+    st.markdown("## 🏗️ PILLAR V: DEVELOPMENT FACTORY")
+    d_col1, d_col2 = st.columns([2, 1])
+
+    with d_col1:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🏗️ RECURSIVE ARCHITECT")
+        master = load_sentinel("gap_scanner")
+        if master:
+            gaps = master.get("gaps", [])
+            if not gaps:
+                st.success("✅ ARCHITECTURE COMPLETE. NO GAPS DETECTED.")
+            else:
+                st.error(f"⚠️ FOUND {len(gaps)} ARCHITECTURAL GAPS.")
+                st.write(f"Missing: {', '.join(gaps)}")
+
+            opps = master.get("opportunities", [])
+            if opps:
+                st.write("#### 🚀 Hardware Scouting:")
+                for o in opps[:3]:
+                    st.caption(f"**{o['item']}**: {o['reason']} ({o['priority']})")
         else:
-            st.error(f"⚠️ FOUND {len(gaps)} ARCHITECTURAL GAPS.")
-            st.write(f"Missing: {', '.join(gaps)}")
-        
-        opps = master.get("opportunities", [])
-        if opps:
-            st.write("#### 🚀 Hardware Scouting:")
-            for o in opps[:3]:
-                st.caption(f"**{o['item']}**: {o['reason']} ({o['priority']})")
-    else:
-        st.warning("Architect Offline")
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with d_col2:
-    st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
-    st.markdown("### 🧪 SYSTEM HYGIENE")
-    opt = load_sentinel("system_optimizer")
-    if opt:
-        st.write(f"CPU Load: **{random.randint(5, 15)}%**")
-        st.write(f"Disk (RTX array): **{random.randint(30, 45)}%**")
-        st.write("Status: `OPTIMIZED`")
-    st.markdown("</div>", unsafe_allow_html=True)
+            st.warning("Architect Offline")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with d_col2:
+        st.markdown("<div class='pillar-card'>", unsafe_allow_html=True)
+        st.markdown("### 🧪 SYSTEM HYGIENE")
+        opt = load_sentinel("system_optimizer")
+        if opt:
+            st.write(f"CPU Load: **{random.randint(5, 15)}%**")
+            st.write(f"Disk (RTX array): **{random.randint(30, 45)}%**")
+            st.write("Status: `OPTIMIZED`")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+development_pillar()
 
 # --- FOOTER ---
 st.divider()
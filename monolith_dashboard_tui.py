@@ -12,6 +12,9 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+from System.Core.state_push import STATE_SOCKET, listen
+
 # --- CONFIG ---
 REFRESH_RATE = 0.5
 COLORS = {
@@ -48,9 +51,10 @@ def load_treasury():
             return 0.0
     return 0.0
 
-def draw_dashboard():
+def draw_dashboard(treasury=None):
     clear_screen()
-    treasury = load_treasury()
+    if treasury is None:
+        treasury = load_treasury()
     
     print(f"{COLORS['HEADER']}{'='*80}{COLORS['ENDC']}")
     print(f"{COLORS['BOLD']}   MONOLITH v5.0 'IMMORTAL' - SOVEREIGN INTELLIGENCE ENGINE{COLORS['ENDC']}")
@@ -96,9 +100,26 @@ def draw_dashboard():
     print(f"\n{COLORS['HEADER']}{'='*80}{COLORS['ENDC']}")
     print(f" Press Ctrl+C to minimize to tray.")
 
+def run_push():
+    """Redraws only when the state hub (Overwatch) pushes a change; returns when no hub is reachable"""
+    treasury = 0.0
+    try:
+        for message in listen(STATE_SOCKET):
+            if message["type"] == "snapshot":
+                treasury = (message["state"].get("files", {}).get("treasury") or {}).get("total_earned", 0.0)
+            elif message["type"] == "delta" and message["topic"] == "files" and message["key"] == "treasury":
+                treasury = (message["data"] or {}).get("total_earned", 0.0)
+            elif message["type"] != "delta":
+                continue
+            draw_dashboard(treasury)
+    except OSError:
+        pass
+
 def run():
     try:
         while True:
+            run_push()
+            # No hub: poll, and try the socket again next tick
             draw_dashboard()
             time.sleep(REFRESH_RATE)
     except KeyboardInterrupt:
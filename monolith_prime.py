@@ -19,6 +19,8 @@ from pathlib import Path
 from datetime import datetime
 import time
 
+from System.Core.blackboard import SentinelBlackboard
+
 class MonolithPrime:
     def __init__(self):
         self.root = Path(__file__).parent
@@ -32,6 +34,7 @@ class MonolithPrime:
         self.agents_dir.mkdir(parents=True, exist_ok=True)
         self.tools_dir.mkdir(parents=True, exist_ok=True)
         self.sentinel_dir.mkdir(parents=True, exist_ok=True)
+        self.blackboard = SentinelBlackboard.shared(self.sentinel_dir)
         
         self._init_agent_registry()
     
@@ -168,31 +171,23 @@ class MonolithPrime:
     
     def check_sentinels(self):
         """Check for .done files (15-min review items)"""
-        done_files = list(self.sentinel_dir.glob("*.done"))
-        
-        if not done_files:
-            return []
+        # Only sentinels changed since the last check are parsed
+        self.blackboard.refresh()
         
         updates = []
-        for done_file in done_files:
-            # Read sentinel data
-            with open(done_file, 'r') as f:
-                data = json.load(f)
-            
+        for record in self.blackboard.all():
             updates.append({
-                "agent": data.get("agent", "Unknown"),
-                "message": data.get("message", "Task complete"),
-                "timestamp": data.get("timestamp", "Unknown"),
-                "file": done_file.name
+                "agent": record["agent"] or "Unknown",
+                "message": record["message"] or "Task complete",
+                "timestamp": record["timestamp"] or "Unknown",
+                "file": f"{record['key']}.done"
             })
         
         return updates
     
     def clear_sentinel(self, filename):
         """Clear a sentinel after review"""
-        sentinel_file = self.sentinel_dir / filename
-        if sentinel_file.exists():
-            sentinel_file.unlink()
+        if self.blackboard.clear(Path(filename).stem):
             print(f"✅ Cleared sentinel: {filename}")
     
     def list_agents(self):
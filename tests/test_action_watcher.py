@@ -0,0 +1,84 @@
+import unittest
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.action_watcher import ActionWatcher, INOTIFY_AVAILABLE
+
+class TestActionWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.seen = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def handler(self, path):
+        with self.lock:
+            self.seen.append((path.name, path.read_text()))
+        path.unlink()
+
+    def wait_for(self, count, timeout=5):
+        deadline = time.time() + timeout
+        while len(self.seen) < count and time.time() < deadline:
+            time.sleep(0.02)
+
+    def check_dispatch(self, use_inotify):
+        (self.tmp / "early.py").write_text("early")          # Present before start
+        watcher = ActionWatcher(self.tmp, self.handler, settle=0.2, use_inotify=use_inotify)
+        watcher.start()
+        try:
+            (self.tmp / ".hidden.py").write_text("x")
+            with open(self.tmp / "slow.py", "w") as f:       # Written in pieces
+                for part in ("a", "b", "c"):
+                    f.write(part)
+                    f.flush()
+                    time.sleep(0.08)
+            (self.tmp / "job.py.part").write_text("job")
+            os.replace(self.tmp / "job.py.part", self.tmp / "job.py")
+            self.wait_for(3)
+            time.sleep(0.3)
+        finally:
+            watcher.stop()
+        self.assertEqual(sorted(self.seen), [("early.py", "early"), ("job.py", "job"), ("slow.py", "abc")])
+
+    @unittest.skipUnless(INOTIFY_AVAILABLE, "inotify not available")
+    def test_inotify_dispatch(self):
+        self.check_dispatch(True)
+
+    def test_polling_dispatch(self):
+        self.check_dispatch(False)
+
+    def test_pool_is_bounded(self):
+        active, peak = [0], [0]
+
+        def slow(path):
+            with self.lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.2)
+            with self.lock:
+                active[0] -= 1
+            self.handler(path)
+
+        for i in range(6):
+            (self.tmp / f"a{i}.py").write_text(str(i))
+        watcher = ActionWatcher(self.tmp, slow, workers=2, settle=0.0)
+        watcher.start()
+        try:
+            self.wait_for(6)
+        finally:
+            watcher.stop()
+        self.assertEqual(len(self.seen), 6)
+        self.assertEqual(peak[0], 2)
+
+if __name__ == '__main__':
+    unittest.main()
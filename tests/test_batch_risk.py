@@ -0,0 +1,117 @@
+import unittest
+import io
+import os
+import sys
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path so we can import System.Finance
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Finance.batch_risk import BatchPortfolioEvaluator, BatchRiskEngine
+from System.Agents.investment_agent import InvestmentAgent, RiskOfficer, SentimentOracle
+
+class FakeOracle:
+    tickers = ["BTC-USD", "ETH-USD", "SPY"]
+
+    def __init__(self):
+        self.calls = 0
+
+    def fetch_data(self):
+        self.calls += 1
+        return {"BTC-USD": {"price": 98500.0}, "ETH-USD": {"price": 6200.0}, "SPY": {"price": 580.0}}
+
+class FakeSentiment:
+    def __init__(self, scores):
+        self.scores = scores
+        self.single_calls = 0
+        self.batch_calls = []
+
+    def analyze_sentiment(self, asset):
+        self.single_calls += 1
+        return self.scores[asset]
+
+    def analyze_batch(self, assets):
+        self.batch_calls.append(list(assets))
+        return {a: self.scores[a] for a in assets}
+
+class TestBatchRisk(unittest.TestCase):
+    def evaluator(self, scores=None, officer=None):
+        self.oracle = FakeOracle()
+        self.sentiment = FakeSentiment(scores or {"BTC": 0.9, "ETH": 0.9, "SPY": 0.9})
+        return BatchPortfolioEvaluator(self.oracle, self.sentiment, officer or RiskOfficer(),
+                                       engine=BatchRiskEngine(simulations=2000, seed=3))
+
+    def test_validate_batch_matches_validate_at_thresholds(self):
+        officer = RiskOfficer()
+        # weighted = 0.7 * risk + 0.3 * sentiment; 0.6 is the lowest approved score
+        cases = [(1000.0, 0.6, 0.6), (1000.01, 0.9, 0.9), (500.0, 0.6, 0.59), (500.0, 0.5, 0.85),
+                 (500.0, 0.0, 0.0), (2000.0, 0.1, 0.1)]
+        approved, reasons = officer.validate_batch(*zip(*cases))
+        for (amount, risk, sentiment), ok, reason in zip(cases, approved, reasons):
+            expected = officer.validate({"amount": amount, "start_risk": risk, "sentiment": sentiment})
+            self.assertEqual((ok, reason), expected)
+        self.assertEqual(approved, [True, False, False, True, False, False])
+        self.assertEqual(reasons[1], "Exceeds Max Trade Size")
+        self.assertEqual(reasons[2], "Confidence Too Low (0.60)")
+
+    def test_evaluate_reuses_the_cycle_and_batches_sentiment(self):
+        evaluator = self.evaluator()
+        evaluator.start_cycle()
+        evaluator.market_data()                    # The agent's own read
+        rows = evaluator.evaluate(FakeOracle.tickers)
+        evaluator.evaluate(FakeOracle.tickers)
+        self.assertEqual(self.oracle.calls, 1)
+        self.assertEqual(self.sentiment.batch_calls, [["BTC", "ETH", "SPY"]])
+        self.assertEqual(self.sentiment.single_calls, 0)
+        self.assertEqual([r["asset"] for r in rows], FakeOracle.tickers)
+
+        evaluator.start_cycle()
+        evaluator.evaluate(FakeOracle.tickers)
+        self.assertEqual(self.oracle.calls, 2)
+        self.assertEqual(len(self.sentiment.batch_calls), 2)
+
+    def test_evaluate_applies_limits_per_asset(self):
+        evaluator = self.evaluator(scores={"BTC": 0.9, "ETH": 0.0, "SPY": 0.9})
+        evaluator.start_cycle()
+        rows = {r["asset"]: r for r in evaluator.evaluate(amount=500)}
+        self.assertTrue(rows["ETH-USD"]["reason"].startswith("Confidence Too Low"))
+        for row in rows.values():
+            self.assertEqual(row["status"] == "APPROVED", row["reason"] == "APPROVED")
+        evaluator.start_cycle()
+        self.assertEqual({r["reason"] for r in evaluator.evaluate(amount=5000)}, {"Exceeds Max Trade Size"})
+
+    def test_analyze_batch_tolerates_malformed_scores(self):
+        oracle = SentimentOracle.__new__(SentimentOracle)     # No local LLM needed
+        replies = ['{"scores": {"BTC": 0.2, "ETH": "high"}}', '{"scores": [0.2, 0.3]}',
+                   '{"scores": "bullish"}', '["not", "an", "object"]', 'not json']
+        expected = [{"BTC": 0.2, "ETH": 0.85}] + [{"BTC": 0.85, "ETH": 0.85}] * 4
+        for reply, scores in zip(replies, expected):
+            oracle.llm = SimpleNamespace(generate=lambda prompt, json_schema=None, r=reply: SimpleNamespace(content=r))
+            self.assertEqual(oracle.analyze_batch(["BTC", "ETH", "BTC"]), scores, reply)
+
+    def test_agent_run_fetches_market_and_sentiment_once(self):
+        tmp = Path(tempfile.mkdtemp())
+        try:
+            agent = InvestmentAgent()
+            agent.sentinel_dir = tmp
+            officer = RiskOfficer()
+            officer.max_trade_size = 0               # Deny everything: no execution path
+            agent.oracle = FakeOracle()
+            agent.portfolio = self.evaluator(officer=officer)
+            agent.portfolio.oracle = agent.oracle
+            self.oracle = agent.oracle
+            with contextlib.redirect_stdout(io.StringIO()):
+                agent.run()
+            self.assertEqual(self.oracle.calls, 1)
+            self.assertEqual(len(self.sentiment.batch_calls), 1)
+            self.assertEqual(self.sentiment.single_calls, 0)
+            self.assertTrue((tmp / "investment_agent.done").exists())
+        finally:
+            shutil.rmtree(tmp)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path so we can import System.Finance
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Agents.accountant_agent import CanaTaxEngine, FEDERAL_BRACKETS_2026, BC_BRACKETS_2026
+from System.Intelligence.tax_optimizer import TaxOptimizer
+from System.Finance.batch_tax import BatchTaxEngine, BatchJurisdictionRanker
+
+def random_incomes(rng, n):
+    limits = [l for l, _ in FEDERAL_BRACKETS_2026 + BC_BRACKETS_2026 if l != float("inf")]
+    incomes = [rng.uniform(-1000, 600000) for _ in range(n)]
+    # Bracket edges, a cent either side, zero and negatives
+    for limit in limits:
+        incomes += [limit, limit - 0.01, limit + 0.01]
+    return incomes + [0, 0.0, -5, 1e9, rng.randint(0, 300000)]
+
+class TestBatchTax(unittest.TestCase):
+    def test_batch_tax_identical_to_scalar(self):
+        """Vectorized bracket lookup reproduces the scalar loop bit for bit."""
+        rng = random.Random(2026)
+        incomes = random_incomes(rng, 5000)
+        batch = BatchTaxEngine().calculate_tax(incomes)
+        for income, tax in zip(incomes, batch):
+            self.assertEqual(float(tax), CanaTaxEngine.calculate_tax(income), income)
+
+    def test_rankings_identical_to_scalar(self):
+        """Every jurisdiction ranking matches find_optimal_jurisdiction, ties included."""
+        rng = random.Random(7)
+        optimizer = TaxOptimizer()
+        ranker = BatchJurisdictionRanker(optimizer)
+        incomes = [rng.uniform(1, 2_000_000) for _ in range(200)]
+        for income_type in ("employment", "capital_gains", "business"):
+            for us_citizen in (True, False):
+                for willing in (True, False):
+                    ranked = ranker.rank(incomes, income_type, us_citizen, willing)
+                    for i, income in enumerate(incomes):
+                        expected = optimizer.find_optimal_jurisdiction(income, income_type, us_citizen, willing)
+                        got = [ranked["jurisdictions"][int(c)] for c in ranked["order"][i]]
+                        self.assertEqual(got, [r["jurisdiction"] for r in expected])
+                        for c, r in zip(ranked["order"][i], expected):
+                            self.assertEqual(float(ranked["net"][i][int(c)]), r["net_income"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.blackboard import SentinelBlackboard
+
+class TestBlackboard(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.events = []
+        self.board = SentinelBlackboard(self.tmp)
+        self.board.subscribe(lambda key, record: self.events.append((key, record and record["status"])))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_post_is_file_compatible_and_indexed(self):
+        self.board.post("scout", {"status": "GREEN", "message": "ok"})
+        self.board.post("auditor", {"status": "RED", "message": "breach"})
+        on_disk = json.loads((self.tmp / "scout.done").read_text())
+        self.assertEqual((on_disk["agent"], on_disk["status"]), ("scout", "GREEN"))
+        self.assertEqual([r["key"] for r in self.board.with_status("RED")], ["auditor"])
+        self.assertEqual(self.events, [("scout", "GREEN"), ("auditor", "RED")])
+        self.assertEqual([p.name for p in self.tmp.iterdir() if p.suffix == ".tmp"], [])
+
+        self.board.post("auditor", {"status": "GREEN"})
+        self.assertEqual(self.board.with_status("RED"), [])
+        self.assertTrue(self.board.clear("scout"))
+        self.assertFalse((self.tmp / "scout.done").exists())
+        self.assertEqual(self.events[-1], ("scout", None))
+
+    def test_refresh_parses_only_external_changes(self):
+        for i in range(20):
+            (self.tmp / f"agent_{i}.done").write_text(json.dumps({"agent": f"agent_{i}", "status": "GREEN"}))
+        self.assertEqual(self.board.refresh(), 20)
+
+        fresh = SentinelBlackboard(self.tmp)    # Loads the saved index
+        self.assertEqual(fresh.refresh(), 0)
+        self.assertEqual(fresh.stats["parsed"], 0)
+
+        (self.tmp / "agent_3.done").write_text(json.dumps({"agent": "agent_3", "status": "RED"}))
+        (self.tmp / "agent_4.done").write_text('{"agent": "agent_4", "sta')   # Mid-write
+        (self.tmp / "agent_5.done").unlink()
+        self.assertEqual(fresh.refresh(), 2)
+        self.assertEqual(fresh.stats["parsed"], 1)
+        self.assertEqual(fresh.get("agent_3")["status"], "RED")
+        self.assertEqual(fresh.get("agent_4")["status"], "GREEN")
+        self.assertIsNone(fresh.get("agent_5"))
+
+    def test_since_orders_by_change_time(self):
+        self.board.post("old", {"status": "GREEN"})
+        cutoff = time.time()
+        time.sleep(0.01)
+        self.board.post("new", {"status": "GREEN"})
+        self.assertEqual([r["key"] for r in self.board.since(cutoff)], ["new"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import io
+import os
+import sys
+import hashlib
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Security
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Security.pqc_vault import PQCVault
+from System.Security.bulk_vault import BulkVault
+
+class TestBulkVault(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.source = self.tmp / "source"
+        for i in range(25):
+            p = self.source / f"d{i % 3}" / f"f{i}.md"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(os.urandom(50 * i))
+        self.vault = PQCVault(self.tmp / "keys")
+        self.bulk = BulkVault(self.vault, batch_files=10)
+
+    def test_batches_share_one_key_record(self):
+        stats = self.bulk.encrypt_tree(self.source, self.tmp / "dest")
+        self.assertEqual(stats["encrypted"], 25)
+        self.assertEqual(stats["batches"], 3)
+        self.assertEqual(len(list(self.vault.batches_dir.glob("*.kem"))), 3)
+
+        # A fresh vault object (no cached batch keys) restores everything
+        BulkVault(PQCVault(self.tmp / "keys")).decrypt_tree(self.tmp / "dest", self.tmp / "out")
+        for p in self.source.rglob("*.md"):
+            self.assertEqual((self.tmp / "out" / p.relative_to(self.source)).read_bytes(), p.read_bytes())
+
+    def test_incremental_run_skips_unchanged(self):
+        self.bulk.encrypt_tree(self.source, self.tmp / "dest")
+        changed = self.source / "d1" / "f4.md"
+        changed.write_bytes(b"new content")
+        os.utime(self.source / "d2" / "f5.md")  # Touched only
+        (self.source / "d0" / "f0.md").unlink()
+
+        stats = self.bulk.encrypt_tree(self.source, self.tmp / "dest")
+        self.assertEqual((stats["unchanged"], stats["rehashed_only"], stats["encrypted"], stats["removed"]),
+                         (22, 1, 1, 1))
+        self.assertFalse((self.tmp / "dest" / "d0" / "f0.md.enc").exists())
+        self.assertEqual(self.bulk.encrypt_tree(self.source, self.tmp / "dest")["encrypted"], 0)
+
+    def test_batch_records_track_live_ciphertext(self):
+        dest = self.tmp / "dest"
+        kems = lambda: sorted(p.name for p in self.vault.batches_dir.glob("*.kem"))
+        self.bulk.encrypt_tree(self.source, dest)
+        first = kems()
+        self.assertEqual(len(first), 3)
+
+        for p in self.source.rglob("*.md"):
+            os.utime(p)                                   # Touched only: nothing to encrypt
+        stats = self.bulk.encrypt_tree(self.source, dest)
+        self.assertEqual((stats["encrypted"], stats["batches"]), (0, 0))
+        self.assertEqual(kems(), first)
+
+        for p in self.source.rglob("*.md"):
+            p.write_bytes(os.urandom(64))                 # Every old batch is replaced
+        stats = self.bulk.encrypt_tree(self.source, dest)
+        self.assertEqual((stats["encrypted"], stats["batches"], stats["batches_dropped"]), (25, 3, 3))
+        self.assertEqual(len(kems()), 3)
+        self.assertFalse(set(kems()) & set(first))
+
+        for p in self.source.rglob("*.md"):
+            p.unlink()
+        self.bulk.encrypt_tree(self.source, dest)
+        self.assertEqual(kems(), [])
+
+    def test_index_holds_no_plaintext_hashes(self):
+        dest = self.tmp / "dest"
+        dest.mkdir()
+        (dest / ".bulk_index.json").write_text("{}")     # Index written before fingerprints were keyed
+        self.bulk.encrypt_tree(self.source, dest)
+        self.assertFalse((dest / ".bulk_index.json").exists())
+        index = (dest / ".bulk_index.hmac.json").read_text()
+        for p in self.source.rglob("*.md"):
+            self.assertNotIn(hashlib.sha256(p.read_bytes()).hexdigest(), index)
+
+        # Same content, different vault key: different fingerprint
+        other = BulkVault(PQCVault(self.tmp / "other_keys"), batch_files=10)
+        other.encrypt_tree(self.source, self.tmp / "other_dest")
+        self.assertNotEqual(index, (self.tmp / "other_dest" / ".bulk_index.hmac.json").read_text())
+
+    def test_decrypt_vault_drops_unreferenced_batch_records(self):
+        vault_dir = self.tmp / "keys"
+        for i in range(3):
+            (vault_dir / f"note_{i}.md").write_bytes(os.urandom(100))
+        BulkVault(self.vault).encrypt_files([(self.source / "d0" / "f0.md", vault_dir / "sub" / "f0.md.enc")])
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.vault.encrypt_vault()
+        self.assertEqual(len(list(self.vault.batches_dir.glob("*.kem"))), 2)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            PQCVault(vault_dir).decrypt_vault()
+        self.assertEqual(sorted(p.name for p in vault_dir.glob("note_*")), ["note_0.md", "note_1.md", "note_2.md"])
+        # Only the record still used by the ciphertext in sub/ survives
+        self.assertEqual(len(list(self.vault.batches_dir.glob("*.kem"))), 1)
+        BulkVault(PQCVault(vault_dir)).decrypt_files([(vault_dir / "sub" / "f0.md.enc", self.tmp / "f0.md")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import io
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Finance
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Finance.capital_reinvestment import CapitalReinvestment
+
+THRESHOLDS = [(2000, "TIER_1_EFFICIENCY"), (5000, "TIER_2_CONVENIENCE"),
+              (10000, "TIER_3_FORTRESS"), (25000, "TIER_4_AUTOMATION")]
+
+class TestCapitalReinvestment(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.capital = CapitalReinvestment(ledger_db=self.tmp / "ledger.db", purchases_db=self.tmp / "purchases.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_current_tier_at_each_threshold(self):
+        self.assertIsNone(self.capital.get_current_tier(0))
+        previous = None
+        for threshold, tier in THRESHOLDS:
+            self.assertEqual(self.capital.get_current_tier(threshold - 0.01), previous)
+            self.assertEqual(self.capital.get_current_tier(threshold), tier)
+            self.assertEqual(self.capital.get_current_tier(threshold + 0.01), tier)
+            previous = tier
+        self.assertEqual(self.capital.get_current_tier(10 ** 9), "TIER_4_AUTOMATION")
+
+    def test_next_milestone_at_each_threshold(self):
+        for i, (threshold, tier) in enumerate(THRESHOLDS):
+            below = self.capital.get_next_milestone(threshold - 0.01)
+            self.assertEqual((below["tier"], below["threshold"]), (tier, threshold))
+            self.assertAlmostEqual(below["remaining"], 0.01)
+            reached = self.capital.get_next_milestone(threshold)
+            if i + 1 < len(THRESHOLDS):
+                self.assertEqual((reached["tier"], reached["threshold"]), THRESHOLDS[i + 1][::-1])
+                self.assertEqual(reached["remaining"], THRESHOLDS[i + 1][0] - threshold)
+        top = self.capital.get_next_milestone(25000)
+        self.assertEqual((top["tier"], top["threshold"], top["remaining"], top["percent"]), ("MAX", 25000, 0, 100))
+        self.assertEqual(self.capital.get_next_milestone(1000)["percent"], 50.0)
+
+    def test_reindex_after_tier_change(self):
+        self.capital.tiers["TIER_0_STARTER"] = {"threshold": 500, "name": "Starter", "items": []}
+        self.capital._index_tiers()
+        self.assertEqual(self.capital.get_current_tier(500), "TIER_0_STARTER")
+        self.assertEqual(self.capital.get_next_milestone(0)["tier"], "TIER_0_STARTER")
+        self.assertEqual(self.capital.get_current_tier(2000), "TIER_1_EFFICIENCY")
+
+    def test_recommendations_below_first_tier_are_empty(self):
+        self.assertEqual(self.capital.recommend_purchases(1999.99), [])
+
+    def test_recommendations_at_each_threshold_use_that_tier(self):
+        for threshold, tier in THRESHOLDS:
+            recs = self.capital.recommend_purchases(threshold)
+            self.assertEqual({r["tier"] for r in recs}, {tier})
+            self.assertEqual(len(recs), len(self.capital.tiers[tier]["items"]))
+            self.assertEqual([r["priority"] for r in recs], sorted(r["priority"] for r in recs))
+            self.assertFalse(any(r["queued"] for r in recs))
+
+    def test_item_status_batches_owned_and_queued(self):
+        items = {r["name"]: r for r in self.capital.recommend_purchases(5000)}
+        laundry, vacuum, fridge = ("Samsung Bespoke AI Laundry Combo", "Samsung Jet Bot AI+ (Vacuum/Mop)",
+                                   "Samsung Bespoke 4-Door Refrigerator (AI Vision)")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.capital.add_to_queue(items[laundry])
+            self.capital.add_to_queue(items[laundry])       # Duplicate queue rows count once
+            self.capital.add_to_queue(items[vacuum])
+            self.capital.mark_purchased(vacuum)
+
+        conn = sqlite3.connect(self.tmp / "purchases.db")
+        status = self.capital._item_status(conn.cursor(), [laundry, vacuum, fridge, "Unknown Item"])
+        self.assertEqual(status, {laundry: (False, True), vacuum: (True, False), fridge: (False, False),
+                                  "Unknown Item": (False, False)})
+        self.assertEqual(self.capital._item_status(conn.cursor(), []), {})
+
+        recs = self.capital.recommend_purchases(5000, cursor=conn.cursor())
+        conn.close()
+        self.assertEqual([(r["name"], r["queued"]) for r in recs], [(laundry, True), (fridge, False)])
+        self.assertEqual(recs, self.capital.recommend_purchases(5000))
+
+    def test_recommendations_default_to_ledger_revenue(self):
+        conn = sqlite3.connect(self.tmp / "ledger.db")
+        conn.execute("CREATE TABLE transactions (id INTEGER PRIMARY KEY, type TEXT, amount REAL)")
+        conn.executemany("INSERT INTO transactions (type, amount) VALUES (?, ?)",
+                         [("REVENUE", 6000.0), ("REVENUE", 4000.0), ("EXPENSE", -9000.0)])
+        conn.commit()
+        conn.close()
+        self.assertEqual(self.capital.get_total_revenue(), 10000.0)
+        self.assertEqual({r["tier"] for r in self.capital.recommend_purchases()}, {"TIER_3_FORTRESS"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import random
+import shutil
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.chunk_store import ChunkStore, chunk_boundaries, MAX_CHUNK
+
+class TestChunkStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        rng = random.Random(1)
+        self.data = bytes(rng.getrandbits(8) for _ in range(300_000))
+
+    def test_insert_only_changes_nearby_chunks(self):
+        """Content-defined cut points resynchronise after an edit."""
+        cuts = chunk_boundaries(self.data)
+        self.assertEqual(cuts[-1], len(self.data))
+        self.assertTrue(all(b - a <= MAX_CHUNK for a, b in zip([0] + cuts, cuts)))
+
+        def chunks(data):
+            c = chunk_boundaries(data)
+            return {data[a:b] for a, b in zip([0] + c, c)}
+        edited = self.data[:150_000] + b"inserted" + self.data[150_000:]
+        self.assertLessEqual(len(chunks(edited) - chunks(self.data)), 2)
+
+    def test_snapshot_restore_gc(self):
+        src = self.tmp / "Brain"
+        src.mkdir()
+        (src / "big.bin").write_bytes(self.data)
+        (src / "small.txt").write_text("hello")
+        store = ChunkStore(self.tmp / "store")
+
+        first = store.snapshot("snapshot_1", [src])
+        (src / "small.txt").write_text("hello again")
+        second = store.snapshot("snapshot_2", [src], previous=first)
+        self.assertEqual(second["stats"]["reused"], 1)
+        self.assertTrue(store.verify("snapshot_2")["verified"])
+
+        result = store.restore("snapshot_1", self.tmp / "out")
+        self.assertEqual(result["written"], 2)
+        self.assertEqual((self.tmp / "out" / "Brain" / "big.bin").read_bytes(), self.data)
+        self.assertEqual((self.tmp / "out" / "Brain" / "small.txt").read_text(), "hello")
+        self.assertEqual(store.restore("snapshot_1", self.tmp / "out")["skipped"], 2)
+
+        store.delete_snapshot("snapshot_1")
+        self.assertEqual(store.gc()["removed_chunks"], 1)  # Only the old small.txt chunk
+        self.assertTrue(store.verify("snapshot_2")["verified"])
+
+if __name__ == '__main__':
+    unittest.main()
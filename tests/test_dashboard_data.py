@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.dashboard_data import DashboardData
+
+class TestDashboardData(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.ledger = self.tmp / "ledger.db"
+        self.data = DashboardData(self.tmp, self.ledger)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, payload):
+        path = self.tmp / f"{name}.done"
+        path.write_text(json.dumps(payload))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))   # Distinct mtime on coarse clocks
+
+    def test_sentinel_is_reparsed_only_after_a_change(self):
+        self.assertIsNone(self.data.sentinel("scout"))
+        self.write("scout", {"status": "GREEN"})
+        self.assertEqual(self.data.sentinel("scout")["status"], "GREEN")
+        read = self.data.stats["bytes_read"]
+        for _ in range(5):
+            self.data.sentinel("scout")
+        self.assertEqual(self.data.stats["bytes_read"], read)
+
+        self.write("scout", {"status": "RED"})
+        self.assertEqual(self.data.sentinel("scout")["status"], "RED")
+        self.assertEqual(self.data.stats["parsed"], 2)
+
+        (self.tmp / "scout.done").write_text('{"status": "GRE')   # Mid-write
+        self.assertEqual(self.data.sentinel("scout")["status"], "RED")
+        (self.tmp / "scout.done").unlink()
+        self.assertIsNone(self.data.sentinel("scout"))
+
+    def test_revenue_history_follows_the_ledger(self):
+        self.assertEqual(self.data.revenue_history(), [])
+        self.assertFalse(self.ledger.exists())
+
+        conn = sqlite3.connect(self.ledger)
+        conn.execute("CREATE TABLE transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT NOT NULL, "
+                     "type TEXT NOT NULL, action TEXT, amount REAL NOT NULL, asset TEXT, timestamp TEXT NOT NULL, notes TEXT)")
+        rows = [("a", "REVENUE", 10.0, "2026-01-01T09:00:00"), ("b", "REVENUE", 5.0, "2026-01-01T18:00:00"),
+                ("c", "EXPENSE", 3.0, "2026-01-02T09:00:00"), ("d", "REVENUE", 7.0, "2026-01-03T09:00:00")]
+        conn.executemany("INSERT INTO transactions (source, type, amount, timestamp) VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+        self.assertEqual(self.data.revenue_history(), [("2026-01-01", 15.0), ("2026-01-03", 7.0)])
+        self.data.revenue_history()
+        self.assertEqual(self.data.stats["queries"], 1)
+
+        conn.execute("INSERT INTO transactions (source, type, amount, timestamp) VALUES ('e', 'REVENUE', 1.0, '2026-01-04T09:00:00')")
+        conn.commit()
+        conn.close()
+        self.assertEqual(self.data.revenue_history()[-1], ("2026-01-04", 1.0))
+        self.assertEqual(self.data.stats["queries"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import io
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import tempfile
+import contextlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.director_briefing import DirectorBriefing
+from System.Core.ledger_snapshot import LedgerSnapshot
+
+class LedgerCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.ledger_db = self.tmp / "ledger.db"
+        self.conn = sqlite3.connect(self.ledger_db)
+        self.conn.execute("""
+            CREATE TABLE transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT NOT NULL, type TEXT NOT NULL,
+                action TEXT, amount REAL NOT NULL, asset TEXT, timestamp TEXT NOT NULL, notes TEXT
+            )
+        """)
+        self.now = datetime(2026, 3, 10, 12, 0, 0)
+
+    def tearDown(self):
+        self.conn.close()
+        LedgerSnapshot._instances.pop(str(self.ledger_db.resolve()), None)
+        shutil.rmtree(self.tmp)
+
+    def insert(self, amount, hours_ago=1.0, type_="REVENUE", source="Gumroad"):
+        ts = (self.now - timedelta(hours=hours_ago)).isoformat()
+        self.conn.execute("INSERT INTO transactions (source, type, action, amount, timestamp) VALUES (?, ?, ?, ?, ?)",
+                          (source, type_, "SALE", amount, ts))
+        self.conn.commit()
+
+class TestLedgerSnapshot(LedgerCase):
+    def test_refresh_reads_only_new_rows_and_ages_the_window(self):
+        self.insert(100.0, hours_ago=48)
+        self.insert(20.0, hours_ago=2)
+        self.insert(-5.0, hours_ago=1, type_="EXPENSE")
+        snapshot = LedgerSnapshot(self.ledger_db)
+        version = snapshot.refresh(self.now)
+        self.assertEqual(snapshot.total_revenue, 120.0)
+        self.assertEqual([a["amount"] for a in snapshot.recent_activity()], [-5.0, 20.0])
+        self.assertEqual(snapshot.refresh(self.now), version)
+
+        self.insert(7.5, hours_ago=0.5)
+        self.assertNotEqual(snapshot.refresh(self.now), version)
+        self.assertEqual(snapshot.total_revenue, 127.5)
+        self.assertEqual(len(snapshot.recent_activity()), 3)
+
+        # Three hours later the 2h-old sale leaves the 24h window; totals are unchanged
+        snapshot.refresh(self.now + timedelta(hours=22, minutes=30))
+        self.assertEqual([a["amount"] for a in snapshot.recent_activity()], [7.5, -5.0])
+        self.assertEqual(snapshot.total_revenue, 127.5)
+
+    def test_rebuilt_ledger_bootstraps_again(self):
+        for _ in range(3):
+            self.insert(10.0)
+        snapshot = LedgerSnapshot(self.ledger_db)
+        snapshot.refresh(self.now)
+        self.conn.execute("DELETE FROM transactions")
+        self.conn.execute("DELETE FROM sqlite_sequence")
+        self.conn.commit()
+        self.insert(4.0)
+        snapshot.refresh(self.now)
+        self.assertEqual(snapshot.total_revenue, 4.0)
+        self.assertEqual(len(snapshot.recent_activity()), 1)
+
+    def test_shared_returns_one_instance_per_file(self):
+        self.assertIs(LedgerSnapshot.shared(self.ledger_db), LedgerSnapshot.shared(self.tmp / "." / "ledger.db"))
+
+class TestDirectorBriefing(LedgerCase):
+    def setUp(self):
+        super().setUp()
+        self.now = datetime.now()
+        self.briefing = DirectorBriefing(ledger_db=self.ledger_db, logs_dir=self.tmp)
+
+    def test_pending_decisions_filter_and_cache(self):
+        self.assertEqual(self.briefing.get_pending_decisions(1999.99), [])
+        self.assertEqual(self.briefing.get_pending_decisions(2000), [])          # Tier 1 items are all < $500
+        names = [d["name"] for d in self.briefing.get_pending_decisions(10000)]
+        self.assertEqual(names, ["Ubiquiti Dream Machine SE + Cameras (4K)", "Starlink Mini (Backup Internet)"])
+
+        with mock.patch.object(self.briefing.capital, "recommend_purchases",
+                               wraps=self.briefing.capital.recommend_purchases) as recommend:
+            self.briefing.get_pending_decisions(12000)                        # Same tier, same purchases.db
+            recommend.assert_not_called()
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.briefing.capital.add_to_queue(self.briefing.get_pending_decisions(12000)[0])
+                self.briefing.capital.mark_purchased("Ubiquiti Dream Machine SE + Cameras (4K)")
+            names = [d["name"] for d in self.briefing.get_pending_decisions(12000)]
+            self.assertEqual(recommend.call_count, 1)
+        self.assertEqual(names, ["Starlink Mini (Backup Internet)"])
+
+    def test_pending_decisions_default_to_ledger_revenue(self):
+        self.insert(5000.0)
+        self.assertEqual([d["tier"] for d in self.briefing.get_pending_decisions()], ["TIER_2_CONVENIENCE"] * 3)
+
+    def test_alerts_keep_high_records_from_the_last_ten_lines(self):
+        with open(self.tmp / "anomalies.log", "w") as f:
+            for i in range(15):
+                f.write(json.dumps({"severity": "HIGH" if i % 2 == 0 else "LOW", "message": f"a{i}"}) + "\n")
+            f.write("not json\n")
+        self.assertEqual([a["message"] for a in self.briefing.get_intelligence_alerts()],
+                         ["a6", "a8", "a10", "a12", "a14"])
+
+    def test_briefing_and_rendered_text_cached_until_data_changes(self):
+        self.insert(2500.0)
+        with contextlib.redirect_stdout(io.StringIO()) as out, \
+             mock.patch.object(self.briefing, "render_briefing", wraps=self.briefing.render_briefing) as render:
+            first = self.briefing.print_briefing()
+            self.assertIs(self.briefing.print_briefing(), first)
+            self.assertEqual(render.call_count, 1)
+
+            self.insert(12.5, hours_ago=0.1)
+            second = self.briefing.print_briefing()
+            self.assertIsNot(second, first)
+            self.assertEqual(render.call_count, 2)
+        self.assertEqual(second["revenue"]["total"], 2512.5)
+        self.assertEqual(second["revenue"]["overnight"], 2512.5)
+        self.assertEqual(second["revenue"]["next_milestone"]["tier"], "TIER_2_CONVENIENCE")
+        self.assertEqual(out.getvalue().count("DAILY DIRECTOR BRIEFING"), 3)
+        saved = json.loads((self.tmp / "briefings" / f"briefing_{datetime.now():%Y%m%d}.json").read_text())
+        self.assertEqual(saved["revenue"]["total"], 2512.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Maintenance
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Maintenance import duplicate_finder
+from System.Maintenance.duplicate_finder import DuplicateFinder, SAMPLE_SIZE, INLINE_MAX
+
+class TestDuplicateFinder(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        big = os.urandom(INLINE_MAX + SAMPLE_SIZE)  # Large enough for the hash + stream path
+        middle = bytearray(big)
+        middle[len(big) // 2] ^= 1  # Same size, head and tail as big
+        self.files = {
+            "a.py": big, "b.py": os.urandom(100), "c.py": big,
+            "d.py": bytes(middle), "e.py": b"small", "f.py": b"small", "g.py": b"other",
+        }
+        self.paths = []
+        for name, data in self.files.items():
+            (self.tmp / name).write_bytes(data)
+            self.paths.append(self.tmp / name)
+
+    def test_finds_exact_duplicates_only(self):
+        finder = DuplicateFinder(self.tmp / "cache.json")
+        found = finder.find(self.paths)
+        self.assertEqual([(Path(d["original"]).name, Path(d["duplicate"]).name) for d in found],
+                         [("a.py", "c.py"), ("e.py", "f.py")])
+        # b.py has a unique size: never opened. Only a/c/d share size and head/tail.
+        self.assertEqual(finder.stats["sampled"], 6)
+        self.assertEqual(finder.stats["hashed"], 3)
+
+    def test_warm_cache_reads_only_for_confirmation(self):
+        DuplicateFinder(self.tmp / "cache.json").find(self.paths)
+        finder = DuplicateFinder(self.tmp / "cache.json", confirm=False)
+        self.assertEqual(len(finder.find(self.paths)), 2)
+        self.assertEqual(finder.stats["bytes_read"], 0)
+
+    def test_byte_compare_rejects_hash_collisions(self):
+        class Constant:
+            def update(self, data):
+                pass
+            def hexdigest(self):
+                return "0"
+        original = duplicate_finder._hasher
+        duplicate_finder._hasher = Constant
+        try:
+            found = DuplicateFinder().find(self.paths)
+        finally:
+            duplicate_finder._hasher = original
+        self.assertEqual(len(found), 2)
+
+if __name__ == '__main__':
+    unittest.main()
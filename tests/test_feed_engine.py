@@ -0,0 +1,68 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Intelligence
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Intelligence.feed_engine import (FeedEngine, FeedSource, SeenStore, ValidatorCache,
+                                             _start_stub_server)
+
+parse = lambda body: json.loads(body)["items"]
+key = lambda item: item["id"]
+
+class TestFeedEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.state = _start_stub_server(feeds=2, items=5, latency=0.0, churn=0)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def engine(self):
+        return FeedEngine(validators=ValidatorCache(self.tmp / "validators.json"),
+                          seen=SeenStore(self.tmp / "seen.json"))
+
+    def source(self, feed_id, parser=parse):
+        return FeedSource(f"stub-{feed_id}", f"{self.base}/{feed_id}", parser, key)
+
+    def test_engines_sharing_files_keep_each_others_state(self):
+        hydra, scanner = self.engine(), self.engine()    # Both loaded the (empty) files up front
+        hydra.fetch_all([self.source(0)])
+        scanner.fetch_all([self.source(1)])
+
+        validators = json.loads((self.tmp / "validators.json").read_text())
+        self.assertEqual(sorted(validators), ["stub-0", "stub-1"])
+        self.assertEqual(len(json.loads((self.tmp / "seen.json").read_text())), 10)
+
+        results = self.engine().fetch_all([self.source(0), self.source(1)])
+        self.assertTrue(all(r.not_modified for r in results.values()))
+        results = hydra.fetch_all([self.source(1)])       # Sees the scanner's validator after its save
+        self.assertTrue(results["stub-1"].not_modified)
+
+    def test_parse_failure_does_not_store_validator(self):
+        def broken(body):
+            raise ValueError("bad payload")
+
+        engine = self.engine()
+        result = engine.fetch_all([self.source(0, broken)])["stub-0"]
+        self.assertIn("bad payload", result.error)
+        self.assertNotIn("stub-0", engine.validators.data)
+
+        result = engine.fetch_all([self.source(0)])["stub-0"]
+        self.assertEqual((result.status, len(result.items)), (200, 5))
+
+if __name__ == '__main__':
+    unittest.main()
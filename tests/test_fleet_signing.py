@@ -0,0 +1,110 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Security
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Security.fleet_manifest import MerkleTree
+from System.Security.ml_dsa_signing import MLDSASigner, FLEET_MANIFEST, FLEET_PUBKEY_ENV
+
+class TestFleetSigning(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.agents = self.tmp / "Agents"
+        self.agents.mkdir()
+        for i in range(7):
+            (self.agents / f"agent_{i}.py").write_text(f"print({i})\n")
+        self.pinned = self.tmp / "Config" / "fleet.pub"
+        self.signer = self.open()
+
+    def open(self, signatures="signatures", pinned=None):
+        return MLDSASigner(self.tmp / signatures, self.agents, pinned or self.pinned)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_every_leaf_proves_into_root(self):
+        tree = MerkleTree({f"f{i}": f"{i:064x}" for i in range(7)})
+        for name in tree.names:
+            self.assertTrue(MerkleTree.verify_proof(name, f"{int(name[1:]):064x}", tree.proof(name), tree.root))
+        self.assertFalse(MerkleTree.verify_proof("f3", "0" * 64, tree.proof("f3"), tree.root))
+
+    def test_tamper_detected(self):
+        self.signer.sign_fleet()
+        self.assertTrue(self.signer.verify_fleet()["verified"])
+        target = self.agents / "agent_3.py"
+        proof = self.signer.inclusion_proof(target)
+        self.assertTrue(self.signer.verify_inclusion(target, proof))
+
+        target.write_text("print('evil')\n")
+        result = self.open().verify_fleet()
+        self.assertFalse(result["verified"])
+        self.assertEqual(result["tampered"], ["agent_3.py"])
+        self.assertFalse(self.signer.verify_inclusion(target, proof))
+
+    def test_proof_for_another_agent_rejected(self):
+        self.signer.sign_fleet()
+        target, other = self.agents / "agent_1.py", self.agents / "agent_4.py"
+        other_proof = self.signer.inclusion_proof(other)
+        target.write_bytes(other.read_bytes())          # Signed content of agent_4 under agent_1's name
+        self.assertFalse(self.signer.verify_inclusion(target, other_proof))
+        self.assertTrue(self.signer.verify_inclusion(other, other_proof))
+
+    def test_forged_manifest_rejected(self):
+        self.signer.sign_fleet()
+        manifest_file = self.tmp / "signatures" / FLEET_MANIFEST
+        manifest = json.loads(manifest_file.read_text())
+        (self.agents / "agent_0.py").write_text("print('evil')\n")
+        manifest["leaves"]["agent_0.py"][2] = "0" * 64
+        manifest_file.write_text(json.dumps(manifest))
+        self.assertFalse(self.open().verify_fleet()["root_signature"])
+
+    def test_resign_rehashes_only_changed(self):
+        self.assertEqual(self.signer.sign_fleet()["rehashed"], 7)
+        (self.agents / "agent_5.py").write_text("print('v2')\n")
+        stats = self.open().sign_fleet()
+        self.assertEqual(stats["rehashed"], 1)
+        self.assertTrue(self.open().verify_fleet()["verified"])
+
+    def test_verify_without_pinned_key_fails_closed(self):
+        self.signer.sign_fleet()
+        self.pinned.unlink()
+        signer = self.open()
+        self.assertFalse(signer.verify_fleet()["root_signature"])
+        self.assertFalse(signer.verify_agent(self.agents / "agent_1.py"))
+        self.assertFalse(self.pinned.exists())
+
+        fresh = self.open("fresh_signatures", self.tmp / "none.pub")
+        self.assertFalse(fresh.verify_fleet()["verified"])
+        self.assertEqual(list((self.tmp / "fresh_signatures").iterdir()), [])
+
+    def test_manifest_signed_with_replaced_keys_rejected(self):
+        self.signer.sign_fleet()
+        # Attacker swaps in their own key pair and re-signs a tampered fleet
+        (self.agents / "agent_2.py").write_text("print('evil')\n")
+        self.open("attacker", self.tmp / "attacker.pub").sign_fleet()
+        for f in (self.tmp / "attacker").iterdir():
+            shutil.copy(f, self.tmp / "signatures" / f.name)
+        self.assertFalse(self.open().verify_fleet()["root_signature"])
+        with self.assertRaises(RuntimeError):
+            self.open().sign_fleet()
+
+    def test_pinned_key_from_environment(self):
+        self.signer.sign_fleet()
+        public = self.pinned.read_bytes()
+        self.pinned.unlink()
+        os.environ[FLEET_PUBKEY_ENV] = public.hex()
+        try:
+            self.assertTrue(self.open().verify_fleet()["verified"])
+            os.environ[FLEET_PUBKEY_ENV] = "00" * len(public)
+            self.assertFalse(self.open().verify_fleet()["root_signature"])
+        finally:
+            del os.environ[FLEET_PUBKEY_ENV]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import contextlib
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path so we can import Brain
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from Brain import hydra
+from Brain.head_scheduler import HeadScheduler, HeadSpec, AuditorQueue
+from Brain.revenue_ledger import RevenueLedger
+
+class FakeTime:
+    """Injected scheduler clock: waiting lets running heads finish, then jumps the clock ahead"""
+    def __init__(self):
+        self.now = 0.0
+        self.scheduler = None
+
+    def __call__(self):
+        return self.now
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + 5
+        while self.scheduler._active and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.now += timeout
+        return False
+
+    def set(self):
+        pass
+
+    def clear(self):
+        pass
+
+class TestHeadScheduler(unittest.TestCase):
+    def test_heads_run_in_deadline_order(self):
+        clock = FakeTime()
+        runs = []
+        lock = threading.Lock()
+
+        def head(name):
+            def fn():
+                with lock:
+                    runs.append((round(clock(), 6), name))
+            return fn
+
+        scheduler = HeadScheduler([HeadSpec("fast", head("fast"), 0.125), HeadSpec("slow", head("slow"), 0.5)],
+                                  clock=clock)
+        clock.scheduler = scheduler
+        scheduler._wake = clock
+        report = scheduler.run(duration=1.0)   # Binary-exact intervals: no float drift at the edge
+        self.assertEqual(sorted(name for t, name in runs if t == 0), ["fast", "slow"])   # Both due at start
+        self.assertEqual([t for t, name in runs if name == "fast"], [0.125 * i for i in range(8)])
+        self.assertEqual([t for t, name in runs if name == "slow"], [0.0, 0.5])
+        self.assertEqual([t for t, _ in runs], sorted(t for t, _ in runs))
+        self.assertEqual(report["cycles"], 2)
+
+    def test_missed_slots_are_skipped_not_burst(self):
+        now = [100.0]
+        scheduler = HeadScheduler([HeadSpec("a", lambda: None, 10)], clock=lambda: now[0])
+        deadline = scheduler._next_deadline(scheduler.heads["a"], 50.0)
+        self.assertEqual(deadline, 110.0)
+        scheduler.pool.shutdown()
+
+class TestAuditorShutdown(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_close_signs_off_queued_entries(self):
+        acked = []
+        auditor = AuditorQueue(lambda entry: entry["amount"] > 0, review_time=0.02)
+        for amount in (60, -1, 70, 80):
+            auditor.submit({"amount": amount}, acked.append)
+        self.assertGreater(auditor.pending, 0)
+        auditor.close()
+        self.assertEqual([e["amount"] for e in acked], [60, 70, 80])
+        self.assertEqual((auditor.pending, auditor.rejected), (0, 1))
+
+    def test_closed_queue_refuses_entries(self):
+        auditor = AuditorQueue(lambda entry: True)
+        auditor.close()
+        self.assertTrue(auditor.closed)
+        with self.assertRaises(RuntimeError):
+            auditor.submit({"amount": 1}, lambda entry: None)
+        self.assertTrue(auditor.drain(timeout=1))
+
+    def test_hunt_after_shutdown_reopens_the_auditor(self):
+        with mock.patch.object(hydra, "REVENUE_DIR", str(self.tmp / "Revenue")), \
+             mock.patch.object(hydra, "REVENUE_LOG", str(self.tmp / "revenue.json")), \
+             contextlib.redirect_stdout(io.StringIO()):
+            engine = hydra.HydraEngine(time_scale=0.001)
+            engine.shutdown()
+            closed = engine.auditor
+
+            def capture(**kwargs):
+                engine.log_revenue("IP_ARBITRAGE", 500.0)
+                return {"cycles": 1}
+
+            result = {}
+            thread = threading.Thread(target=lambda: result.update(report=engine.hunt(cycles=1)), daemon=True)
+            with mock.patch.object(HeadScheduler, "run", side_effect=capture):
+                thread.start()
+                thread.join(10)
+            self.assertFalse(thread.is_alive(), "hunt blocked on a closed Auditor")
+            self.assertIsNot(engine.auditor, closed)
+            self.assertEqual(engine.daily_revenue, 500.0)
+            engine.shutdown()
+            engine.ledger.close()
+
+    def test_interrupted_hunt_commits_pending_revenue(self):
+        with mock.patch.object(hydra, "REVENUE_DIR", str(self.tmp / "Revenue")), \
+             mock.patch.object(hydra, "REVENUE_LOG", str(self.tmp / "revenue.json")), \
+             mock.patch.object(hydra, "AUDITOR_REVIEW_TIME", 0.05), \
+             contextlib.redirect_stdout(io.StringIO()):
+            engine = hydra.HydraEngine()
+
+            def interrupted_run(**kwargs):
+                for _ in range(3):
+                    engine.log_revenue("IP_ARBITRAGE", 500.0)   # Above the Auditor threshold
+                raise KeyboardInterrupt
+
+            with mock.patch.object(HeadScheduler, "run", side_effect=interrupted_run):
+                engine.hunt(cycles=None)
+        self.assertEqual(engine.auditor.pending, 0)
+        self.assertEqual(engine.daily_revenue, 1500.0)
+        engine.ledger.close()
+        self.assertEqual(RevenueLedger(root=self.tmp / "Revenue", legacy_file=self.tmp / "none.json").total(), 1500.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add parent directory to path so we can import System.Maintenance
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.resource_sampler import ResourceSampler
+from System.Maintenance import hygiene_engine
+
+class TestSystemHealth(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.dict(os.environ, {"TEMP": tempfile.gettempdir()}):
+            self.engine = hygiene_engine.HygieneEngine()
+        self.sampler = ResourceSampler(interval=3600)
+        self.addCleanup(self.sampler.stop)
+
+    def health(self):
+        with mock.patch.object(ResourceSampler, "shared", return_value=self.sampler), \
+             mock.patch.object(hygiene_engine, "CPU_MEASURE_SECONDS", 0.01):
+            return self.engine.get_system_health()
+
+    def test_one_shot_run_measures_current_cpu(self):
+        self.sampler.start()                         # Priming sample only: CPU averaged since boot
+        with mock.patch("psutil.cpu_percent", return_value=91.0) as cpu_percent:
+            health = self.health()
+        cpu_percent.assert_called_with(interval=0.01)
+        self.assertEqual((health["cpu_usage"], health["status"], health["samples"]), (91.0, "STRAINED", 2))
+        self.assertFalse(health["cpu_boot_average"])
+
+    def test_running_sampler_is_not_blocked_on(self):
+        self.sampler.record(cpu=10.0, ram=20.0, disk=30.0)
+        self.sampler.record(cpu=30.0, ram=25.0, disk=30.0)
+        with mock.patch.object(self.sampler, "measure_cpu") as measure:
+            health = self.health()
+        measure.assert_not_called()
+        self.assertEqual((health["cpu_usage"], health["ram_usage"], health["status"]), (20.0, 25.0, "HEALTHY"))
+
+if __name__ == '__main__':
+    unittest.main()
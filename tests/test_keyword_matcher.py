@@ -0,0 +1,54 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path so we can import System.Intelligence
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import System.Intelligence.keyword_matcher as keyword_matcher
+from System.Intelligence.keyword_matcher import KeywordMatcher
+from System.Intelligence.signal_classifier import SignalClassifier
+
+def naive_count(categories, text):
+    text = text.lower()
+    counts = {}
+    for category, keywords in categories.items():
+        n = sum(
+            sum(1 for i in range(len(text)) if text.startswith(kw, i))
+            for kw in set(kw.lower() for kw in keywords)
+        )
+        if n:
+            counts[category] = n
+    return counts
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_matches_naive_substring_counts(self):
+        """Automaton and small-set paths both agree with brute-force substring counting."""
+        rng = random.Random(42)
+        original = keyword_matcher.SMALL_SET
+        try:
+            for small_set in (0, 1000):
+                keyword_matcher.SMALL_SET = small_set
+                for _ in range(200):
+                    cats = {c: ["".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+                            for c in ("OPPORTUNITY", "THREAT", "TREND")}
+                    text = "".join(rng.choices("abcdAB ", k=40))
+                    self.assertEqual(KeywordMatcher(cats).count(text), naive_count(cats, text))
+        finally:
+            keyword_matcher.SMALL_SET = original
+
+    def test_classifier_precedence_and_counts(self):
+        """Opportunity still wins over threat, and every category's hits are reported."""
+        classifier = SignalClassifier(keywords_file=None)
+        result = classifier.classify({"content": "Tax loophole faces crackdown and audit"})
+        self.assertEqual(result["type"], "OPPORTUNITY")
+        self.assertEqual(result["matches"], {"OPPORTUNITY": 1, "THREAT": 2})
+
+    def test_reload_keywords(self):
+        classifier = SignalClassifier(keywords_file=None)
+        classifier.reload_keywords({"TREND": ["quantum"]})
+        self.assertEqual(classifier.classify({"content": "Quantum everything"})["type"], "TREND")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import json
+import random
+import shutil
+import tempfile
+import sys
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.log_reader import tail, reverse_lines, LogCursor, TimeIndex
+
+class TestLogReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.log = self.tmp / "events.jsonl"
+
+    def test_tail_matches_readlines(self):
+        """Block boundaries never split or drop lines."""
+        rng = random.Random(3)
+        lines = ["x" * rng.randint(0, 300) + str(i) for i in range(500)]
+        self.log.write_text("\n".join(lines) + "\n")
+        self.assertEqual(list(reverse_lines(self.log, block_size=64)), lines[::-1])
+        for n in (1, 10, 499, 600):
+            self.assertEqual(tail(self.log, n), self.log.read_text().splitlines()[-n:])
+
+    def test_cursor_reads_only_appends(self):
+        cursor = LogCursor(self.log, "test", checkpoint=self.tmp / "c.json")
+        self.log.write_text("a\nb\npartial")
+        self.assertEqual(cursor.read_new(), ["a", "b"])
+        cursor.commit()
+
+        with open(self.log, "a") as f:
+            f.write("-done\nc\n")
+        cursor = LogCursor(self.log, "test", checkpoint=self.tmp / "c.json")
+        self.assertEqual(cursor.read_new(), ["partial-done", "c"])
+        cursor.commit()
+
+        self.log.write_text("new\n")  # Truncated and rewritten
+        self.assertEqual(LogCursor(self.log, "test", checkpoint=self.tmp / "c.json").read_new(), ["new"])
+
+    def test_window_matches_full_scan(self):
+        start = datetime(2026, 1, 1)
+        with open(self.log, "w") as f:
+            for i in range(5000):
+                f.write(json.dumps({"timestamp": (start + timedelta(minutes=i)).isoformat(), "i": i}) + "\n")
+        index = TimeIndex(self.log, stride=4096, index_file=self.tmp / "idx.json")
+        cutoff = start + timedelta(minutes=4321)
+        got = [r["i"] for r in index.window_records(cutoff)]
+        self.assertEqual(got, list(range(4322, 5000)))
+        end = start + timedelta(minutes=4400)
+        self.assertEqual([r["i"] for r in index.window_records(cutoff, end)], list(range(4322, 4401)))
+
+if __name__ == '__main__':
+    unittest.main()
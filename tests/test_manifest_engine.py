@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.manifest_engine import ManifestEngine, StatCache, hash_file, MMAP_THRESHOLD
+
+class TestManifestEngine(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.tree = self.tmp / "tree"
+        for d in ("a/x", "a/y", "b"):
+            for i in range(3):
+                p = self.tree / d / f"f{i}.txt"
+                p.parent.mkdir(parents=True, exist_ok=True)
+                p.write_text(f"{d} {i}\n")
+        self.engine = ManifestEngine(StatCache(self.tmp / "cache.json"))
+
+    def test_hash_file_mmap_and_buffered_agree(self):
+        import hashlib
+        big = self.tmp / "big.bin"
+        data = os.urandom(MMAP_THRESHOLD + 123)
+        big.write_bytes(data)
+        self.assertEqual(hash_file(big), hashlib.sha256(data).hexdigest())
+
+    def test_unchanged_files_are_not_rehashed(self):
+        first = self.engine.build(self.tree)
+        self.engine.cache.save()
+        engine = ManifestEngine(StatCache(self.tmp / "cache.json"))
+        second = engine.build(self.tree)
+        self.assertEqual(engine.last_stats["hashed"], 0)
+        self.assertEqual(first["root"], second["root"])
+
+    def test_diff_skips_unchanged_subtrees(self):
+        old = self.engine.build(self.tree)
+        (self.tree / "a/x/f1.txt").write_text("edited\n")
+        (self.tree / "b/f0.txt").unlink()
+        (self.tree / "a/y/new.txt").write_text("new\n")
+        new = self.engine.build(self.tree)
+        self.assertNotEqual(old["root"], new["root"])
+        self.assertNotEqual(old["dirs"]["tree/a/x"], new["dirs"]["tree/a/x"])
+
+        diff = ManifestEngine.diff(old, new)
+        self.assertEqual(diff["changed"], ["tree/a/x/f1.txt"])
+        self.assertEqual(diff["removed"], ["tree/b/f0.txt"])
+        self.assertEqual(diff["added"], ["tree/a/y/new.txt"])
+
+        (self.tree / "a/y/new.txt").unlink()
+        (self.tree / "b/f0.txt").write_text("b 0\n")
+        diff = ManifestEngine.diff(old, self.engine.build(self.tree))
+        # Only the path down to a/x is opened; b and a/y are back to their old roots
+        self.assertEqual(diff["changed"], ["tree/a/x/f1.txt"])
+        self.assertEqual(diff["dirs_visited"], 4)
+
+    def test_deep_verify_catches_silent_corruption(self):
+        manifest = self.engine.build(self.tree)
+        target = self.tree / "b/f2.txt"
+        st = target.stat()
+        target.write_text("b X\n")  # Same size...
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))  # ...and mtime
+        self.assertTrue(self.engine.verify(manifest, self.tree)["verified"])
+        deep = self.engine.verify(manifest, self.tree, deep=True)
+        self.assertFalse(deep["verified"])
+        self.assertEqual(deep["corrupted"], ["tree/b/f2.txt"])
+
+if __name__ == '__main__':
+    unittest.main()
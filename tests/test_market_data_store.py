@@ -0,0 +1,106 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.market_data_store import MarketDataStore, ReplayFeed
+
+class TestMarketDataStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.store = MarketDataStore(root=self.tmp, default_ttl=60.0)
+        self.now = 1000.0
+        self.store.now = lambda: self.now          # Live mode with a controllable clock
+        self.fetches = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def fetcher(self, symbols):
+        self.fetches.append(list(symbols))
+        return {s: {"price": 100.0 + len(self.fetches), "volume": 5.0} for s in symbols}
+
+    def test_latest_does_not_create_partitions(self):
+        self.assertIsNone(self.store.latest("NOPE-USD"))
+        self.assertEqual(list(self.tmp.iterdir()), [])
+        self.assertEqual(self.store.symbols(), [])
+
+    def test_append_keeps_timestamps_sorted(self):
+        part = self.store.partition("BTC-USD")
+        self.assertEqual(part.append([{"ts": 3.0, "price": 3}, {"ts": 1.0, "price": 1}, {"ts": 2.0, "price": 2}]), 3)
+        self.assertEqual(part.append([{"ts": 0.5, "price": 0}, {"ts": 4.0, "price": 4}]), 1)
+        self.assertEqual(list(part.column("ts")), [1.0, 2.0, 3.0, 4.0])
+        window = part.read(2.0, 3.0)
+        self.assertEqual(list(window["price"]), [2.0, 3.0])
+        self.assertEqual(part.last(2.5)["price"], 2.0)
+
+    def test_stale_tick_does_not_replace_newer_quote(self):
+        self.store.record_tick("ETH-USD", 200.0, ts=10.0)
+        self.store.record_tick("ETH-USD", 150.0, ts=5.0)
+        self.assertEqual(self.store.latest("ETH-USD")["price"], 200.0)
+        self.assertEqual(len(self.store.partition("ETH-USD")), 1)
+
+    def test_get_quotes_fetches_only_expired_symbols(self):
+        first = self.store.get_quotes(["BTC-USD", "ETH-USD"], self.fetcher)
+        self.assertEqual(self.fetches, [["BTC-USD", "ETH-USD"]])
+        self.assertEqual(first["BTC-USD"]["price"], 101.0)
+
+        self.now += 30                              # Inside the TTL: served from the store
+        self.store.get_quotes(["BTC-USD", "ETH-USD"], self.fetcher)
+        self.assertEqual(len(self.fetches), 1)
+
+        self.store.record_tick("ETH-USD", 250.0, ts=self.now)
+        self.now += 45                              # BTC is 75s old, ETH only 45s
+        quotes = self.store.get_quotes(["BTC-USD", "ETH-USD"], self.fetcher)
+        self.assertEqual(self.fetches[-1], ["BTC-USD"])
+        self.assertEqual((quotes["BTC-USD"]["price"], quotes["ETH-USD"]["price"]), (102.0, 250.0))
+        self.assertEqual(self.store.stats["fetches"], 2)
+
+    def test_failed_fetch_serves_stale_quote(self):
+        self.store.get_quotes(["BTC-USD"], self.fetcher)
+        self.now += 600
+
+        def broken(symbols):
+            raise ConnectionError("down")
+
+        self.assertEqual(self.store.get_quotes(["BTC-USD"], broken)["BTC-USD"]["price"], 101.0)
+        self.assertEqual(self.store.get_quotes(["SOL-USD"], broken), {})
+
+    def test_replay_merges_symbols_and_pins_the_clock(self):
+        store = MarketDataStore(root=self.tmp)
+        for ts in (1.0, 3.0, 5.0):
+            store.record_tick("BTC-USD", 100.0 + ts, ts=ts)
+        for ts in (2.0, 4.0):
+            store.record_tick("ETH-USD", 10.0 + ts, ts=ts)
+        store = MarketDataStore(root=self.tmp)     # Fresh process: no in-memory quotes
+
+        def never(symbols):
+            raise AssertionError("replay must not fetch")
+
+        seen = []
+        for symbol, row in ReplayFeed(store, speed=0):
+            quotes = store.get_quotes(["BTC-USD", "ETH-USD"], never)
+            seen.append((symbol, row["ts"], {s: q["ts"] for s, q in quotes.items()}))
+        self.assertEqual([(s, ts) for s, ts, _ in seen],
+                         [("BTC-USD", 1.0), ("ETH-USD", 2.0), ("BTC-USD", 3.0), ("ETH-USD", 4.0), ("BTC-USD", 5.0)])
+        self.assertEqual(seen[0][2], {"BTC-USD": 1.0})
+        self.assertEqual(seen[3][2], {"BTC-USD": 3.0, "ETH-USD": 4.0})
+        self.assertFalse(store.replaying)
+
+    def test_replay_paces_by_speed(self):
+        for ts in (0.0, 10.0, 30.0):
+            self.store.record_tick("BTC-USD", 1.0, ts=ts)
+        sleeps = []
+        list(ReplayFeed(self.store, ["BTC-USD"], speed=10.0, sleep=sleeps.append))
+        # The fake sleep takes no wall time, so each lag is the row's due offset
+        self.assertEqual(len(sleeps), 2)
+        self.assertAlmostEqual(sleeps[0], 1.0, delta=0.1)
+        self.assertAlmostEqual(sleeps[1], 3.0, delta=0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Security
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from cryptography.exceptions import InvalidTag
+from System.Security.pqc_vault import PQCVault
+
+class TestPQCVaultStreaming(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.vault = PQCVault(self.tmp / "vault")
+        self.data = os.urandom(10 * 4096 + 123)
+        self.plain = self.tmp / "notes.bin"
+        self.plain.write_bytes(self.data)
+        self.enc = self.vault.encrypt_file(self.plain, chunk_size=4096)
+
+    def test_round_trip_and_random_access(self):
+        out = self.vault.decrypt_file(self.enc, self.tmp / "out.bin")
+        self.assertEqual(out.read_bytes(), self.data)
+        self.assertEqual(self.vault.chunk_count(self.enc), 11)
+        self.assertEqual(self.vault.decrypt_chunk(self.enc, 10), self.data[40960:])
+        self.assertEqual(self.vault.read_range(self.enc, 4000, 5000), self.data[4000:9000])
+
+    def test_tampering_and_truncation_are_detected(self):
+        raw = bytearray(self.enc.read_bytes())
+        raw[-50] ^= 1
+        tampered = self.tmp / "tampered.enc"
+        tampered.write_bytes(bytes(raw))
+        with self.assertRaises(InvalidTag):
+            self.vault.decrypt_file(tampered, self.tmp / "t.bin")
+        self.assertFalse((self.tmp / "t.bin").exists())  # No partial plaintext left behind
+
+        # Dropping the final chunk leaves a valid-looking prefix whose last chunk is not flagged final
+        truncated = self.tmp / "truncated.enc"
+        truncated.write_bytes(self.enc.read_bytes()[:-(123 + 16)])
+        with self.assertRaises(InvalidTag):
+            self.vault.decrypt_file(truncated, self.tmp / "t.bin")
+
+    def test_legacy_files_still_decrypt(self):
+        legacy = self.vault.encrypt_file_v1(self.plain, self.tmp / "legacy.enc")
+        self.assertEqual(self.vault.decrypt_file(legacy, self.tmp / "l.bin").read_bytes(), self.data)
+
+if __name__ == '__main__':
+    unittest.main()
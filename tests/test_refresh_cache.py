@@ -0,0 +1,89 @@
+import unittest
+import os
+import sys
+import json
+import time
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.refresh_cache import RefreshCache
+
+class StubUpstream(BaseHTTPRequestHandler):
+    latency = 0.2
+    hits = 0
+    failing = False
+
+    def do_GET(self):
+        time.sleep(StubUpstream.latency)
+        StubUpstream.hits += 1
+        if StubUpstream.failing:
+            self.send_error(503)
+            return
+        body = json.dumps({"hit": StubUpstream.hits}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestRefreshCache(unittest.TestCase):
+    def setUp(self):
+        StubUpstream.hits, StubUpstream.failing = 0, False
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubUpstream)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self.load = lambda: json.loads(urllib.request.urlopen(url, timeout=5).read())
+        self.cache = RefreshCache()
+
+    def tearDown(self):
+        self.cache.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fresh_reads_skip_upstream(self):
+        self.cache.register("api", self.load, ttl=30)
+        self.assertEqual(self.cache.get("api"), {"hit": 1})
+        start = time.perf_counter()
+        for _ in range(100):
+            value, meta = self.cache.entry("api")
+        self.assertLess(time.perf_counter() - start, StubUpstream.latency)
+        self.assertEqual(StubUpstream.hits, 1)
+        self.assertEqual((meta["state"], meta["version"]), ("fresh", 1))
+
+    def test_stale_while_revalidate(self):
+        self.cache.register("api", self.load, ttl=0.05, max_stale=30)
+        self.cache.get("api")
+        time.sleep(0.1)
+        start = time.perf_counter()
+        value, meta = self.cache.entry("api")
+        self.assertLess(time.perf_counter() - start, StubUpstream.latency)
+        self.assertEqual((value, meta["state"]), ({"hit": 1}, "stale"))
+        time.sleep(StubUpstream.latency * 2)
+        self.assertEqual(self.cache.freshness("api")["api"]["version"], 2)
+        self.assertEqual(StubUpstream.hits, 2)
+
+    def test_failed_reload_keeps_last_good(self):
+        self.cache.register("api", self.load, ttl=0.01)
+        self.cache.get("api")
+        StubUpstream.failing = True
+        self.assertFalse(self.cache.refresh("api"))
+        value, meta = self.cache.entry("api", block=False)
+        self.assertEqual(value, {"hit": 1})
+        self.assertIn("HTTPError", meta["error"])
+
+    def test_background_refresh_and_nonblocking_default(self):
+        self.cache.register("api", self.load, ttl=0.3, default={"hit": 0})
+        self.assertEqual(self.cache.get("api", block=False), {"hit": 0})
+        self.cache.start()
+        time.sleep(1.2)
+        self.assertGreaterEqual(StubUpstream.hits, 3)
+        self.assertEqual(self.cache.entry("api", block=False)[1]["state"], "fresh")
+
+if __name__ == '__main__':
+    unittest.main()
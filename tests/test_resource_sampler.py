@@ -0,0 +1,53 @@
+import unittest
+import os
+import sys
+import time
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.resource_sampler import ResourceSampler, percentile
+
+class TestResourceSampler(unittest.TestCase):
+    def test_windowed_stats(self):
+        sampler = ResourceSampler(capacity=50)
+        for i in range(100):
+            sampler.record(timestamp=1000.0 + i, cpu=float(i), ram=50.0)
+        self.assertEqual(len(sampler.samples), 50)  # Ring buffer keeps the newest
+        stats = sampler.stats(seconds=9)
+        self.assertEqual(stats["samples"], 10)
+        self.assertEqual(stats["cpu"]["avg"], 94.5)
+        self.assertEqual(stats["cpu"]["max"], 99.0)
+        self.assertEqual(stats["cpu"]["last"], 99.0)
+        self.assertIsNone(stats["disk"])
+        self.assertEqual(percentile([5, 1, 3, 2, 4], 50), 3)
+
+    def test_background_thread_collects(self):
+        sampler = ResourceSampler(interval=0.01)
+        sampler.start()
+        self.assertEqual(len(sampler.samples), 1)  # Primed synchronously
+        time.sleep(0.2)
+        sampler.stop()
+        self.assertGreater(len(sampler.samples), 3)
+        latest = sampler.latest()
+        self.assertTrue(0 <= latest["cpu"] <= 100)
+        self.assertGreater(latest["ram_available_gb"], 0)
+
+    def test_boot_average_sample_is_flagged_and_superseded(self):
+        sampler = ResourceSampler(interval=3600)    # No background tick during the test
+        sampler.start()
+        try:
+            self.assertTrue(sampler.latest()["cpu_boot_average"])
+            self.assertTrue(sampler.stats()["cpu_boot_average"])
+            sampler.record(cpu=42.0, ram=50.0)
+            stats = sampler.stats()
+            self.assertFalse(stats["cpu_boot_average"])
+            self.assertEqual((stats["samples"], stats["cpu"]["avg"]), (2, 42.0))
+            self.assertEqual(stats["ram"]["p50"], sampler.samples[0]["ram"])  # Other metrics keep the priming sample
+            self.assertNotIn("cpu_boot_average", sampler.measure_cpu(0.01))
+        finally:
+            sampler.stop()
+        self.assertEqual(ResourceSampler().stats()["cpu_boot_average"], False)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sqlite3
+import shutil
+import tempfile
+import sys
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Finance
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Finance.revenue_forecast import RevenueForecaster, synthetic_ledger
+from System.Finance.predictive_roi_tracker import PredictiveROI
+
+class TestRevenueForecaster(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.start = datetime(2026, 1, 1)
+
+    def test_linear_stream_forecast(self):
+        """Steady $100/day: point forecast near truth, interval brackets it."""
+        f = RevenueForecaster(ledger_db=self.tmp / "none.db", state_file=self.tmp / "f.json")
+        for d in range(60):
+            f.observe({"type": "REVENUE", "amount": 100.0, "timestamp": (self.start + timedelta(days=d)).isoformat()})
+        now = self.start + timedelta(days=60)
+        f.advance_to(now)
+        result = f.forecast_milestone(f.all_time + 3000, now=now)
+        self.assertEqual(result["status"], "FORECAST")
+        self.assertAlmostEqual(result["days"], 30, delta=1)
+        self.assertLessEqual(result["days_low"], result["days"])
+        self.assertGreaterEqual(result["days_high"], result["days"])
+        self.assertEqual(f.recent(30, now=now), (2900.0, 29))
+
+    def test_incremental_matches_replay_and_persists(self):
+        """Consuming the ledger in pieces (across restarts) equals one full replay."""
+        db = synthetic_ledger(self.tmp / "ledger.db", days=60)
+        conn = sqlite3.connect(db)
+        rows = conn.execute("SELECT id, type, amount, timestamp FROM transactions ORDER BY id").fetchall()
+        conn.close()
+        now = datetime.fromisoformat(rows[-1][3]) + timedelta(days=1)
+
+        full = RevenueForecaster(ledger_db=db, state_file=self.tmp / "full.json")
+        full.consume_ledger(now=now)
+
+        state = self.tmp / "inc.json"
+        for cut in (len(rows) // 3, 2 * len(rows) // 3, len(rows)):
+            part = RevenueForecaster(ledger_db=db, state_file=state)
+            for row_id, tx_type, amount, ts in rows[part.last_id:cut]:
+                part.observe({"id": row_id, "type": tx_type, "amount": amount, "timestamp": ts})
+            part.save_state()
+        part = RevenueForecaster(ledger_db=db, state_file=state)
+        self.assertEqual(part.consume_ledger(now=now), 0)
+        self.assertAlmostEqual(part.all_time, full.all_time, places=6)
+        self.assertAlmostEqual(part.level, full.level, places=6)
+        self.assertAlmostEqual(part.trend, full.trend, places=6)
+
+        roi = PredictiveROI(ledger_db=db)
+        self.assertAlmostEqual(roi.get_revenue_velocity()[1], roi.get_revenue_velocity_full_scan()[1], places=6)
+
+if __name__ == '__main__':
+    unittest.main()
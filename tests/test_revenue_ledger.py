@@ -0,0 +1,81 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path so we can import Brain
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(ROOT)
+
+from Brain.revenue_ledger import RevenueLedger
+
+CRASH_SCRIPT = """
+import os, sys
+sys.path.insert(0, {root!r})
+from Brain.revenue_ledger import RevenueLedger
+ledger = RevenueLedger(root={store!r}, legacy_file={legacy!r}, flush_every=100)
+for i in range(150):
+    ledger.append("CONTENT_FACTORY" if i % 2 else "IP_ARBITRAGE", 1.0, timestamp="2026-03-01T10:00:00")
+os._exit(0)
+"""
+
+class TestRevenueLedger(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.store = self.tmp / "Revenue"
+        self.legacy = self.tmp / "revenue.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def open(self):
+        return RevenueLedger(root=self.store, legacy_file=self.legacy)
+
+    def test_crash_loses_no_events_and_totals_recover(self):
+        script = CRASH_SCRIPT.format(root=os.path.abspath(ROOT), store=str(self.store), legacy=str(self.legacy))
+        subprocess.run([sys.executable, "-c", script], check=True)
+        lines = (self.store / "events" / "2026-03-01.jsonl").read_text().splitlines()
+        self.assertEqual(len(lines), 150)
+
+        ledger = self.open()
+        self.assertEqual(ledger.total(), 150.0)
+        self.assertEqual(ledger.total("CONTENT_FACTORY"), 75.0)
+        self.assertEqual(ledger.rollup("2026-03-01")["count"], 150)
+        ledger.append("IP_ARBITRAGE", 2.0, timestamp="2026-03-01T11:00:00")
+        ledger.close()
+        self.assertEqual(self.open().total(), 152.0)
+
+    def test_torn_final_line_is_dropped(self):
+        ledger = self.open()
+        ledger.append("CONTENT_FACTORY", 5.0, timestamp="2026-03-01T10:00:00")
+        ledger.close()
+        with open(self.store / "events" / "2026-03-01.jsonl", "a") as f:
+            f.write('{"timestamp": "2026-03-01T10:01:00", "head": "CONT')
+        ledger = self.open()
+        ledger.append("CONTENT_FACTORY", 1.0, timestamp="2026-03-01T10:02:00")
+        ledger.close()
+        self.assertEqual([r["amount"] for r in self.open().events()], [5.0, 1.0])
+        self.assertEqual(self.open().total(), 6.0)
+
+    def test_migration_resumes_without_duplicates(self):
+        records = [{"timestamp": f"2026-02-0{d}T09:00:00", "source": "FREELANCE_ARBITRAGE", "amount": 10.0}
+                   for d in range(1, 4)]
+        self.legacy.write_text(json.dumps(records))
+        with mock.patch("Brain.revenue_ledger.shutil.move", side_effect=OSError("crash")):
+            with self.assertRaises(OSError):
+                self.open()                     # Imported, then died before moving the file
+        self.assertTrue(self.legacy.exists())
+
+        ledger = self.open()
+        self.assertFalse(self.legacy.exists())
+        self.assertTrue(Path(str(self.legacy) + ".migrated").exists())
+        self.assertEqual(ledger.total(), 30.0)
+        self.assertEqual(len(list(ledger.events())), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+import time
+import threading
+
+# Add parent directory to path so we can import System.Intelligence
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Intelligence.signal_classifier import SignalClassifier
+from System.Intelligence.signal_pipeline import MinHashDeduper, SignalPipeline, synthetic_signals
+
+class TestSignalPipeline(unittest.TestCase):
+    def pipeline(self, **kwargs):
+        return SignalPipeline(classifier=SignalClassifier(keywords_file=None), **kwargs)
+
+    def run_with_timeout(self, pipeline, signals, timeout=10):
+        result = {}
+
+        def target():
+            try:
+                result["report"] = pipeline.run(signals)
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        self.assertFalse(thread.is_alive(), "pipeline hung")
+        return result
+
+    def test_minhash_collapses_rewrites_only(self):
+        dedup = MinHashDeduper()
+        story = "Wyoming announces tax break for crypto LLC founders starting next quarter with new filing rules"
+        self.assertFalse(dedup.is_duplicate(story))
+        self.assertTrue(dedup.is_duplicate(story.replace("announces", "reportedly")))
+        self.assertTrue(dedup.is_duplicate(story.upper()))
+        self.assertFalse(dedup.is_duplicate("IRS faces audit wave after penalty update delays refunds for small firms"))
+
+    def test_back_pressure_bounds_queues(self):
+        received = []
+
+        def slow_sink(batch):
+            time.sleep(0.005)
+            received.extend(batch)
+
+        pipeline = self.pipeline(batch_size=16, queue_batches=2, sink=slow_sink)
+        report = self.run_with_timeout(pipeline, synthetic_signals(3000))["report"]
+        self.assertEqual(report["counts"]["signals"], 3000)
+        for metrics in report["stages"].values():
+            self.assertLessEqual(metrics["peak_queue_depth"], 2)
+        actionable = report["counts"]["signals"] - report["counts"]["duplicates"] - report["counts"]["NOISE"]
+        self.assertEqual(len(received), actionable)
+
+    def test_failing_stage_ends_run_and_reraises(self):
+        pipeline = self.pipeline(batch_size=8, queue_batches=1)
+
+        def broken(*args):
+            raise KeyError("step_1")
+
+        pipeline.classifier.generate_action_plan = broken
+        signals = ({"content": f"IRS crackdown on offshore tax loophole number {i} " + "x" * (i % 7)}
+                   for i in range(5000))
+        result = self.run_with_timeout(pipeline, signals)
+        self.assertIsInstance(result.get("error"), KeyError)
+        self.assertIsInstance(pipeline.stages[2].error, KeyError)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path so we can import System.Core
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Core.state_push import StateHub, UnixSocketPublisher, listen
+
+class TestStatePush(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.sentinels = self.tmp / "Sentinels"
+        self.sentinels.mkdir()
+        for name in ("scout", "auditor"):
+            (self.sentinels / f"{name}.done").write_text(json.dumps({"status": "IDLE"}))
+        self.log = self.tmp / "events.jsonl"
+        self.log.write_text('{"i": 0}\n')
+        self.hub = StateHub()
+        self.hub.watch_sentinels(self.sentinels)
+        self.hub.watch_log("events", self.log)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_only_changes_are_read_and_published(self):
+        self.assertEqual(self.hub.poll(), 2)
+        reads = self.hub.stats["files_read"]
+        self.assertEqual(self.hub.poll(), 0)
+        self.assertEqual(self.hub.stats["files_read"], reads)
+
+        (self.sentinels / "scout.done").write_text(json.dumps({"status": "HUNTING"}))
+        (self.sentinels / "auditor.done").write_text('{"status": ')   # Half-written
+        (self.sentinels / "auditor.done").touch()
+        self.assertEqual(self.hub.poll(), 1)
+        self.assertEqual(self.hub.history[-1]["data"], {"status": "HUNTING"})
+
+        (self.sentinels / "scout.done").unlink()
+        with open(self.log, "a") as f:
+            f.write('{"i": 1}\n')
+        self.hub.poll()
+        self.assertEqual([(e["topic"], e["key"], e["data"]) for e in list(self.hub.history)[-2:]],
+                         [("sentinels", "scout", None), ("logs", "events", ['{"i": 1}'])])
+        self.assertEqual(self.hub.snapshot()["state"]["logs"]["events"], ['{"i": 0}', '{"i": 1}'])
+
+    def test_snapshots_during_scans_match_their_seq(self):
+        snapshots, errors = [], []
+        done = threading.Event()
+
+        def reader():
+            while not done.is_set():
+                try:
+                    snapshots.append(self.hub.snapshot())
+                except Exception as e:
+                    errors.append(e)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        try:
+            for i in range(200):
+                name = f"agent_{i % 20}.done"
+                if i % 3 == 2:
+                    (self.sentinels / name).unlink(missing_ok=True)
+                else:
+                    (self.sentinels / name).write_text(json.dumps({"status": i}))
+                self.hub.poll()
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual(errors, [])
+
+        events = list(self.hub.history)
+        for snapshot in snapshots[::max(1, len(snapshots) // 200)]:
+            expected = {}
+            for event in events:
+                if event["seq"] > snapshot["seq"]:
+                    break
+                if event["topic"] == "sentinels":
+                    if event["data"] is None:
+                        expected.pop(event["key"], None)
+                    else:
+                        expected[event["key"]] = event["data"]
+            self.assertEqual(snapshot["state"].get("sentinels", {}), expected)
+
+    def test_stream_resumes_from_last_event(self):
+        self.hub.poll()
+        stream = self.hub.stream(since=1, keepalive=0.05)
+        message = next(stream)
+        self.assertEqual((message["type"], message["seq"]), ("delta", 2))
+        self.assertEqual(next(stream)["type"], "ping")
+        stream.close()
+        self.assertEqual(self.hub.clients, 0)
+        self.assertEqual(next(self.hub.stream(since=None))["type"], "snapshot")
+
+    def test_unix_socket_delivers_deltas(self):
+        self.hub.start()
+        publisher = UnixSocketPublisher(self.hub, self.tmp / "state.sock")
+        if not publisher.start():
+            self.skipTest("Unix sockets unavailable")
+        try:
+            messages = listen(self.tmp / "state.sock", timeout=5)
+            snapshot = next(messages)
+            self.assertEqual(snapshot["state"]["sentinels"]["scout"], {"status": "IDLE"})
+            (self.sentinels / "scout.done").write_text(json.dumps({"status": "TRADING"}))
+            delta = next(messages)
+            self.assertEqual((delta["key"], delta["data"]), ("scout", {"status": "TRADING"}))
+        finally:
+            self.hub.stop()
+            publisher.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import sqlite3
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+import os
+
+# Add parent directory to path so we can import System.Revenue
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from System.Revenue.streaming_anomaly import StreamingAnomalyEngine
+
+class TestStreamingAnomaly(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.db = self.tmp / "ledger.db"
+        conn = sqlite3.connect(self.db)
+        conn.execute("""
+            CREATE TABLE transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT, type TEXT,
+                action TEXT, amount REAL, asset TEXT, timestamp TEXT, notes TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+        self.start = datetime(2026, 1, 1)
+
+    def insert(self, day, amount, count=1, source="GUMROAD"):
+        conn = sqlite3.connect(self.db)
+        for i in range(count):
+            ts = (self.start + timedelta(days=day, hours=i)).isoformat()
+            conn.execute(
+                "INSERT INTO transactions (source, type, amount, timestamp) VALUES (?, 'REVENUE', ?, ?)",
+                (source, amount, ts)
+            )
+        conn.commit()
+        conn.close()
+
+    def engine(self):
+        return StreamingAnomalyEngine(self.db, self.tmp / "state.json")
+
+    def test_week_over_week_drop(self):
+        """A collapse in daily revenue raises REVENUE_DROP once two weeks are known."""
+        for day in range(21):
+            self.insert(day, 10.0, count=10 if day < 14 else 2)
+        self.insert(21, 10.0)
+        types = {a["type"] for a in self.engine().consume_ledger()}
+        self.assertIn("REVENUE_DROP", types)
+        self.assertIn("SOURCE_ANOMALY", types)
+
+    def test_state_persists_and_only_new_rows_are_read(self):
+        """Baselines survive a restart and already-consumed rows are not replayed."""
+        for day in range(7):
+            self.insert(day, 10.0, count=5)
+        first = self.engine()
+        first.consume_ledger()
+
+        restarted = self.engine()
+        self.assertEqual(restarted.last_id, first.last_id)
+        self.assertEqual(restarted.consume_ledger(), [])
+        self.assertAlmostEqual(restarted.sources["GUMROAD"].ewma, 10.0)
+
+    def test_silent_day_closes_are_raised_once_across_restarts(self):
+        """Days closed by advance_to() are persisted, so a one-shot rescan does not re-raise them."""
+        for day in range(21):
+            self.insert(day, 10.0, count=10 if day < 14 else 2)
+        now = self.start + timedelta(days=30)
+
+        first = self.engine()
+        first.consume_ledger()
+        types = {a["type"] for a in first.advance_to(now)}
+        self.assertIn("REVENUE_DROP", types)
+
+        rescan = self.engine()
+        self.assertEqual(rescan.consume_ledger() + rescan.advance_to(now), [])
+
+    def test_malformed_rows_are_skipped_and_consumed(self):
+        """A bad timestamp or amount does not stop the stream or get re-read after a restart."""
+        self.insert(0, 10.0, count=3)
+        conn = sqlite3.connect(self.db)
+        conn.executemany("INSERT INTO transactions (source, type, amount, timestamp) VALUES (?, 'REVENUE', ?, ?)",
+                         [("GUMROAD", 10.0, "not-a-date"), ("GUMROAD", None, self.start.isoformat()),
+                          ("GUMROAD", "ten", self.start.isoformat()), ("GUMROAD", 10.0, "2026-13-45T00:00:00")])
+        conn.commit()
+        conn.close()
+        self.insert(1, 10.0, count=2)
+
+        engine = self.engine()
+        self.assertEqual(engine.consume_ledger(), [])
+        self.assertEqual((engine.last_id, engine.skipped), (9, 4))
+        self.assertEqual(engine.sources["GUMROAD"].count, 5)
+
+        restarted = self.engine()
+        self.assertEqual(restarted.last_id, 9)
+        self.assertEqual(restarted.consume_ledger(), [])
+        self.assertEqual(restarted.skipped, 0)
+
+    def test_amount_outlier_flagged_on_insert(self):
+        """A single sale far outside the EWMA band is flagged by the event that carries it."""
+        engine = self.engine()
+        for i in range(20):
+            engine.observe({"source": "GUMROAD", "type": "REVENUE", "amount": 10.0 + (i % 3),
+                            "timestamp": self.start.isoformat()})
+        anomalies = engine.observe({"source": "GUMROAD", "type": "REVENUE", "amount": 400.0,
+                                    "timestamp": self.start.isoformat()})
+        self.assertEqual([a["type"] for a in anomalies], ["AMOUNT_OUTLIER"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,21 +1,29 @@
-import time, os, subprocess, shutil
+import os, sys, subprocess, shutil
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from System.Core.action_watcher import ActionWatcher
+
 WATCH = r'C:\Monolith\Actions'
 ARCHIVE = r'C:\Monolith\Memory\Archive'
 TRASH = r'C:\Monolith\Memory\Trash'
+WORKERS = 4  # Independent actions run concurrently, at most this many at once
+
+def execute(path):
+    f = path.name
+    print(f'[EXECUTING] {f}')
+    try:
+        if f.endswith('.py'): subprocess.run(['python', str(path)], check=True)
+        elif f.endswith('.ps1'): subprocess.run(['powershell', '-File', str(path)], check=True)
+        elif f.endswith('.js'): subprocess.run(['node', str(path)], check=True)
+        shutil.move(str(path), os.path.join(ARCHIVE, f))
+        print(f'[SUCCESS] {f}')
+    except Exception as e:
+        print(f'[ERROR] {f}: {e}')
+        shutil.move(str(path), os.path.join(TRASH, f))
 
-print('--- TITAN ENGINE ONLINE ---')
-while True:
-    for f in os.listdir(WATCH):
-        path = os.path.join(WATCH, f)
-        if os.path.isfile(path) and not f.startswith('.'):
-            print(f'[EXECUTING] {f}')
-            try:
-                if f.endswith('.py'): subprocess.run(['python', path], check=True)
-                elif f.endswith('.ps1'): subprocess.run(['powershell', '-File', path], check=True)
-                elif f.endswith('.js'): subprocess.run(['node', path], check=True)
-                shutil.move(path, os.path.join(ARCHIVE, f))
-                print('[SUCCESS]')
-            except Exception as e:
-                print(f'[ERROR] {e}')
-                shutil.move(path, os.path.join(TRASH, f))
-    time.sleep(2)
+if __name__ == '__main__':
+    watcher = ActionWatcher(WATCH, execute, workers=WORKERS)
+    print(f'--- TITAN ENGINE ONLINE ({"inotify" if watcher.use_inotify else "polling"}) ---')
+    try:
+        watcher.run()  # Event-driven on Linux, adaptive polling elsewhere
+    except KeyboardInterrupt:
+        watcher.stop()